@@ -1,23 +1,53 @@
 # coding:utf-8
 import sys
+from multiprocessing import freeze_support
 
-from PyQt5.QtCore import QLocale, Qt, QTranslator
-from PyQt5.QtWidgets import QApplication
+from common.startup_tracer import startupTracer
 
-from View.main_window import MainWindow
 
+if __name__ == '__main__':
+    # 扫描歌曲信息时会用到进程池，子进程不应该再次创建主界面
+    freeze_support()
 
-app = QApplication(sys.argv)
+    # 启动耗时追踪，需要在导入 Qt 和界面之前启用
+    startupTracer.enableFromArgs(sys.argv)
 
-app.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    with startupTracer.phase("import PyQt5"):
+        from PyQt5.QtCore import QLocale, Qt, QTimer, QTranslator
+        from PyQt5.QtWidgets import QApplication
 
-# 国际化
-translator = QTranslator()
-translator.load(QLocale.system(), ":/i18n/Groove_")
-app.installTranslator(translator)
+    # 资源文件由 Qt 进行内存映射，需要在创建任何界面之前注册
+    with startupTracer.phase("register resource"):
+        from common.resource import registerResource
+        registerResource()
 
-# 创建主界面
-groove = MainWindow()
-groove.show()
+    with startupTracer.phase("import MainWindow"):
+        from View.main_window import MainWindow
 
-app.exec_()
\ No newline at end of file
+    startupTracer.traceWidgets()
+
+    with startupTracer.phase("QApplication"):
+        app = QApplication(sys.argv)
+
+    app.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+
+    # 国际化
+    with startupTracer.phase("install translator"):
+        translator = QTranslator()
+        translator.load(QLocale.system(), ":/i18n/Groove_")
+        app.installTranslator(translator)
+
+    # 创建主界面
+    with startupTracer.phase("MainWindow"):
+        groove = MainWindow()
+        groove.show()
+
+    # 事件循环处理完显示主界面产生的事件之后认为启动完成
+    if startupTracer.isEnabled:
+        QTimer.singleShot(0, startupTracer.finish)
+
+        # 持续集成中只需要追踪启动过程
+        if "--quit-after-startup" in sys.argv:
+            QTimer.singleShot(0, groove.onExit)
+
+    app.exec_()
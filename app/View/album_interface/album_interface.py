@@ -1,6 +1,5 @@
 # coding:utf-8
-from copy import deepcopy
-
+from common.meta_data import AlbumInfoReader
 from common.os_utils import getCoverPath
 from common.thread.save_album_info_thread import SaveAlbumInfoThread
 from components.dialog_box.album_info_edit_dialog import AlbumInfoEditDialog
@@ -19,11 +18,11 @@ class AlbumInterface(ScrollArea):
 
     songCardPlaySig = pyqtSignal(int)                    # 在当前播放列表中播放这首歌
     playAlbumSignal = pyqtSignal(list)                   # 播放整张专辑
-    playOneSongCardSig = pyqtSignal(dict)                # 将播放列表重置为一首歌
+    playOneSongCardSig = pyqtSignal(object)              # 将播放列表重置为一首歌
     playCheckedCardsSig = pyqtSignal(list)               # 播放选中的歌曲卡
-    nextToPlayOneSongSig = pyqtSignal(dict)              # 下一首播放一首歌
-    addOneSongToPlayingSig = pyqtSignal(dict)            # 添加一首歌到正在播放
-    editSongInfoSignal = pyqtSignal(dict, dict)          # 编辑歌曲信息信号
+    nextToPlayOneSongSig = pyqtSignal(object)            # 下一首播放一首歌
+    addOneSongToPlayingSig = pyqtSignal(object)          # 添加一首歌到正在播放
+    editSongInfoSignal = pyqtSignal(object, object)      # 编辑歌曲信息信号
     selectionModeStateChanged = pyqtSignal(bool)         # 进入/退出 选择模式
     switchToSingerInterfaceSig = pyqtSignal(str)         # 切换到歌手界面
     nextToPlayCheckedCardsSig = pyqtSignal(list)         # 将选中的多首歌添加到下一首播放
@@ -69,7 +68,8 @@ class AlbumInterface(ScrollArea):
 
     def __getInfo(self, albumInfo: dict):
         """ 获取信息 """
-        self.albumInfo = deepcopy(albumInfo) if albumInfo else {}
+        self.albumInfo = AlbumInfoReader.copyAlbumInfos(
+            [albumInfo])[0] if albumInfo else {}
         self.songInfo_list = self.albumInfo.get("songInfo_list", [])
         self.album = self.albumInfo.get('album', self.tr('Unknown album'))
         self.singer = self.albumInfo.get('singer', self.tr('Unknown artist'))
@@ -192,7 +192,7 @@ class AlbumInterface(ScrollArea):
         self.sender().deleteLater()
 
         # 更新窗口
-        albumInfo = deepcopy(newAlbumInfo)
+        albumInfo = AlbumInfoReader.copyAlbumInfos([newAlbumInfo])[0]
         songInfo_list = albumInfo["songInfo_list"]
         oldKey = oldAlbumInfo["album"]+'.'+oldAlbumInfo["singer"]
         for songInfo in songInfo_list.copy():
@@ -11,8 +11,8 @@ class SongListWidget(NoScrollSongListWidget):
     """ 专辑界面歌曲卡列表视图 """
 
     playSignal = pyqtSignal(int)                    # 播放指定歌曲
-    playOneSongSig = pyqtSignal(dict)               # 只播放选中的歌曲
-    nextToPlayOneSongSig = pyqtSignal(dict)         # 插入一首歌到播放列表中
+    playOneSongSig = pyqtSignal(object)             # 只播放选中的歌曲
+    nextToPlayOneSongSig = pyqtSignal(object)       # 插入一首歌到播放列表中
     switchToSingerInterfaceSig = pyqtSignal(str)    # 切换到歌手界面
 
     def __init__(self, songInfo_list: list, parent=None):
@@ -1,13 +1,14 @@
 # coding:utf-8
 import os
-from copy import deepcopy
 from pathlib import Path
 from random import shuffle
 
-from common import resource
 from common.crawler import CrawlerBase
+from common.meta_data import LibraryWatcher, playlistStore
 from common.os_utils import moveToTrash
+from common.startup_tracer import startupTracer
 from common.thread.get_online_song_url_thread import GetOnlineSongUrlThread
+from common.thread.lyric_prefetch_thread import LyricPrefetchThread
 from components.dialog_box.create_playlist_dialog import CreatePlaylistDialog
 from components.dialog_box.message_dialog import MessageDialog
 from components.frameless_window import FramelessWindow
@@ -17,7 +18,8 @@ from components.system_tray_icon import SystemTrayIcon
 from components.thumbnail_tool_bar import ThumbnailToolBar
 from components.title_bar import TitleBar
 from components.video_window import VideoWindow
-from components.widgets.stacked_widget import (OpacityAniStackedWidget,
+from components.widgets.stacked_widget import (LazyStackedWidget,
+                                               OpacityAniStackedWidget,
                                                PopUpAniStackedWidget)
 from components.widgets.state_tooltip import StateTooltip
 from PyQt5.QtCore import (QEasingCurve, QEvent, QEventLoop, QFile, Qt, QTimer,
@@ -52,8 +54,13 @@ class MainWindow(FramelessWindow):
         self.navigationHistories = [("myMusicInterfaceStackWidget", 0)]
         self.initWidget()
 
+    @startupTracer.traced()
     def createWidgets(self):
         """ 创建小部件 """
+        # 延迟创建的界面的加载函数，界面创建之后会被移除
+        self.lazyInterfaceLoaders = {}
+        self.loadingInterfaces = set()
+
         # 主界面放置 totalStackWidget、playBar 和 titleBar
         # totalStackWidget用来放置 subMainWindow、 playingInterface 和 videoWindow
         self.totalStackWidget = OpacityAniStackedWidget(self)
@@ -93,12 +100,20 @@ class MainWindow(FramelessWindow):
         self.settingInterface = SettingInterface(self.subMainWindow)
 
         # 从配置文件中的选择文件夹读取音频文件
+        config = self.settingInterface.config
         self.myMusicInterface = MyMusicInterface(
-            self.settingInterface.config["selected-folders"], self.subMainWindow)
+            config["selected-folders"], config["scan-max-depth"],
+            config["scan-ignore-patterns"], config["scan-in-background"],
+            self.subMainWindow)
 
-        # 创建定时扫描歌曲信息的定时器
+        # 创建定时扫描歌曲信息的定时器，监视歌曲文件夹时只作为后备
         self.rescanSongInfoTimer = QTimer(self)
 
+        # 创建歌曲文件夹监视器
+        self.libraryWatcher = LibraryWatcher(
+            config["selected-folders"], config["scan-max-depth"],
+            config["scan-ignore-patterns"], parent=self)
+
         # 创建更新歌词位置的定时器
         self.updateLyricPosTimer = QTimer(self)
 
@@ -111,46 +126,20 @@ class MainWindow(FramelessWindow):
         self.playBar = PlayBar(
             self.mediaPlaylist.lastSongInfo, QColor(*color), self)
 
-        # 创建正在播放界面
+        # 创建正在播放界面，其他次要界面在第一次使用时才创建
         self.playingInterface = PlayingInterface(
             self.mediaPlaylist.playlist, self)
 
-        # 创建视频界面
-        self.videoWindow = VideoWindow(self)
-
-        # 创建专辑界面
-        self.albumInterface = AlbumInterface(parent=self.subMainWindow)
-
-        # 创建歌手界面
-        self.singerInterface = SingerInterface(parent=self.subMainWindow)
-
-        # 创建播放列表卡界面和播放列表界面
-        self.playlistInterface = PlaylistInterface({}, self.subMainWindow)
-        self.playlistCardInterface = PlaylistCardInterface(self.subMainWindow)
-
         # 创建导航界面
         self.navigationInterface = NavigationInterface(self.subMainWindow)
 
-        # 创建标签导航界面
-        self.labelNavigationInterface = LabelNavigationInterface(
-            self.subMainWindow)
-
-        # 创建最小播放界面
-        self.smallestPlayInterface = SmallestPlayInterface(
-            self.mediaPlaylist.playlist, parent=self)
-
         # 创建系统托盘图标
         self.systemTrayIcon = SystemTrayIcon(self)
 
-        # 创建搜索结果界面
-        pageSize = self.settingInterface.config['online-music-page-size']
-        quality = self.settingInterface.config['online-play-quality']
-        folder = self.settingInterface.config['download-folder']
-        self.searchResultInterface = SearchResultInterface(
-            pageSize, quality, folder, self.subMainWindow)
-
         # 创建线程
         self.getOnlineSongUrlThread = GetOnlineSongUrlThread(self)
+        self.lyricPrefetchThread = LyricPrefetchThread(
+            config["lyric-prefetch-num"], config["lyric-prefetch-concurrency"], self)
 
         # 创建快捷键
         self.togglePlayPauseAct_1 = QAction(
@@ -174,35 +163,40 @@ class MainWindow(FramelessWindow):
         self.songTabSongListWidget = self.myMusicInterface.songListWidget
         self.albumCardInterface = self.myMusicInterface.albumCardInterface
 
+    @startupTracer.traced()
     def initWidget(self):
         """ 初始化小部件 """
         self.resize(1240, 970)
         self.setMinimumSize(1030, 800)
-        self.videoWindow.hide()
 
         # 关闭最后一个窗口后不退出
         QApplication.setQuitOnLastWindowClosed(
             not self.settingInterface.config['minimize-to-tray'])
 
-        # 在去除任务栏的显示区域居中显示
-        desktop = QApplication.desktop().availableGeometry()
-        self.smallestPlayInterface.move(desktop.width() - 390, 40)
-
         # 标题栏置顶
         self.titleBar.raise_()
 
-        # 将窗口添加到 StackWidget 中
+        # 将窗口添加到 StackWidget 中，次要界面先放入占位窗口，第一次使用时才创建
         self.subStackWidget.addWidget(self.myMusicInterface, 0, 70)
-        self.subStackWidget.addWidget(self.playlistCardInterface, 0, 120)
+        self.addLazyInterface("playlistCardInterface",
+                              self.createPlaylistCardInterface, self.subStackWidget, 0, 120)
         self.subStackWidget.addWidget(self.settingInterface, 0, 120)
-        self.subStackWidget.addWidget(self.albumInterface, 0, 70)
-        self.subStackWidget.addWidget(self.singerInterface, 0, 70)
-        self.subStackWidget.addWidget(self.playlistInterface, 0, 70)
-        self.subStackWidget.addWidget(self.labelNavigationInterface, 0, 100)
-        self.subStackWidget.addWidget(self.searchResultInterface, 0, 120)
+        self.addLazyInterface(
+            "albumInterface", self.createAlbumInterface, self.subStackWidget, 0, 70)
+        self.addLazyInterface(
+            "singerInterface", self.createSingerInterface, self.subStackWidget, 0, 70)
+        self.addLazyInterface(
+            "playlistInterface", self.createPlaylistInterface, self.subStackWidget, 0, 70)
+        self.addLazyInterface("labelNavigationInterface",
+                              self.createLabelNavigationInterface, self.subStackWidget, 0, 100)
+        self.addLazyInterface("searchResultInterface",
+                              self.createSearchResultInterface, self.subStackWidget, 0, 120)
         self.totalStackWidget.addWidget(self.subMainWindow)
         self.totalStackWidget.addWidget(self.playingInterface)
-        self.totalStackWidget.addWidget(self.videoWindow)
+        self.addLazyInterface(
+            "videoWindow", self.createVideoWindow, self.totalStackWidget)
+        self.addLazyInterface(
+            "smallestPlayInterface", self.createSmallestPlayInterface)
         self.subMainWindow.setGraphicsEffect(None)
 
         # 设置右边子窗口的位置
@@ -240,7 +234,11 @@ class MainWindow(FramelessWindow):
 
         # 安装事件过滤器
         self.navigationInterface.navigationMenu.installEventFilter(self)
-        self.rescanSongInfoTimer.start()
+        if self.settingInterface.config["watch-selected-folders"]:
+            self.libraryWatcher.foldersChanged.connect(self.onSongFoldersChanged)
+        else:
+            self.rescanSongInfoTimer.start()
+
         self.updateLyricPosTimer.start()
         self.onInitFinished()
 
@@ -249,11 +247,83 @@ class MainWindow(FramelessWindow):
         self.splashScreen.hide()
         self.subStackWidget.show()
         self.navigationInterface.show()
+
+        # 界面显示之后再在后台扫描歌曲文件夹和创建次要界面
+        QTimer.singleShot(0, self.myMusicInterface.startLibrarySync)
+        if self.settingInterface.config["preload-interfaces"]:
+            QTimer.singleShot(1000, self.preloadInterfaces)
         self.playBar.show()
         self.systemTrayIcon.show()
         self.setWindowEffect(
             self.settingInterface.config["enable-acrylic-background"])
 
+    def addLazyInterface(self, name: str, factory, stackWidget: LazyStackedWidget = None, *args):
+        """ 注册延迟创建的界面，第一次访问界面对应的属性或者切换到界面时才创建它
+
+        Parameters
+        ----------
+        name: str
+            界面对应的属性名
+
+        factory: callable
+            创建界面、将界面的信号连接到槽函数并返回界面的函数
+
+        stackWidget: LazyStackedWidget
+            放置界面的堆叠窗口，为 `None` 时界面是一个独立的窗口
+
+        *args:
+            传给堆叠窗口的 `addLazyWidget()` 的其他参数
+        """
+        def load():
+            # 工厂函数在界面赋值给属性之前访问了这个属性
+            if name in self.loadingInterfaces:
+                raise RuntimeError(f"界面 {name} 还没有创建完成")
+
+            self.loadingInterfaces.add(name)
+            try:
+                with startupTracer.phase("load " + name):
+                    widget = factory()
+            except Exception as e:
+                # 移除创建了一半的界面，下次访问时重新创建。
+                # 抛出的异常不能是 AttributeError，否则会被 __getattr__ 当成属性不存在
+                self.__dict__.pop(name, None)
+                raise RuntimeError(f"创建界面 {name} 失败") from e
+            finally:
+                self.loadingInterfaces.discard(name)
+
+            self.lazyInterfaceLoaders.pop(name, None)
+            return widget
+
+        if stackWidget is None:
+            self.lazyInterfaceLoaders[name] = load
+        else:
+            index = stackWidget.addLazyWidget(load, *args)
+            self.lazyInterfaceLoaders[name] = lambda: stackWidget.loadWidget(index)
+
+    def isInterfaceLoaded(self, name: str) -> bool:
+        """ 界面是否已经创建 """
+        return name in self.__dict__
+
+    def isInterface(self, widget: QWidget, *names: str) -> bool:
+        """ 小部件是否为指定的界面之一，不会创建还没有创建的界面 """
+        return any(self.isInterfaceLoaded(i) and widget is getattr(self, i) for i in names)
+
+    def preloadInterfaces(self):
+        """ 空闲时逐个创建还没有创建的界面，每次只创建一个，避免长时间阻塞事件循环 """
+        if not self.lazyInterfaceLoaders:
+            return
+
+        getattr(self, next(iter(self.lazyInterfaceLoaders)))
+        QTimer.singleShot(100, self.preloadInterfaces)
+
+    def __getattr__(self, name):
+        # 只有在找不到属性时才会调用，第一次访问延迟创建的界面时创建它
+        loader = self.__dict__.get("lazyInterfaceLoaders", {}).get(name)
+        if loader is not None:
+            return loader()
+
+        return super().__getattr__(name)
+
     def setHotKey(self):
         """ 设置全局热键 """
         self.nextSongHotKey = SystemHotkey()
@@ -361,9 +431,10 @@ class MainWindow(FramelessWindow):
         self.adjustWidgetGeometry()
         self.navigationInterface.navigationMenu.stackUnder(self.playBar)
         # 如果现在显示的是字母导航界面就将其隐藏
-        if self.subStackWidget.currentWidget() is self.labelNavigationInterface:
+        if self.isInterface(self.subStackWidget.currentWidget(), "labelNavigationInterface"):
             self.subStackWidget.setCurrentIndex(0)
 
+    @startupTracer.traced()
     def initPlaylist(self):
         """ 初始化播放列表 """
         self.player.setPlaylist(self.mediaPlaylist)
@@ -372,7 +443,6 @@ class MainWindow(FramelessWindow):
         if not self.mediaPlaylist.playlist:
             songInfo_list = self.songTabSongListWidget.songInfo_list
             self.playingInterface.setPlaylist(songInfo_list)
-            self.smallestPlayInterface.setPlaylist(songInfo_list)
             self.mediaPlaylist.setPlaylist(songInfo_list)
             self.mediaPlaylist.playlistType = PlaylistType.ALL_SONG_PLAYLIST
             self.songTabSongListWidget.setPlay(0)
@@ -385,7 +455,6 @@ class MainWindow(FramelessWindow):
                 self.mediaPlaylist.lastSongInfo)
             self.mediaPlaylist.setCurrentIndex(index)
             self.playingInterface.setCurrentIndex(index)
-            self.smallestPlayInterface.setCurrentIndex(index)
             self.systemTrayIcon.updateWindow(self.mediaPlaylist.lastSongInfo)
 
             index = self.songTabSongListWidget.index(
@@ -395,7 +464,7 @@ class MainWindow(FramelessWindow):
 
     def togglePlayState(self):
         """ 播放按钮按下时根据播放器的状态来决定是暂停还是播放 """
-        if self.totalStackWidget.currentWidget() is self.videoWindow:
+        if self.isInterface(self.totalStackWidget.currentWidget(), "videoWindow"):
             self.videoWindow.togglePlayState()
             return
 
@@ -433,7 +502,8 @@ class MainWindow(FramelessWindow):
         self.systemTrayIcon.setPlay(isPlay)
         self.playingInterface.setPlay(isPlay)
         self.thumbnailToolBar.setPlay(isPlay)
-        self.smallestPlayInterface.setPlay(isPlay)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlay(isPlay)
 
     def setPlayButtonEnabled(self, isEnabled: bool):
         """ 设置播放按钮是否启用 """
@@ -446,14 +516,16 @@ class MainWindow(FramelessWindow):
         self.thumbnailToolBar.playButton.setEnabled(isEnabled)
         self.thumbnailToolBar.nextSongButton.setEnabled(isEnabled)
         self.thumbnailToolBar.lastSongButton.setEnabled(isEnabled)
-        self.smallestPlayInterface.playButton.setEnabled(isEnabled)
-        self.smallestPlayInterface.lastSongButton.setEnabled(isEnabled)
-        self.smallestPlayInterface.nextSongButton.setEnabled(isEnabled)
         self.systemTrayIcon.menu.songAct.setEnabled(isEnabled)
         self.systemTrayIcon.menu.playAct.setEnabled(isEnabled)
         self.systemTrayIcon.menu.lastSongAct.setEnabled(isEnabled)
         self.systemTrayIcon.menu.nextSongAct.setEnabled(isEnabled)
 
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.playButton.setEnabled(isEnabled)
+            self.smallestPlayInterface.lastSongButton.setEnabled(isEnabled)
+            self.smallestPlayInterface.nextSongButton.setEnabled(isEnabled)
+
     def onVolumeChanged(self, volume: int):
         """ 音量滑动条数值改变时更换图标并设置音量 """
         self.player.setVolume(volume)
@@ -468,7 +540,8 @@ class MainWindow(FramelessWindow):
         self.playBar.progressSlider.setValue(position)
         self.playingInterface.setCurrentTime(position)
         self.playingInterface.playBar.progressSlider.setValue(position)
-        self.smallestPlayInterface.progressBar.setValue(position)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.progressBar.setValue(position)
 
     def onPlayerDurationChanged(self):
         """ 播放器当前播放的歌曲变化时更新进度条的范围和总时长标签 """
@@ -481,14 +554,16 @@ class MainWindow(FramelessWindow):
         self.playBar.progressSlider.setRange(0, duration)
         self.playingInterface.playBar.setTotalTime(duration)
         self.playingInterface.playBar.progressSlider.setRange(0, duration)
-        self.smallestPlayInterface.progressBar.setRange(0, duration)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.progressBar.setRange(0, duration)
 
     def onprogressSliderMoved(self, position):
         """ 手动拖动进度条时改变当前播放进度标签和播放器的值 """
         self.player.setPosition(position)
         self.playBar.setCurrentTime(position)
         self.playingInterface.setCurrentTime(position)
-        self.smallestPlayInterface.progressBar.setValue(position)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.progressBar.setValue(position)
 
     def onSongCardNextPlay(self, songInfo: dict):
         """ 下一首播放动作触发对应的槽函数 """
@@ -500,7 +575,8 @@ class MainWindow(FramelessWindow):
             + self.mediaPlaylist.playlist[index + 1:]
         )
         self.playingInterface.setPlaylist(newPlaylist, False)
-        self.smallestPlayInterface.setPlaylist(newPlaylist, False)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlaylist(newPlaylist, False)
         self.playingInterface.setCurrentIndex(
             self.mediaPlaylist.currentIndex())
         self.mediaPlaylist.insertSong(
@@ -575,16 +651,20 @@ class MainWindow(FramelessWindow):
         self.playingInterface.setCurrentIndex(index)
         self.systemTrayIcon.updateWindow(songInfo)
 
-        if self.smallestPlayInterface.isVisible():
+        if self.isInterfaceLoaded("smallestPlayInterface") and self.smallestPlayInterface.isVisible():
             self.smallestPlayInterface.setCurrentIndex(index)
 
+        # 还没有创建的界面在创建之后才会显示歌曲，不需要更新
         self.songTabSongListWidget.setPlayBySongInfo(songInfo)
-        self.albumInterface.songListWidget.setPlayBySongInfo(songInfo)
-        self.playlistInterface.songListWidget.setPlayBySongInfo(songInfo)
-        self.searchResultInterface.localSongListWidget.setPlayBySongInfo(
-            songInfo)
-        self.searchResultInterface.onlineSongListWidget.setPlayBySongInfo(
-            songInfo)
+        if self.isInterfaceLoaded("albumInterface"):
+            self.albumInterface.songListWidget.setPlayBySongInfo(songInfo)
+        if self.isInterfaceLoaded("playlistInterface"):
+            self.playlistInterface.songListWidget.setPlayBySongInfo(songInfo)
+        if self.isInterfaceLoaded("searchResultInterface"):
+            self.searchResultInterface.localSongListWidget.setPlayBySongInfo(
+                songInfo)
+            self.searchResultInterface.onlineSongListWidget.setPlayBySongInfo(
+                songInfo)
 
         # 在更新完界面之后，检查媒体是否可用（需要显示警告图标）
         self.checkMediaAvailable()
@@ -592,7 +672,8 @@ class MainWindow(FramelessWindow):
     def playAlbum(self, playlist: list, index=0):
         """ 播放专辑中的歌曲 """
         self.playingInterface.setPlaylist(playlist, index=index)
-        self.smallestPlayInterface.setPlaylist(playlist)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlaylist(playlist)
         self.mediaPlaylist.playAlbum(playlist, index)
         self.play()
 
@@ -605,7 +686,8 @@ class MainWindow(FramelessWindow):
             + self.mediaPlaylist.playlist[index + 1:]
         )
         self.playingInterface.setPlaylist(newPlaylist, False)
-        self.smallestPlayInterface.setPlaylist(newPlaylist, False)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlaylist(newPlaylist, False)
         self.playingInterface.setCurrentIndex(
             self.mediaPlaylist.currentIndex())
         # insertMedia的时候自动更新playlist列表，所以不必手动更新列表
@@ -615,7 +697,7 @@ class MainWindow(FramelessWindow):
     def disorderPlayAll(self):
         """ 无序播放所有 """
         self.mediaPlaylist.playlistType = PlaylistType.ALL_SONG_PLAYLIST
-        newPlaylist = deepcopy(self.songTabSongListWidget.songInfo_list)
+        newPlaylist = self.songTabSongListWidget.songInfo_list.copy()
         shuffle(newPlaylist)
         self.setPlaylist(newPlaylist)
 
@@ -632,6 +714,7 @@ class MainWindow(FramelessWindow):
             self.setPlayButtonState(True)
             self.playBar.songInfoCard.show()
 
+    @startupTracer.traced()
     def initPlayBar(self):
         """ 从配置文件中读取配置数据来初始化播放栏 """
         # 初始化音量
@@ -644,6 +727,7 @@ class MainWindow(FramelessWindow):
                 self.mediaPlaylist.getCurrentSong())
             self.playBar.songInfoCard.albumCoverLabel.setOpacity(1)
 
+    @startupTracer.traced()
     def setQss(self):
         """ 设置层叠样式 """
         self.setObjectName("mainWindow")
@@ -699,7 +783,8 @@ class MainWindow(FramelessWindow):
         self.navigationHistories.append(("totalStackWidget", 1))
 
         self.showFullScreen()
-        self.videoWindow.playBar.fullScreenButton.setFullScreen(True)
+        if self.isInterfaceLoaded("videoWindow"):
+            self.videoWindow.playBar.fullScreenButton.setFullScreen(True)
         self.playingInterface.setFullScreen(True)
         if self.playingInterface.isPlaylistVisible:
             self.playingInterface.songInfoCardChute.move(
@@ -717,7 +802,8 @@ class MainWindow(FramelessWindow):
         self.titleBar.returnButton.show()
         self.titleBar.show()
 
-        self.videoWindow.playBar.fullScreenButton.setFullScreen(False)
+        if self.isInterfaceLoaded("videoWindow"):
+            self.videoWindow.playBar.fullScreenButton.setFullScreen(False)
         self.playingInterface.setFullScreen(False)
         if self.playingInterface.isPlaylistVisible:
             self.playingInterface.songInfoCardChute.move(
@@ -737,16 +823,21 @@ class MainWindow(FramelessWindow):
         self.mediaPlaylist.playlistType = PlaylistType.NO_PLAYLIST
         self.mediaPlaylist.clear()
         self.playingInterface.clearPlaylist()
-        self.smallestPlayInterface.clearPlaylist()
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.clearPlaylist()
+
         self.playBar.songInfoCard.hide()
         self.setPlayButtonState(False)
         self.setPlayButtonEnabled(False)
 
         self.songTabSongListWidget.cancelPlayState()
-        self.albumInterface.songListWidget.cancelPlayState()
-        self.playlistInterface.songListWidget.cancelPlayState()
-        self.searchResultInterface.localSongListWidget.cancelPlayState()
-        self.searchResultInterface.onlineSongListWidget.cancelPlayState()
+        if self.isInterfaceLoaded("albumInterface"):
+            self.albumInterface.songListWidget.cancelPlayState()
+        if self.isInterfaceLoaded("playlistInterface"):
+            self.playlistInterface.songListWidget.cancelPlayState()
+        if self.isInterfaceLoaded("searchResultInterface"):
+            self.searchResultInterface.localSongListWidget.cancelPlayState()
+            self.searchResultInterface.onlineSongListWidget.cancelPlayState()
 
         self.playBar.setTotalTime(0)
         self.playBar.progressSlider.setRange(0, 0)
@@ -755,15 +846,17 @@ class MainWindow(FramelessWindow):
         """ 向正在播放列表尾部添加一首歌 """
         self.mediaPlaylist.addSong(songInfo)
         self.playingInterface.setPlaylist(self.mediaPlaylist.playlist, False)
-        self.smallestPlayInterface.setPlaylist(
-            self.mediaPlaylist.playlist, False)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlaylist(
+                self.mediaPlaylist.playlist, False)
 
     def addSongsToPlayingPlaylist(self, songInfo_list: list):
         """ 向正在播放列表尾部添加多首歌 """
         self.mediaPlaylist.addSongs(songInfo_list)
         self.playingInterface.setPlaylist(self.mediaPlaylist.playlist, False)
-        self.smallestPlayInterface.setPlaylist(
-            self.mediaPlaylist.playlist, False)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlaylist(
+                self.mediaPlaylist.playlist, False)
 
     def switchToSubInterface(self, widget: QWidget, whiteIcon=False, whiteReturn=False):
         """ 切换到 `subStackWidget` 的一个子界面
@@ -797,7 +890,7 @@ class MainWindow(FramelessWindow):
             return
 
         # 切换界面
-        playlist = self.playlistCardInterface.playlists[playlistName]
+        playlist = self.playlistCardInterface.getPlaylist(playlistName)
         self.playlistInterface.updateWindow(playlist)
         self.switchToSubInterface(self.playlistInterface, True)
 
@@ -845,7 +938,7 @@ class MainWindow(FramelessWindow):
         """ 切换到设置界面 """
         self.show()
 
-        if self.videoWindow.isVisible():
+        if self.isInterfaceLoaded("videoWindow") and self.videoWindow.isVisible():
             # TODO: 从视频界面直接切换回设置界面
             return
 
@@ -880,12 +973,13 @@ class MainWindow(FramelessWindow):
     def switchToSearchResultInterface(self, keyWord: str):
         """ 切换到搜索结果界面 """
         # 更新搜索结果界面
-        self.searchResultInterface.search(
-            keyWord,
-            self.songTabSongListWidget.songInfo_list,
-            self.albumCardInterface.albumInfo_list,
-            self.playlistCardInterface.playlists
-        )
+        # 不需要为了搜索播放列表创建播放列表界面
+        if self.isInterfaceLoaded("playlistCardInterface"):
+            playlists = self.playlistCardInterface.playlists
+        else:
+            playlists = playlistStore.readPlaylists()
+
+        self.searchResultInterface.search(keyWord, playlists)
 
         # 增加导航历史
         self.switchToSubInterface(self.searchResultInterface)
@@ -940,16 +1034,15 @@ class MainWindow(FramelessWindow):
         self.totalStackWidget.setCurrentIndex(0)
 
         # 根据当前界面设置标题栏按钮颜色
-        whiteInterface = [self.albumInterface,
-                          self.playlistInterface, self.singerInterface]
-        if self.subStackWidget.currentWidget() in whiteInterface:
+        currentWidget = self.subStackWidget.currentWidget()
+        if self.isInterface(currentWidget, "albumInterface", "playlistInterface", "singerInterface"):
             self.titleBar.returnButton.setWhiteIcon(False)
         else:
             self.titleBar.setWhiteIcon(False)
 
         # 隐藏返回按钮
-        cond = self.subStackWidget.currentWidget() not in [
-            self.albumInterface, self.labelNavigationInterface]
+        cond = not self.isInterface(
+            currentWidget, "albumInterface", "labelNavigationInterface")
         if len(self.navigationHistories) == 1 and cond:
             self.titleBar.returnButton.hide()
 
@@ -1023,9 +1116,9 @@ class MainWindow(FramelessWindow):
                 index, True, isShowNextWidgetDirectly, 200, QEasingCurve.InCubic)
             self.navigationInterface.setCurrentIndex(index)
             # 更新标题栏图标颜色
-            whiteIndexes = [self.subStackWidget.indexOf(
-                i) for i in [self.playlistInterface, self.albumInterface, self.singerInterface]]
-            self.titleBar.setWhiteIcon(index in whiteIndexes)
+            isWhite = self.isInterface(self.subStackWidget.widget(
+                index), "playlistInterface", "albumInterface", "singerInterface")
+            self.titleBar.setWhiteIcon(isWhite)
             self.titleBar.returnButton.setWhiteIcon(False)
 
         self.hidePlayingInterface()
@@ -1042,48 +1135,51 @@ class MainWindow(FramelessWindow):
         """ 编辑歌曲卡完成信号的槽函数 """
         self.mediaPlaylist.updateOneSongInfo(newSongInfo)
         self.playingInterface.updateOneSongCard(newSongInfo)
-        self.playlistCardInterface.updateOneSongInfo(newSongInfo)
-        self.smallestPlayInterface.updateOneSongInfo(newSongInfo)
+        self.updatePlaylistSongInfos([newSongInfo])
         self.myMusicInterface.updateOneSongInfo(oldSongInfo, newSongInfo)
-        self.playlistInterface.updateOneSongCard(oldSongInfo, newSongInfo)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.updateOneSongInfo(newSongInfo)
+        if self.isInterfaceLoaded("playlistInterface"):
+            self.playlistInterface.updateOneSongCard(oldSongInfo, newSongInfo)
+
+    def updatePlaylistSongInfos(self, newSongInfo_list: list):
+        """ 更新自定义播放列表中的歌曲信息，播放列表界面还没有创建时只更新播放列表库 """
+        if self.isInterfaceLoaded("playlistCardInterface"):
+            self.playlistCardInterface.updateMultiSongInfo(newSongInfo_list)
+        else:
+            playlistStore.saveSongInfos(
+                playlistStore.updateSongInfos(newSongInfo_list))
 
     def onEditAlbumInfo(self, oldAlbumInfo: dict, newAlbumInfo: dict, coverPath: str):
         """ 更新专辑卡及其对应的歌曲卡信息 """
         newSongInfo_list = newAlbumInfo["songInfo_list"]
         self.mediaPlaylist.updateMultiSongInfo(newSongInfo_list)
         self.playingInterface.updateMultiSongCards(newSongInfo_list)
-        self.playlistInterface.updateMultiSongCards(newSongInfo_list)
-        self.smallestPlayInterface.updateMultiSongInfo(newSongInfo_list)
-        self.playlistCardInterface.updateMultiSongInfo(newSongInfo_list)
+        self.updatePlaylistSongInfos(newSongInfo_list)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.updateMultiSongInfo(newSongInfo_list)
+        if self.isInterfaceLoaded("playlistInterface"):
+            self.playlistInterface.updateMultiSongCards(newSongInfo_list)
         self.songTabSongListWidget.updateMultiSongCards(newSongInfo_list)
+        self.myMusicInterface.syncSongInfos(
+            oldAlbumInfo["songInfo_list"], newSongInfo_list)
 
-        if self.sender() is self.albumInterface:
+        if self.isInterface(self.sender(), "albumInterface"):
             self.albumCardInterface.updateOneAlbumInfo(
                 oldAlbumInfo, newAlbumInfo, coverPath)
-            self.myMusicInterface.singerInfoReader.updateSingerInfos(
-                self.albumCardInterface.albumInfo_list)
             if not self.albumInterface.songInfo_list:
                 self.titleBar.returnButton.click()
 
         elif self.sender() is self.albumCardInterface:
-            self.myMusicInterface.singerInfoReader.updateSingerInfos(
-                self.albumCardInterface.albumInfo_list)
-            if oldAlbumInfo == self.albumInterface.albumInfo:
+            if self.isInterfaceLoaded("albumInterface") and oldAlbumInfo == self.albumInterface.albumInfo:
                 self.albumInterface.albumInfoBar.updateWindow(newAlbumInfo)
 
-        elif self.sender() is self.singerInterface:
+        elif self.isInterface(self.sender(), "singerInterface"):
             self.albumCardInterface.updateOneAlbumInfo(
                 oldAlbumInfo, newAlbumInfo, coverPath)
-            self.myMusicInterface.singerInfoReader.updateSingerInfos(
-                self.albumCardInterface.albumInfo_list)
             self.singerInterface.updateWindow(
                 self.myMusicInterface.findSingerInfo(newAlbumInfo['singer']))
 
-        self.myMusicInterface.songInfoReader.songInfo_list = deepcopy(
-            self.songTabSongListWidget.songInfo_list)
-        self.myMusicInterface.albumInfoReader.albumInfo_list = deepcopy(
-            self.albumCardInterface.albumInfo_list)
-
     def showSmallestPlayInterface(self):
         """ 切换到最小化播放模式 """
         self.smallestPlayInterface.setCurrentIndex(
@@ -1110,12 +1206,13 @@ class MainWindow(FramelessWindow):
     def setPlaylist(self, playlist: list, index=0):
         """ 设置播放列表 """
         self.playingInterface.setPlaylist(playlist, index=index)
-        self.smallestPlayInterface.setPlaylist(playlist)
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.setPlaylist(playlist)
         self.mediaPlaylist.setPlaylist(playlist, index)
         self.play()
 
     def showEvent(self, e):
-        if hasattr(self, 'smallestPlayInterface'):
+        if self.isInterfaceLoaded("smallestPlayInterface"):
             self.smallestPlayInterface.hide()
         super().showEvent(e)
 
@@ -1125,11 +1222,14 @@ class MainWindow(FramelessWindow):
             return
 
         self.myMusicInterface.exitSelectionMode()
-        self.albumInterface.exitSelectionMode()
-        self.playlistCardInterface.exitSelectionMode()
-        self.playlistInterface.exitSelectionMode()
         self.playingInterface.exitSelectionMode()
-        self.singerInterface.exitSelectionMode()
+
+        # 还没有创建的界面不可能处于选择模式
+        names = ["albumInterface", "playlistCardInterface",
+                 "playlistInterface", "singerInterface"]
+        for name in names:
+            if self.isInterfaceLoaded(name):
+                getattr(self, name).exitSelectionMode()
 
     def showCreatePlaylistDialog(self, songInfo_list: list = None):
         """ 显示创建播放列表面板 """
@@ -1150,10 +1250,10 @@ class MainWindow(FramelessWindow):
     def onDeleteCustomPlaylist(self, playlistName: str):
         """ 删除自定义播放列表槽函数 """
         self.navigationInterface.updateWindow()
-        if self.sender() is self.playlistInterface:
+        if self.isInterface(self.sender(), "playlistInterface"):
             self.playlistCardInterface.deleteOnePlaylistCard(playlistName)
             self.titleBar.returnButton.click()
-        elif self.sender() is self.searchResultInterface:
+        elif self.isInterface(self.sender(), "searchResultInterface"):
             self.playlistCardInterface.deleteOnePlaylistCard(playlistName)
 
     def playCustomPlaylist(self, songInfo_list: list, index=0):
@@ -1167,13 +1267,13 @@ class MainWindow(FramelessWindow):
             songInfo_list.clear()
             songInfo_list.extend(differentSongInfo_list)
 
-        songInfo_list = deepcopy(songInfo_list)
+        songInfo_list = songInfo_list.copy()
 
         # 找出新的歌曲
         oldPlaylist = self.playlistCardInterface.playlists[playlistName]
-        oldSongInfo_list = oldPlaylist.get("songInfo_list", [])
+        oldSongPaths = set(oldPlaylist["songPaths"])
         differentSongInfo_list = [
-            i for i in songInfo_list if i not in oldSongInfo_list]
+            i for i in songInfo_list if i["songPath"] not in oldSongPaths]
 
         planToAddNum = len(songInfo_list)
         repeatNum = planToAddNum-len(differentSongInfo_list)
@@ -1220,12 +1320,32 @@ class MainWindow(FramelessWindow):
             self.mediaPlaylist.getCurrentSong())
         w.setState(True)
 
+    def onSongFoldersChanged(self, folderPaths: list):
+        """ 歌曲文件夹变化槽函数，只更新发生变化的文件夹中的歌曲 """
+        if self.isInSelectionMode:
+            self.libraryWatcher.addChangedFolders(folderPaths)
+            return
+
+        if self.myMusicInterface.updateSongFolders(folderPaths):
+            self.songTabSongListWidget.setPlayBySongInfo(
+                self.mediaPlaylist.getCurrentSong())
+
+    def onLibrarySyncUpdated(self):
+        """ 后台同步更新了歌曲信息槽函数 """
+        self.songTabSongListWidget.setPlayBySongInfo(
+            self.mediaPlaylist.getCurrentSong())
+        self.setPlayButtonEnabled(
+            len(self.songTabSongListWidget.songInfo_list) > 0)
+
     def deleteSongs(self, songPaths: list):
         """ 删除歌曲 """
-        self.playlistCardInterface.deleteSongs(songPaths)
-        if self.sender() in [self.searchResultInterface, self.singerInterface]:
+        if self.isInterfaceLoaded("playlistCardInterface"):
+            self.playlistCardInterface.deleteSongs(songPaths)
+        else:
+            playlistStore.deleteSongs(songPaths)
+        if self.isInterface(self.sender(), "searchResultInterface", "singerInterface"):
             self.myMusicInterface.deleteSongs(songPaths)
-            if self.sender() is self.singerInterface and not self.singerInterface.albumInfo_list:
+            if self.isInterface(self.sender(), "singerInterface") and not self.singerInterface.albumInfo_list:
                 self.titleBar.returnButton.click()
 
         # 歌曲移动到回收站
@@ -1278,6 +1398,12 @@ class MainWindow(FramelessWindow):
 
         self.settingInterface.updateConfig(config)
         self.mediaPlaylist.save()
+        self.myMusicInterface.stopLibrarySync()
+        self.myMusicInterface.stopBuildSearchIndex()
+        self.lyricPrefetchThread.stop()
+        if self.isInterfaceLoaded("searchResultInterface"):
+            self.searchResultInterface.stopOnlineSearch()
+
         qApp.exit()
 
     def getOnlineSongUrl(self, index: int):
@@ -1289,9 +1415,6 @@ class MainWindow(FramelessWindow):
         if songInfo['songPath'] != CrawlerBase.song_url_mark:
             return
 
-        i = self.searchResultInterface.onlineSongInfo_list.index(songInfo)
-        songCard = self.searchResultInterface.onlineSongListWidget.songCard_list[i]
-
         # 获取封面和播放地址
         eventLoop = QEventLoop(self)
         self.getOnlineSongUrlThread.finished.connect(eventLoop.quit)
@@ -1300,17 +1423,31 @@ class MainWindow(FramelessWindow):
         self.getOnlineSongUrlThread.start()
         eventLoop.exec()
 
+        # 边输入边搜索时，获取播放地址期间在线音乐列表可能已经被新的搜索结果替换
+        onlineSongInfo_list = self.searchResultInterface.onlineSongInfo_list
+        i = onlineSongInfo_list.index(
+            songInfo) if songInfo in onlineSongInfo_list else -1
+
         # TODO：更优雅地更新在线媒体
         songInfo['songPath'] = self.getOnlineSongUrlThread.playUrl
         songInfo['coverPath'] = self.getOnlineSongUrlThread.coverPath
-        songCard.setSongInfo(songInfo)
+        if i >= 0:
+            onlineSongInfo_list[i] = songInfo
+            self.searchResultInterface.onlineSongListWidget.songCard_list[i].setSongInfo(
+                songInfo)
+
         self.mediaPlaylist.insertSong(index, songInfo)
         self.playingInterface.playlist[index] = songInfo
-        self.smallestPlayInterface.playlist[index] = songInfo
-        self.searchResultInterface.onlineSongInfo_list[i] = songInfo
+        if self.isInterfaceLoaded("smallestPlayInterface"):
+            self.smallestPlayInterface.playlist[index] = songInfo
         self.mediaPlaylist.removeOnlineSong(index+1)
         self.mediaPlaylist.setCurrentIndex(index)
 
+    def prefetchLyrics(self):
+        """ 当前歌曲的歌词获取完成之后，在后台预取播放队列中接下来几首歌的歌词 """
+        self.lyricPrefetchThread.prefetch(self.mediaPlaylist.getUpcomingSongs(
+            self.lyricPrefetchThread.prefetchNum))
+
     def onMinimizeToTrayChanged(self, isMinimize: bool):
         """ 最小化到托盘改变槽函数 """
         QApplication.setQuitOnLastWindowClosed(not isMinimize)
@@ -1323,6 +1460,225 @@ class MainWindow(FramelessWindow):
         t = self.player.position()
         self.playingInterface.lyricWidget.setCurrentTime(t)
 
+    def createPlaylistCardInterface(self):
+        """ 创建播放列表卡界面 """
+        self.playlistCardInterface = PlaylistCardInterface(self.subMainWindow)
+
+        # 将信号连接到槽函数
+        self.playlistCardInterface.selectionModeStateChanged.connect(
+            self.onSelectionModeStateChanged)
+        self.playlistCardInterface.createPlaylistSig.connect(
+            self.showCreatePlaylistDialog)
+        self.playlistCardInterface.renamePlaylistSig.connect(
+            self.onRenamePlaylist)
+        self.playlistCardInterface.deletePlaylistSig.connect(
+            self.onDeleteCustomPlaylist)
+        self.playlistCardInterface.playSig.connect(self.playCustomPlaylist)
+        self.playlistCardInterface.nextToPlaySig.connect(
+            self.onMultiSongsNextPlay)
+        self.playlistCardInterface.switchToPlaylistInterfaceSig.connect(
+            self.switchToPlaylistInterface)
+        self.playlistCardInterface.addSongsToCustomPlaylistSig.connect(
+            self.addSongsToCustomPlaylist)
+        self.playlistCardInterface.addSongsToNewCustomPlaylistSig.connect(
+            self.showCreatePlaylistDialog)
+        self.playlistCardInterface.addSongsToPlayingPlaylistSig.connect(
+            self.addSongsToPlayingPlaylist)
+        return self.playlistCardInterface
+
+    def createAlbumInterface(self):
+        """ 创建专辑界面 """
+        self.albumInterface = AlbumInterface(parent=self.subMainWindow)
+
+        # 将信号连接到槽函数
+        self.albumInterface.playAlbumSignal.connect(self.playAlbum)
+        self.albumInterface.playOneSongCardSig.connect(self.playOneSongCard)
+        self.albumInterface.editSongInfoSignal.connect(self.onEditSongInfo)
+        self.albumInterface.editAlbumInfoSignal.connect(self.onEditAlbumInfo)
+        self.albumInterface.songCardPlaySig.connect(
+            self.onAlbumInterfaceSongCardPlay)
+        self.albumInterface.nextToPlayOneSongSig.connect(
+            self.onSongCardNextPlay)
+        self.albumInterface.addOneSongToPlayingSig.connect(
+            self.addOneSongToPlayingPlaylist)
+        self.albumInterface.addSongsToPlayingPlaylistSig.connect(
+            self.addSongsToPlayingPlaylist)
+        self.albumInterface.selectionModeStateChanged.connect(
+            self.onSelectionModeStateChanged)
+        self.albumInterface.playCheckedCardsSig.connect(self.playCheckedCards)
+        self.albumInterface.nextToPlayCheckedCardsSig.connect(
+            self.onMultiSongsNextPlay)
+        self.albumInterface.addSongsToCustomPlaylistSig.connect(
+            self.addSongsToCustomPlaylist)
+        self.albumInterface.addSongsToNewCustomPlaylistSig.connect(
+            self.showCreatePlaylistDialog)
+        self.albumInterface.switchToSingerInterfaceSig.connect(
+            self.switchToSingerInterface)
+        return self.albumInterface
+
+    def createSingerInterface(self):
+        """ 创建歌手界面 """
+        self.singerInterface = SingerInterface(parent=self.subMainWindow)
+
+        # 将信号连接到槽函数
+        self.singerInterface.playSig.connect(self.playCustomPlaylist)
+        self.singerInterface.deleteAlbumSig.connect(self.deleteSongs)
+        self.singerInterface.nextToPlaySig.connect(self.onMultiSongsNextPlay)
+        self.singerInterface.editAlbumInfoSignal.connect(self.onEditAlbumInfo)
+        self.singerInterface.switchToAlbumInterfaceSig.connect(
+            self.switchToAlbumInterface)
+        self.singerInterface.addSongsToPlayingPlaylistSig.connect(
+            self.addSongsToPlayingPlaylist)
+        self.singerInterface.addSongsToNewCustomPlaylistSig.connect(
+            self.showCreatePlaylistDialog)
+        self.singerInterface.addSongsToCustomPlaylistSig.connect(
+            self.addSongsToCustomPlaylist)
+        self.singerInterface.selectionModeStateChanged.connect(
+            self.onSelectionModeStateChanged)
+        return self.singerInterface
+
+    def createPlaylistInterface(self):
+        """ 创建播放列表界面 """
+        self.playlistInterface = PlaylistInterface({}, self.subMainWindow)
+
+        # 将信号连接到槽函数
+        self.playlistInterface.playAllSig.connect(self.playCustomPlaylist)
+        self.playlistInterface.editSongInfoSignal.connect(self.onEditSongInfo)
+        self.playlistInterface.playOneSongCardSig.connect(self.playOneSongCard)
+        self.playlistInterface.deletePlaylistSig.connect(
+            self.onDeleteCustomPlaylist)
+        self.playlistInterface.playCheckedCardsSig.connect(
+            self.playCustomPlaylist)
+        self.playlistInterface.songCardPlaySig.connect(
+            self.onPlaylistInterfaceSongCardPlay)
+        self.playlistInterface.addSongsToPlayingPlaylistSig.connect(
+            self.addSongsToPlayingPlaylist)
+        self.playlistInterface.addSongsToNewCustomPlaylistSig.connect(
+            self.showCreatePlaylistDialog)
+        self.playlistInterface.addSongsToCustomPlaylistSig.connect(
+            self.addSongsToCustomPlaylist)
+        self.playlistInterface.nextToPlayOneSongSig.connect(
+            self.onSongCardNextPlay)
+        self.playlistInterface.nextToPlayCheckedCardsSig.connect(
+            self.onMultiSongsNextPlay)
+        self.playlistInterface.addOneSongToPlayingSig.connect(
+            self.addOneSongToPlayingPlaylist)
+        self.playlistInterface.selectionModeStateChanged.connect(
+            self.onSelectionModeStateChanged)
+        self.playlistInterface.switchToAlbumInterfaceSig.connect(
+            self.switchToAlbumInterface)
+        self.playlistInterface.renamePlaylistSig.connect(
+            self.onRenamePlaylist)
+        self.playlistInterface.removeSongSig.connect(
+            self.playlistCardInterface.updateOnePlaylist)
+        self.playlistInterface.switchToAlbumCardInterfaceSig.connect(
+            self.switchToAlbumCardInterface)
+        self.playlistInterface.switchToSingerInterfaceSig.connect(
+            self.switchToSingerInterface)
+        return self.playlistInterface
+
+    def createLabelNavigationInterface(self):
+        """ 创建标签导航界面 """
+        self.labelNavigationInterface = LabelNavigationInterface(
+            self.subMainWindow)
+
+        # 将信号连接到槽函数
+        self.labelNavigationInterface.labelClicked.connect(
+            self.onNavigationLabelClicked)
+        return self.labelNavigationInterface
+
+    def createSearchResultInterface(self):
+        """ 创建搜索结果界面 """
+        pageSize = self.settingInterface.config['online-music-page-size']
+        quality = self.settingInterface.config['online-play-quality']
+        folder = self.settingInterface.config['download-folder']
+        self.searchResultInterface = SearchResultInterface(
+            pageSize, quality, folder, self.subMainWindow)
+
+        # 将信号连接到槽函数
+        self.searchResultInterface.playAlbumSig.connect(self.playAlbum)
+        self.searchResultInterface.deleteAlbumSig.connect(self.deleteSongs)
+        self.searchResultInterface.playLocalSongSig.connect(
+            self.playLocalSearchedSongs)
+        self.searchResultInterface.playOnlineSongSig.connect(
+            self.playOnlineSearchedSongs)
+        self.searchResultInterface.deletePlaylistSig.connect(
+            self.onDeleteCustomPlaylist)
+        self.searchResultInterface.playPlaylistSig.connect(
+            self.playCustomPlaylist)
+        self.searchResultInterface.nextToPlaySig.connect(
+            self.onMultiSongsNextPlay)
+        self.searchResultInterface.playOneSongCardSig.connect(
+            self.playOneSongCard)
+        self.searchResultInterface.renamePlaylistSig.connect(
+            self.onRenamePlaylist)
+        self.searchResultInterface.switchToSingerInterfaceSig.connect(
+            self.switchToSingerInterface)
+        self.searchResultInterface.switchToAlbumInterfaceSig.connect(
+            self.switchToAlbumInterface)
+        self.searchResultInterface.switchToPlaylistInterfaceSig.connect(
+            self.switchToPlaylistInterface)
+        self.searchResultInterface.addSongsToPlayingPlaylistSig.connect(
+            self.addSongsToPlayingPlaylist)
+        self.searchResultInterface.addSongsToNewCustomPlaylistSig.connect(
+            self.showCreatePlaylistDialog)
+        self.searchResultInterface.addSongsToCustomPlaylistSig.connect(
+            self.addSongsToCustomPlaylist)
+        self.searchResultInterface.deleteSongSig.connect(
+            lambda songPath: self.deleteSongs([songPath]))
+        self.searchResultInterface.downloadFinished.connect(
+            self.onDownloadFinished)
+
+        # 将设置界面的在线音乐设置同步到搜索结果界面
+        self.settingInterface.downloadFolderChanged.connect(
+            self.searchResultInterface.setDownloadFolder)
+        self.settingInterface.onlinePlayQualityChanged.connect(
+            self.searchResultInterface.setOnlinePlayQuality)
+        self.settingInterface.pageSizeChanged.connect(
+            self.searchResultInterface.setOnlineMusicPageSize)
+        return self.searchResultInterface
+
+    def createVideoWindow(self):
+        """ 创建视频界面 """
+        self.videoWindow = VideoWindow(self)
+        self.videoWindow.hide()
+
+        # 将信号连接到槽函数
+        self.videoWindow.fullScreenChanged.connect(self.setVideoFullScreen)
+        return self.videoWindow
+
+    def createSmallestPlayInterface(self):
+        """ 创建最小播放界面，并同步当前的播放状态 """
+        self.smallestPlayInterface = SmallestPlayInterface(
+            self.mediaPlaylist.playlist, parent=self)
+        self.smallestPlayInterface.setCurrentIndex(
+            self.mediaPlaylist.currentIndex())
+        self.smallestPlayInterface.setPlay(
+            self.player.state() == QMediaPlayer.PlayingState)
+        self.smallestPlayInterface.progressBar.setRange(
+            0, max(self.player.duration(), 0))
+        self.smallestPlayInterface.progressBar.setValue(self.player.position())
+
+        isEnabled = bool(self.mediaPlaylist.playlist)
+        self.smallestPlayInterface.playButton.setEnabled(isEnabled)
+        self.smallestPlayInterface.lastSongButton.setEnabled(isEnabled)
+        self.smallestPlayInterface.nextSongButton.setEnabled(isEnabled)
+
+        # 在去除任务栏的显示区域的右上角显示
+        desktop = QApplication.desktop().availableGeometry()
+        self.smallestPlayInterface.move(desktop.width() - 390, 40)
+
+        # 将信号连接到槽函数
+        self.smallestPlayInterface.nextSongSig.connect(self.mediaPlaylist.next)
+        self.smallestPlayInterface.lastSongSig.connect(
+            self.mediaPlaylist.previous)
+        self.smallestPlayInterface.togglePlayStateSig.connect(
+            self.togglePlayState)
+        self.smallestPlayInterface.exitSmallestPlayInterfaceSig.connect(
+            self.exitSmallestPlayInterface)
+        return self.smallestPlayInterface
+
+    @startupTracer.traced()
     def connectSignalToSlot(self):
         """ 将信号连接到槽 """
 
@@ -1337,17 +1693,13 @@ class MainWindow(FramelessWindow):
 
         # 将设置界面信号连接到槽函数
         self.settingInterface.crawlComplete.connect(
-            self.myMusicInterface.rescanSongInfo)
+            lambda: self.myMusicInterface.rescanSongInfo(True))
         self.settingInterface.acrylicEnableChanged.connect(
             self.setWindowEffect)
         self.settingInterface.selectedMusicFoldersChanged.connect(
             self.myMusicInterface.scanTargetPathSongInfo)
-        self.settingInterface.downloadFolderChanged.connect(
-            self.searchResultInterface.setDownloadFolder)
-        self.settingInterface.onlinePlayQualityChanged.connect(
-            self.searchResultInterface.setOnlinePlayQuality)
-        self.settingInterface.pageSizeChanged.connect(
-            self.searchResultInterface.setOnlineMusicPageSize)
+        self.settingInterface.selectedMusicFoldersChanged.connect(
+            self.libraryWatcher.setFolderPaths)
         self.settingInterface.mvQualityChanged.connect(
             self.playingInterface.getMvUrlThread.setVideoQuality)
         self.settingInterface.minimizeToTrayChanged.connect(
@@ -1430,6 +1782,8 @@ class MainWindow(FramelessWindow):
             self.onSelectionModeStateChanged)
         self.playingInterface.switchToVideoInterfaceSig.connect(
             self.showVideoWindow)
+        self.playingInterface.getLyricThread.crawlFinished.connect(
+            self.prefetchLyrics)
 
         # 将歌曲界面歌曲卡列表视图的信号连接到槽函数
         self.songTabSongListWidget.playSignal.connect(
@@ -1476,155 +1830,13 @@ class MainWindow(FramelessWindow):
             self.addSongsToPlayingPlaylist)
         self.myMusicInterface.showLabelNavigationInterfaceSig.connect(
             self.showLabelNavigationInterface)
+        self.myMusicInterface.librarySyncUpdated.connect(
+            self.onLibrarySyncUpdated)
 
         # 将定时器信号连接到槽函数
         self.rescanSongInfoTimer.timeout.connect(self.onRescanSongInfoTimeOut)
         self.updateLyricPosTimer.timeout.connect(self.onUpdateLyricPosTimeOut)
 
-        # 将专辑界面的信号连接到槽函数
-        self.albumInterface.playAlbumSignal.connect(self.playAlbum)
-        self.albumInterface.playOneSongCardSig.connect(self.playOneSongCard)
-        self.albumInterface.editSongInfoSignal.connect(self.onEditSongInfo)
-        self.albumInterface.editAlbumInfoSignal.connect(self.onEditAlbumInfo)
-        self.albumInterface.songCardPlaySig.connect(
-            self.onAlbumInterfaceSongCardPlay)
-        self.albumInterface.nextToPlayOneSongSig.connect(
-            self.onSongCardNextPlay)
-        self.albumInterface.addOneSongToPlayingSig.connect(
-            self.addOneSongToPlayingPlaylist)
-        self.albumInterface.addSongsToPlayingPlaylistSig.connect(
-            self.addSongsToPlayingPlaylist)
-        self.albumInterface.selectionModeStateChanged.connect(
-            self.onSelectionModeStateChanged)
-        self.albumInterface.playCheckedCardsSig.connect(self.playCheckedCards)
-        self.albumInterface.nextToPlayCheckedCardsSig.connect(
-            self.onMultiSongsNextPlay)
-        self.albumInterface.addSongsToCustomPlaylistSig.connect(
-            self.addSongsToCustomPlaylist)
-        self.albumInterface.addSongsToNewCustomPlaylistSig.connect(
-            self.showCreatePlaylistDialog)
-        self.albumInterface.switchToSingerInterfaceSig.connect(
-            self.switchToSingerInterface)
-
-        # 将播放界面信号连接到槽函数
-        self.playlistInterface.playAllSig.connect(self.playCustomPlaylist)
-        self.playlistInterface.editSongInfoSignal.connect(self.onEditSongInfo)
-        self.playlistInterface.playOneSongCardSig.connect(self.playOneSongCard)
-        self.playlistInterface.deletePlaylistSig.connect(
-            self.onDeleteCustomPlaylist)
-        self.playlistInterface.playCheckedCardsSig.connect(
-            self.playCustomPlaylist)
-        self.playlistInterface.songCardPlaySig.connect(
-            self.onPlaylistInterfaceSongCardPlay)
-        self.playlistInterface.addSongsToPlayingPlaylistSig.connect(
-            self.addSongsToPlayingPlaylist)
-        self.playlistInterface.addSongsToNewCustomPlaylistSig.connect(
-            self.showCreatePlaylistDialog)
-        self.playlistInterface.addSongsToCustomPlaylistSig.connect(
-            self.addSongsToCustomPlaylist)
-        self.playlistInterface.nextToPlayOneSongSig.connect(
-            self.onSongCardNextPlay)
-        self.playlistInterface.nextToPlayCheckedCardsSig.connect(
-            self.onMultiSongsNextPlay)
-        self.playlistInterface.addOneSongToPlayingSig.connect(
-            self.addOneSongToPlayingPlaylist)
-        self.playlistInterface.selectionModeStateChanged.connect(
-            self.onSelectionModeStateChanged)
-        self.playlistInterface.switchToAlbumInterfaceSig.connect(
-            self.switchToAlbumInterface)
-        self.playlistInterface.renamePlaylistSig.connect(
-            self.onRenamePlaylist)
-        self.playlistInterface.removeSongSig.connect(
-            self.playlistCardInterface.updateOnePlaylist)
-        self.playlistInterface.switchToAlbumCardInterfaceSig.connect(
-            self.switchToAlbumCardInterface)
-        self.playlistInterface.switchToSingerInterfaceSig.connect(
-            self.switchToSingerInterface)
-
-        # 将播放列表卡界面信号连接到槽函数
-        self.playlistCardInterface.selectionModeStateChanged.connect(
-            self.onSelectionModeStateChanged)
-        self.playlistCardInterface.createPlaylistSig.connect(
-            self.showCreatePlaylistDialog)
-        self.playlistCardInterface.renamePlaylistSig.connect(
-            self.onRenamePlaylist)
-        self.playlistCardInterface.deletePlaylistSig.connect(
-            self.onDeleteCustomPlaylist)
-        self.playlistCardInterface.playSig.connect(self.playCustomPlaylist)
-        self.playlistCardInterface.nextToPlaySig.connect(
-            self.onMultiSongsNextPlay)
-        self.playlistCardInterface.switchToPlaylistInterfaceSig.connect(
-            self.switchToPlaylistInterface)
-        self.playlistCardInterface.addSongsToCustomPlaylistSig.connect(
-            self.addSongsToCustomPlaylist)
-        self.playlistCardInterface.addSongsToNewCustomPlaylistSig.connect(
-            self.showCreatePlaylistDialog)
-        self.playlistCardInterface.addSongsToPlayingPlaylistSig.connect(
-            self.addSongsToPlayingPlaylist)
-
-        # 将最小播放界面连接到槽函数
-        self.smallestPlayInterface.nextSongSig.connect(self.mediaPlaylist.next)
-        self.smallestPlayInterface.lastSongSig.connect(
-            self.mediaPlaylist.previous)
-        self.smallestPlayInterface.togglePlayStateSig.connect(
-            self.togglePlayState)
-        self.smallestPlayInterface.exitSmallestPlayInterfaceSig.connect(
-            self.exitSmallestPlayInterface)
-
-        # 将标签导航界面的信号连接到槽函数
-        self.labelNavigationInterface.labelClicked.connect(
-            self.onNavigationLabelClicked)
-
-        # 将搜索结果界面信号连接到槽函数
-        self.searchResultInterface.playAlbumSig.connect(self.playAlbum)
-        self.searchResultInterface.deleteAlbumSig.connect(self.deleteSongs)
-        self.searchResultInterface.playLocalSongSig.connect(
-            self.playLocalSearchedSongs)
-        self.searchResultInterface.playOnlineSongSig.connect(
-            self.playOnlineSearchedSongs)
-        self.searchResultInterface.deletePlaylistSig.connect(
-            self.onDeleteCustomPlaylist)
-        self.searchResultInterface.playPlaylistSig.connect(
-            self.playCustomPlaylist)
-        self.searchResultInterface.nextToPlaySig.connect(
-            self.onMultiSongsNextPlay)
-        self.searchResultInterface.playOneSongCardSig.connect(
-            self.playOneSongCard)
-        self.searchResultInterface.renamePlaylistSig.connect(
-            self.onRenamePlaylist)
-        self.searchResultInterface.switchToSingerInterfaceSig.connect(
-            self.switchToSingerInterface)
-        self.searchResultInterface.switchToAlbumInterfaceSig.connect(
-            self.switchToAlbumInterface)
-        self.searchResultInterface.switchToPlaylistInterfaceSig.connect(
-            self.switchToPlaylistInterface)
-        self.searchResultInterface.addSongsToPlayingPlaylistSig.connect(
-            self.addSongsToPlayingPlaylist)
-        self.searchResultInterface.addSongsToNewCustomPlaylistSig.connect(
-            self.showCreatePlaylistDialog)
-        self.searchResultInterface.addSongsToCustomPlaylistSig.connect(
-            self.addSongsToCustomPlaylist)
-        self.searchResultInterface.deleteSongSig.connect(
-            lambda songPath: self.deleteSongs([songPath]))
-        self.searchResultInterface.downloadFinished.connect(
-            self.onDownloadFinished)
-
-        # 将歌手界面信号连接到槽函数
-        self.singerInterface.playSig.connect(self.playCustomPlaylist)
-        self.singerInterface.deleteAlbumSig.connect(self.deleteSongs)
-        self.singerInterface.nextToPlaySig.connect(self.onMultiSongsNextPlay)
-        self.singerInterface.editAlbumInfoSignal.connect(self.onEditAlbumInfo)
-        self.singerInterface.switchToAlbumInterfaceSig.connect(
-            self.switchToAlbumInterface)
-        self.singerInterface.addSongsToPlayingPlaylistSig.connect(
-            self.addSongsToPlayingPlaylist)
-        self.singerInterface.addSongsToNewCustomPlaylistSig.connect(
-            self.showCreatePlaylistDialog)
-        self.singerInterface.addSongsToCustomPlaylistSig.connect(
-            self.addSongsToCustomPlaylist)
-        self.singerInterface.selectionModeStateChanged.connect(
-            self.onSelectionModeStateChanged)
-
         # 将系统托盘图标信号连接到槽函数
         qApp.aboutToQuit.connect(self.systemTrayIcon.hide)
         self.systemTrayIcon.exitSignal.connect(self.onExit)
@@ -1637,9 +1849,6 @@ class MainWindow(FramelessWindow):
         self.systemTrayIcon.showPlayingInterfaceSig.connect(
             self.showPlayingInterface)
 
-        # 将视频界面信号连接到槽函数
-        self.videoWindow.fullScreenChanged.connect(self.setVideoFullScreen)
-
 
 class SplashScreen(QWidget):
     """ 启动界面 """
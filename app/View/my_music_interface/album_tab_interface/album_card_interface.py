@@ -1,24 +1,27 @@
 # coding:utf-8
-from copy import deepcopy
+from bisect import bisect_left, bisect_right
 from typing import Dict, List
 
 import pinyin
-from common.meta_data import AlbumCoverReader
+from common.meta_data import AlbumCoverReader, AlbumInfoReader
 from common.os_utils import getCoverPath
 from common.thread.save_album_info_thread import SaveAlbumInfoThread
 from components.album_card import AlbumBlurBackground, AlbumCard
 from components.dialog_box.album_info_edit_dialog import AlbumInfoEditDialog
 from components.dialog_box.message_dialog import MessageDialog
 from components.widgets.group_box import GroupBox
-from components.layout.grid_layout import GridLayout
 from components.widgets.scroll_area import ScrollArea
 from PyQt5.QtCore import (QFile, QParallelAnimationGroup, QPoint,
                           QPropertyAnimation, Qt, pyqtSignal)
-from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+from PyQt5.QtWidgets import QApplication, QLabel, QWidget
 
 
 class AlbumCardInterface(ScrollArea):
-    """ 定义一个专辑卡视图 """
+    """ 定义一个专辑卡视图
+
+    专辑卡网格是虚拟的：所有专辑卡和分组标题的位置都通过计算得到，
+    只有和视口 (加上上下各一行的余量) 相交的专辑卡才会被创建出来，滚动时循环使用这些专辑卡
+    """
 
     playSignal = pyqtSignal(list)                               # 播放专辑
     deleteAlbumSig = pyqtSignal(list)                           # 删除(多张)专辑
@@ -35,19 +38,35 @@ class AlbumCardInterface(ScrollArea):
     addAlbumToCustomPlaylistSig = pyqtSignal(str, list)         # 专辑添加到已存在的播放列表
     showLabelNavigationInterfaceSig = pyqtSignal(list, str)     # 显示标签导航界面
 
+    # 虚拟网格的尺寸
+    cardWidth = 210
+    cardHeight = 290
+    horizontalSpacing = 10
+    verticalSpacing = 20
+    columnWidth = cardWidth + horizontalSpacing
+    rowHeight = cardHeight + verticalSpacing
+    leftMargin = 10
+    topMargin = 245             # 顶部留出工具栏的位置
+    bottomMargin = 120
+    gridPadding = 9             # 网格和分组边缘的距离
+    groupTitleHeight = 30
+    groupSpacing = 30
+    overscan = rowHeight        # 视口上下额外创建专辑卡的范围
+
     def __init__(self, albumInfo_list: list, parent=None):
         super().__init__(parent)
         self.albumInfo_list = albumInfo_list
         # 初始化网格的列数
         self.columnNum = 1
-        self.albumCard_list = []  # type:List[AlbumCard]
         self.albumCardInfo_list = []
-        self.checkedAlbumCard_list = []  # type:List[AlbumCard]
-        self.currentGroupInfo_list = []
-        self.groupTitle_dict = {}  # 记录首字母或年份及其对应的第一个分组
-        # 由键值对 "albumName.singer":albumCard组成的字典，albumInfo 是引用
-        self.albumSinger2AlbumCard_dict = {}  # type:Dict[str, AlbumCard]
+        self.groupInfo_list = []    # 当前排序方式下的分组，元素为 `{"title", "albumInfo_list"}`
+        self.groupTitle_dict = {}   # 记录首字母或年份及其对应的第一个分组的序号
+        # 由键值对 "albumName.singer":albumInfo 组成的字典，albumInfo 是引用
         self.albumSinger2AlbumInfo_dict = {}  # type:Dict[str, dict]
+        # 已经创建出来并且显示在视口中的专辑卡
+        self.albumSinger2AlbumCard_dict = {}  # type:Dict[str, AlbumCard]
+        # 按照选中顺序排列的选中专辑
+        self.checkedAlbumInfo_dict = {}  # type:Dict[str, dict]
         # 初始化标志位
         self.isInSelectionMode = False
         self.isAllAlbumCardsChecked = False
@@ -61,17 +80,30 @@ class AlbumCardInterface(ScrollArea):
         }
         # 分组标签列表
         self.groupTitle_list = []
-        # 实例化滚动部件的竖直布局
-        self.scrollWidgetVBoxLayout = QVBoxLayout()
+        # 虚拟网格中每张专辑卡的位置 `(专辑信息, x, y)` 和每个分组标题的位置 `(标题, y)`
+        self.__cardPos_list = []
+        self.__cardY_list = []
+        self.__groupPos_list = []
+        self.__groupY_list = []
+        # 创建过的所有专辑卡和分组框，不可见的会被回收利用
+        self.__albumCard_list = []  # type:List[AlbumCard]
+        self.__spareAlbumCard_list = []  # type:List[AlbumCard]
+        self.__groupBox_dict = {}  # type:Dict[int, GroupBox]
+        self.__spareGroupBox_list = []  # type:List[GroupBox]
         # 实例化滚动区域和滚动区域的窗口
         self.__createGuideLabel()
         self.scrollWidget = QWidget()
         self.albumBlurBackground = AlbumBlurBackground(self.scrollWidget)
-        # 创建专辑卡并将其添加到布局中
-        self.__createAlbumCards()
+        self.hideCheckBoxAniGroup = QParallelAnimationGroup(self)
+        self.__updateAlbumInfoIndex()
         # 初始化小部件
         self.__initWidget()
 
+    @property
+    def checkedAlbumInfo_list(self) -> List[dict]:
+        """ 按照选中顺序排列的选中专辑信息列表 """
+        return list(self.checkedAlbumInfo_dict.values())
+
     def __initWidget(self):
         """ 初始化小部件 """
         self.resize(1270, 760)
@@ -79,7 +111,7 @@ class AlbumCardInterface(ScrollArea):
         self.albumBlurBackground.hide()
         # 设置导航标签的可见性
         self.guideLabel.raise_()
-        self.guideLabel.setHidden(bool(self.albumCard_list))
+        self.guideLabel.setHidden(bool(self.albumInfo_list))
         # 初始化滚动条
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scrollWidget.setObjectName("scrollWidget")
@@ -96,38 +128,15 @@ class AlbumCardInterface(ScrollArea):
         self.guideLabel.adjustSize()
         self.guideLabel.move(35, 286)
 
-    def __createAlbumCards(self):
-        """ 将专辑卡添加到窗口中 """
-        # 创建并行动画组
-        self.hideCheckBoxAniGroup = QParallelAnimationGroup(self)
-        self.hideCheckBoxAni_list = []
-        for albumInfo in self.albumInfo_list:
-            self.__createOneAlbumCard(albumInfo)
-
-    def __createOneAlbumCard(self, albumInfo: dict):
+    def __createOneAlbumCard(self, albumInfo: dict) -> AlbumCard:
         """ 创建一个专辑卡 """
-        # 实例化专辑卡和动画
-        albumCard = AlbumCard(albumInfo, self)
+        albumCard = AlbumCard(albumInfo, self.scrollWidget)
+        albumCard.hide()
+        self.__albumCard_list.append(albumCard)
         # 创建动画
         hideCheckBoxAni = QPropertyAnimation(
             albumCard.checkBoxOpacityEffect, b"opacity")
         self.hideCheckBoxAniGroup.addAnimation(hideCheckBoxAni)
-        self.hideCheckBoxAni_list.append(hideCheckBoxAni)
-        # 将含有专辑卡及其信息的字典插入列表
-        album = albumInfo["album"]
-        self.albumCard_list.append(albumCard)
-        self.albumCardInfo_list.append(
-            {
-                "albumCard": albumCard,
-                "albumName": album,
-                "year": albumInfo["year"][:4],
-                "singer": albumInfo["singer"],
-                "firstLetter": pinyin.get_initial(album[0])[0].upper(),
-            }
-        )
-        key = albumInfo["album"] + "." + albumInfo["singer"]
-        self.albumSinger2AlbumCard_dict[key] = albumCard
-        self.albumSinger2AlbumInfo_dict[key] = albumInfo
         # 专辑卡信号连接到槽函数
         albumCard.playSignal.connect(self.playSignal)
         albumCard.nextPlaySignal.connect(self.nextPlaySignal)
@@ -148,263 +157,238 @@ class AlbumCardInterface(ScrollArea):
         albumCard.addAlbumToNewCustomPlaylistSig.connect(
             self.addAlbumToNewCustomPlaylistSig)
         albumCard.showAlbumInfoEditDialogSig.connect(
-            self.__showAlbumInfoEditDialog)
+            self.showAlbumInfoEditDialog)
+        return albumCard
+
+    def __createOneGroupBox(self) -> GroupBox:
+        """ 创建一个分组框，只用来显示分组的标题 """
+        group = GroupBox(parent=self.scrollWidget)
+        group.titleClicked.connect(self.__onGroupTitleClicked)
+        return group
 
     def __connectSignalToSlot(self):
         """ 将信号连接到槽函数 """
         # 动画完成隐藏复选框
         self.hideCheckBoxAniGroup.finished.connect(self.__hideAllCheckBox)
+        # 滚动时更新可见的专辑卡
+        self.verticalScrollBar().valueChanged.connect(
+            lambda: self.__updateVisibleAlbumCards())
 
     def __initLayout(self):
         """ 初始化布局 """
+        self.setWidget(self.scrollWidget)
         # 按照添加时间分组
         self.sortByAddTime()
-        self.scrollWidgetVBoxLayout.setSpacing(30)
-        # 顶部留出工具栏的位置
-        self.scrollWidgetVBoxLayout.setContentsMargins(10, 245, 0, 120)
-        self.scrollWidget.setLayout(self.scrollWidgetVBoxLayout)
-        self.setWidget(self.scrollWidget)
 
     def resizeEvent(self, event):
         """ 根据宽度调整网格的列数 """
         super().resizeEvent(event)
         column = 2 if self.width() <= 690 else (self.width()-690)//220+3
         if self.columnNum == column:
+            self.__updateVisibleAlbumCards()
             return
 
         self.columnNum = column
-        for currentGroup_dict in self.currentGroupInfo_list:
-            gridLayout = currentGroup_dict["gridLayout"]  # type:GridLayout
-            gridLayout.updateColumnNum(column, 210, 290)
-        self.__adjustScrollWidgetSize()
-
-    def __adjustScrollWidgetSize(self):
-        """ 调整滚动部件的高度 """
-        rowCount = sum(
-            [
-                currentGroup_dict["gridLayout"].rowCount()
-                for currentGroup_dict in self.currentGroupInfo_list
-            ]
-        )
-        containerCount = len(self.currentGroupInfo_list)
-        self.scrollWidget.resize(
-            self.width(),
-            310 * rowCount
-            + 60 * containerCount * (self.sortMode != "Date added")
-            + 120
-            + 245,
-        )
-
-    def __removeContainerFromVBoxLayout(self):
-        """ 从竖直布局中移除专辑卡容器 """
-        for currentGroup_dict in self.currentGroupInfo_list:
-            # 将专辑卡从每个网格布局中移除
-            currentGroup_dict["gridLayout"].removeAllWidgets()
-            self.scrollWidgetVBoxLayout.removeWidget(
-                currentGroup_dict["container"])
-            currentGroup_dict["container"].deleteLater()
-            currentGroup_dict["gridLayout"].deleteLater()
-        self.currentGroupInfo_list = []
-
-    def __addContainterToVBoxLayout(self):
-        """ 将当前的分组添加到箱式布局中 """
-        for currentGroup_dict in self.currentGroupInfo_list:
-            self.scrollWidgetVBoxLayout.addWidget(
-                currentGroup_dict["container"], 0, Qt.AlignTop)
-
-    def __addAlbumCardToGridLayout(self):
-        """ 将专辑卡添加到每一个网格布局中 """
-        for currentGroup_dict in self.currentGroupInfo_list:
-            for index, albumCard in enumerate(currentGroup_dict["albumCard_list"]):
-                row = index // self.columnNum
-                column = index - row * self.columnNum
-                currentGroup_dict["gridLayout"].addWidget(
-                    albumCard, row, column)
-            currentGroup_dict["gridLayout"].setAlignment(Qt.AlignLeft)
+        self.__updateLayout()
+
+    def __updateAlbumInfoIndex(self):
+        """ 更新分组用的专辑信息和 "专辑名.歌手名"：专辑信息 字典 """
+        self.albumCardInfo_list = []
+        self.albumSinger2AlbumInfo_dict.clear()
+        for albumInfo in self.albumInfo_list:
+            album = albumInfo["album"]
+            self.albumCardInfo_list.append(
+                {
+                    "albumInfo": albumInfo,
+                    "albumName": album,
+                    "year": albumInfo["year"][:4],
+                    "singer": albumInfo["singer"],
+                    "firstLetter": pinyin.get_initial(album[0])[0].upper(),
+                }
+            )
+            self.albumSinger2AlbumInfo_dict[self.__getAlbumKey(
+                albumInfo)] = albumInfo
+
+    def __updateLayout(self):
+        """ 计算当前分组下每张专辑卡和分组标题的位置并调整滚动部件的高度 """
+        self.__cardPos_list = []
+        self.__groupPos_list = []
+        y = self.topMargin
+        for group in self.groupInfo_list:
+            if group["title"] is not None:
+                self.__groupPos_list.append((group["title"], y))
+                y += self.groupTitleHeight
+
+            y += self.gridPadding
+            x = self.leftMargin + self.gridPadding
+            for i, albumInfo in enumerate(group["albumInfo_list"]):
+                row, column = divmod(i, self.columnNum)
+                self.__cardPos_list.append(
+                    (albumInfo, x + column * self.columnWidth, y + row * self.rowHeight))
+
+            rowNum = -(-len(group["albumInfo_list"]) // self.columnNum)
+            y += max(rowNum * self.rowHeight - self.verticalSpacing, 0)
+            y += self.gridPadding + self.groupSpacing
+
+        self.__cardY_list = [i[2] for i in self.__cardPos_list]
+        self.__groupY_list = [i[1] for i in self.__groupPos_list]
+        height = y - self.groupSpacing + self.bottomMargin
+        self.scrollWidget.resize(self.width(), max(height, self.topMargin))
+        self.__updateVisibleAlbumCards(True)
+
+    def __updateVisibleAlbumCards(self, isRelayout=False):
+        """ 创建和视口相交的专辑卡和分组标题，回收离开视口的部件
+
+        Parameters
+        ----------
+        isRelayout: bool
+            专辑卡的位置或者专辑信息是否发生了改变
+        """
+        value = self.verticalScrollBar().value()
+        top = value - self.overscan
+        bottom = value + self.viewport().height() + self.overscan
+
+        # 可见的专辑卡在位置列表中是连续的
+        start = bisect_right(self.__cardY_list, top - self.cardHeight)
+        end = bisect_left(self.__cardY_list, bottom)
+        self.__placeAlbumCards(self.__cardPos_list[start:end], isRelayout)
+
+        start = bisect_right(self.__groupY_list, top - self.groupTitleHeight)
+        end = bisect_left(self.__groupY_list, bottom)
+        self.__placeGroupBoxes(range(start, end))
+
+    def __placeAlbumCards(self, cardPos_list: list, isRelayout: bool):
+        """ 将专辑卡放到指定位置，不在列表中的专辑卡会被回收 """
+        visibleAlbums = {self.__getAlbumKey(i[0]) for i in cardPos_list}
+        for key in list(self.albumSinger2AlbumCard_dict.keys()):
+            if key not in visibleAlbums:
+                albumCard = self.albumSinger2AlbumCard_dict.pop(key)
+                albumCard.hide()
+                self.__spareAlbumCard_list.append(albumCard)
+
+        for albumInfo, x, y in cardPos_list:
+            key = self.__getAlbumKey(albumInfo)
+            albumCard = self.albumSinger2AlbumCard_dict.get(key)
+            if albumCard and not isRelayout:
+                continue
+
+            if not albumCard:
+                if self.__spareAlbumCard_list:
+                    albumCard = self.__spareAlbumCard_list.pop()
+                else:
+                    albumCard = self.__createOneAlbumCard(albumInfo)
+
+                self.albumSinger2AlbumCard_dict[key] = albumCard
+
+            if albumCard.albumInfo is not albumInfo:
+                albumCard.updateWindow(albumInfo)
+
+            albumCard.setChecked(key in self.checkedAlbumInfo_dict)
+            albumCard.setSelectionModeOpen(self.isInSelectionMode)
+            albumCard.checkBox.setVisible(self.isInSelectionMode)
+            albumCard.move(x, y)
+            albumCard.show()
+
+    def __placeGroupBoxes(self, indexes: range):
+        """ 显示指定序号的分组标题，其余的分组框会被回收 """
+        for index in list(self.__groupBox_dict.keys()):
+            if index not in indexes:
+                group = self.__groupBox_dict.pop(index)
+                group.hide()
+                self.__spareGroupBox_list.append(group)
+
+        for index in indexes:
+            group = self.__groupBox_dict.get(index)
+            if not group:
+                if self.__spareGroupBox_list:
+                    group = self.__spareGroupBox_list.pop()
+                else:
+                    group = self.__createOneGroupBox()
+
+                self.__groupBox_dict[index] = group
+
+            title, y = self.__groupPos_list[index]
+            group.setTitle(title)
+            group.setGeometry(
+                self.leftMargin, y, self.scrollWidget.width() - self.leftMargin,
+                self.groupTitleHeight + self.gridPadding)
+            group.show()
 
     def sortByAddTime(self):
         """ 按照添加时间分组 """
         self.sortMode = "Date added"
-        # 创建一个包含所有歌曲卡的网格布局
-        container = QWidget()
-        gridLayout = GridLayout()
-        gridLayout.setVerticalSpacing(20)
-        gridLayout.setHorizontalSpacing(10)
-        container.setLayout(gridLayout)
-        # 清空分组标签列表
-        self.groupTitle_list.clear()
-        # 从竖直布局中移除小部件
-        self.__removeContainerFromVBoxLayout()
-        # 构造一个包含布局和小部件列表字典的列表
-        self.addTimeGroupInfo_list = [
-            {
-                "container": container,
-                "gridLayout": gridLayout,
-                "albumCard_list": self.albumCard_list,
-            }
-        ]
-        # 创建一个对当前分组列表引用的列表
-        self.currentGroupInfo_list = self.addTimeGroupInfo_list
-        # 将专辑卡添加到布局中
-        self.__addAlbumCardToGridLayout()
-        self.__addContainterToVBoxLayout()
-        self.__adjustScrollWidgetSize()
+        self.groupTitle_list = []
+        self.groupTitle_dict = {}
+        self.groupInfo_list = [
+            {"title": None, "albumInfo_list": self.albumInfo_list.copy()}]
+        self.__updateLayout()
 
     def sortByFirstLetter(self):
         """ 按照专辑名的首字母进行分组排序 """
         self.sortMode = "A to Z"
-        # 将专辑卡从旧布局中移除
-        self.__removeContainerFromVBoxLayout()
-        self.groupTitle_list.clear()
-        # 创建分组
-        firstLetter_list = []
-        self.firsetLetterGroupInfo_list = []
-        # 将专辑卡添加到分组中
+        # 将专辑添加到分组中(仅限于A-Z和...)
+        groups = {}
         for albumCard_dict in self.albumCardInfo_list:
-            # 获取专辑卡的专辑名首字母(有可能不是字母)
+            # 专辑名首字母有可能不是字母
             firstLetter = albumCard_dict["firstLetter"]
             firstLetter = firstLetter if 65 <= ord(
                 firstLetter) <= 90 else "..."
-            # 如果首字母属于不在列表中就将创建分组(仅限于A-Z和...)
-            if firstLetter not in firstLetter_list:
-                # firstLetter_list的首字母顺序和firsetLetterGroupInfo_list保持一致
-                firstLetter_list.append(firstLetter)
-                group = GroupBox(firstLetter)
-                gridLayout = GridLayout()
-                group.setLayout(gridLayout)
-                gridLayout.setVerticalSpacing(20)
-                gridLayout.setHorizontalSpacing(10)
-                self.firsetLetterGroupInfo_list.append(
-                    {
-                        "container": group,
-                        "firstLetter": firstLetter,
-                        "gridLayout": gridLayout,
-                        "albumCard_list": [],
-                    }
-                )
-                self.groupTitle_list.append(group.title())
-            # 将专辑卡添加到分组中
-            index = firstLetter_list.index(firstLetter)
-            self.firsetLetterGroupInfo_list[index]["albumCard_list"].append(
-                albumCard_dict["albumCard"]
-            )
-        # 排序列表
-        self.firsetLetterGroupInfo_list.sort(
-            key=lambda item: item["firstLetter"])
-        # 将...分组移到最后
-        if "..." in firstLetter_list:
-            unique_group = self.firsetLetterGroupInfo_list.pop(0)
-            self.firsetLetterGroupInfo_list.append(unique_group)
-        # 将专辑加到分组的网格布局中
-        self.currentGroupInfo_list = self.firsetLetterGroupInfo_list
-        # 将专辑卡添加到网格布局中并将容器添加到竖直布局中
-        self.__addAlbumCardToGridLayout()
-        self.__addContainterToVBoxLayout()
-        self.__adjustScrollWidgetSize()
-        self.__getFirstLetterFirstGroupBox()
-        self.__connectGroupBoxSigToSlot("letterGridLayout")
+            groups.setdefault(firstLetter, []).append(
+                albumCard_dict["albumInfo"])
+
+        # 排序分组并将...分组移到最后
+        titles = sorted(i for i in groups if i != "...")
+        if "..." in groups:
+            titles.append("...")
+
+        self.__setGroups(titles, groups)
+        self.__getFirstLetterFirstGroup()
 
     def sortByYear(self):
         """ 按照专辑的年份进行分组排序 """
         self.sortMode = "Release year"
-        self.groupTitle_list.clear()
-        self.groupTitle_dict.clear()
-        # 将专辑卡从旧布局中移除
-        self.__removeContainerFromVBoxLayout()
-        # 创建分组
-        year_list = []
-        self.yearGroupInfo_list = []
-        # 将专辑加到分组中
+        unknown = self.tr("Unknown")
+        groups = {}
         for albumCard_dict in self.albumCardInfo_list:
-            year = albumCard_dict["year"]
-            year = self.tr("Unknown") if year == '' else year
-
-            # 如果年份不在年份列表中就创建分组
-            if year not in year_list:
-                year_list.append(year)
-
-                # 实例化分组和网格布局
-                group = GroupBox(year)
-                gridLayout = GridLayout()
-                group.setLayout(gridLayout)
-                gridLayout.setVerticalSpacing(20)
-                gridLayout.setHorizontalSpacing(10)
-                self.yearGroupInfo_list.append(
-                    {
-                        "year": year,
-                        "container": group,
-                        "albumCard_list": [],
-                        "gridLayout": gridLayout,
-                    }
-                )
-                self.groupTitle_list.append(group.title())
-                self.groupTitle_dict[year] = group
-
-            # 将专辑卡添加到分组中
-            index = year_list.index(year)
-            self.yearGroupInfo_list[index]["albumCard_list"].append(
-                albumCard_dict["albumCard"])
-
-        # 按照年份从进到远排序
-        self.groupTitle_list.sort(reverse=True)
-        self.yearGroupInfo_list.sort(
-            key=lambda item: item["year"], reverse=True)
-
-        # 检测是否含有未知分组,有的话将其移到最后一个
-        if self.tr("Unknown") in year_list:
-            unique_group = self.yearGroupInfo_list.pop(0)
-            self.yearGroupInfo_list.append(unique_group)
-
-        # 将专辑加到分组的网格布局中
-        self.currentGroupInfo_list = self.yearGroupInfo_list
-        self.__addAlbumCardToGridLayout()
-        self.__addContainterToVBoxLayout()
-        self.__adjustScrollWidgetSize()
-        self.__connectGroupBoxSigToSlot("listLayout")
+            year = albumCard_dict["year"] or unknown
+            groups.setdefault(year, []).append(albumCard_dict["albumInfo"])
+
+        # 按照年份从进到远排序，未知分组放在最后
+        titles = sorted((i for i in groups if i != unknown), reverse=True)
+        if unknown in groups:
+            titles.append(unknown)
+
+        self.__setGroups(titles, groups)
+        self.groupTitle_dict = {title: i for i, title in enumerate(titles)}
 
     def sortBySonger(self):
-        """ 按照专辑的专辑进行分组排序 """
+        """ 按照专辑的歌手进行分组排序 """
         self.sortMode = "Artist"
-        # 将专辑卡从旧布局中移除
-        self.groupTitle_list.clear()
-        self.__removeContainerFromVBoxLayout()
-        # 创建列表
-        singer_list = []
-        self.singerGroupInfo_list = []
-        # 将专辑加到分组中
+        groups = {}
         for albumCard_dict in self.albumCardInfo_list:
-            singer = albumCard_dict["singer"]
-            if singer not in singer_list:
-                singer_list.append(singer)
-                group = GroupBox(singer)
-                gridLayout = GridLayout()
-                group.setLayout(gridLayout)
-                gridLayout.setVerticalSpacing(20)
-                gridLayout.setHorizontalSpacing(10)
-                self.singerGroupInfo_list.append(
-                    {
-                        "singer": singer,
-                        "container": group,
-                        "albumCard_list": [],
-                        "gridLayout": gridLayout,
-                    }
-                )
-                # 点击分组的标题时显示导航界面
-                self.groupTitle_list.append(group.title())
-            # 将专辑卡添加到分组中
-            index = singer_list.index(singer)
-            self.singerGroupInfo_list[index]["albumCard_list"].append(
-                albumCard_dict["albumCard"])
-        # 排序列表
-        self.singerGroupInfo_list.sort(
-            key=lambda item: pinyin.get_initial(item["singer"])[0].lower())
-        # 将专辑加到分组的网格布局中
-        self.currentGroupInfo_list = self.singerGroupInfo_list
-        self.__addAlbumCardToGridLayout()
-        self.__addContainterToVBoxLayout()
-        self.__adjustScrollWidgetSize()
-        self.__getFirstLetterFirstGroupBox()
-        self.__connectGroupBoxSigToSlot("letterGridLayout")
+            groups.setdefault(albumCard_dict["singer"], []).append(
+                albumCard_dict["albumInfo"])
+
+        titles = sorted(
+            groups, key=lambda i: pinyin.get_initial(i)[0].lower())
+        self.__setGroups(titles, groups)
+        self.__getFirstLetterFirstGroup()
+
+    def __setGroups(self, titles: list, groups: Dict[str, list]):
+        """ 设置当前的分组并重新布局
+
+        Parameters
+        ----------
+        titles: list
+            排好序的分组标题列表
+
+        groups: Dict[str, list]
+            分组标题和分组中的专辑信息列表组成的字典
+        """
+        self.groupTitle_list = titles
+        self.groupInfo_list = [
+            {"title": i, "albumInfo_list": groups[i]} for i in titles]
+        self.__updateLayout()
 
     def __setQss(self):
         """ 设置层叠样式 """
@@ -413,17 +397,10 @@ class AlbumCardInterface(ScrollArea):
         self.setStyleSheet(str(f.readAll(), encoding='utf-8'))
         f.close()
 
-    def findAlbumCardByAlbumInfo(self, albumInfo: dict) -> AlbumCard:
-        """ 通过专辑信息查找专辑卡，没找到则返回 None """
-        album = albumInfo.get("album", "")
-        singer = albumInfo.get("singer")
-        return self.findAlbumCardByName(album, singer)
-
-    def findAlbumCardByName(self, albumName: str, singerName: str) -> AlbumCard:
-        """ 通过专辑和歌手名字查找专辑卡，没找到则返回 None """
-        key = f'{albumName}.{singerName}'
-        albumCard = self.albumSinger2AlbumCard_dict.get(key, None)
-        return albumCard
+    @staticmethod
+    def __getAlbumKey(albumInfo: dict) -> str:
+        """ 获取专辑的 "专辑名.歌手名" 键 """
+        return albumInfo["album"] + "." + albumInfo["singer"]
 
     def findAlbumInfoByName(self, albumName: str, singerName: str) -> dict:
         """ 通过专辑和歌手名字查找专辑信息，没找到则返回 None """
@@ -433,38 +410,42 @@ class AlbumCardInterface(ScrollArea):
 
     def __onAlbumCardCheckedStateChanged(self, albumCard: AlbumCard, isChecked: bool):
         """ 专辑卡选中状态改变对应的槽函数 """
-        # 如果专辑信息不在选中的专辑信息列表中且对应的专辑卡变为选中状态就将专辑信息添加到列表中
-        if albumCard not in self.checkedAlbumCard_list and isChecked:
-            self.checkedAlbumCard_list.append(albumCard)
-            self.checkedAlbumCardNumChanged.emit(
-                len(self.checkedAlbumCard_list))
-        # 如果专辑信息已经在列表中且该专辑卡变为非选中状态就弹出该专辑信息
-        elif albumCard in self.checkedAlbumCard_list and not isChecked:
-            self.checkedAlbumCard_list.pop(
-                self.checkedAlbumCard_list.index(albumCard))
-            self.checkedAlbumCardNumChanged.emit(
-                len(self.checkedAlbumCard_list))
+        key = self.__getAlbumKey(albumCard.albumInfo)
+        # 回收的专辑卡同步选中状态时也会发送信号，状态没有改变时直接返回
+        if isChecked == (key in self.checkedAlbumInfo_dict):
+            return
 
+        if isChecked:
+            self.checkedAlbumInfo_dict[key] = self.albumSinger2AlbumInfo_dict.get(
+                key, albumCard.albumInfo)
+        else:
+            self.checkedAlbumInfo_dict.pop(key)
+
+        self.checkedAlbumCardNumChanged.emit(len(self.checkedAlbumInfo_dict))
+        self.__onCheckedAlbumsChanged()
+
+    def __onCheckedAlbumsChanged(self):
+        """ 选中的专辑改变时更新全选状态和选择模式 """
         # 检查是否全部专辑卡选中改变
-        isAllChecked = (len(self.checkedAlbumCard_list)
-                        == len(self.albumCard_list))
+        isAllChecked = (len(self.checkedAlbumInfo_dict)
+                        == len(self.albumInfo_list))
         if isAllChecked != self.isAllAlbumCardsChecked:
             self.isAllAlbumCardsChecked = isAllChecked
             self.isAllCheckedChanged.emit(isAllChecked)
 
         # 如果先前不处于选择模式那么这次发生选中状态改变就进入选择模式
-        if not self.isInSelectionMode:
+        if not self.isInSelectionMode and self.checkedAlbumInfo_dict:
             self.__setAllAlbumCardSelectionModeOpen(True)
             self.selectionModeStateChanged.emit(True)
             self.isInSelectionMode = True
-        elif not self.checkedAlbumCard_list:
+        elif self.isInSelectionMode and not self.checkedAlbumInfo_dict:
             self.__setAllAlbumCardSelectionModeOpen(False)
             self.selectionModeStateChanged.emit(False)
             self.isInSelectionMode = False
 
     def __setAllAlbumCardSelectionModeOpen(self, isOpen: bool):
         """ 设置所有专辑卡是否进入选择模式 """
-        for albumCard in self.albumCard_list:
+        for albumCard in self.__albumCard_list:
             albumCard.setSelectionModeOpen(isOpen)
         # 退出选择模式时开启隐藏所有复选框的动画
         if not isOpen:
@@ -472,7 +453,8 @@ class AlbumCardInterface(ScrollArea):
 
     def __startHideCheckBoxAni(self):
         """ 开始隐藏复选框动画 """
-        for ani in self.hideCheckBoxAni_list:
+        for i in range(self.hideCheckBoxAniGroup.animationCount()):
+            ani = self.hideCheckBoxAniGroup.animationAt(i)
             ani.setStartValue(1)
             ani.setEndValue(0)
             ani.setDuration(140)
@@ -480,22 +462,34 @@ class AlbumCardInterface(ScrollArea):
 
     def __hideAllCheckBox(self):
         """ 隐藏所有复选框 """
-        for albumCard in self.albumCard_list:
+        for albumCard in self.__albumCard_list:
             albumCard.checkBox.hide()
 
+    def __setAllChecked(self, isChecked: bool):
+        """ 设置所有专辑的选中状态并同步可见的专辑卡 """
+        if isChecked:
+            self.checkedAlbumInfo_dict = self.albumSinger2AlbumInfo_dict.copy()
+        elif self.checkedAlbumInfo_dict:
+            self.checkedAlbumInfo_dict = {}
+        else:
+            return
+
+        for albumCard in self.albumSinger2AlbumCard_dict.values():
+            albumCard.setChecked(isChecked)
+
+        self.checkedAlbumCardNumChanged.emit(len(self.checkedAlbumInfo_dict))
+        self.__onCheckedAlbumsChanged()
+
     def unCheckAlbumCards(self):
         """ 取消所有已处于选中状态的专辑卡的选中状态 """
-        checkedAlbumCard_list_copy = self.checkedAlbumCard_list.copy()
-        for albumCard in checkedAlbumCard_list_copy:
-            albumCard.setChecked(False)
+        self.__setAllChecked(False)
 
     def setAllAlbumCardCheckedState(self, isAllChecked: bool):
         """ 设置所有的专辑卡checked状态 """
         if self.isAllAlbumCardsChecked == isAllChecked:
             return
         self.isAllAlbumCardsChecked = isAllChecked
-        for albumCard in self.albumCard_list:
-            albumCard.setChecked(isAllChecked)
+        self.__setAllChecked(isAllChecked)
 
     def __showBlurAlbumBackground(self, pos: QPoint, picPath: str):
         """ 显示磨砂背景 """
@@ -509,7 +503,7 @@ class AlbumCardInterface(ScrollArea):
         """ 更新一首歌的信息 """
         newKey = newSongInfo["album"] + "." + newSongInfo["singer"]
         oldKey = oldSongInfo["album"] + "." + oldSongInfo["singer"]
-        albumInfo_list = deepcopy(self.albumInfo_list)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
         oldAlbumInfo = self.albumSinger2AlbumInfo_dict[oldKey]
         oldIndex = albumInfo_list.index(oldAlbumInfo)
 
@@ -559,12 +553,13 @@ class AlbumCardInterface(ScrollArea):
         """ 更新一张专辑信息 """
         oldSongInfo_list = oldAlbumInfo["songInfo_list"]
         newSongInfo_list = newAlbumInfo["songInfo_list"]
-        albumInfo_list = deepcopy(self.albumInfo_list)
-        albumSinger2AlbumInfo_dict = deepcopy(self.albumSinger2AlbumInfo_dict)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
+        albumSinger2AlbumInfo_dict = {
+            i["album"]+'.'+i["singer"]: i for i in albumInfo_list}
 
-        # 更新当前专辑卡封面
-        if coverPath:
-            key = oldAlbumInfo["album"]+'.'+oldAlbumInfo["singer"]
+        # 更新当前专辑卡封面，专辑卡不在视口中时不需要更新
+        key = oldAlbumInfo["album"]+'.'+oldAlbumInfo["singer"]
+        if coverPath and key in self.albumSinger2AlbumCard_dict:
             self.albumSinger2AlbumCard_dict[key].updateAlbumCover(coverPath)
 
         # 更新所有专辑卡
@@ -622,59 +617,30 @@ class AlbumCardInterface(ScrollArea):
         if albumInfo_list == self.albumInfo_list:
             return
 
-        # 将专辑卡从布局中移除
-        self.__removeContainerFromVBoxLayout()
-
-        # 根据具体情况增减专辑卡
-        newCardNum = len(albumInfo_list)
-        oldCardNum = len(self.albumCard_list)
-        if newCardNum < oldCardNum:
-            # 删除部分专辑卡
-            for i in range(oldCardNum - 1, newCardNum - 1, -1):
-                albumCard = self.albumCard_list.pop()
-                self.hideCheckBoxAni_list.pop()
-                self.albumCardInfo_list.pop()
-                self.hideCheckBoxAniGroup.takeAnimation(i)
-                albumCard.deleteLater()
-                QApplication.processEvents()
-        elif newCardNum > oldCardNum:
-            # 新增部分专辑卡
-            for albumInfo in albumInfo_list[oldCardNum:]:
-                self.__createOneAlbumCard(albumInfo)
-                QApplication.processEvents()
-
-        # 更新部分专辑卡
+        oldAlbumNum = len(self.albumInfo_list)
         self.albumInfo_list = albumInfo_list
-        n = oldCardNum if oldCardNum < newCardNum else newCardNum
-        for i in range(n):
-            albumInfo = albumInfo_list[i]
-            album = albumInfo["album"]
-            self.albumCard_list[i].updateWindow(albumInfo)
-            QApplication.processEvents()
-            self.albumCardInfo_list[i] = {
-                "albumCard": self.albumCard_list[i],
-                "albumName": album,
-                "year": albumInfo["year"][:4],
-                "singer": albumInfo["singer"],
-                "firstLetter": pinyin.get_initial(album)[0].upper(),
-            }
-
-        # 重新排序专辑卡
+        self.__updateAlbumInfoIndex()
+
+        # 移除已经不存在的专辑的选中状态
+        checkedAlbumNum = len(self.checkedAlbumInfo_dict)
+        self.checkedAlbumInfo_dict = {
+            k: self.albumSinger2AlbumInfo_dict[k] for k in self.checkedAlbumInfo_dict
+            if k in self.albumSinger2AlbumInfo_dict
+        }
+
+        # 重新排序专辑卡，可见的专辑卡会被更新
         self.__sortFunctions[self.sortMode]()
 
         # 根据当前专辑卡数决定是否显示导航标签
         self.guideLabel.setHidden(bool(albumInfo_list))
 
-        # 更新 "专辑名.歌手名"：专辑卡 字典
-        self.albumSinger2AlbumCard_dict.clear()
-        self.albumSinger2AlbumInfo_dict.clear()
-        for albumCard, albumInfo in zip(self.albumCard_list, albumInfo_list):
-            key = albumInfo["album"] + "." + albumInfo["singer"]
-            self.albumSinger2AlbumCard_dict[key] = albumCard
-            self.albumSinger2AlbumInfo_dict[key] = albumInfo
+        if checkedAlbumNum != len(self.checkedAlbumInfo_dict):
+            self.checkedAlbumCardNumChanged.emit(
+                len(self.checkedAlbumInfo_dict))
+            self.__onCheckedAlbumsChanged()
 
-        if oldCardNum != newCardNum:
-            self.albumNumChanged.emit(newCardNum)
+        if oldAlbumNum != len(albumInfo_list):
+            self.albumNumChanged.emit(len(albumInfo_list))
 
     def setSortMode(self, sortMode: str):
         """ 排序专辑卡
@@ -700,32 +666,28 @@ class AlbumCardInterface(ScrollArea):
         w.yesSignal.connect(lambda: self.deleteAlbumSig.emit(songPaths))
         w.exec_()
 
-    def __connectGroupBoxSigToSlot(self, layout):
-        """ 分组框信号连接到槽函数 """
-        for group_dict in self.currentGroupInfo_list:
-            group_dict["container"].titleClicked.connect(
-                lambda: self.showLabelNavigationInterfaceSig.emit(self.groupTitle_list, layout))
+    def __onGroupTitleClicked(self):
+        """ 点击分组的标题时显示导航界面 """
+        layout = "listLayout" if self.sortMode == "Release year" else "letterGridLayout"
+        self.showLabelNavigationInterfaceSig.emit(self.groupTitle_list, layout)
 
     def scrollToLabel(self, label: str):
         """ 滚动到label指定的位置 """
-        group = self.groupTitle_dict[label]
-        self.verticalScrollBar().setValue(group.y() - 245)
-
-    def __getFirstLetterFirstGroupBox(self):
-        """ 获取首字母对应的第一个分组框 """
-        letter_list = []
-        self.groupTitle_dict.clear()
-        for group_dict in self.currentGroupInfo_list:
-            group = group_dict["container"]
-            letter = pinyin.get_initial(group.title())[0].upper()
+        index = self.groupTitle_dict[label]
+        self.verticalScrollBar().setValue(
+            self.__groupY_list[index] - self.topMargin)
+
+    def __getFirstLetterFirstGroup(self):
+        """ 获取首字母对应的第一个分组 """
+        self.groupTitle_dict = {}
+        for i, title in enumerate(self.groupTitle_list):
+            letter = pinyin.get_initial(title)[0].upper()
             letter = "..." if not 65 <= ord(letter) <= 90 else letter
-            # 将字母对应的第一个分组框添加到字典中
-            if letter not in letter_list:
-                letter_list.append(letter)
-                self.groupTitle_dict[letter] = group
+            # 将字母对应的第一个分组添加到字典中
+            self.groupTitle_dict.setdefault(letter, i)
 
-    def __showAlbumInfoEditDialog(self, albumInfo: dict):
-        """ 显示专辑信息编辑界面信号 """
+    def showAlbumInfoEditDialog(self, albumInfo: dict):
+        """ 显示专辑信息编辑界面 """
         # 创建线程和对话框
         thread = SaveAlbumInfoThread(self)
         w = AlbumInfoEditDialog(albumInfo, self.window())
@@ -773,19 +735,11 @@ class AlbumCardInterface(ScrollArea):
 
     def __sortOneAlbum(self, albumInfo: dict):
         """ 根据曲序就地排序一张专辑中的歌曲列表 """
-        albumInfo["songInfo_list"].sort(key=self.__getTrackNum)
-
-    def __getTrackNum(self, songInfo: dict) -> int:
-        """ 根据歌曲信息获取曲目 """
-        trackNum = songInfo["tracknumber"]  # type:str
-        # 处理m4a
-        if not trackNum[0].isnumeric():
-            return eval(trackNum)[0]
-        return int(trackNum)
+        albumInfo["songInfo_list"].sort(key=AlbumInfoReader.sortAlbum)
 
     def deleteSongs(self, songPaths: list):
         """ 删除歌曲 """
-        albumInfo_list = deepcopy(self.albumInfo_list)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
         for albumInfo in albumInfo_list.copy():
             songInfo_list = albumInfo["songInfo_list"]
 
@@ -802,7 +756,7 @@ class AlbumCardInterface(ScrollArea):
 
     def deleteAlbums(self, albumNames: list):
         """ 删除专辑 """
-        albumInfo_list = deepcopy(self.albumInfo_list)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
 
         for albumInfo in albumInfo_list.copy():
             if albumInfo["album"] in albumNames:
@@ -1,8 +1,9 @@
 # coding:utf-8
-from copy import deepcopy
 
 from common.meta_data import *
+from common.thread.build_search_index_thread import BuildSearchIndexThread
 from common.thread.get_info_thread import GetInfoThread
+from common.thread.sync_library_thread import SyncLibraryThread
 from components.dialog_box.message_dialog import MessageDialog
 from components.widgets.menu import AddToMenu
 from components.widgets.stacked_widget import PopUpAniStackedWidget
@@ -13,7 +14,7 @@ from View.my_music_interface.album_tab_interface.selection_mode_bar import \
 from View.my_music_interface.song_tab_interface import SongListWidget
 from View.my_music_interface.song_tab_interface.selection_mode_bar import \
     SelectionModeBar as SongTabSelectionModeBar
-from PyQt5.QtCore import QPoint, Qt, pyqtSignal
+from PyQt5.QtCore import QPoint, Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QPalette
 from PyQt5.QtWidgets import QWidget
 
@@ -33,37 +34,66 @@ class MyMusicInterface(QWidget):
     addSongsToNewCustomPlaylistSig = pyqtSignal(list)       # 将歌曲添加到新建播放列表
     addSongsToCustomPlaylistSig = pyqtSignal(str, list)     # 将歌曲添加到自定义播放列表
     showLabelNavigationInterfaceSig = pyqtSignal(list, str)  # 显示标签导航界面
+    librarySyncUpdated = pyqtSignal()                       # 后台同步更新了歌曲信息
 
-    def __init__(self, folderPaths: list, parent=None):
+    def __init__(self, folderPaths: list, maxDepth: int = None, ignorePatterns: list = None,
+                 isScanInBackground=False, parent=None):
         """
         Parameters
         ----------
         folderPaths: list
             歌曲文件夹列表
 
+        maxDepth: int
+            递归扫描歌曲文件夹的最大深度，为 `None` 时不限制深度
+
+        ignorePatterns: list
+            扫描时忽略的文件和文件夹的通配符
+
+        isScanInBackground: bool
+            是否先显示歌曲库中上一次保存的歌曲信息，再调用 `startLibrarySync()` 在后台扫描歌曲文件夹
+
         parent:
             父级窗口 """
         super().__init__(parent)
         self.folderPaths = folderPaths
+        self.maxDepth = maxDepth
+        self.ignorePatterns = ignorePatterns
+        self.isScanInBackground = isScanInBackground
+        self.syncLibraryThread = None  # type:SyncLibraryThread
+        self.pendingFolders = set()    # 后台同步期间发生变化的文件夹
+        self.pendingSyncPaths = set()  # 后台同步移除但是还没更新到界面上的歌曲路径
+        self.pendingSyncSongInfos = {}  # 后台同步读取但是还没更新到界面上的歌曲信息
+        self.syncFlushTimer = QTimer(self)
+        self.buildSearchIndexThread = None  # type:BuildSearchIndexThread
         # 初始化标志位
         self.isInSelectionMode = False
         # 创建小部件
         self.__createWidgets()
         # 初始化
         self.__initWidget()
+        # 在后台建立搜索索引，第一次搜索时就不需要为整个歌曲库分词
+        self.__buildSearchIndex()
 
     def __createWidgets(self):
         """ 创建小部件 """
         self.stackedWidget = PopUpAniStackedWidget(self)
 
         # 扫描文件夹列表下的音频文件信息，顺序不能改动
-        self.songInfoReader = SongInfoReader(self.folderPaths)
-        self.albumCoverReader = AlbumCoverReader(
-            self.songInfoReader.songInfo_list)
+        self.songInfoReader = SongInfoReader(
+            self.folderPaths, maxDepth=self.maxDepth, ignorePatterns=self.ignorePatterns,
+            isLoadSnapshot=self.isScanInBackground)
+        playlistStore.setLibrary(self.songInfoReader.songInfo_list)
+
+        # 快照中歌曲的封面已经提取过了，新歌曲的封面会在后台同步时提取
+        songInfo_list = [] if self.isScanInBackground else self.songInfoReader.songInfo_list
+        self.albumCoverReader = AlbumCoverReader(songInfo_list)
         self.albumInfoReader = AlbumInfoReader(
             self.songInfoReader.songInfo_list)
         self.singerInfoReader = SingerInfoReader(
             self.albumInfoReader.albumInfo_list)
+        librarySearchIndex.songs.setItems(self.songInfoReader.songInfo_list)
+        librarySearchIndex.albums.setItems(self.albumInfoReader.albumInfo_list)
 
         self.songListWidget = SongListWidget(
             self.songInfoReader.songInfo_list, self)
@@ -101,6 +131,9 @@ class MyMusicInterface(QWidget):
         palette = QPalette()
         palette.setColor(self.backgroundRole(), Qt.white)
         self.setPalette(palette)
+        # 后台同步的歌曲信息先攒起来再一起更新到界面上
+        self.syncFlushTimer.setSingleShot(True)
+        self.syncFlushTimer.setInterval(1000)
         # 信号连接到槽
         self.__connectSignalToSlot()
 
@@ -115,7 +148,7 @@ class MyMusicInterface(QWidget):
                 text+f" ({self.songListWidget.songCardNum()})")
         elif index == 1:
             self.toolBar.randomPlayAllButton.setText(
-                text+f" ({len(self.albumCardInterface.albumCard_list)})")
+                text+f" ({len(self.albumCardInterface.albumInfo_list)})")
 
         self.toolBar.randomPlayAllButton.adjustSize()
 
@@ -173,10 +206,7 @@ class MyMusicInterface(QWidget):
 
     def __emitSongTabPlaylist(self):
         """ 发送歌曲界面选中的播放列表 """
-        playlist = [
-            songCard.songInfo
-            for songCard in self.songListWidget.checkedSongCard_list
-        ]
+        playlist = self.songListWidget.checkedSongInfo_list
         self.__unCheckSongCards()
         if self.sender() is self.songTabSelectionModeBar.playButton:
             self.playCheckedCardsSig.emit(playlist)
@@ -187,8 +217,8 @@ class MyMusicInterface(QWidget):
         """ 发送专辑界面选中的播放列表 """
         # 将选中的所有专辑中的歌曲合成为一个列表
         playlist = []
-        for albumCard in self.albumCardInterface.checkedAlbumCard_list:
-            playlist.extend(albumCard.albumInfo["songInfo_list"])
+        for albumInfo in self.albumCardInterface.checkedAlbumInfo_list:
+            playlist.extend(albumInfo["songInfo_list"])
         self.__unCheckAlbumCards()
         if self.sender() is self.albumTabSelectionModeBar.playButton:
             self.playCheckedCardsSig.emit(playlist)
@@ -198,44 +228,45 @@ class MyMusicInterface(QWidget):
     def __switchToAlbumInterface(self):
         """ 切换到专辑界面 """
         if self.sender() is self.songTabSelectionModeBar.showAlbumButton:
-            songCard = self.songListWidget.checkedSongCard_list[0]
+            songInfo = self.songListWidget.checkedSongInfo_list[0]
             # 取消选中的歌曲卡的选中状态，隐藏选择栏并显示播放栏
             self.__unCheckSongCards()
             self.songListWidget.switchToAlbumInterfaceSig.emit(
-                songCard.album, songCard.singer)
+                songInfo["album"], songInfo["singer"])
 
     def __editCardInfo(self):
         """ 编辑卡片信息 """
         if self.sender() is self.songTabSelectionModeBar.editInfoButton:
-            songCard = self.songListWidget.checkedSongCard_list[0]
+            songInfo = self.songListWidget.checkedSongInfo_list[0]
             self.__unCheckSongCards()
-            self.songListWidget.showSongInfoEditDialog(songCard)
+            self.songListWidget.showSongInfoEditDialog(songInfo)
         elif self.sender() is self.albumTabSelectionModeBar.editInfoButton:
-            albumCard = self.albumCardInterface.checkedAlbumCard_list[0]
+            albumInfo = self.albumCardInterface.checkedAlbumInfo_list[0]
             self.__unCheckAlbumCards()
-            albumCard.showAlbumInfoEditDialog()
+            self.albumCardInterface.showAlbumInfoEditDialog(albumInfo)
 
     def __onAlbumTabShowSingerButtonClicked(self):
         """ 专辑选择模式栏显示歌手点击信号槽函数 """
-        albumCard = self.albumCardInterface.checkedAlbumCard_list[0]
+        albumInfo = self.albumCardInterface.checkedAlbumInfo_list[0]
         self.__unCheckAlbumCards()
         self.albumCardInterface.switchToSingerInterfaceSig.emit(
-            albumCard.singerName)
+            albumInfo["singer"])
 
     def __showCheckedSongCardProperty(self):
         """ 显示选中的歌曲卡的属性 """
-        songInfo = self.songListWidget.checkedSongCard_list[0].songInfo
+        songInfo = self.songListWidget.checkedSongInfo_list[0]
         self.__unCheckSongCards()
         self.songListWidget.showSongPropertyDialog(songInfo)
 
     def __showDeleteSongsDialog(self):
         """ 显示删除歌曲对话框 """
-        if len(self.songListWidget.checkedSongCard_list) > 1:
+        checkedSongInfo_list = self.songListWidget.checkedSongInfo_list
+        if len(checkedSongInfo_list) > 1:
             title = self.tr("Are you sure you want to delete these?")
             content = self.tr(
                 "If you delete these songs, they won't be on be this device anymore.")
         else:
-            name = self.songListWidget.checkedSongCard_list[0].songName
+            name = checkedSongInfo_list[0]["songName"]
             title = self.tr("Are you sure you want to delete this?")
             content = self.tr("If you delete") + f' "{name}" ' + \
                 self.tr("it won't be on be this device anymore.")
@@ -247,11 +278,10 @@ class MyMusicInterface(QWidget):
     def __onDeleteSongsYesButtonClicked(self):
         """ 歌曲界面选择模式栏删除按钮点击槽函数 """
         songPaths = [
-            i.songPath for i in self.songListWidget.checkedSongCard_list]
+            i["songPath"] for i in self.songListWidget.checkedSongInfo_list]
 
-        for songCard in self.songListWidget.checkedSongCard_list.copy():
-            songCard.setChecked(False)
-            self.songListWidget.removeSongCard(songCard.itemIndex)
+        self.songListWidget.unCheckSongCards()
+        self.songListWidget.removeSongCards(songPaths)
 
         self.__deleteSongs(songPaths)
 
@@ -260,6 +290,8 @@ class MyMusicInterface(QWidget):
         self.albumCardInterface.deleteSongs(songPaths)
         self.singerInfoReader.updateSingerInfos(
             self.albumCardInterface.albumInfo_list)
+        librarySearchIndex.songs.removeItems(songPaths)
+        librarySearchIndex.albums.setItems(self.albumCardInterface.albumInfo_list)
         self.removeSongSig.emit(songPaths)
 
     def deleteSongs(self, songPaths: list):
@@ -268,15 +300,17 @@ class MyMusicInterface(QWidget):
         self.albumCardInterface.deleteSongs(songPaths)
         self.singerInfoReader.updateSingerInfos(
             self.albumCardInterface.albumInfo_list)
+        librarySearchIndex.songs.removeItems(songPaths)
+        librarySearchIndex.albums.setItems(self.albumCardInterface.albumInfo_list)
 
     def __showDeleteAlbumsDialog(self):
         """ 显示删除专辑对话框 """
-        if len(self.albumCardInterface.checkedAlbumCard_list) > 1:
+        if len(self.albumCardInterface.checkedAlbumInfo_list) > 1:
             title = self.tr("Are you sure you want to delete these?")
             content = self.tr(
                 "If you delete these albums, they won't be on be this device anymore.")
         else:
-            name = self.albumCardInterface.checkedAlbumCard_list[0].albumName
+            name = self.albumCardInterface.checkedAlbumInfo_list[0]["album"]
             title = self.tr("Are you sure you want to delete this?")
             content = self.tr("If you delete") + f' "{name}" ' + \
                 self.tr("it won't be on be this device anymore.")
@@ -289,11 +323,11 @@ class MyMusicInterface(QWidget):
         """ 专辑界面选择模式栏删除按钮点击槽函数 """
         albumNames = []
         songPaths = []
-        for albumCard in self.albumCardInterface.checkedAlbumCard_list.copy():
-            albumNames.append(albumCard.albumName)
-            songPaths.extend([i["songPath"] for i in albumCard.songInfo_list])
-            albumCard.setChecked(False)
+        for albumInfo in self.albumCardInterface.checkedAlbumInfo_list:
+            albumNames.append(albumInfo["album"])
+            songPaths.extend([i["songPath"] for i in albumInfo["songInfo_list"]])
 
+        self.albumCardInterface.unCheckAlbumCards()
         self.albumCardInterface.deleteAlbums(albumNames)
         self.__deleteAlbums(songPaths)
 
@@ -302,6 +336,8 @@ class MyMusicInterface(QWidget):
         self.songListWidget.removeSongCards(songPaths)
         self.singerInfoReader.updateSingerInfos(
             self.albumCardInterface.albumInfo_list)
+        librarySearchIndex.songs.removeItems(songPaths)
+        librarySearchIndex.albums.setItems(self.albumCardInterface.albumInfo_list)
         self.removeSongSig.emit(songPaths)
 
     def exitSelectionMode(self):
@@ -343,11 +379,13 @@ class MyMusicInterface(QWidget):
 
     def scanTargetPathSongInfo(self, folderPaths: list):
         """ 重新扫描指定的歌曲文件夹列表中的歌曲信息并更新标签界面 """
+        self.stopLibrarySync()
         self.folderPaths = folderPaths
         self.songInfoReader.folderPaths = folderPaths
 
         # 创建线程来扫描信息
-        thread = GetInfoThread(folderPaths, self)
+        thread = GetInfoThread(
+            folderPaths, self.maxDepth, self.ignorePatterns, self)
         thread.scanFinished.connect(self.__onScanFinished)
 
         # 创建状态提示条
@@ -356,6 +394,8 @@ class MyMusicInterface(QWidget):
             content = self.tr("Please wait patiently")
             w = StateTooltip(title, content, self.window())
             thread.scanFinished.connect(lambda: w.setState(True))
+            thread.scanProgressChanged.connect(
+                lambda i, n: w.setContent(content + f" ({i}/{n})"))
             w.move(w.getSuitablePos())
             w.show()
 
@@ -364,28 +404,211 @@ class MyMusicInterface(QWidget):
     def __onScanFinished(self, songInfo_list: list, albumInfo_list: list, singerInfos: dict):
         """ 扫描线程完成 """
         # 删除线程
-        self.sender().quit()
-        self.sender().wait()
-        self.sender().deleteLater()
+        thread = self.sender()  # type:GetInfoThread
+        thread.quit()
+        thread.wait()
+        thread.deleteLater()
 
         # 更新界面
         self.songListWidget.updateAllSongCards(songInfo_list)
         self.albumCardInterface.updateAllAlbumCards(albumInfo_list)
-        self.singerInfoReader.singerInfos = singerInfos
-        self.songInfoReader.songInfo_list = deepcopy(songInfo_list)
-        self.albumInfoReader.albumInfo_list = deepcopy(albumInfo_list)
+        # 只复制列表，歌曲信息在歌曲库和界面之间共享引用
+        songInfo_list = songInfo_list.copy()
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(albumInfo_list)
+        self.songInfoReader.songInfo_list = songInfo_list
+        self.albumInfoReader.setAlbumInfos(albumInfo_list)
+        playlistStore.setLibrary(songInfo_list)
+        self.singerInfoReader.updateSingerInfos(albumInfo_list)
+        librarySearchIndex.songs.setItems(songInfo_list)
+        librarySearchIndex.albums.setItems(albumInfo_list)
+
+        # 之后的增量扫描使用扫描线程建立的文件索引
+        self.songInfoReader.changeDetector = thread.songInfoReader.changeDetector
+        self.__buildSearchIndex()
+
+    def startLibrarySync(self):
+        """ 在后台扫描歌曲文件夹，将和歌曲库快照相比发生的变化分批更新到界面上 """
+        if not self.isScanInBackground or self.isSyncingLibrary():
+            return
+
+        self.syncLibraryThread = SyncLibraryThread(
+            self.folderPaths, self.maxDepth, self.ignorePatterns, parent=self)
+        self.syncLibraryThread.songInfosChanged.connect(
+            self.__onLibrarySyncChanged)
+        self.syncLibraryThread.finished.connect(self.__onLibrarySyncFinished)
+
+        # 第一次启动时歌曲库为空，需要显示扫描进度
+        if self.folderPaths and not self.songInfoReader.songInfo_list:
+            title = self.tr("Scanning song information")
+            content = self.tr("Please wait patiently")
+            w = StateTooltip(title, content, self.window())
+            self.syncLibraryThread.finished.connect(lambda: w.setState(True))
+            self.syncLibraryThread.syncProgressChanged.connect(
+                lambda i, n: w.setContent(content + f" ({i}/{n})"))
+            w.move(w.getSuitablePos())
+            w.show()
+
+        self.syncLibraryThread.start()
 
-    def rescanSongInfo(self):
-        """ 重新扫描当前的歌曲文件夹的歌曲信息 """
-        if not self.songInfoReader.rescanSongInfo():
+    def stopLibrarySync(self):
+        """ 停止后台同步，已经同步的歌曲信息会被保留 """
+        if not self.isSyncingLibrary():
             return
 
-        self.albumCoverReader.updateAlbumCovers(
-            self.songInfoReader.songInfo_list)
-        self.albumInfoReader.updateAlbumInfo(
-            self.songInfoReader.songInfo_list)
-        self.singerInfoReader.updateSingerInfos(
-            self.albumInfoReader.albumInfo_list)
+        thread = self.syncLibraryThread
+        thread.songInfosChanged.disconnect(self.__onLibrarySyncChanged)
+        thread.finished.disconnect(self.__onLibrarySyncFinished)
+        thread.finished.connect(thread.deleteLater)
+        thread.requestInterruption()
+        thread.wait()
+        self.syncLibraryThread = None
+        self.pendingFolders.clear()
+        self.__flushLibrarySync()
+
+    def isSyncingLibrary(self) -> bool:
+        """ 是否正在后台同步歌曲库 """
+        return self.syncLibraryThread is not None
+
+    def __onLibrarySyncChanged(self, removedPaths: list, songInfo_list: list):
+        """ 后台同步读取到一批发生变化的歌曲信息 """
+        self.pendingSyncPaths.update(removedPaths)
+        for songInfo in songInfo_list:
+            self.pendingSyncSongInfos[songInfo["songPath"]] = songInfo
+
+        # 每次更新都要重新排序歌曲并刷新整个界面，等待更新的歌曲数不少于已有的歌曲数时
+        # 才立即更新，这样更新的总耗时和歌曲数成线性关系，其余的变化由定时器定期更新
+        pendingNum = len(self.pendingSyncPaths) + len(self.pendingSyncSongInfos)
+        if pendingNum >= len(self.songInfoReader.songInfo_list):
+            self.__flushLibrarySync()
+        elif not self.syncFlushTimer.isActive():
+            self.syncFlushTimer.start()
+
+    def __flushLibrarySync(self):
+        """ 将后台同步攒下的歌曲信息变化更新到界面上 """
+        self.syncFlushTimer.stop()
+        removedPaths = list(self.pendingSyncPaths)
+        songInfo_list = list(self.pendingSyncSongInfos.values())
+        self.pendingSyncPaths.clear()
+        self.pendingSyncSongInfos.clear()
+        if not (removedPaths or songInfo_list):
+            return
+
+        if not self.songInfoReader.applySongInfos(removedPaths, songInfo_list):
+            return
+
+        # 封面已经在读取标签时提取过了
+        self.__updateChangedSongInfos(False)
+        self.librarySyncUpdated.emit()
+
+    def __onLibrarySyncFinished(self):
+        """ 后台同步完成，之后的增量扫描使用同步线程建立的文件索引 """
+        thread = self.sender()  # type:SyncLibraryThread
+        if thread.songInfoReader:
+            self.songInfoReader.changeDetector = thread.songInfoReader.changeDetector
+
+        thread.deleteLater()
+        self.syncLibraryThread = None
+        self.__flushLibrarySync()
+        self.__buildSearchIndex()
+
+        # 处理同步期间发生变化的文件夹
+        folderPaths = list(self.pendingFolders)
+        self.pendingFolders.clear()
+        if folderPaths and self.updateSongFolders(folderPaths):
+            self.librarySyncUpdated.emit()
+
+    def __buildSearchIndex(self):
+        """ 在后台为还没有建立搜索索引的歌曲和专辑建立索引，正在建立的索引会被丢弃 """
+        # 变化的条目较少时，搜索时再增量建立索引就足够快了
+        if librarySearchIndex.songs.dirtyNum() + librarySearchIndex.albums.dirtyNum() < 512:
+            return
+
+        self.stopBuildSearchIndex()
+        self.buildSearchIndexThread = BuildSearchIndexThread(self)
+        self.buildSearchIndexThread.finished.connect(self.__onSearchIndexBuilt)
+        self.buildSearchIndexThread.start(QThread.LowPriority)
+
+    def stopBuildSearchIndex(self):
+        """ 停止在后台建立搜索索引，没有建立索引的条目会在搜索时建立 """
+        thread = self.buildSearchIndexThread
+        if not thread:
+            return
+
+        thread.finished.disconnect(self.__onSearchIndexBuilt)
+        thread.finished.connect(thread.deleteLater)
+        thread.requestInterruption()
+        thread.wait()
+        self.buildSearchIndexThread = None
+
+    def __onSearchIndexBuilt(self):
+        """ 后台建立搜索索引完成 """
+        thread = self.sender()  # type:BuildSearchIndexThread
+        thread.load()
+        thread.deleteLater()
+        self.buildSearchIndexThread = None
+
+    def rescanSongInfo(self, isFullScan=False):
+        """ 重新扫描当前的歌曲文件夹的歌曲信息
+
+        Parameters
+        ----------
+        isFullScan: bool
+            是否检查所有文件夹中的文件，为 `False` 时跳过修改时间没有变化的文件夹
+        """
+        # 后台同步完成前还没有建立文件索引
+        if self.isSyncingLibrary():
+            return
+
+        if not self.songInfoReader.rescanSongInfo(isFullScan):
+            return
+
+        self.__updateChangedSongInfos()
+
+    def updateSongFolders(self, folderPaths: list):
+        """ 只重新扫描发生变化的歌曲文件夹
+
+        Parameters
+        ----------
+        folderPaths: list
+            发生变化的歌曲文件夹列表
+
+        Returns
+        -------
+        isUpdated: bool
+            歌曲信息是否有更新
+        """
+        # 后台同步完成后再处理这些文件夹
+        if self.isSyncingLibrary():
+            self.pendingFolders.update(folderPaths)
+            return False
+
+        if not self.songInfoReader.updateFolders(folderPaths):
+            return False
+
+        self.__updateChangedSongInfos()
+        return True
+
+    def __updateChangedSongInfos(self, isReadCovers=True):
+        """ 使用发生变化的歌曲信息增量更新专辑、歌手和封面，再刷新界面
+
+        Parameters
+        ----------
+        isReadCovers: bool
+            是否需要提取新歌曲的封面
+        """
+        removedSongInfos = self.songInfoReader.removedSongInfos
+        updatedSongInfos = self.songInfoReader.updatedSongInfos
+
+        if isReadCovers:
+            self.albumCoverReader.getAlbumCovers(updatedSongInfos)
+        singers = self.albumInfoReader.updateSongInfos(
+            removedSongInfos, updatedSongInfos)
+        self.singerInfoReader.updateSingers(
+            self.albumInfoReader.albumInfo_list, singers)
+        playlistStore.setLibrary(self.songInfoReader.songInfo_list)
+        librarySearchIndex.songs.removeItems(i["songPath"] for i in removedSongInfos)
+        librarySearchIndex.songs.updateItems(updatedSongInfos)
+        librarySearchIndex.albums.setItems(self.albumInfoReader.albumInfo_list)
 
         # 更新界面
         self.songListWidget.updateAllSongCards(
@@ -394,18 +617,35 @@ class MyMusicInterface(QWidget):
             self.albumInfoReader.albumInfo_list)
 
     def hasSongModified(self):
+        if self.isSyncingLibrary():
+            return False
+
         return self.songInfoReader.hasSongModified()
 
     def updateOneSongInfo(self, oldSongInfo: dict, newSongInfo: dict):
         """ 更新一首歌的信息 """
         self.songListWidget.updateOneSongCard(newSongInfo)
         self.albumCardInterface.updateOneSongInfo(oldSongInfo, newSongInfo)
-        self.singerInfoReader.updateSingerInfos(
-            self.albumCardInterface.albumInfo_list)
-        self.songInfoReader.songInfo_list = deepcopy(
-            self.songListWidget.songInfo_list)
-        self.albumInfoReader.albumInfo_list = deepcopy(
-            self.albumCardInterface.albumInfo_list)
+        self.syncSongInfos([oldSongInfo], [newSongInfo])
+
+    def syncSongInfos(self, oldSongInfo_list: list, newSongInfo_list: list):
+        """ 歌曲信息被修改后增量更新歌曲、专辑和歌手信息，不会更新界面
+
+        Parameters
+        ----------
+        oldSongInfo_list: list
+            修改前的歌曲信息列表
+
+        newSongInfo_list: list
+            修改后的歌曲信息列表
+        """
+        self.songInfoReader.updateSongInfos(newSongInfo_list)
+        singers = self.albumInfoReader.updateSongInfos(
+            oldSongInfo_list, newSongInfo_list)
+        self.singerInfoReader.updateSingers(
+            self.albumInfoReader.albumInfo_list, singers)
+        librarySearchIndex.songs.updateItems(newSongInfo_list)
+        librarySearchIndex.albums.setItems(self.albumInfoReader.albumInfo_list)
 
     def __showSortModeMenu(self):
         """ 显示排序方式菜单 """
@@ -456,12 +696,11 @@ class MyMusicInterface(QWidget):
         songInfo_list = []
         if self.sender() is self.songTabSelectionModeBar.addToButton:
             selectionModeBar = self.songTabSelectionModeBar
-            songInfo_list = [
-                i.songInfo for i in self.songListWidget.checkedSongCard_list]
+            songInfo_list = self.songListWidget.checkedSongInfo_list
         else:
             selectionModeBar = self.albumTabSelectionModeBar
-            for albumCard in self.albumCardInterface.checkedAlbumCard_list:
-                songInfo_list.extend(albumCard.songInfo_list)
+            for albumInfo in self.albumCardInterface.checkedAlbumInfo_list:
+                songInfo_list.extend(albumInfo["songInfo_list"])
 
         # 计算菜单弹出位置
         pos = selectionModeBar.mapToGlobal(addToButton.pos())
@@ -505,6 +744,8 @@ class MyMusicInterface(QWidget):
         for act in self.toolBar.albumSortAction_list:
             act.triggered.connect(self.__sortAlbumCard)
 
+        self.syncFlushTimer.timeout.connect(self.__flushLibrarySync)
+
         # 将标签页面信号连接到槽
         self.stackedWidget.currentChanged.connect(self.__onCurrentTabChanged)
 
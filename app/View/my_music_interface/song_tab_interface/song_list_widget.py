@@ -1,18 +1,18 @@
 # coding:utf-8
 from components.dialog_box.message_dialog import MessageDialog
 from components.widgets.menu import AddToMenu, DWMMenu
-from components.song_list_widget import BasicSongListWidget, SongCardType
+from components.song_list_widget import BasicSongListView, SongCardType
 from PyQt5.QtCore import QFile, QMargins, Qt, pyqtSignal
 from PyQt5.QtGui import QContextMenuEvent
 from PyQt5.QtWidgets import QAction, QLabel
 
 
-class SongListWidget(BasicSongListWidget):
+class SongListWidget(BasicSongListView):
     """ 歌曲卡列表视图 """
 
-    playSignal = pyqtSignal(dict)                       # 播放选中的歌曲
-    playOneSongSig = pyqtSignal(dict)                   # 重置播放列表为指定的一首歌
-    nextToPlayOneSongSig = pyqtSignal(dict)             # 下一首播放
+    playSignal = pyqtSignal(object)                     # 播放选中的歌曲
+    playOneSongSig = pyqtSignal(object)                 # 重置播放列表为指定的一首歌
+    nextToPlayOneSongSig = pyqtSignal(object)           # 下一首播放
     switchToSingerInterfaceSig = pyqtSignal(str)        # 切换到歌手界面
     switchToAlbumInterfaceSig = pyqtSignal(str, str)    # 切换到专辑界面
 
@@ -34,8 +34,6 @@ class SongListWidget(BasicSongListWidget):
         )
         self.resize(1150, 758)
         self.sortMode = "createTime"
-        # 创建歌曲卡
-        self.createSongCards()
         self.guideLabel = QLabel(
             self.tr("There is nothing to display here. Try a different filter."), self)
 
@@ -53,12 +51,12 @@ class SongListWidget(BasicSongListWidget):
 
     def __playButtonSlot(self, index):
         """ 歌曲卡播放按钮槽函数 """
-        self.playSignal.emit(self.songCard_list[index].songInfo)
+        self.playSignal.emit(self.songInfo_list[index])
         self.setCurrentIndex(index)
 
     def contextMenuEvent(self, e: QContextMenuEvent):
         """ 重写鼠标右击时间的响应函数 """
-        hitIndex = self.indexAt(e.pos()).column()
+        hitIndex = self.indexAt(e.pos()).row()
         # 显示右击菜单
         if hitIndex > -1:
             contextMenu = SongCardListContextMenu(self)
@@ -71,7 +69,7 @@ class SongListWidget(BasicSongListWidget):
         if self.isInSelectionMode:
             return
         # 发送歌曲信息更新信号
-        self.playSignal.emit(self.songCard_list[index].songInfo)
+        self.playSignal.emit(self.songInfo_list[index])
 
     def __setQss(self):
         """ 设置层叠样式 """
@@ -125,10 +123,10 @@ class SongListWidget(BasicSongListWidget):
         """ 信号连接到槽 """
         menu.playAct.triggered.connect(
             lambda: self.playOneSongSig.emit(
-                self.songCard_list[self.currentRow()].songInfo))
+                self.songInfo_list[self.currentRow()]))
         menu.nextSongAct.triggered.connect(
             lambda: self.nextToPlayOneSongSig.emit(
-                self.songCard_list[self.currentRow()].songInfo))
+                self.songInfo_list[self.currentRow()]))
         # 显示歌曲信息编辑面板
         menu.editInfoAct.triggered.connect(self.showSongInfoEditDialog)
         # 显示属性面板
@@ -137,8 +135,8 @@ class SongListWidget(BasicSongListWidget):
         # 显示专辑界面
         menu.showAlbumAct.triggered.connect(
             lambda: self.switchToAlbumInterfaceSig.emit(
-                self.songCard_list[self.currentRow()].album,
-                self.songCard_list[self.currentRow()].singer,
+                self.songInfo_list[self.currentRow()]["album"],
+                self.songInfo_list[self.currentRow()]["singer"],
             )
         )
         # 删除歌曲卡
@@ -146,18 +144,18 @@ class SongListWidget(BasicSongListWidget):
         # 将歌曲添加到正在播放列表
         menu.addToMenu.playingAct.triggered.connect(
             lambda: self.addSongToPlayingSignal.emit(
-                self.songCard_list[self.currentRow()].songInfo))
+                self.songInfo_list[self.currentRow()]))
         # 进入选择模式
         menu.selectAct.triggered.connect(
-            lambda: self.songCard_list[self.currentRow()].setChecked(True))
+            lambda: self.onSongCardCheckedStateChanged(self.currentRow(), True))
         # 将歌曲添加到已存在的自定义播放列表中
         menu.addToMenu.addSongsToPlaylistSig.connect(
             lambda name: self.addSongsToCustomPlaylistSig.emit(
-                name, [self.songCard_list[self.currentRow()].songInfo]))
+                name, [self.songInfo_list[self.currentRow()]]))
         # 将歌曲添加到新建的播放列表
         menu.addToMenu.newPlaylistAct.triggered.connect(
             lambda: self.addSongsToNewCustomPlaylistSig.emit(
-                [self.songCard_list[self.currentRow()].songInfo]))
+                [self.songInfo_list[self.currentRow()]]))
 
     def _connectSongCardSignalToSlot(self, songCard):
         """ 将歌曲卡信号连接到槽 """
@@ -76,6 +76,8 @@ class NavigationWidget(NavigationWidgetBase):
         self.__connectPlaylistNameClickedSigToSlot()
         self.searchLineEdit.searchButton.clicked.connect(
             self._onSearchButtonClicked)
+        self.searchLineEdit.searchTextChanged.connect(
+            self._onSearchTextChanged)
         # 初始化布局
         self.__initLayout()
 
@@ -175,6 +177,11 @@ class NavigationWidget(NavigationWidgetBase):
             self.currentButton.setSelected(False)
             self.searchSig.emit(text)
 
+    def _onSearchTextChanged(self, text: str):
+        """ 输入停顿槽函数，边输入边搜索时不隐藏导航栏 """
+        self.currentButton.setSelected(False)
+        self.searchSig.emit(text)
+
 
 class ScrollWidget(QWidget):
     """ 滚动部件 """
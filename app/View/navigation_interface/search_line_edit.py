@@ -1,7 +1,7 @@
 # coding:utf-8
 from components.buttons.three_state_button import ThreeStateButton
 from components.widgets.menu import LineEditMenu
-from PyQt5.QtCore import QEvent, Qt
+from PyQt5.QtCore import QEvent, Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon, QKeyEvent
 from PyQt5.QtWidgets import QLineEdit
 
@@ -9,6 +9,10 @@ from PyQt5.QtWidgets import QLineEdit
 class SearchLineEdit(QLineEdit):
     """ 单行搜索框 """
 
+    searchTextChanged = pyqtSignal(str)  # 输入停顿之后发送搜索文本
+
+    debounceInterval = 300  # 输入停顿多久之后才发送搜索文本，单位为毫秒
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -30,6 +34,8 @@ class SearchLineEdit(QLineEdit):
             self.__search_iconPath_dict, self, (46, 45))
         # 实例化右击菜单
         self.menu = LineEditMenu(self)
+        # 实例化防抖计时器，连续输入时只在最后一次输入之后发送搜索文本
+        self.debounceTimer = QTimer(self)
         # 初始化界面
         self.__initWidget()
 
@@ -40,6 +46,12 @@ class SearchLineEdit(QLineEdit):
         # 设置提示文字
         self.setPlaceholderText(self.tr("Search"))
         self.textChanged.connect(self.__onTextChanged)
+        # 防抖
+        self.debounceTimer.setSingleShot(True)
+        self.debounceTimer.setInterval(self.debounceInterval)
+        self.debounceTimer.timeout.connect(self.__onDebounceTimeout)
+        self.textEdited.connect(self.debounceTimer.start)
+        self.searchButton.clicked.connect(self.debounceTimer.stop)
         # 设置外边距
         self.setTextMargins(
             0, 0, self.clearButton.width() + self.searchButton.width(), 0)
@@ -53,6 +65,12 @@ class SearchLineEdit(QLineEdit):
         """ 编辑框的文本改变时选择是否显示清空按钮 """
         self.clearButton.setVisible(bool(text))
 
+    def __onDebounceTimeout(self):
+        """ 输入停顿之后发送搜索文本 """
+        text = self.text()
+        if text.strip():
+            self.searchTextChanged.emit(text)
+
     def resizeEvent(self, e):
         """ 调整大小的同时改变按钮位置 """
         self.searchButton.move(self.width() - self.searchButton.width() - 8, 0)
@@ -85,6 +103,7 @@ class SearchLineEdit(QLineEdit):
             if e.type() == QEvent.MouseButtonRelease and e.button() == Qt.LeftButton:
                 self.clear()
                 self.clearButton.hide()
+                self.debounceTimer.stop()
                 return True
         elif obj == self.searchButton:
             if e.type() == QEvent.MouseButtonRelease and e.button() == Qt.LeftButton:
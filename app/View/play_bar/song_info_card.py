@@ -1,6 +1,7 @@
 # coding:utf-8
 import re
 
+from common.meta_data.thumbnail_cache import thumbnailCache
 from common.os_utils import getCoverPath
 from components.widgets.label import FadeInLabel
 from components.widgets.perspective_widget import PerspectiveWidget
@@ -89,7 +90,7 @@ class SongInfoCard(PerspectiveWidget):
         if newCoverPath != self.coverPath:
             self.albumChanged.emit(newCoverPath)
             self.coverPath = newCoverPath
-            self.albumCoverLabel.setPixmap(QPixmap(newCoverPath).scaled(
+            self.albumCoverLabel.setPixmap(QPixmap(thumbnailCache.getThumbnailPath(newCoverPath, 115)).scaled(
                 115, 115, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
 
 
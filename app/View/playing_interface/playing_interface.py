@@ -1,5 +1,4 @@
 # coding:utf-8
-from copy import deepcopy
 from typing import Dict, List
 
 from common.os_utils import getCoverPath
@@ -60,7 +59,7 @@ class PlayingInterface(QWidget):
 
     def __init__(self, playlist: list = None, parent=None):
         super().__init__(parent)
-        self.playlist = deepcopy(playlist) if playlist else []
+        self.playlist = playlist.copy() if playlist else []
         self.currentIndex = 0
         self.isPlaylistVisible = False
         self.isInSelectionMode = True
@@ -310,7 +309,7 @@ class PlayingInterface(QWidget):
         index: int
             重置后的当前歌曲索引
         """
-        self.playlist = deepcopy(playlist) if playlist else []
+        self.playlist = playlist.copy() if playlist else []
         self.currentIndex = index if isResetIndex else self.currentIndex
         self.songInfoCardChute.setPlaylist(self.playlist, isResetIndex, index)
         self.songListWidget.updateSongCards(self.playlist, isResetIndex, index)
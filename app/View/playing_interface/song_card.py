@@ -19,8 +19,8 @@ class SongCard(QWidget):
     checkedStateChanged = pyqtSignal(int, bool)         # 歌曲卡选中状态改变
     switchToSingerInterfaceSig = pyqtSignal(str)        # 切换到歌手界面
     switchToAlbumInterfaceSig = pyqtSignal(str, str)    # 切换到专辑界面
-    addSongToNewCustomPlaylistSig = pyqtSignal(dict)    # 添加歌曲到新建的播放列表
-    addSongToCustomPlaylistSig = pyqtSignal(str, dict)  # 添加歌曲到已存在的播放列表
+    addSongToNewCustomPlaylistSig = pyqtSignal(object)    # 添加歌曲到新建的播放列表
+    addSongToCustomPlaylistSig = pyqtSignal(str, object)  # 添加歌曲到已存在的播放列表
 
     def __init__(self, songInfo: dict, parent=None):
         super().__init__(parent=parent)
@@ -1,11 +1,8 @@
 # coding:utf-8
-import json
-from copy import deepcopy
-from json import dump
 from typing import Dict, List
-from pathlib import Path
 
 import pinyin
+from common.meta_data.playlist_store import playlistStore
 from common.os_utils import moveToTrash
 from components.buttons.three_state_button import ThreeStatePushButton
 from components.dialog_box.message_dialog import MessageDialog
@@ -35,13 +32,11 @@ class PlaylistCardInterface(ScrollArea):
     addSongsToNewCustomPlaylistSig = pyqtSignal(list)    # 添加歌曲到新的自定义的播放列表中
     addSongsToCustomPlaylistSig = pyqtSignal(str, list)  # 添加歌曲到自定义的播放列表中
 
-    playlistFolder = Path('cache/Playlists')
-
     def __init__(self, parent=None):
         super().__init__(parent)
         self.columnNum = 1
         self.sortMode = "modifiedTime"
-        self.playlists = self.readCustomPlaylists()
+        self.playlists = playlistStore.readPlaylists()
         self.playlistCard_list = []      # type:List[PlaylistCard]
         self.playlistCardInfo_list = []  # type:List[dict]
         self.playlistName2Card_dict = {}   # type:Dict[str, PlaylistCard]
@@ -411,7 +406,7 @@ class PlaylistCardInterface(ScrollArea):
 
         # 删除播放列表卡和播放列表文件
         playlistCard.deleteLater()
-        moveToTrash(str(self.playlistFolder/(playlistName+'.json')))
+        moveToTrash(str(playlistStore.getPlaylistPath(playlistName)))
 
         # 调整高度
         self.scrollWidget.resize(
@@ -421,16 +416,15 @@ class PlaylistCardInterface(ScrollArea):
         self.guideLabel.setHidden(bool(self.playlistCard_list))
 
     def deleteSongs(self, songPaths: list):
-        """ 从各个播放列表中删除歌曲 """
+        """ 从各个播放列表中删除歌曲，只保存包含这些歌曲的播放列表 """
+        songPaths = set(songPaths)
         for name, playlist in self.playlists.items():
-            songInfo_list = playlist["songInfo_list"]
-            playlistCard = self.playlistName2Card_dict[name]
-
-            for songInfo in songInfo_list.copy():
-                if songInfo['songPath'] in songPaths:
-                    songInfo_list.remove(songInfo)
+            paths = [i for i in playlist["songPaths"] if i not in songPaths]
+            if len(paths) == len(playlist["songPaths"]):
+                continue
 
-            playlistCard.updateWindow(playlist)
+            playlist["songPaths"] = paths
+            self.playlistName2Card_dict[name].updateWindow(playlist)
             self.savePlaylist(playlist)
 
     def __deleteMultiPlaylistCards(self, playlistNames: list):
@@ -494,7 +488,7 @@ class PlaylistCardInterface(ScrollArea):
         """
         playlist = self.playlists[playlistName]
         playlistCard = self.playlistName2Card_dict[playlistName]
-        playlist["songInfo_list"] += deepcopy(songInfo_list)
+        playlist["songPaths"] += playlistStore.register(songInfo_list)
         playlist["modifiedTime"] = QDateTime.currentDateTime().toString(
             Qt.ISODate)
         playlistCard.updateWindow(playlist)
@@ -504,21 +498,21 @@ class PlaylistCardInterface(ScrollArea):
 
     def updateOneSongInfo(self, newSongInfo: dict):
         """ 更新一首歌曲信息 """
-        for playlist in self.playlists.values():
-            for i, songInfo in enumerate(playlist["songInfo_list"]):
-                # 一个播放列表中可能有好几首相同的歌曲，需要全部更新
-                if songInfo["songPath"] == newSongInfo["songPath"]:
-                    playlist["songInfo_list"][i] = newSongInfo
-                    name = playlist["playlistName"]
-                    self.playlistName2Card_dict[name].updateWindow(playlist)
-                    index = self.__getCardInfoIndex(name)
-                    self.playlistCardInfo_list[index][1] = playlist
-                    self.savePlaylist(playlist)
+        self.updateMultiSongInfo([newSongInfo])
 
     def updateMultiSongInfo(self, newSongInfo_list: list):
-        """ 更新多首歌曲信息 """
-        for songInfo in newSongInfo_list:
-            self.updateOneSongInfo(songInfo)
+        """ 更新多首歌曲信息，播放列表只保存了歌曲路径，只需要更新封面可能变化的播放列表卡 """
+        externalPaths = playlistStore.updateSongInfos(newSongInfo_list)
+        songPaths = {i["songPath"] for i in newSongInfo_list}
+
+        for name, playlist in self.playlists.items():
+            songInfo = playlistStore.getFirstSongInfo(playlist)
+            if songInfo is not None and songInfo["songPath"] in songPaths:
+                self.playlistName2Card_dict[name].updateWindow(playlist)
+
+            # 不在歌曲库中的歌曲信息保存在播放列表文件中，需要重新保存
+            if externalPaths and not externalPaths.isdisjoint(playlist["songPaths"]):
+                self.savePlaylist(playlist)
 
     def updateOnePlaylist(self, playlistName: str, songInfo_list: list):
         """ 更新一个播放列表中的歌曲
@@ -532,7 +526,7 @@ class PlaylistCardInterface(ScrollArea):
             新的歌曲列表
         """
         playlist = self.playlists[playlistName]
-        playlist["songInfo_list"] = deepcopy(songInfo_list)
+        playlist["songPaths"] = playlistStore.register(songInfo_list)
         playlist["modifiedTime"] = QDateTime.currentDateTime().toString(
             Qt.ISODate)
         playlistCard = self.playlistName2Card_dict[playlistName]
@@ -597,21 +591,8 @@ class PlaylistCardInterface(ScrollArea):
 
     def savePlaylist(self, playlist: dict):
         """ 保存播放列表 """
-        path = self.playlistFolder/(playlist["playlistName"]+'.json')
-        with open(path, "w", encoding="utf-8") as f:
-            dump(playlist, f)
-
-    def readCustomPlaylists(self):
-        """ 读取自定义播放列表 """
-        self.playlistFolder.mkdir(exist_ok=True, parents=True)
-
-        playlists = {}  # type:Dict[str, dict]
-        
-        for file in self.playlistFolder.glob('*.json'):
-            with open(file, encoding="utf-8") as f:
-                playlist = json.load(f)  # type:dict
-                name = playlist.get("playlistName", file.stem)
-                playlist["playlistName"] = name
-                playlists[name] = playlist
-
-        return playlists
+        playlistStore.save(playlist)
+
+    def getPlaylist(self, playlistName: str) -> dict:
+        """ 获取解析了歌曲信息的播放列表，用于打开播放列表 """
+        return playlistStore.resolve(self.playlists[playlistName])
@@ -1,6 +1,6 @@
 # coding:utf-8
-from copy import deepcopy
 
+from common.meta_data.playlist_store import playlistStore
 from common.os_utils import getCoverPath
 from components.buttons.three_state_button import ThreeStatePushButton
 from components.dialog_box.message_dialog import MessageDialog
@@ -22,12 +22,12 @@ class PlaylistInterface(ScrollArea):
     songCardPlaySig = pyqtSignal(int)                       # 在当前播放列表中播放这首歌
     deletePlaylistSig = pyqtSignal(str)                     # 删除整张播放列表
     removeSongSig = pyqtSignal(str, list)                   # 从播放列表中移除歌曲
-    playOneSongCardSig = pyqtSignal(dict)                   # 将播放列表重置为一首歌
+    playOneSongCardSig = pyqtSignal(object)                 # 将播放列表重置为一首歌
     playCheckedCardsSig = pyqtSignal(list)                  # 播放选中的歌曲卡
-    nextToPlayOneSongSig = pyqtSignal(dict)                 # 下一首播放一首歌
-    addOneSongToPlayingSig = pyqtSignal(dict)               # 添加一首歌到正在播放
+    nextToPlayOneSongSig = pyqtSignal(object)               # 下一首播放一首歌
+    addOneSongToPlayingSig = pyqtSignal(object)             # 添加一首歌到正在播放
     renamePlaylistSig = pyqtSignal(dict, dict)              # 重命名播放列表
-    editSongInfoSignal = pyqtSignal(dict, dict)             # 编辑歌曲信息信号
+    editSongInfoSignal = pyqtSignal(object, object)         # 编辑歌曲信息信号
     switchToAlbumCardInterfaceSig = pyqtSignal()            # 切换到专辑卡界面
     selectionModeStateChanged = pyqtSignal(bool)            # 进入/退出 选择模式
     nextToPlayCheckedCardsSig = pyqtSignal(list)            # 将选中的多首歌添加到下一首播放
@@ -144,7 +144,8 @@ class PlaylistInterface(ScrollArea):
 
     def __getPlaylistInfo(self, playlist: dict):
         """ 获取播放列表信息 """
-        self.playlist = deepcopy(playlist)
+        self.playlist = playlist.copy()
+        self.playlist["songInfo_list"] = playlist.get("songInfo_list", []).copy()
         self.songInfo_list = self.playlist.get("songInfo_list", [])
         self.playlistName = self.playlist.get(
             "playlistName", self.tr("Unknown playlist"))
@@ -259,8 +260,8 @@ class PlaylistInterface(ScrollArea):
 
     def __renamePlaylist(self, oldPlaylist: dict, newPlaylist):
         """ 重命名播放列表 """
-        self.__getPlaylistInfo(newPlaylist)
-        self.playlistInfoBar.updateWindow(newPlaylist)
+        self.__getPlaylistInfo(playlistStore.resolve(newPlaylist))
+        self.playlistInfoBar.updateWindow(self.playlist)
         self.renamePlaylistSig.emit(oldPlaylist, newPlaylist)
 
     def __onSongListWidgetRemoveSongs(self, songPath: str):
@@ -277,8 +278,7 @@ class PlaylistInterface(ScrollArea):
 
     def __onEditSongInfo(self, oldSongInfo: dict, newSongInfo: dict):
         """ 编辑歌曲信息槽函数 """
-        self.playlist['songInfo_list'] = deepcopy(
-            self.songListWidget.songInfo_list)
+        self.playlist['songInfo_list'] = self.songListWidget.songInfo_list.copy()
         self.songInfo_list = self.playlist['songInfo_list']
         index = self.songInfo_list.index(newSongInfo)
 
@@ -10,8 +10,8 @@ class SongListWidget(NoScrollSongListWidget):
     """ 歌曲卡列表视图 """
 
     playSignal = pyqtSignal(int)                        # 将当前歌曲切换为指定的歌曲卡
-    playOneSongSig = pyqtSignal(dict)                   # 只播放一首歌
-    nextToPlayOneSongSig = pyqtSignal(dict)             # 下一首播放
+    playOneSongSig = pyqtSignal(object)                 # 只播放一首歌
+    nextToPlayOneSongSig = pyqtSignal(object)           # 下一首播放
     switchToSingerInterfaceSig = pyqtSignal(str)        # 切换到歌手界面
     switchToAlbumInterfaceSig = pyqtSignal(str, str)    # 切换到专辑界面
 
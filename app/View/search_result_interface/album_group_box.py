@@ -1,7 +1,7 @@
 # coding:utf-8
-from copy import deepcopy
 from typing import List
 
+from common.meta_data import AlbumInfoReader
 from components.album_card import AlbumBlurBackground
 from components.album_card import AlbumCard as AlbumCardBase
 from components.buttons.three_state_button import ThreeStatePushButton
@@ -231,7 +231,7 @@ class AlbumGroupBox(QScrollArea):
 
     def deleteAlbums(self, albumNames: list):
         """ 删除专辑 """
-        albumInfo_list = deepcopy(self.albumInfo_list)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
 
         for albumInfo in albumInfo_list.copy():
             if albumInfo["album"] in albumNames:
@@ -241,7 +241,7 @@ class AlbumGroupBox(QScrollArea):
 
     def deleteSongs(self, songPaths: list):
         """ 删除歌曲 """
-        albumInfo_list = deepcopy(self.albumInfo_list)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
         for albumInfo in albumInfo_list.copy():
             songInfo_list = albumInfo["songInfo_list"]
 
@@ -284,7 +284,7 @@ class AlbumGroupBox(QScrollArea):
         self.scrollWidget.adjustSize()
 
         # 更新部分专辑卡
-        self.albumInfo_list = deepcopy(albumInfo_list)
+        self.albumInfo_list = AlbumInfoReader.copyAlbumInfos(albumInfo_list)
         n = oldCardNum if oldCardNum < newCardNum else newCardNum
         for i in range(n):
             albumInfo = albumInfo_list[i]
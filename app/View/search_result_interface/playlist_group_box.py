@@ -1,7 +1,7 @@
 # coding:utf-8
-from copy import deepcopy
 from typing import Dict, List
 
+from common.meta_data.playlist_store import playlistStore
 from common.os_utils import moveToTrash
 from components.buttons.three_state_button import ThreeStatePushButton
 from components.dialog_box.message_dialog import MessageDialog
@@ -191,20 +191,18 @@ class PlaylistGroupBox(QScrollArea):
 
         # 删除播放列表卡和播放列表文件
         playlistCard.deleteLater()
-        moveToTrash(f'cache/Playlists/{playlistName}.json')
+        moveToTrash(str(playlistStore.getPlaylistPath(playlistName)))
 
     def deleteSongs(self, songPaths: list):
-        """ 从各个播放列表中删除歌曲 """
+        """ 从各个播放列表中删除歌曲，播放列表文件由播放列表卡界面保存 """
+        songPaths = set(songPaths)
         for name, playlist in self.playlists.items():
-            songInfo_list = playlist["songInfo_list"]
-            playlistCard = self.playlistName2Card_dict[name]
+            paths = [i for i in playlist["songPaths"] if i not in songPaths]
+            if len(paths) == len(playlist["songPaths"]):
+                continue
 
-            for songInfo in songInfo_list.copy():
-                if songInfo['songPath'] in songPaths:
-                    songInfo_list.remove(songInfo)
-
-            playlistCard.updateWindow(playlist)
-            self.savePlaylist(playlist)
+            playlist["songPaths"] = paths
+            self.playlistName2Card_dict[name].updateWindow(playlist)
 
     def enterEvent(self, e):
         """ 进入窗口时显示滚动按钮 """
@@ -310,7 +308,8 @@ class PlaylistGroupBox(QScrollArea):
         self.scrollWidget.adjustSize()
 
         # 更新部分播放列表卡
-        self.playlists = deepcopy(playlists)
+        self.playlists = {
+            k: {**v, "songPaths": v["songPaths"].copy()} for k, v in playlists.items()}
         n = oldCardNum if oldCardNum < newCardNum else newCardNum
         for i, playlist in enumerate(list(playlists.values())[:n]):
             self.playlistCard_list[i].updateWindow(playlist)
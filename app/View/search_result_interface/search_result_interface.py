@@ -1,10 +1,10 @@
 # coding:utf-8
 import os
-from copy import deepcopy
 from math import ceil
 
-from common.crawler import KuWoMusicCrawler
+from common.meta_data import AlbumInfoReader, librarySearchIndex
 from common.thread.download_song_thread import DownloadSongThread
+from common.thread.search_online_song_thread import SearchOnlineSongThread
 from components.widgets.scroll_area import ScrollArea
 from components.widgets.state_tooltip import DownloadStateTooltip
 from PyQt5.QtCore import QFile, Qt, pyqtSignal
@@ -27,7 +27,7 @@ class SearchResultInterface(ScrollArea):
     deleteSongSig = pyqtSignal(str)                      # 删除一首歌
     deleteAlbumSig = pyqtSignal(list)                    # 删除整张专辑
     deletePlaylistSig = pyqtSignal(str)                  # 删除整张播放列表
-    playOneSongCardSig = pyqtSignal(dict)                # 将播放列表重置为一首歌
+    playOneSongCardSig = pyqtSignal(object)              # 将播放列表重置为一首歌
     renamePlaylistSig = pyqtSignal(dict, dict)           # 重命名播放列表
     switchToSingerInterfaceSig = pyqtSignal(str)         # 切换到歌手界面
     switchToPlaylistInterfaceSig = pyqtSignal(str)       # 切换到播放列表界面
@@ -36,6 +36,11 @@ class SearchResultInterface(ScrollArea):
     addSongsToNewCustomPlaylistSig = pyqtSignal(list)    # 添加歌曲到新的自定义的播放列表中
     addSongsToCustomPlaylistSig = pyqtSignal(str, list)  # 添加歌曲到自定义的播放列表中
 
+    # 每种本地搜索结果最多显示的数量，按照相关度取前几个
+    maxLocalSongNum = 200
+    maxAlbumNum = 50
+    maxPlaylistNum = 50
+
     def __init__(self, onlineMusicPageSize=10, onlinePlayQuality='Standard quality',
                  downloadFolder='app/download', parent=None):
         """
@@ -74,7 +79,6 @@ class SearchResultInterface(ScrollArea):
             self.tr('Check your spelling, or search for something else'), self)
         self.localSongListWidget = self.localSongGroupBox.songListWidget
         self.onlineSongListWidget = self.onlineSongGroupBox.songListWidget
-        self.crawler = KuWoMusicCrawler()
         self.totalPages = 1                             # 在线音乐总分页数
         self.currentPage = 1                            # 当前在线音乐页码
         self.totalOnlineMusic = 0                       # 数据库中所有符合条件的在线音乐数
@@ -83,6 +87,7 @@ class SearchResultInterface(ScrollArea):
         self.onlineMusicPageSize = onlineMusicPageSize  # 每页最多显示的在线音乐数量
         self.downloadSongThread = DownloadSongThread(self.downloadFolder, self)
         self.downloadStateTooltip = None
+        self.searchOnlineSongThread = SearchOnlineSongThread(self)
         self.__initWidget()
 
     def __initWidget(self):
@@ -149,21 +154,22 @@ class SearchResultInterface(ScrollArea):
         """ 删除一张专辑槽函数 """
         self.localSongListWidget.removeSongCards(songPaths)
         self.playlistGroupBox.deleteSongs(songPaths)
-        self.localSongInfo_list = deepcopy(
-            self.localSongListWidget.songInfo_list)
-        self.albumInfo_list = deepcopy(
+        self.localSongInfo_list = self.localSongListWidget.songInfo_list.copy()
+        self.albumInfo_list = AlbumInfoReader.copyAlbumInfos(
             self.albumGroupBox.albumInfo_list)
-        self.playlists = deepcopy(self.playlistGroupBox.playlists)
+        self.playlists = {
+            k: {**v, "songPaths": v["songPaths"].copy()}
+            for k, v in self.playlistGroupBox.playlists.items()
+        }
         self.__updateWidgetsVisible()
         self.deleteAlbumSig.emit(songPaths)
 
     def __onDeleteOneSong(self, songPath: str):
         """ 删除一首本地歌曲槽函数 """
         self.albumGroupBox.deleteSongs([songPath])
-        self.albumInfo_list = deepcopy(
+        self.albumInfo_list = AlbumInfoReader.copyAlbumInfos(
             self.albumGroupBox.albumInfo_list)
-        self.localSongInfo_list = deepcopy(
-            self.localSongListWidget.songInfo_list)
+        self.localSongInfo_list = self.localSongListWidget.songInfo_list.copy()
         self.__updateWidgetsVisible()
         self.deleteSongSig.emit(songPath)
 
@@ -193,44 +199,40 @@ class SearchResultInterface(ScrollArea):
         self.downloadStateTooltip = None
         self.downloadFinished.emit(self.downloadFolder)
 
-    def search(self, keyWord: str, songInfo_list: list, albumInfo_list: list, playlists: dict):
-        """ 搜索与关键词相匹配的专辑、歌曲和播放列表 """
+    def search(self, keyWord: str, playlists: dict):
+        """ 在歌曲库的搜索索引中搜索与关键词相匹配的专辑、歌曲和播放列表
+
+        Parameters
+        ----------
+        keyWord: str
+            关键词
+
+        playlists: dict
+            所有自定义播放列表
+        """
         keyWord_ = keyWord
         self.keyWord = keyWord = keyWord.lower()
 
-        # 对专辑进行匹配
-        self.albumInfo_list = []
-        for albumInfo in albumInfo_list:
-            album = albumInfo['album'].lower()
-            singer = albumInfo["singer"].lower()
-            if album.find(keyWord) >= 0 or singer.find(keyWord) >= 0:
-                self.albumInfo_list.append(albumInfo)
-
-        # 对本地歌曲进行匹配
-        self.localSongInfo_list = []
-        for songInfo in songInfo_list:
-            songName = songInfo["songName"].lower()
-            singer = songInfo["singer"].lower()
-            if songName.find(keyWord) >= 0 or singer.find(keyWord) >= 0:
-                self.localSongInfo_list.append(songInfo)
-
-        # 对在线歌曲进行匹配并获取播放地址和封面
-        self.currentPage = 1
-        self.onlineSongInfo_list, self.totalOnlineMusic = self.crawler.getSongInfoList(
-            keyWord, 1, self.onlineMusicPageSize)
-        self.totalPages = 1 if not self.totalOnlineMusic else ceil(
-            self.totalOnlineMusic/self.onlineMusicPageSize)
-
-        # 根据页面数更新加载更多标签
-        self.__updateLoadMoreLabel()
+        # 对专辑和本地歌曲进行匹配
+        self.albumInfo_list = librarySearchIndex.albums.search(
+            keyWord, self.maxAlbumNum)
+        self.localSongInfo_list = librarySearchIndex.songs.search(
+            keyWord, self.maxLocalSongNum)
 
+        # 在线歌曲在线程中搜索，先清空上一个关键词的搜索结果，搜索完成后再显示
+        self.currentPage = 1
+        self.totalPages = 1
+        self.totalOnlineMusic = 0
+        self.onlineSongInfo_list = []
         self.onlineSongGroupBox.updateWindow(self.onlineSongInfo_list)
+        self.searchOnlineSongThread.search(
+            keyWord, 1, self.onlineMusicPageSize)
 
-        # 对播放列表进行匹配
-        self.playlists = {}
-        for name, playlist in playlists.items():
-            if name.lower().find(keyWord) >= 0:
-                self.playlists[name] = playlist
+        # 对播放列表进行匹配，播放列表很少，直接在搜索时同步索引
+        librarySearchIndex.playlists.setItems(playlists.values())
+        self.playlists = {
+            i["playlistName"]: i for i in librarySearchIndex.playlists.search(keyWord, self.maxPlaylistNum)
+        }
 
         # 更新界面
         self.titleLabel.setText(f'"{keyWord_}"'+self.tr('Search Result'))
@@ -244,6 +246,31 @@ class SearchResultInterface(ScrollArea):
         self.__updateWidgetsVisible()
         self.verticalScrollBar().setValue(0)
 
+    def __onOnlineSearchFinished(self, requestId: int, songInfo_list: list, total: int):
+        """ 在线歌曲搜索完成槽函数，过期的搜索结果直接丢弃 """
+        if self.searchOnlineSongThread.isStale(requestId):
+            return
+
+        if self.currentPage == 1:
+            self.totalOnlineMusic = total
+            self.totalPages = 1 if not total else ceil(
+                total/self.onlineMusicPageSize)
+            self.onlineSongInfo_list = songInfo_list
+            self.onlineSongGroupBox.updateWindow(self.onlineSongInfo_list)
+        else:
+            self.onlineSongGroupBox.loadMoreOnlineMusic(songInfo_list)
+            self.onlineSongInfo_list = self.onlineSongListWidget.songInfo_list
+
+        # 根据页面数更新加载更多标签
+        self.__updateLoadMoreLabel()
+        self.__adjustHeight()
+        self.__updateWidgetsVisible()
+
+    def stopOnlineSearch(self):
+        """ 取消在线歌曲搜索并等待线程退出 """
+        self.searchOnlineSongThread.cancel()
+        self.searchOnlineSongThread.wait()
+
     def __adjustHeight(self):
         """ 调整窗口长度 """
         # 调整窗口大小
@@ -312,22 +339,14 @@ class SearchResultInterface(ScrollArea):
 
     def __loadMoreOnlineMusic(self):
         """ 加载更多在线音乐 """
-        if self.currentPage == self.totalPages:
+        if self.currentPage == self.totalPages or self.searchOnlineSongThread.isRunning():
             return
 
-        # 获取在线音乐
+        # 在线程中获取下一页在线音乐，结果在搜索完成槽函数中更新
         self.currentPage += 1
-        songInfo_list, _ = self.crawler.getSongInfoList(
+        self.searchOnlineSongThread.search(
             self.keyWord, self.currentPage, self.onlineMusicPageSize)
 
-        # 更新在线音乐列表
-        offset = len(self.onlineSongListWidget.songInfo_list)
-        self.onlineSongGroupBox.loadMoreOnlineMusic(songInfo_list)
-        self.onlineSongInfo_list = self.onlineSongListWidget.songInfo_list
-
-        self.__updateLoadMoreLabel()
-        self.__adjustHeight()
-
     def __connectSignalToSlot(self):
         """ 信号连接到槽 """
         # 专辑分组框信号连接到槽
@@ -391,3 +410,5 @@ class SearchResultInterface(ScrollArea):
 
         # 线程信号连接到槽函数
         self.downloadSongThread.finished.connect(self.__onDownloadAllComplete)
+        self.searchOnlineSongThread.searchFinished.connect(
+            self.__onOnlineSearchFinished)
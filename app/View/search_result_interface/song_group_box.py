@@ -109,8 +109,8 @@ class LocalSongListWidget(NoScrollSongListWidget):
     """ 本地音乐歌曲卡列表 """
 
     playSignal = pyqtSignal(int)                        # 将播放列表的当前歌曲切换为指定的歌曲卡
-    playOneSongSig = pyqtSignal(dict)                   # 重置播放列表为指定的一首歌
-    nextToPlayOneSongSig = pyqtSignal(dict)             # 将歌曲添加到下一首播放
+    playOneSongSig = pyqtSignal(object)                 # 重置播放列表为指定的一首歌
+    nextToPlayOneSongSig = pyqtSignal(object)           # 将歌曲添加到下一首播放
     switchToSingerInterfaceSig = pyqtSignal(str)        # 切换到歌手界面
     switchToAlbumInterfaceSig = pyqtSignal(str, str)    # 切换到专辑界面
 
@@ -209,8 +209,8 @@ class OnlineSongListWidget(NoScrollSongListWidget):
     """ 在线音乐歌曲卡列表 """
 
     playSignal = pyqtSignal(int)                # 将播放列表的当前歌曲切换为指定的歌曲卡
-    playOneSongSig = pyqtSignal(dict)           # 重置播放列表为指定的一首歌
-    nextToPlayOneSongSig = pyqtSignal(dict)     # 将歌曲添加到下一首播放
+    playOneSongSig = pyqtSignal(object)         # 重置播放列表为指定的一首歌
+    nextToPlayOneSongSig = pyqtSignal(object)   # 将歌曲添加到下一首播放
     downloadSig = pyqtSignal(dict, str)         # 下载歌曲 (songInfo, quality)
 
     def __init__(self, parent=None):
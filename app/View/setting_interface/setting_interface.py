@@ -34,9 +34,16 @@ class SettingInterface(ScrollArea):
         # 默认配置
         self.config = {
             "selected-folders": [],
+            "watch-selected-folders": True,
+            "scan-max-depth": 10,
+            "scan-in-background": True,
+            "preload-interfaces": True,
+            "scan-ignore-patterns": [],
             "mv-quality": "Full HD",
             "online-play-quality": "Standard quality",
             "online-music-page-size": 20,
+            "lyric-prefetch-num": 3,
+            "lyric-prefetch-concurrency": 1,
             "enable-acrylic-background": False,
             "minimize-to-tray": True,
             "volume": 30,
@@ -265,7 +272,8 @@ class SettingInterface(ScrollArea):
         """ 爬取歌曲元数据 """
         # 创建爬虫线程
         crawler = GetFolderMetaDataThread(
-            self.config["selected-folders"], self)
+            self.config["selected-folders"], self.config["scan-max-depth"],
+            self.config["scan-ignore-patterns"], self)
 
         # 创建状态提示条
         stateToolTip = StateTooltip(
@@ -1,10 +1,10 @@
 # coding:utf-8
 import os
 from pathlib import Path
-from copy import deepcopy
 from typing import Dict, List
 
 from common.crawler import KuWoMusicCrawler
+from common.meta_data import AlbumInfoReader
 from common.thread.get_singer_avatar_thread import GetSingerAvatarThread
 from common.thread.save_album_info_thread import SaveAlbumInfoThread
 from components.album_card import AlbumBlurBackground
@@ -194,7 +194,9 @@ class SingerInterface(ScrollArea):
 
     def __getInfo(self, singerInfo: dict):
         """ 获取信息 """
-        self.singerInfo = deepcopy(singerInfo) if singerInfo else {}
+        self.singerInfo = singerInfo.copy() if singerInfo else {}
+        self.singerInfo["albumInfo_list"] = AlbumInfoReader.copyAlbumInfos(
+            self.singerInfo.get("albumInfo_list", []))
         self.genre = self.singerInfo.get('genre', self.tr('Unknown genre'))
         self.singer = self.singerInfo.get('singer', self.tr('Unknown artist'))
         self.albumInfo_list = self.singerInfo.get('albumInfo_list', [])
@@ -253,7 +255,7 @@ class SingerInterface(ScrollArea):
 
     def deleteAlbums(self, albumNames: list):
         """ 删除专辑 """
-        albumInfo_list = deepcopy(self.albumInfo_list)
+        albumInfo_list = AlbumInfoReader.copyAlbumInfos(self.albumInfo_list)
 
         for albumInfo in albumInfo_list.copy():
             if albumInfo["album"] in albumNames:
@@ -1,5 +1,4 @@
 # coding:utf-8
-from copy import deepcopy
 
 from common.os_utils import getCoverPath
 from components.buttons.circle_button import CircleButton
@@ -27,7 +26,7 @@ class SmallestPlayInterface(FramelessWindow):
 
     def __init__(self, playlist: list = None, parent=None):
         super().__init__(parent)
-        self.playlist = deepcopy(playlist) if playlist else []
+        self.playlist = playlist.copy() if playlist else []
         self.currentIndex = 0
         self.shiftLeftTime = 0
         self.shiftRightTime = 0
@@ -298,7 +297,7 @@ class SmallestPlayInterface(FramelessWindow):
         isResetIndex: bool
             是否从头播放歌曲
         """
-        self.playlist = deepcopy(playlist) if playlist else []
+        self.playlist = playlist.copy() if playlist else []
         self.currentIndex = 0 if isResetIndex else self.currentIndex
         if playlist:
             self.curSongInfoCard.updateCard(self.playlist[0])
@@ -2,4 +2,7 @@ from .wanyi_music_crawler import WanYiMusicCrawler
 from .kugou_music_crawler import KuGouMusicCrawler
 from .kuwo_music_crawler import KuWoMusicCrawler
 from .qq_music_crawler import QQMusicCrawler
-from .crawler_base import CrawlerBase
\ No newline at end of file
+from .crawler_base import CrawlerBase
+from .http_client import HttpClient, httpClient
+from .response_cache import ResponseCache, responseCache
+from .provider_health import ProviderHealthTracker, providerHealth
\ No newline at end of file
@@ -1,13 +1,23 @@
 # coding:utf-8
 import os
 from copy import deepcopy
+from threading import local
 from typing import List, Tuple
 
-import requests
 from common.image_process_utils import getPicSuffix
 from common.meta_data import AlbumCoverReader
 from common.meta_data.writer import writeAlbumCover, writeSongInfo
 
+from .http_client import httpClient
+
+
+_failureCounter = local()
+
+
+def failureCount() -> int:
+    """ 当前线程中被 `exceptionHandler` 处理的异常数，用于判断一次查询中是否有请求失败 """
+    return getattr(_failureCounter, "count", 0)
+
 
 def exceptionHandler(*default):
     """ 请求异常处理装饰器
@@ -25,6 +35,7 @@ def exceptionHandler(*default):
                 return func(*args, **kwargs)
             except BaseException as e:
                 print(e)
+                _failureCounter.count = failureCount() + 1
                 value = deepcopy(default)
                 if len(value) == 0:
                     return None
@@ -42,6 +53,7 @@ class CrawlerBase:
     """ 爬虫抽象类 """
 
     song_url_mark = 'http'  # 还未取得歌曲播放地址时的标记
+    provider = None         # 服务商名字，用于限制并发请求数，为 `None` 时按主机名限制
 
     def __init__(self):
         self.qualities = ['Standard quality', 'High quality', 'Super quality']
@@ -328,7 +340,7 @@ class CrawlerBase:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
                           'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/71.0.3578.98 Safari/537.36'
         }
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
         pic_data = response.content
 
@@ -0,0 +1,165 @@
+# coding:utf-8
+import time
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock, Semaphore, local
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpClient:
+    """ 所有爬虫共用的 HTTP 客户端
+
+    所有请求共用一个会话，会话为每个主机维护一个连接池并保持长连接，不必为每个请求重新建立
+    TCP 和 TLS 连接。请求默认带有连接超时和读取超时，幂等请求失败时会按指数退避重试，
+    同一个服务商的并发请求数受限于它的并发上限
+    """
+
+    idempotentMethods = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    retryStatusCodes = {429, 500, 502, 503, 504}
+
+    def __init__(self, timeout=(5, 15), retries=2, backoffFactor=0.5, maxBackoff=4,
+                 poolConnections=16, poolMaxSize=16, defaultConcurrencyLimit=4):
+        """
+        Parameters
+        ----------
+        timeout: float or Tuple[float, float]
+            默认的超时时间，单位为秒，元组表示 `(连接超时, 读取超时)`
+
+        retries: int
+            幂等请求失败时的最大重试次数
+
+        backoffFactor: float
+            退避系数，第 `i` 次重试前等待 `backoffFactor * 2**i` 秒
+
+        maxBackoff: float
+            重试前最长的等待时间，单位为秒
+
+        poolConnections: int
+            缓存的连接池个数，每个主机对应一个连接池
+
+        poolMaxSize: int
+            每个连接池保持的最大连接数
+
+        defaultConcurrencyLimit: int
+            没有单独设置并发上限的服务商的并发上限
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoffFactor = backoffFactor
+        self.maxBackoff = maxBackoff
+        self.defaultConcurrencyLimit = defaultConcurrencyLimit
+        self.__concurrencyLimits = {}
+        self.__semaphores = {}
+        self.__lock = Lock()
+        self.__local = local()
+
+        # 爬虫自己设置 Cookie 请求头，会话不保存服务器返回的 cookie，
+        # 这样请求之间互不影响，多个线程共用会话也是安全的
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(poolConnections, poolMaxSize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def setConcurrencyLimit(self, provider: str, limit: int):
+        """ 设置服务商的并发上限，只对之后发出的请求生效
+
+        Parameters
+        ----------
+        provider: str
+            服务商名字，比如 `kuwo`
+
+        limit: int
+            同时进行的请求数上限，必须大于 0
+        """
+        if limit <= 0:
+            raise ValueError("并发上限必须大于 0")
+
+        with self.__lock:
+            self.__concurrencyLimits[provider] = limit
+            self.__semaphores.pop(provider, None)
+
+    def concurrencyLimit(self, provider: str) -> int:
+        """ 服务商的并发上限 """
+        return self.__concurrencyLimits.get(provider, self.defaultConcurrencyLimit)
+
+    def requestCount(self) -> int:
+        """ 当前线程发送的请求数，用于判断一次查询是否使用了网络 """
+        return getattr(self.__local, "requestCount", 0)
+
+    def get(self, url: str, params=None, provider: str = None, **kwargs) -> requests.Response:
+        """ 发送 get 请求，参数的含义同 `request()` """
+        return self.request("GET", url, params=params, provider=provider, **kwargs)
+
+    def post(self, url: str, data=None, provider: str = None, idempotent=False, **kwargs) -> requests.Response:
+        """ 发送 post 请求，参数的含义同 `request()` """
+        return self.request("POST", url, data=data, provider=provider, idempotent=idempotent, **kwargs)
+
+    def request(self, method: str, url: str, provider: str = None, idempotent: bool = None,
+                **kwargs) -> requests.Response:
+        """ 发送请求
+
+        Parameters
+        ----------
+        method: str
+            请求方法
+
+        url: str
+            请求地址
+
+        provider: str
+            服务商名字，用于限制并发数，为 `None` 时使用请求地址的主机名
+
+        idempotent: bool
+            请求是否幂等，只有幂等请求才会在失败后重试，为 `None` 时根据请求方法判断
+
+        **kwargs:
+            传给 `requests.Session.request()` 的其他参数，没有指定 `timeout` 时使用默认超时时间
+
+        Returns
+        -------
+        response: requests.Response
+            服务器的响应，不会检查响应的状态码
+
+        Raises
+        ------
+        requests.RequestException:
+            重试之后依然连接失败或者超时
+        """
+        method = method.upper()
+        provider = provider or urlsplit(url).hostname or ""
+        kwargs.setdefault("timeout", self.timeout)
+        if idempotent is None:
+            idempotent = method in self.idempotentMethods
+
+        retries = self.retries if idempotent else 0
+        self.__local.requestCount = self.requestCount() + 1
+        for i in range(retries + 1):
+            if i > 0:
+                time.sleep(min(self.backoffFactor * 2**(i-1), self.maxBackoff))
+
+            try:
+                with self.__getSemaphore(provider):
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if i == retries:
+                    raise
+            else:
+                if i == retries or response.status_code not in self.retryStatusCodes:
+                    return response
+
+                response.close()
+
+    def __getSemaphore(self, provider: str) -> Semaphore:
+        """ 获取限制服务商并发数的信号量 """
+        with self.__lock:
+            if provider not in self.__semaphores:
+                self.__semaphores[provider] = Semaphore(
+                    self.concurrencyLimit(provider))
+
+            return self.__semaphores[provider]
+
+
+httpClient = HttpClient()
@@ -7,16 +7,19 @@ from time import time
 from typing import List, Tuple
 from pprint import pprint
 
-import requests
 from common.meta_data.writer import writeAlbumCover, writeSongInfo
 from common.os_utils import adjustName
 
 from .crawler_base import CrawlerBase, AudioQualityError, VideoQualityError, exceptionHandler
+from .http_client import httpClient
+from .response_cache import responseCache
 
 
 class KuGouMusicCrawler(CrawlerBase):
     """ 酷狗音乐爬虫 """
 
+    provider = 'kugou'
+
     def __init__(self):
         super().__init__()
         self.quality_hash_map = {
@@ -100,11 +103,13 @@ class KuGouMusicCrawler(CrawlerBase):
         return song_info_list, total
 
     @exceptionHandler()
+    @responseCache.cached(ttl=24*3600, negativeTtl=600)
     def getSongInfoList(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         # 请求 URL 获取歌曲信息列表
         url = 'https://complexsearch.kugou.com/v2/search/song'
         params = self.__getSearchParams(key_word, page_num, page_size)
-        response = requests.get(url, headers=self.headers, params=params)
+        response = httpClient.get(
+            url, headers=self.headers, params=params, provider=self.provider)
         response.raise_for_status()
 
         # 解析返回的 json 数据
@@ -154,7 +159,7 @@ class KuGouMusicCrawler(CrawlerBase):
         """
         url = f'https://wwwapi.kugou.com/yy/index.php?r=play/getdata&hash={file_hash}&mid=68aa6f0242d4192a2a9e2b91e44c226d&album_id={album_id}'
 
-        response = requests.get(url, headers=self.headers)
+        response = httpClient.get(url, headers=self.headers, provider=self.provider)
         response.raise_for_status()
 
         data = json.loads(response.text)["data"]
@@ -177,12 +182,13 @@ class KuGouMusicCrawler(CrawlerBase):
         if not url:
             return ''
 
-        response = requests.get(url, headers=self.headers)
+        response = httpClient.get(url, headers=self.headers, provider=self.provider)
         response.raise_for_status()
 
         # 保存歌曲文件
         return self.saveSong(song_info, save_dir, '.mp3', response.content)
 
+    @responseCache.cached(ttl=30*24*3600, negativeTtl=24*3600)
     def getLyric(self, key_word: str) -> str:
         """ 获取歌词
 
@@ -214,11 +220,13 @@ class KuGouMusicCrawler(CrawlerBase):
         return lyric
 
     @exceptionHandler([], 0)
+    @responseCache.cached(ttl=24*3600, negativeTtl=3600)
     def getMvInfoList(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         # 获取 MV 信息列表
         url = 'https://complexsearch.kugou.com/v1/search/mv'
         params = self.__getSearchParams(key_word, page_num, page_size)
-        response = requests.get(url, headers=self.headers, params=params)
+        response = httpClient.get(
+            url, headers=self.headers, params=params, provider=self.provider)
         response.raise_for_status()
 
         # 解析数据
@@ -269,8 +277,9 @@ class KuGouMusicCrawler(CrawlerBase):
             mv_info["MvID"]) + '"}]}'
         headers = self.headers.copy()
         headers['kg-tid'] = "317"
-        response = requests.post(
-            url, form_data, params=params, headers=headers)
+        # 这个接口只查询 MV 信息，可以安全地重试
+        response = httpClient.post(
+            url, form_data, params=params, headers=headers, provider=self.provider, idempotent=True)
         response.raise_for_status()
 
         # 解析数据
@@ -295,7 +304,8 @@ class KuGouMusicCrawler(CrawlerBase):
         params = self.__getMvUrlParams(mv_hash)
         headers = self.headers.copy()
         headers['x-router'] = 'trackermv.kugou.com'
-        response = requests.get(url, params, headers=headers)
+        response = httpClient.get(
+            url, params, headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 解析数据
@@ -5,17 +5,20 @@ import re
 from urllib import parse
 from typing import List, Tuple
 
-import requests
 from fuzzywuzzy import fuzz
 from common.meta_data.writer import writeAlbumCover, writeSongInfo
 from common.os_utils import adjustName
 
 from .crawler_base import CrawlerBase, AudioQualityError, exceptionHandler
+from .http_client import httpClient
+from .response_cache import responseCache
 
 
 class KuWoMusicCrawler(CrawlerBase):
     """ 酷我音乐爬虫 """
 
+    provider = 'kuwo'
+
     def __init__(self):
         super().__init__()
         self.headers = {
@@ -28,6 +31,7 @@ class KuWoMusicCrawler(CrawlerBase):
         }
 
     @exceptionHandler([], 0)
+    @responseCache.cached(ttl=24*3600, negativeTtl=600)
     def getSongInfoList(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         key_word = parse.quote(key_word)
 
@@ -37,7 +41,7 @@ class KuWoMusicCrawler(CrawlerBase):
 
         # 请求歌曲信息列表
         url = f'http://www.kuwo.cn/api/www/search/searchMusicBykeyWord?key={key_word}&pn={page_num}&rn={page_size}&reqId=c06e0e50-fe7c-11eb-9998-47e7e13a7206'
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 获取歌曲信息
@@ -88,7 +92,7 @@ class KuWoMusicCrawler(CrawlerBase):
 
         # 请求歌曲播放地址
         url = f'http://www.kuwo.cn/api/v1/www/music/playUrl?mid={rid}&type=convert_url3&br={br}mp3'
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
         play_url = json.loads(response.text)['data']['url']
 
@@ -106,7 +110,7 @@ class KuWoMusicCrawler(CrawlerBase):
         headers.pop('Referer')
         headers.pop('csrf')
         headers.pop('Host')
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 保存歌曲文件
@@ -123,6 +127,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return song_info_list, total
 
     @exceptionHandler('')
+    @responseCache.cached(ttl=0, negativeTtl=24*3600)
     def getSingerAvatar(self, singer: str, save_dir: str) -> str:
         singer_ = parse.quote(singer)
 
@@ -132,7 +137,7 @@ class KuWoMusicCrawler(CrawlerBase):
 
         # 请求歌手信息列表
         url = f'http://www.kuwo.cn/api/www/search/searchArtistBykeyWord?key={singer_}&pn=1&rn=3&reqId=c06e0e50-fe7c-11eb-9998-47e7e13a7206'
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 请求歌手头像
@@ -141,7 +146,8 @@ class KuWoMusicCrawler(CrawlerBase):
         headers.pop('Referer')
         headers.pop('csrf')
         headers.pop('Host')
-        response = requests.get(artist_info['pic300'], headers=headers)
+        response = httpClient.get(
+            artist_info['pic300'], headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 保存头像
@@ -149,6 +155,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return save_path
 
     @exceptionHandler()
+    @responseCache.cached(ttl=30*24*3600, negativeTtl=24*3600)
     def getLyric(self, key_word: str) -> list:
         """ 获取歌词
 
@@ -177,7 +184,7 @@ class KuWoMusicCrawler(CrawlerBase):
         # 发送请求
         rid = song_info_list[matches.index(best_match)]['rid']
         url = f"https://m.kuwo.cn/newh5/singles/songinfoandlrc?musicId={rid}"
-        response = requests.get(url)
+        response = httpClient.get(url, provider=self.provider)
         response.raise_for_status()
 
         # 歌词可能为 null，此时返回 None
@@ -185,6 +192,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return lyric
 
     @exceptionHandler([], 0)
+    @responseCache.cached(ttl=24*3600, negativeTtl=3600)
     def getMvInfoList(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         key_word = parse.quote(key_word)
 
@@ -196,7 +204,7 @@ class KuWoMusicCrawler(CrawlerBase):
 
         # 搜索 MV 信息
         url = f'http://www.kuwo.cn/api/www/search/searchMvBykeyWord?key={key_word}&pn={page_num}&rn={page_size}&reqId=ba2f7511-6e89-11ec-aa1e-9520a8bfa7a5'
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 解析信息
@@ -223,7 +231,7 @@ class KuWoMusicCrawler(CrawlerBase):
 
         # 获取 HTML 页面
         url = f"http://www.kuwo.cn/mvplay/{mv_info['id']}"
-        response = requests.get(url, headers=headers)
+        response = httpClient.get(url, headers=headers, provider=self.provider)
         response.raise_for_status()
 
         # 寻找 mp4 链接
@@ -0,0 +1,226 @@
+# coding:utf-8
+import time
+from collections import deque
+from threading import Lock
+from typing import List
+
+from .crawler_base import failureCount
+from .http_client import httpClient
+
+
+class ProviderState:
+    """ 服务商的健康状况 """
+
+    def __init__(self, windowSize: int, coolDown: float):
+        self.samples = deque(maxlen=windowSize)  # 元素为 `(耗时, 是否查到结果, 是否发生异常)`
+        self.consecutiveErrors = 0               # 连续发生异常的次数
+        self.coolDown = coolDown                 # 下一次熔断的冷却时间
+        self.openUntil = 0                       # 熔断结束的时间
+        self.probeUntil = 0                      # 试探性查询的截止时间，截止之前不放行其他查询
+
+    def isOpen(self, now: float) -> bool:
+        """ 是否处于熔断状态 """
+        return self.openUntil > now
+
+
+class ProviderHealthTracker:
+    """ 服务商健康状况追踪器
+
+    记录最近几次查询的耗时、是否查到结果和是否发生异常，据此估计每个服务商查到结果的期望耗时。
+    连续发生异常的服务商会被熔断一段时间，熔断结束之后只放行一次试探性的查询，
+    试探成功则恢复，失败则再次熔断并加倍冷却时间
+    """
+
+    def __init__(self, windowSize=20, failureThreshold=3, coolDown=30, maxCoolDown=300,
+                 defaultLatency=1):
+        """
+        Parameters
+        ----------
+        windowSize: int
+            每个服务商保留的最近查询记录数
+
+        failureThreshold: int
+            连续发生多少次异常之后熔断
+
+        coolDown: float
+            第一次熔断的冷却时间，单位为秒
+
+        maxCoolDown: float
+            最长的冷却时间，单位为秒
+
+        defaultLatency: float
+            没有查询记录的服务商的估计耗时，单位为秒
+        """
+        self.windowSize = windowSize
+        self.failureThreshold = failureThreshold
+        self.coolDown = coolDown
+        self.maxCoolDown = maxCoolDown
+        self.defaultLatency = defaultLatency
+        self.__states = {}
+        self.__lock = Lock()
+
+    def call(self, crawler, func, *args, isSuccess=None, **kwargs):
+        """ 调用爬虫的方法并记录服务商的健康状况，没有发送网络请求的调用 (比如命中了缓存) 不会被记录
+
+        Parameters
+        ----------
+        crawler:
+            爬虫，需要有 `provider` 属性
+
+        func: callable
+            爬虫的方法
+
+        *args, **kwargs:
+            传给方法的参数
+
+        isSuccess: callable
+            判断返回值是否表示查到了结果的函数，为 `None` 时返回值不为空则认为查到了结果，
+            `(结果列表, 总数)` 形式的返回值看结果列表是否为空
+
+        Returns
+        -------
+        value:
+            方法的返回值，方法抛出的异常会被记录并继续抛出
+        """
+        errorCount = failureCount()
+        requestCount = httpClient.requestCount()
+        t0 = time.time()
+        try:
+            value = func(*args, **kwargs)
+        except Exception:
+            self.record(crawler.provider, time.time() - t0, False, True)
+            raise
+
+        if httpClient.requestCount() != requestCount:
+            isError = failureCount() != errorCount
+            isSuccess_ = (isSuccess or self.isSuccessValue)(value)
+            self.record(crawler.provider, time.time() - t0,
+                        isSuccess_ and not isError, isError)
+
+        return value
+
+    @staticmethod
+    def isSuccessValue(value) -> bool:
+        """ 返回值是否表示查到了结果 """
+        if isinstance(value, tuple) and value:
+            value = value[0]
+
+        return bool(value)
+
+    def record(self, provider: str, latency: float, isSuccess: bool, isError: bool):
+        """ 记录一次查询
+
+        Parameters
+        ----------
+        provider: str
+            服务商名字
+
+        latency: float
+            查询耗时，单位为秒
+
+        isSuccess: bool
+            是否查到结果
+
+        isError: bool
+            是否发生异常，比如网络错误、超时和接口返回的数据无法解析，只有异常才会导致熔断
+        """
+        now = time.time()
+        with self.__lock:
+            state = self.__getState(provider)
+            state.samples.append((latency, isSuccess, isError))
+
+            if not isError:
+                state.consecutiveErrors = 0
+                state.coolDown = self.coolDown
+                state.openUntil = 0
+                state.probeUntil = 0
+                return
+
+            # 试探失败时连续异常数依然不小于阈值，会再次熔断
+            state.consecutiveErrors += 1
+            if state.consecutiveErrors >= self.failureThreshold:
+                state.openUntil = now + state.coolDown
+                state.coolDown = min(state.coolDown*2, self.maxCoolDown)
+                state.probeUntil = 0
+
+    def isAvailable(self, provider: str) -> bool:
+        """ 服务商是否可用，熔断结束后第一次调用会放行一次试探性的查询，试探完成之前其他调用返回 `False`，
+        放行之后没有记录到结果 (比如爬虫最终没有被调用) 时，等待冷却时间之后会再次放行
+        """
+        now = time.time()
+        with self.__lock:
+            state = self.__getState(provider)
+            if state.isOpen(now) or state.probeUntil > now:
+                return False
+
+            if state.consecutiveErrors >= self.failureThreshold:
+                state.probeUntil = now + self.coolDown
+
+            return True
+
+    def successRate(self, provider: str) -> float:
+        """ 查到结果的概率，使用拉普拉斯平滑，没有查询记录时为 0.5 """
+        with self.__lock:
+            samples = list(self.__getState(provider).samples)
+
+        return (sum(i[1] for i in samples) + 1) / (len(samples) + 2)
+
+    def latency(self, provider: str, percentile=50) -> float:
+        """ 查询耗时的百分位数，单位为秒，没有查询记录时为 `defaultLatency` """
+        with self.__lock:
+            latencies = sorted(i[0] for i in self.__getState(provider).samples)
+
+        if not latencies:
+            return self.defaultLatency
+
+        index = max(0, min(len(latencies)-1, round(percentile/100*len(latencies)) - 1))
+        return latencies[index]
+
+    def expectedTime(self, provider: str) -> float:
+        """ 查到结果的期望耗时，等于耗时中位数除以查到结果的概率 """
+        return self.latency(provider, 50) / self.successRate(provider)
+
+    def sortCrawlers(self, crawlers: list) -> list:
+        """ 去掉熔断中的爬虫，并按照查到结果的期望耗时对剩下的爬虫升序排序，期望耗时相同时保持原来的顺序
+
+        Parameters
+        ----------
+        crawlers: list
+            爬虫列表，爬虫需要有 `provider` 属性
+
+        Returns
+        -------
+        crawlers: list
+            排序后的爬虫列表
+        """
+        crawlers = [i for i in crawlers if self.isAvailable(i.provider)]
+        return sorted(crawlers, key=lambda i: self.expectedTime(i.provider))
+
+    def getReport(self) -> List[dict]:
+        """ 获取所有服务商的健康状况 """
+        now = time.time()
+        with self.__lock:
+            providers = list(self.__states)
+
+        report = []
+        for provider in providers:
+            report.append({
+                "provider": provider,
+                "successRate": self.successRate(provider),
+                "p50": self.latency(provider, 50),
+                "p95": self.latency(provider, 95),
+                "isOpen": self.__states[provider].isOpen(now),
+            })
+
+        return report
+
+    def __getState(self, provider: str) -> ProviderState:
+        """ 获取服务商的健康状况，需要在加锁之后调用 """
+        if provider not in self.__states:
+            self.__states[provider] = ProviderState(
+                self.windowSize, self.coolDown)
+
+        return self.__states[provider]
+
+
+providerHealth = ProviderHealthTracker()
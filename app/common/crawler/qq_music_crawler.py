@@ -3,15 +3,17 @@ import json
 from typing import Union
 from pathlib import Path
 
-import requests
 from fuzzywuzzy import fuzz
 from .crawler_base import exceptionHandler
+from .http_client import httpClient
 
 
 
 class QQMusicCrawler:
     """ QQ 音乐爬虫 """
 
+    provider = 'qq'
+
     def __init__(self):
         self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
                         'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/71.0.3578.98 Safari/537.36'}
@@ -34,7 +36,8 @@ class QQMusicCrawler:
             歌曲信息，如果获取失败返回 `None`
         """
         search_url = f"https://c.y.qq.com/soso/fcgi-bin/client_search_cp?new_json=1&p=1&n=5&w={key_word}"
-        response = requests.get(search_url, headers=self.headers)
+        response = httpClient.get(
+            search_url, headers=self.headers, provider=self.provider)
 
         infos = json.loads(response.text[9:-1])["data"]["song"]["list"]
         if not infos:
@@ -97,12 +100,15 @@ class QQMusicCrawler:
             专辑封面 URL，如果没有获取到封面就返回 `None`
         """
         detail_url = f"https://c.y.qq.com/v8/fcg-bin/musicmall.fcg?_=1628997268750&cmd=get_album_buy_page&albummid={albummid}"
-        response = requests.get(detail_url, headers=self.headers)
+        response = httpClient.get(
+            detail_url, headers=self.headers, provider=self.provider)
         url = json.loads(response.text[18:-1]
                          )["data"]["headpiclist"][0]["picurl"]
 
+        response = httpClient.get(
+            url, headers=self.headers, provider=self.provider)
         with open(save_path, 'wb') as f:
-            f.write(requests.get(url, headers=self.headers).content)
+            f.write(response.content)
 
         return url
 
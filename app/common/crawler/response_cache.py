@@ -0,0 +1,253 @@
+# coding:utf-8
+import inspect
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+
+from .crawler_base import failureCount
+
+
+class ResponseCache:
+    """ 爬虫查询结果的本地缓存
+
+    缓存保存在 SQLite 数据库中，最近使用的缓存还会放在内存里。爬虫方法需要使用
+    `cached()` 装饰器才会被缓存，缓存的键由服务商、方法名和规范化之后的参数组成，
+    查询成功但是没有结果时也会缓存，只是有效期更短。查询过程中发生了网络异常则不会缓存
+    """
+
+    dbPath = Path("cache/crawler/response_cache.db")
+
+    def __init__(self, dbPath=None, maxSize=32*1024**2, memorySize=256):
+        """
+        Parameters
+        ----------
+        dbPath: str or Path
+            数据库路径，为 `None` 时使用默认路径
+
+        maxSize: int
+            缓存数据的最大字节数，超过之后会先删除过期的缓存，再删除最早的缓存
+
+        memorySize: int
+            内存中缓存的最大条数
+        """
+        self.dbPath = Path(dbPath) if dbPath else self.dbPath
+        self.maxSize = maxSize
+        self.memorySize = memorySize
+        self.isEnabled = True
+        self.__memory = OrderedDict()  # 键为缓存的键，值为 `(过期时间, 数据)`
+        self.__lock = Lock()
+        self.__isTableCreated = False
+
+    def cached(self, ttl: float, negativeTtl: float = 0, isMiss=None):
+        """ 缓存爬虫方法返回值的装饰器，需要放在 `exceptionHandler` 下面，
+        这样发生异常时不会缓存异常处理返回的默认值
+
+        Parameters
+        ----------
+        ttl: float
+            查询到结果时的缓存有效期，单位为秒，为 0 时不缓存
+
+        negativeTtl: float
+            没有查询到结果时的缓存有效期，单位为秒，为 0 时不缓存
+
+        isMiss: callable
+            判断返回值是否表示没有查询到结果的函数，为 `None` 时使用 `isMissValue()`
+        """
+        isMiss = isMiss or self.isMissValue
+
+        def outer(func):
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            def inner(crawler, *args, **kwargs):
+                if not self.isEnabled:
+                    return func(crawler, *args, **kwargs)
+
+                arguments = signature.bind(crawler, *args, **kwargs)
+                arguments.apply_defaults()
+                params = list(arguments.arguments.values())[1:]
+                provider = getattr(crawler, "provider", None) or type(crawler).__name__
+                key = self.makeKey(provider, func.__name__, params)
+
+                isHit, value = self.get(key)
+                if isHit:
+                    return value
+
+                # 查询过程中有被异常处理装饰器吞掉的异常时，返回值不可信，不进行缓存
+                count = failureCount()
+                value = func(crawler, *args, **kwargs)
+                if failureCount() == count:
+                    self.set(key, value, negativeTtl if isMiss(value) else ttl)
+
+                return value
+
+            return inner
+
+        return outer
+
+    @staticmethod
+    def isMissValue(value) -> bool:
+        """ 返回值是否表示没有查询到结果，`(结果列表, 总数)` 形式的返回值看结果列表是否为空 """
+        if isinstance(value, tuple) and value:
+            value = value[0]
+
+        return not value
+
+    @staticmethod
+    def makeKey(provider: str, endpoint: str, params: list) -> str:
+        """ 生成缓存的键，字符串参数会去掉多余的空白并忽略大小写 """
+        params = [' '.join(i.split()).casefold() if isinstance(i, str) else i
+                  for i in params]
+        return json.dumps([provider, endpoint, params], ensure_ascii=False, default=str)
+
+    def get(self, key: str):
+        """ 读取缓存
+
+        Parameters
+        ----------
+        key: str
+            缓存的键
+
+        Returns
+        -------
+        isHit: bool
+            是否命中缓存
+
+        value:
+            缓存的数据，没有命中时为 `None`
+        """
+        now = time.time()
+        with self.__lock:
+            item = self.__memory.get(key)
+            if item and item[0] > now:
+                self.__memory.move_to_end(key)
+                return True, self.__loads(item[1])
+
+        with self.__connect() as conn:
+            row = conn.execute(
+                "SELECT expireTime, value FROM responses WHERE key = ? AND expireTime > ?",
+                (key, now)).fetchone()
+
+        if not row:
+            return False, None
+
+        self.__remember(key, row[0], row[1])
+        return True, self.__loads(row[1])
+
+    def set(self, key: str, value, ttl: float):
+        """ 写入缓存
+
+        Parameters
+        ----------
+        key: str
+            缓存的键
+
+        value:
+            需要缓存的数据，必须能被序列化为 json，元组会被保留
+
+        ttl: float
+            缓存有效期，单位为秒，不大于 0 时不缓存
+        """
+        if ttl <= 0:
+            return
+
+        try:
+            data = self.__dumps(value)
+        except (TypeError, ValueError):
+            return
+
+        now = time.time()
+        self.__remember(key, now + ttl, data)
+        with self.__connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), now, now + ttl))
+            self.__evict(conn, now)
+
+    def clear(self):
+        """ 清空缓存 """
+        with self.__lock:
+            self.__memory.clear()
+
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def __evict(self, conn: sqlite3.Connection, now: float):
+        """ 缓存数据超过上限时先删除过期的缓存，再按写入时间删除最早的缓存 """
+        size = conn.execute("SELECT TOTAL(size) FROM responses").fetchone()[0]
+        if size <= self.maxSize:
+            return
+
+        conn.execute("DELETE FROM responses WHERE expireTime <= ?", (now,))
+        size = conn.execute("SELECT TOTAL(size) FROM responses").fetchone()[0]
+
+        # 删到上限的 80%，避免每次写入都要删除
+        keys = []
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY createTime")
+        for key, n in rows:
+            if size <= self.maxSize * 0.8:
+                break
+
+            keys.append((key,))
+            size -= n
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+        with self.__lock:
+            for key, in keys:
+                self.__memory.pop(key, None)
+
+    def __remember(self, key: str, expireTime: float, data: str):
+        """ 将缓存放到内存中 """
+        with self.__lock:
+            self.__memory[key] = (expireTime, data)
+            self.__memory.move_to_end(key)
+            while len(self.__memory) > self.memorySize:
+                self.__memory.popitem(last=False)
+
+    @staticmethod
+    def __dumps(value) -> str:
+        """ 序列化数据，每次读取缓存都会重新反序列化，调用者修改返回值不会影响缓存 """
+        return json.dumps([isinstance(value, tuple), value], ensure_ascii=False)
+
+    @staticmethod
+    def __loads(data: str):
+        """ 反序列化数据 """
+        isTuple, value = json.loads(data)
+        return tuple(value) if isTuple else value
+
+    @contextmanager
+    def __connect(self):
+        """ 连接数据库，每次操作都使用新的连接，以便在不同线程中使用 """
+        self.dbPath.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.dbPath)
+        try:
+            with conn:
+                if not self.__isTableCreated:
+                    self.__createTable(conn)
+
+                yield conn
+        finally:
+            conn.close()
+
+    def __createTable(self, conn: sqlite3.Connection):
+        """ 创建缓存表 """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT,
+                size INTEGER,
+                createTime REAL,
+                expireTime REAL
+            )""")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_createTime ON responses (createTime)")
+        self.__isTableCreated = True
+
+
+responseCache = ResponseCache()
@@ -6,18 +6,21 @@ from datetime import datetime
 from typing import List, Tuple
 from pprint import pprint
 
-import requests
 from fuzzywuzzy import fuzz
 from common.os_utils import adjustName
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 
 from .crawler_base import CrawlerBase, AudioQualityError, exceptionHandler, VideoQualityError
+from .http_client import httpClient
+from .response_cache import responseCache
 
 
 class WanYiMusicCrawler(CrawlerBase):
     """ 网易云音乐爬虫 """
 
+    provider = 'wanyi'
+
     def __init__(self):
         super().__init__()
         self.types = {
@@ -44,6 +47,7 @@ class WanYiMusicCrawler(CrawlerBase):
 
     # TODO:只能显示前 20 首搜索结果
     @exceptionHandler([], 0)
+    @responseCache.cached(ttl=24*3600, negativeTtl=600)
     def getSongInfoList(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         # 发送请求
         url = 'https://music.163.com/weapi/cloudsearch/get/web'
@@ -138,6 +142,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return play_urls
 
     @exceptionHandler()
+    @responseCache.cached(ttl=30*24*3600, negativeTtl=24*3600)
     def getLyric(self, key_word: str):
         """ 获取歌词
 
@@ -181,6 +186,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return lyrics
 
     @exceptionHandler('')
+    @responseCache.cached(ttl=0, negativeTtl=24*3600)
     def getSingerAvatar(self, singer: str, save_dir: str):
         # 发送搜索歌手的请求
         url = "https://music.163.com/weapi/cloudsearch/get/web"
@@ -196,7 +202,8 @@ class WanYiMusicCrawler(CrawlerBase):
             return ''
 
         # 获取头像
-        response = requests.get(data[0]['img1v1Url'], headers=self.headers)
+        response = httpClient.get(
+            data[0]['img1v1Url'], headers=self.headers, provider=self.provider)
         response.raise_for_status()
 
         # 保存头像
@@ -204,6 +211,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return save_path
 
     @exceptionHandler([], 0)
+    @responseCache.cached(ttl=24*3600, negativeTtl=3600)
     def getMvInfoList(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         # 发送搜索歌手的请求
         url = "https://music.163.com/weapi/cloudsearch/get/web"
@@ -333,7 +341,9 @@ class WanYiMusicCrawler(CrawlerBase):
         """
         headers = headers or self.headers
         form_data = self.encryptor.encrypt(str(form_data))
-        response = requests.post(url, form_data, headers=headers)
+        # 网易云的接口都用 post 请求查询数据，可以安全地重试
+        response = httpClient.post(
+            url, form_data, headers=headers, provider=self.provider, idempotent=True)
         response.raise_for_status()
         return response.text
 
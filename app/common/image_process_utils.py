@@ -1,13 +1,11 @@
 # coding:utf-8
 import imghdr
-from math import floor
 
 import cv2 as cv
 import numpy as np
 from colorthief import ColorThief
 from PIL import Image
 from PyQt5.QtGui import QImage, QPixmap
-from scipy.ndimage.filters import gaussian_filter
 
 
 def gaussianBlur(imagePath: str, blurRadius=18, brightFactor=1, blurPicSize: tuple = None) -> np.ndarray:
@@ -44,7 +42,10 @@ def gaussianBlur(imagePath: str, blurRadius=18, brightFactor=1, blurPicSize: tup
         w_, h_ = w * ratio, h * ratio
 
         if w_ < w:
-            image = image.resize((int(w_), int(h_)), Image.ANTIALIAS)
+            image = image.resize((int(w_), int(h_)), Image.LANCZOS)
+
+    if image.mode not in ('RGB', 'RGBA', 'L'):
+        image = image.convert('RGB')
 
     image = np.array(image)
 
@@ -52,11 +53,13 @@ def gaussianBlur(imagePath: str, blurRadius=18, brightFactor=1, blurPicSize: tup
     if len(image.shape) == 2:
         image = np.stack([image, image, image], axis=-1)
 
-    # 对每一个颜色通道分别磨砂
-    for i in range(3):
-        image[:, :, i] = gaussian_filter(
-            image[:, :, i], blurRadius) * brightFactor
+    # 所有颜色通道一起进行可分离的高斯模糊，边界处理方式和之前的 scipy 实现相同
+    rgb = cv.GaussianBlur(np.ascontiguousarray(
+        image[:, :, :3]), (0, 0), blurRadius, borderType=cv.BORDER_REFLECT)
+    if brightFactor != 1:
+        rgb = (rgb * brightFactor).astype(np.uint8)
 
+    image[:, :, :3] = rgb
     return image
 
 
@@ -115,97 +118,81 @@ class DominantColor:
         palette = colorThief.get_palette(quality=9)
 
         # 调整调色板明度
-        palette = cls.__adjustPaletteValue(palette)
-        for rgb in palette[:]:
-            h, s, v = cls.rgb2hsv(rgb)
-            if h < 0.02:
-                palette.remove(rgb)
-                if len(palette) <= 2:
-                    break
-
-        palette = palette[:5]
-        palette.sort(key=lambda rgb: cls.colorfulness(*rgb), reverse=True)
+        h, s, v = cls.rgb2hsv(np.array(palette)).T
+        v *= np.select([v > 0.9, v > 0.8, v > 0.7], [0.8, 0.9, 0.95], 1)
+        palette = cls.hsv2rgb(np.stack([h, s, v], axis=-1))
 
-        return palette[0]
+        # 移除色相接近于 0 的颜色，至少保留两个颜色
+        indexes = np.flatnonzero(cls.rgb2hsv(palette)[:, 0] < 0.02)
+        indexes = indexes[:max(1, len(palette) - 2)]
+        palette = np.delete(palette, indexes, axis=0)[:5]
 
-    @classmethod
-    def __adjustPaletteValue(cls, palette: list):
-        """ 调整调色板的明度 """
-        newPalette = []
-        for rgb in palette:
-            h, s, v = cls.rgb2hsv(rgb)
-            if v > 0.9:
-                factor = 0.8
-            elif 0.8 < v <= 0.9:
-                factor = 0.9
-            elif 0.7 < v <= 0.8:
-                factor = 0.95
-            else:
-                factor = 1
-            v *= factor
-            newPalette.append(cls.hsv2rgb(h, s, v))
-
-        return newPalette
+        # 选出最鲜艳的颜色，鲜艳程度相同时保持调色板中的顺序
+        index = np.argsort(-cls.colorfulness(*palette.T), kind='stable')[0]
+        return tuple(int(i) for i in palette[index])
 
     @staticmethod
-    def rgb2hsv(rgb: tuple) -> tuple:
-        """ rgb空间变换到hsv空间 """
-        r, g, b = [i / 255 for i in rgb]
-        mx = max(r, g, b)
-        mn = min(r, g, b)
+    def rgb2hsv(rgb: np.ndarray) -> np.ndarray:
+        """ rgb空间变换到hsv空间
+
+        Parameters
+        ----------
+        rgb: array_like of shape `(n, 3)`
+            rgb 颜色，各个通道的取值范围为 0~255
+
+        Returns
+        -------
+        hsv: `~np.ndarray` of shape `(n, 3)`
+            hsv 颜色，h 的取值范围为 0~360，s 和 v 的取值范围为 0~1
+        """
+        r, g, b = np.asarray(rgb, float).reshape(-1, 3).T / 255
+        mx = np.max([r, g, b], axis=0)
+        mn = np.min([r, g, b], axis=0)
         df = mx - mn
-        if mx == mn:
-            h = 0
-        elif mx == r:
-            h = (60 * ((g - b) / df) + 360) % 360
-        elif mx == g:
-            h = (60 * ((b - r) / df) + 120) % 360
-        elif mx == b:
-            h = (60 * ((r - g) / df) + 240) % 360
-        s = 0 if mx == 0 else df / mx
-        v = mx
-        return (h, s, v)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            h = np.select(
+                [mx == mn, mx == r, mx == g],
+                [0, (60 * ((g - b) / df) + 360) % 360, (60 * ((b - r) / df) + 120) % 360],
+                (60 * ((r - g) / df) + 240) % 360
+            )
+            s = np.where(mx == 0, 0, df / mx)
+
+        return np.stack([h, s, mx], axis=-1)
 
     @staticmethod
-    def hsv2rgb(h, s, v) -> tuple:
-        """ hsv空间变换到rgb空间 """
+    def hsv2rgb(hsv: np.ndarray) -> np.ndarray:
+        """ hsv空间变换到rgb空间
+
+        Parameters
+        ----------
+        hsv: array_like of shape `(n, 3)`
+            hsv 颜色，h 的取值范围为 0~360，s 和 v 的取值范围为 0~1
+
+        Returns
+        -------
+        rgb: `~np.ndarray` of shape `(n, 3)`
+            rgb 颜色，各个通道的取值范围为 0~255
+        """
+        h, s, v = np.asarray(hsv, float).reshape(-1, 3).T
         h60 = h / 60.0
-        h60f = floor(h60)
-        hi = int(h60f) % 6
+        h60f = np.floor(h60)
+        hi = h60f.astype(int) % 6
         f = h60 - h60f
         p = v * (1 - s)
         q = v * (1 - f * s)
         t = v * (1 - (1 - f) * s)
-        r, g, b = 0, 0, 0
-        if hi == 0:
-            r, g, b = v, t, p
-        elif hi == 1:
-            r, g, b = q, v, p
-        elif hi == 2:
-            r, g, b = p, v, t
-        elif hi == 3:
-            r, g, b = p, q, v
-        elif hi == 4:
-            r, g, b = t, p, v
-        elif hi == 5:
-            r, g, b = v, p, q
-        r, g, b = int(r * 255), int(g * 255), int(b * 255)
-        return (r, g, b)
+        r = np.choose(hi, [v, q, p, p, t, v])
+        g = np.choose(hi, [t, v, v, q, p, p])
+        b = np.choose(hi, [p, p, t, v, v, q])
+        return (np.stack([r, g, b], axis=-1) * 255).astype(int)
 
     @staticmethod
-    def colorfulness(r: int, g: int, b: int):
+    def colorfulness(r, g, b):
+        """ 计算颜色的鲜艳程度，支持同时计算多个颜色 """
+        r, g, b = [np.asarray(i, float) for i in (r, g, b)]
         rg = np.absolute(r - g)
         yb = np.absolute(0.5 * (r + g) - b)
-
-        # Compute the mean and standard deviation of both `rg` and `yb`.
-        rg_mean, rg_std = (np.mean(rg), np.std(rg))
-        yb_mean, yb_std = (np.mean(yb), np.std(yb))
-
-        # Combine the mean and standard deviations.
-        std_root = np.sqrt((rg_std ** 2) + (yb_std ** 2))
-        mean_root = np.sqrt((rg_mean ** 2) + (yb_mean ** 2))
-
-        return std_root + (0.3 * mean_root)
+        return 0.3 * np.sqrt(rg ** 2 + yb ** 2)
 
 
 def getPicSuffix(pic_data) -> str:
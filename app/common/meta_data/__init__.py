@@ -1,5 +1,14 @@
+from .song_info import SongInfo, encodeSongInfo
 from .song_info_reader import SongInfoReader
 from .album_info_reader import AlbumInfoReader
 from .album_cover_reader import AlbumCoverReader
 from .singer_info_reader import SingerInfoReader
-from .const import GENRES
\ No newline at end of file
+from .tag_reader import AudioTag, readTag
+from .cover_store import CoverStore, coverStore
+from .folder_scanner import FolderScanner
+from .thumbnail_cache import ThumbnailCache, thumbnailCache
+from .playlist_store import PlaylistStore, playlistStore
+from .library_database import LibraryDatabase
+from .library_watcher import LibraryWatcher
+from .search_index import SearchIndex, LibrarySearchIndex, librarySearchIndex
+from .const import GENRES
@@ -1,72 +1,15 @@
 # coding:utf-8
-from shutil import rmtree
-from pathlib import Path
+from common.startup_tracer import startupTracer
 
-from mutagen import File, FileType
-from mutagen.mp4 import MP4
-from mutagen.mp3 import MP3
-from mutagen.flac import FLAC
-
-from common.image_process_utils import getPicSuffix
-
-
-class AlbumCoverReaderBase:
-    """ 专辑封面获取器抽象类 """
-
-    @staticmethod
-    def getAlbumCover(audio: FileType) -> bytes:
-        """ 读取专辑封面
-
-        Parameters
-        ----------
-        audio: FileType
-            音频标签文件
-
-        Returns
-        -------
-        picData: bytes
-            封面二进制数据，不存在封面时返回 `None`
-        """
-        raise NotImplementedError("该方法必须被子类实现")
-
-
-class MP3AlbumCoverReader(AlbumCoverReaderBase):
-    """ MP3 专辑封面获取器 """
-
-    @staticmethod
-    def getAlbumCover(audio: MP3) -> bytes:
-        for k in audio.tags.keys():
-            if k.startswith("APIC"):
-                return audio[k].data
-
-
-class FLACAlbumCoverReader(AlbumCoverReaderBase):
-    """ FLAC 专辑封面获取器 """
-
-    @staticmethod
-    def getAlbumCover(audio: FLAC) -> bytes:
-        if not audio.pictures:
-            return None
-
-        return audio.pictures[0].data
-
-
-class MP4AlbumCoverReader(AlbumCoverReaderBase):
-    """ MP4/M4A 专辑封面获取器 """
-
-    @staticmethod
-    def getAlbumCover(audio: MP4) -> bytes:
-        if not audio.get("covr"):
-            return None
-
-        return bytes(audio["covr"][0])
+from .cover_store import coverStore
+from .tag_reader import AudioTag, readTag
+from .thumbnail_cache import thumbnailCache
 
 
 class AlbumCoverReader:
     """ 读取并保存专辑封面类 """
 
-    coverFolder = Path("cache/Album_Cover")
-
+    @startupTracer.traced()
     def __init__(self, songInfo_list: list):
         """
         Parameters
@@ -85,66 +28,31 @@ class AlbumCoverReader:
     @classmethod
     def getAlbumCovers(cls, songInfo_list: list):
         """ 获取多张专辑封面 """
-        cls.coverFolder.mkdir(exist_ok=True, parents=True)
         for songInfo in songInfo_list:
             cls.getOneAlbumCover(songInfo)
 
     @classmethod
-    def getOneAlbumCover(cls, songInfo: dict):
-        """ 获取一张专辑封面 """
-        cls.coverFolder.mkdir(exist_ok=True, parents=True)
-
-        isExists = cls.__isCoverExists(songInfo['coverName'])
-        if isExists:
-            return
-
-        audio = File(songInfo["songPath"], options=[MP3, FLAC, MP4])
-        AudioType = type(audio)
-        readerMap = {
-            MP3: MP3AlbumCoverReader,
-            FLAC: FLACAlbumCoverReader,
-            MP4: MP4AlbumCoverReader
-        }
-
-        if AudioType not in readerMap:
-            return
-
-        picData = readerMap[AudioType].getAlbumCover(audio)
-        if picData:
-            cls.__save(songInfo['coverName'], picData)
-
-    @classmethod
-    def __isCoverExists(cls, coverName: str) -> bool:
-        """ 检测封面是否存在
+    def getOneAlbumCover(cls, songInfo: dict, tag: AudioTag = None):
+        """ 获取一张专辑封面
 
         Parameters
         ----------
-        coverName: str
-            封面名字
+        songInfo: dict
+            歌曲信息
 
-        Returns
-        -------
-        isExists: bool
-            封面是否存在
+        tag: AudioTag
+            已经读取的标签信息，为 `None` 时才会解析音频文件
         """
-        folder = cls.coverFolder / coverName
-
-        isExists = False
-        if folder.exists():
-            files = list(folder.glob('*'))
-
-            if files:
-                suffix = files[0].suffix.lower()
-                if suffix in ["png", "jpg", "jpeg", "jiff", "gif"]:
-                    isExists = True
-                else:
-                    rmtree(folder)
+        if coverStore.hasCover(songInfo['coverName']):
+            return
 
-        return isExists
+        tag = tag or readTag(songInfo["songPath"])
+        if tag.picData:
+            cls.__save(songInfo['coverName'], tag.picData)
 
     @classmethod
-    def __save(cls, coverName: str, picData: bytes):
-        """ 储存提取到的专辑封面
+    def saveAlbumCover(cls, coverName: str, picData: bytes):
+        """ 封面不存在时保存封面
 
         Parameters
         ----------
@@ -152,11 +60,15 @@ class AlbumCoverReader:
             封面名字
 
         picData: bytes
-            封面二进制数据
+            封面二进制数据，为 `None` 时不做任何处理
         """
-        folder = cls.coverFolder / coverName
-        folder.mkdir(exist_ok=True, parents=True)
+        if not picData or coverStore.hasCover(coverName):
+            return
 
-        suffix = getPicSuffix(picData)
-        with open(folder/(coverName + suffix), "wb") as f:
-            f.write(picData)
+        cls.__save(coverName, picData)
+
+    @staticmethod
+    def __save(coverName: str, picData: bytes):
+        """ 保存封面并在后台生成缩略图 """
+        coverPath = coverStore.saveCover(coverName, picData)
+        thumbnailCache.generateAsync(coverPath)
@@ -1,62 +1,123 @@
 # coding:utf-8
+import re
+from typing import Dict, List, Tuple
+
 from common.os_utils import getCoverPath, adjustName
+from common.startup_tracer import startupTracer
 
 
 class AlbumInfoReader:
     """ 从歌曲信息列表中整理出专辑信息的类 """
 
+    @startupTracer.traced()
     def __init__(self, songInfo_list: list):
-        self.albumInfo_list = self.getAlbumInfo(songInfo_list)
-        self.sortByModifiedTime()
+        self.albumInfo_list = []   # type:List[dict]
+        self.albumInfos = {}       # type:Dict[Tuple[str, str], dict]
+        self.updateAlbumInfo(songInfo_list)
 
     def getAlbumInfo(self, songInfo_list: list):
-        """ 从歌曲信息列表中来获取专辑信息 """
-        albumInfo_list = []
-        albumSonger_list = []
+        """ 从歌曲信息列表中来获取专辑信息，使用 `(专辑名, 歌手名)` 作为键一次遍历完成分组 """
+        albumInfos = {}
 
         for songInfo in songInfo_list:
-            album = songInfo["album"]  # type:str
-            singer = songInfo["singer"]  # type:str
-            coverName = songInfo["coverName"]  # type:str
-            # 如果(专辑名,歌手名)不在列表中，就往列表中插入新的专辑信息字典
-            if (album, singer) not in albumSonger_list:
-                albumSonger_list.append((album, singer))
-                coverPath = getCoverPath(coverName, 'album_big')
-                albumInfo_list.append(
-                    {
-                        "album": album,
-                        "singer": singer,
-                        "songInfo_list": [songInfo],
-                        "coverName": coverName,
-                        "coverPath": coverPath,
-                        "genre": songInfo["genre"],
-                        "year": songInfo["year"],
-                        "modifiedTime": songInfo["createTime"]
-                    }
-                )
+            key = (songInfo["album"], songInfo["singer"])
+            albumInfo = albumInfos.get(key)
+
+            # 如果(专辑名,歌手名)不在字典中，就插入新的专辑信息字典
+            if albumInfo is None:
+                albumInfos[key] = self.__createAlbumInfo(songInfo)
             else:
-                index = albumSonger_list.index((album, singer))
-                albumInfo = albumInfo_list[index]
                 albumInfo["songInfo_list"].append(songInfo)
                 # 更新专辑的更新时间
                 if albumInfo["modifiedTime"] < songInfo["createTime"]:
                     albumInfo["modifiedTime"] = songInfo["createTime"]
 
         # 根据曲目序号排序每一个专辑
+        albumInfo_list = list(albumInfos.values())
         for albumInfo in albumInfo_list:
             albumInfo["songInfo_list"].sort(key=self.sortAlbum)
+
         return albumInfo_list
 
     def updateAlbumInfo(self, songInfo_list: list):
         """ 更新专辑信息 """
-        self.albumInfo_list = self.getAlbumInfo(songInfo_list)
+        self.setAlbumInfos(self.getAlbumInfo(songInfo_list))
+        self.sortByModifiedTime()
+
+    def setAlbumInfos(self, albumInfo_list: list):
+        """ 设置专辑信息列表并重建索引 """
+        self.albumInfo_list = albumInfo_list
+        self.albumInfos = {(i["album"], i["singer"]): i for i in albumInfo_list}
+
+    def updateSongInfos(self, removedSongInfos: list, updatedSongInfos: list):
+        """ 根据发生变化的歌曲信息增量更新专辑信息
+
+        Parameters
+        ----------
+        removedSongInfos: list
+            被移除的歌曲信息列表，被修改的歌曲的旧信息也在该列表中
+
+        updatedSongInfos: list
+            新增或者修改后的歌曲信息列表
+
+        Returns
+        -------
+        singers: set
+            专辑信息发生变化的歌手
+        """
+        albumSongs = {}  # type:Dict[Tuple[str, str], List[dict]]
+
+        # 从专辑中移除旧的歌曲信息
+        removedPaths = {i["songPath"] for i in removedSongInfos}
+        for songInfo in removedSongInfos:
+            key = (songInfo["album"], songInfo["singer"])
+            if key not in self.albumInfos or key in albumSongs:
+                continue
+
+            albumSongs[key] = [
+                i for i in self.albumInfos[key]["songInfo_list"] if i["songPath"] not in removedPaths]
+
+        # 将新的歌曲信息插入专辑中
+        for songInfo in updatedSongInfos:
+            key = (songInfo["album"], songInfo["singer"])
+            if key not in albumSongs:
+                albumInfo = self.albumInfos.get(key)
+                albumSongs[key] = albumInfo["songInfo_list"].copy() if albumInfo else []
+
+            albumSongs[key].append(songInfo)
+
+        # 使用新的专辑信息替换发生变化的专辑，避免修改界面正在使用的专辑信息
+        for key, songInfo_list in albumSongs.items():
+            if not songInfo_list:
+                self.albumInfos.pop(key, None)
+                continue
+
+            songInfo_list.sort(key=self.sortAlbum)
+            if key in self.albumInfos:
+                albumInfo = self.albumInfos[key].copy()
+                albumInfo["songInfo_list"] = songInfo_list
+                albumInfo["genre"] = songInfo_list[0]["genre"]
+                albumInfo["year"] = songInfo_list[0]["year"]
+            else:
+                albumInfo = self.__createAlbumInfo(songInfo_list[0])
+                albumInfo["songInfo_list"] = songInfo_list
 
-    def sortAlbum(self, songInfo):
-        trackNum = songInfo["tracknumber"]  # type:str
-        # 处理m4a
-        if not trackNum[0].isnumeric():
-            return eval(trackNum)[0]
-        return int(trackNum)
+            albumInfo["modifiedTime"] = max(i["createTime"] for i in songInfo_list)
+            self.albumInfos[key] = albumInfo
+
+        self.albumInfo_list = list(self.albumInfos.values())
+        self.sortByModifiedTime()
+        return {singer for _, singer in albumSongs}
+
+    @staticmethod
+    def copyAlbumInfos(albumInfo_list: list) -> list:
+        """ 复制专辑信息列表，专辑中的歌曲信息只复制引用 """
+        return [{**i, "songInfo_list": i["songInfo_list"].copy()} for i in albumInfo_list]
+
+    @staticmethod
+    def sortAlbum(songInfo: dict):
+        """ 专辑中的歌曲按照曲目序号排序的键 """
+        return getTrackNumber(songInfo)
 
     def sortByModifiedTime(self):
         """ 依据修改日期排序专辑信息列表 """
@@ -71,6 +132,21 @@ class AlbumInfoReader:
         """ 以歌手名排序专辑信息列表 """
         self.albumInfo_list.sort(key=lambda albumInfo: albumInfo["singer"])
 
+    @staticmethod
+    def __createAlbumInfo(songInfo: dict):
+        """ 使用专辑中的第一首歌创建专辑信息 """
+        coverName = songInfo["coverName"]
+        return {
+            "album": songInfo["album"],
+            "singer": songInfo["singer"],
+            "songInfo_list": [songInfo],
+            "coverName": coverName,
+            "coverPath": getCoverPath(coverName, 'album_big'),
+            "genre": songInfo["genre"],
+            "year": songInfo["year"],
+            "modifiedTime": songInfo["createTime"]
+        }
+
     @staticmethod
     def getAlbumInfoByOneSong(songInfo: dict):
         """ 从一首歌创建一个专辑信息 """
@@ -90,3 +166,20 @@ class AlbumInfoReader:
             "coverName": coverName,
         }
         return albumInfo
+
+
+def getTrackNumber(songInfo: dict) -> int:
+    """ 获取歌曲的曲目序号，兼容旧版本 m4a 文件保存的 `(3, 12)` 格式
+
+    Parameters
+    ----------
+    songInfo: dict
+        歌曲信息
+
+    Returns
+    -------
+    trackNum: int
+        曲目序号，无法解析时返回 0
+    """
+    match = re.search(r'\d+', str(songInfo.get("tracknumber") or ''))
+    return int(match.group()) if match else 0
@@ -0,0 +1,176 @@
+# coding:utf-8
+import hashlib
+import os
+import sqlite3
+from contextlib import contextmanager
+from multiprocessing import parent_process
+from pathlib import Path
+from shutil import rmtree
+from typing import Dict
+
+from common.image_process_utils import getPicSuffix
+
+
+class CoverStore:
+    """ 按照内容哈希保存专辑封面的封面库，相同的封面只会保存一份 """
+
+    coverFolder = Path("cache/Album_Cover")
+    suffixes = (".png", ".jpg", ".jpeg", ".jiff", ".gif")
+
+    # 封面文件夹中封面库和缩略图缓存自己使用的子文件夹，导入旧版本的封面时需要跳过
+    reservedFolders = {"blobs", "thumbnails"}
+
+    def __init__(self, coverFolder=None):
+        """
+        Parameters
+        ----------
+        coverFolder: str or Path
+            封面文件夹，为 `None` 时使用默认文件夹
+        """
+        self.coverFolder = Path(coverFolder) if coverFolder else self.coverFolder
+        self.blobFolder = self.coverFolder / "blobs"
+        self.dbPath = self.coverFolder / "covers.db"
+        self.index = None   # type:Dict[str, str]
+
+    def getCoverPath(self, coverName: str) -> str:
+        """ 获取封面路径，封面不存在时返回 `None`
+
+        Parameters
+        ----------
+        coverName: str
+            封面名字，格式为 `singer_modifiedAlbum`
+        """
+        if self.index is None:
+            self.reload()
+
+        return self.index.get(coverName)
+
+    def hasCover(self, coverName: str) -> bool:
+        """ 封面是否存在 """
+        return self.getCoverPath(coverName) is not None
+
+    def saveCover(self, coverName: str, picData: bytes) -> str:
+        """ 保存封面，已经存在的封面名字会指向新的封面
+
+        Parameters
+        ----------
+        coverName: str
+            封面名字
+
+        picData: bytes
+            封面二进制数据
+
+        Returns
+        -------
+        coverPath: str
+            封面路径
+        """
+        if self.index is None:
+            self.reload()
+
+        path = self.__saveBlob(picData)
+        with self.__connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO covers (coverName, path) VALUES (?, ?)", (coverName, path))
+
+        self.index[coverName] = path
+        return path
+
+    def migrate(self):
+        """ 封面库不存在时导入旧版本的封面，只能在主进程中调用，并且要在创建读取歌曲信息的进程池之前调用，
+        否则多个进程会同时导入和删除同一批旧封面
+        """
+        if self.dbPath.exists():
+            return
+
+        self.__createTables()
+        self.__importLegacyCovers()
+
+    def reload(self):
+        """ 重新载入封面索引，其他进程保存的封面会被载入 """
+        if parent_process() is None:
+            self.migrate()
+
+        self.__createTables()
+
+        with self.__connect() as conn:
+            rows = conn.execute("SELECT coverName, path FROM covers").fetchall()
+
+        # 只遍历一次封面文件夹，移除已经被删除的封面
+        blobs = self.__getBlobs()
+        self.index = {name: path for name, path in rows if path in blobs}
+
+    def __saveBlob(self, picData: bytes) -> str:
+        """ 以内容哈希作为文件名保存封面，返回封面路径 """
+        digest = hashlib.sha1(picData).hexdigest()
+        folder = self.blobFolder / digest[:2]
+        path = folder / (digest + getPicSuffix(picData))
+        if path.exists():
+            return str(path)
+
+        # 先写入临时文件再重命名，避免多个进程同时写入同一张封面
+        folder.mkdir(exist_ok=True, parents=True)
+        tempPath = folder / f".{digest}.{os.getpid()}.tmp"
+        with open(tempPath, "wb") as f:
+            f.write(picData)
+
+        os.replace(tempPath, path)
+        return str(path)
+
+    def __getBlobs(self) -> set:
+        """ 获取所有封面文件的路径 """
+        blobs = set()
+        if not self.blobFolder.exists():
+            return blobs
+
+        with os.scandir(self.blobFolder) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+
+                with os.scandir(folder.path) as files:
+                    blobs.update(str(self.blobFolder/folder.name/i.name)
+                                 for i in files if not i.name.startswith('.'))
+
+        return blobs
+
+    def __importLegacyCovers(self):
+        """ 导入旧版本 `Album_Cover/{coverName}/{coverName}.jpg` 格式的封面 """
+        covers = []
+        for folder in self.coverFolder.iterdir():
+            if not folder.is_dir() or folder.name in self.reservedFolders:
+                continue
+
+            files = [i for i in folder.iterdir() if i.suffix.lower() in self.suffixes]
+            if files:
+                covers.append((folder.name, self.__saveBlob(files[0].read_bytes())))
+
+            rmtree(folder, ignore_errors=True)
+
+        with self.__connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO covers (coverName, path) VALUES (?, ?)", covers)
+
+    @contextmanager
+    def __connect(self):
+        """ 连接数据库，每次操作都使用新的连接，以便在不同线程和进程中使用 """
+        self.coverFolder.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.dbPath, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __createTables(self):
+        """ 创建封面表 """
+        with self.__connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS covers (
+                    coverName TEXT PRIMARY KEY,
+                    path TEXT
+                )""")
+
+
+coverStore = CoverStore()
@@ -0,0 +1,209 @@
+# coding:utf-8
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+
+class FolderState:
+    """ 文件夹的扫描结果缓存 """
+
+    def __init__(self, mtime: int, files: Dict[str, Tuple[int, int, int]], subfolders: List[str]):
+        """
+        Parameters
+        ----------
+        mtime: int
+            文件夹的修改时间，单位为纳秒
+
+        files: Dict[str, Tuple[int, int, int]]
+            文件夹中的歌曲路径到 `(size, mtime_ns, inode)` 的映射
+
+        subfolders: List[str]
+            子文件夹列表
+        """
+        self.mtime = mtime
+        self.files = files
+        self.subfolders = subfolders
+
+
+class FolderScanner:
+    """ 使用 `os.scandir` 递归扫描文件夹中的歌曲文件 """
+
+    suffixes = ('.mp3', '.flac', '.m4a', '.mp4')
+
+    def __init__(self, maxDepth: int = None, ignorePatterns: list = None):
+        """
+        Parameters
+        ----------
+        maxDepth: int
+            最大递归深度，0 表示只扫描顶层文件夹，为 `None` 或者负数时不限制深度
+
+        ignorePatterns: list
+            忽略的文件和文件夹的通配符，会和名字以及相对于顶层文件夹的路径进行匹配，比如 `.*`、`*/Scans`
+        """
+        self.maxDepth = maxDepth if maxDepth is None or maxDepth >= 0 else None
+        self.ignorePatterns = [os.path.normcase(i) for i in ignorePatterns or []]
+        self.folderStates = {}  # type:Dict[str, Dict[str, FolderState]]
+
+    def iterSongFiles(self, folder: str, forcedFolders=None) -> Iterator[Tuple[str, Tuple[int, int, int]]]:
+        """ 递归遍历文件夹中的歌曲文件，修改时间没有变化的文件夹直接使用缓存
+
+        Parameters
+        ----------
+        folder: str
+            顶层文件夹
+
+        forcedFolders: set
+            需要重新扫描的文件夹，为 `None` 时只使用修改时间判断，为 `True` 时重新扫描所有文件夹
+
+        Yields
+        ------
+        songPath: str
+            歌曲路径
+
+        stat: Tuple[int, int, int]
+            歌曲文件的 `(size, mtime_ns, inode)`
+        """
+        oldStates = self.folderStates.get(folder, {})
+        states = {}
+        visited = set()
+
+        if forcedFolders not in (None, True):
+            forcedFolders = {normalizePath(i) for i in forcedFolders}
+
+        stack = [(folder, 0)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            # 跳过通过符号链接重复访问的文件夹，避免死循环
+            key = (stat.st_dev, stat.st_ino)
+            if stat.st_ino and key in visited:
+                continue
+
+            visited.add(key)
+
+            state = oldStates.get(path)
+            isForced = forcedFolders is True or (
+                forcedFolders is not None and normalizePath(path) in forcedFolders)
+            if isForced or not state or state.mtime != stat.st_mtime_ns:
+                state = self.__scanFolder(folder, path, stat.st_mtime_ns)
+
+            states[path] = state
+            yield from state.files.items()
+
+            if self.maxDepth is None or depth < self.maxDepth:
+                stack.extend((i, depth + 1) for i in reversed(state.subfolders))
+
+        # 只在遍历结束后替换缓存，删除的文件夹也会被移出缓存
+        self.folderStates[folder] = states
+
+    def iterFolders(self, folder: str, prunedFolders: set = None) -> Iterator[str]:
+        """ 递归遍历顶层文件夹和需要扫描的子文件夹，不会读取文件的状态
+
+        Parameters
+        ----------
+        folder: str
+            顶层文件夹
+
+        prunedFolders: set
+            不需要遍历的子文件夹，使用 `os.path.normcase` 规范化后的路径
+        """
+        prunedFolders = prunedFolders or set()
+        visited = set()
+        stack = [(folder, 0)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            key = (stat.st_dev, stat.st_ino)
+            if stat.st_ino and key in visited:
+                continue
+
+            visited.add(key)
+            yield path
+
+            if self.maxDepth is not None and depth >= self.maxDepth:
+                continue
+
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        subfolder = str(Path(path)/entry.name).replace('\\', '/')
+                        try:
+                            if not entry.is_dir() or os.path.normcase(subfolder) in prunedFolders:
+                                continue
+
+                            if not self.isIgnored(folder, subfolder):
+                                stack.append((subfolder, depth + 1))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def removeFolder(self, folder: str):
+        """ 移除顶层文件夹的缓存 """
+        self.folderStates.pop(folder, None)
+
+    def clear(self):
+        """ 清空缓存 """
+        self.folderStates.clear()
+
+    def isIgnored(self, root: str, path: str) -> bool:
+        """ 文件或者文件夹是否被忽略
+
+        Parameters
+        ----------
+        root: str
+            顶层文件夹
+
+        path: str
+            文件或者文件夹路径
+        """
+        if not self.ignorePatterns:
+            return False
+
+        name = os.path.normcase(os.path.basename(path))
+        relPath = os.path.normcase(os.path.relpath(path, root)).replace('\\', '/')
+        return any(fnmatch(name, i) or fnmatch(relPath, i) for i in self.ignorePatterns)
+
+    def __scanFolder(self, root: str, folder: str, mtime: int) -> FolderState:
+        """ 使用 `os.scandir` 扫描一个文件夹中的歌曲文件和子文件夹 """
+        files = {}
+        subfolders = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    path = str(Path(folder)/entry.name).replace('\\', '/')
+                    if self.isIgnored(root, path):
+                        continue
+
+                    try:
+                        if entry.is_dir():
+                            subfolders.append(path)
+                            continue
+
+                        if not entry.name.lower().endswith(self.suffixes) or not entry.is_file():
+                            continue
+
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    files[path] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        except OSError:
+            pass
+
+        subfolders.sort()
+        return FolderState(mtime, files, subfolders)
+
+
+def normalizePath(path: str) -> str:
+    """ 规范化文件夹路径，便于比较 """
+    return os.path.normcase(os.path.abspath(path))
@@ -0,0 +1,185 @@
+# coding:utf-8
+import os
+from datetime import datetime
+from typing import Dict, Iterator, Set, Tuple
+
+from .folder_scanner import FolderScanner, normalizePath
+
+
+class LibraryDiff:
+    """ 两次扫描之间歌曲文件的变化 """
+
+    def __init__(self, added=None, removed=None, modified=None):
+        self.added = set(added or [])        # type:Set[str]
+        self.removed = set(removed or [])    # type:Set[str]
+        self.modified = set(modified or [])  # type:Set[str]
+
+    def isEmpty(self) -> bool:
+        """ 是否没有任何变化 """
+        return not (self.added or self.removed or self.modified)
+
+    def merge(self, diff):
+        """ 合并在这次变化之后发生的变化
+
+        Parameters
+        ----------
+        diff: LibraryDiff
+            之后发生的变化
+        """
+        for path in diff.added:
+            if path in self.removed:
+                self.removed.discard(path)
+                self.modified.add(path)
+            else:
+                self.added.add(path)
+
+        for path in diff.removed:
+            self.modified.discard(path)
+            if path in self.added:
+                self.added.discard(path)
+            else:
+                self.removed.add(path)
+
+        self.modified |= diff.modified - self.added
+
+
+class LibraryChangeDetector:
+    """ 基于文件状态的歌曲文件变化检测器 """
+
+    def __init__(self, folderPaths: list = None, maxDepth: int = None, ignorePatterns: list = None):
+        """
+        Parameters
+        ----------
+        folderPaths: list
+            歌曲文件夹列表
+
+        maxDepth: int
+            递归扫描的最大深度，为 `None` 时不限制深度
+
+        ignorePatterns: list
+            忽略的文件和文件夹的通配符
+        """
+        self.folderPaths = folderPaths or []
+        self.scanner = FolderScanner(maxDepth, ignorePatterns)
+        self.fileStats = {}     # type:Dict[str, Tuple[int, int, int]]
+        self.folderStates = {}  # type:Dict[str, Set[str]]
+
+    def setFolderPaths(self, folderPaths: list):
+        """ 设置歌曲文件夹并重建索引 """
+        self.folderPaths = folderPaths or []
+        return self.rebuild()
+
+    def rebuild(self) -> Dict[str, Tuple[int, int, int]]:
+        """ 重新扫描所有歌曲文件夹并建立索引
+
+        Returns
+        -------
+        fileStats: Dict[str, Tuple[int, int, int]]
+            歌曲路径到 `(size, mtime_ns, inode)` 的映射
+        """
+        for _ in self.iterRebuild():
+            pass
+
+        return self.fileStats
+
+    def iterRebuild(self) -> Iterator[str]:
+        """ 重新扫描所有歌曲文件夹并建立索引，边扫描边返回歌曲路径
+
+        Yields
+        ------
+        songPath: str
+            歌曲路径
+        """
+        self.fileStats.clear()
+        self.folderStates.clear()
+        self.scanner.clear()
+
+        for folder in self.folderPaths:
+            paths = set()
+            for path, stat in self.scanner.iterSongFiles(folder):
+                if path in self.fileStats:
+                    continue
+
+                self.fileStats[path] = stat
+                paths.add(path)
+                yield path
+
+            self.folderStates[folder] = paths
+
+    def scan(self, isFullScan=False) -> LibraryDiff:
+        """ 检测歌曲文件的变化并更新索引
+
+        Parameters
+        ----------
+        isFullScan: bool
+            是否重新扫描所有文件夹，为 `False` 时修改时间没有变化的文件夹直接使用缓存
+
+        Returns
+        -------
+        diff: LibraryDiff
+            和上一次扫描相比发生的变化
+        """
+        diff = LibraryDiff()
+        for folder in self.folderPaths:
+            self.__updateFolder(folder, diff, True if isFullScan else None)
+
+        return diff
+
+    def scanFolders(self, folderPaths: list) -> LibraryDiff:
+        """ 重新扫描指定的文件夹，其余文件夹只在修改时间变化时才重新扫描
+
+        Parameters
+        ----------
+        folderPaths: list
+            发生变化的文件夹列表，可以是歌曲文件夹的子文件夹
+
+        Returns
+        -------
+        diff: LibraryDiff
+            和上一次扫描相比发生的变化
+        """
+        folders = {normalizePath(i) for i in folderPaths}
+
+        diff = LibraryDiff()
+        for folder in self.folderPaths:
+            root = normalizePath(folder)
+            if any(i == root or i.startswith(os.path.join(root, '')) for i in folders):
+                self.__updateFolder(folder, diff, folders)
+
+        return diff
+
+    def getModifiedTime(self, songPath: str) -> str:
+        """ 从索引中获取歌曲的修改时间，格式和 `getModifiedTime()` 相同 """
+        stat = self.fileStats.get(songPath)
+        if not stat:
+            return getModifiedTime(songPath)
+
+        return toISOTime(stat[1])
+
+    def __updateFolder(self, folder: str, diff: LibraryDiff, forcedFolders):
+        """ 重新扫描一个歌曲文件夹，将变化添加到 `diff` 中 """
+        oldPaths = self.folderStates.get(folder, set())
+        stats = dict(self.scanner.iterSongFiles(folder, forcedFolders))
+        paths = set(stats)
+        diff.added |= paths - oldPaths
+        diff.removed |= oldPaths - paths
+        diff.modified |= {
+            i for i in paths & oldPaths if stats[i] != self.fileStats.get(i)}
+
+        # 更新索引
+        for path in oldPaths - paths:
+            self.fileStats.pop(path, None)
+
+        self.fileStats.update(stats)
+        self.folderStates[folder] = paths
+
+
+def toISOTime(mtime_ns: int) -> str:
+    """ 将纳秒时间戳转换为 ISO 格式的本地时间字符串 """
+    return datetime.fromtimestamp(mtime_ns // 10**9).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def getModifiedTime(path: str) -> str:
+    """ 获取文件的修改时间 """
+    return toISOTime(os.stat(path).st_mtime_ns)
+
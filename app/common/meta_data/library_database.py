@@ -0,0 +1,143 @@
+# coding:utf-8
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, List
+
+from .song_info import SONG_INFO_KEYS, SongInfo
+
+
+class LibraryDatabase:
+    """ 使用 SQLite 保存歌曲信息的本地歌曲库 """
+
+    dbPath = Path("cache/song_info/library.db")
+    legacyJsonPath = Path("cache/song_info/songInfo.json")
+
+    def __init__(self, dbPath=None):
+        """
+        Parameters
+        ----------
+        dbPath: str or Path
+            数据库路径，为 `None` 时使用默认路径
+        """
+        self.dbPath = Path(dbPath) if dbPath else self.dbPath
+        isNew = not self.dbPath.exists()
+        self.__createTables()
+
+        # 第一次创建数据库时导入旧版本的 json 歌曲信息
+        if isNew and self.legacyJsonPath.exists():
+            self.__importLegacyJson()
+
+    def exists(self) -> bool:
+        """ 数据库文件是否存在 """
+        return self.dbPath.exists()
+
+    def getSongInfos(self) -> List[SongInfo]:
+        """ 读取所有歌曲信息，按照创建时间降序排列 """
+        with self.__connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM songs ORDER BY createTime DESC").fetchall()
+
+        return [SongInfo.fromDict(row) for row in rows]
+
+    def upsertSongInfos(self, songInfo_list: Iterable[dict]):
+        """ 插入或者更新歌曲信息
+
+        Parameters
+        ----------
+        songInfo_list: Iterable[dict]
+            歌曲信息列表
+        """
+        with self.__connect() as conn:
+            self.__upsert(conn, songInfo_list)
+
+    def updateSongInfos(self, songInfo_list: Iterable[dict]):
+        """ 更新已存在于歌曲库中的歌曲信息，不在歌曲库中的歌曲会被忽略
+
+        Parameters
+        ----------
+        songInfo_list: Iterable[dict]
+            歌曲信息列表
+        """
+        keys = SONG_INFO_KEYS[1:]
+        assignments = ", ".join(f"{k} = ?" for k in keys)
+        sql = f"UPDATE songs SET {assignments} WHERE songPath = ?"
+
+        rows = [row[1:] + row[:1] for row in self.__toRows(songInfo_list)]
+        with self.__connect() as conn:
+            conn.executemany(sql, rows)
+
+    def removeSongInfos(self, songPaths: Iterable[str]):
+        """ 移除歌曲信息
+
+        Parameters
+        ----------
+        songPaths: Iterable[str]
+            歌曲路径列表
+        """
+        with self.__connect() as conn:
+            conn.executemany("DELETE FROM songs WHERE songPath = ?",
+                             [(i,) for i in songPaths])
+
+    def setSongInfos(self, songInfo_list: Iterable[dict]):
+        """ 使用新的歌曲信息替换歌曲库中的所有歌曲信息 """
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM songs")
+            self.__upsert(conn, songInfo_list)
+
+    def clear(self):
+        """ 清空歌曲库 """
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM songs")
+
+    @contextmanager
+    def __connect(self):
+        """ 连接数据库，每次操作都使用新的连接，以便在不同线程中使用 """
+        self.dbPath.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.dbPath)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __createTables(self):
+        """ 创建歌曲表和索引 """
+        columns = ",\n".join(f"{k} TEXT" for k in SONG_INFO_KEYS[1:])
+        with self.__connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS songs (
+                    songPath TEXT PRIMARY KEY,
+                    {columns}
+                )""")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_songs_album ON songs (album, singer)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_songs_singer ON songs (singer)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_songs_createTime ON songs (createTime)")
+
+    def __importLegacyJson(self):
+        """ 导入旧版本的 json 歌曲信息 """
+        try:
+            with open(self.legacyJsonPath, encoding="utf-8") as f:
+                songInfo_list = json.load(f)
+        except:
+            return
+
+        self.upsertSongInfos(i for i in songInfo_list if i.get("songPath"))
+
+    def __upsert(self, conn: sqlite3.Connection, songInfo_list: Iterable[dict]):
+        """ 使用指定的连接插入或者更新歌曲信息 """
+        columns = ", ".join(SONG_INFO_KEYS)
+        placeholders = ", ".join("?"*len(SONG_INFO_KEYS))
+        sql = f"INSERT OR REPLACE INTO songs ({columns}) VALUES ({placeholders})"
+        conn.executemany(sql, self.__toRows(songInfo_list))
+
+    @staticmethod
+    def __toRows(songInfo_list: Iterable[dict]):
+        """ 将歌曲信息转换为数据库中的行 """
+        return [tuple(songInfo.get(k) for k in SONG_INFO_KEYS) for songInfo in songInfo_list]
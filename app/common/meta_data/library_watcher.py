@@ -0,0 +1,112 @@
+# coding:utf-8
+import os
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from .folder_scanner import FolderScanner
+
+
+class LibraryWatcher(QObject):
+    """ 监视歌曲文件夹的变化，合并短时间内的多次变化后再发送信号 """
+
+    foldersChanged = pyqtSignal(list)   # 发生变化的歌曲文件夹或者子文件夹
+
+    def __init__(self, folderPaths: list, maxDepth: int = None, ignorePatterns: list = None,
+                 debounceInterval=1000, maxDelay=10000, parent=None):
+        """
+        Parameters
+        ----------
+        folderPaths: list
+            歌曲文件夹列表
+
+        maxDepth: int
+            监视的子文件夹的最大深度，为 `None` 时不限制深度
+
+        ignorePatterns: list
+            不需要监视的文件夹的通配符
+
+        debounceInterval: int
+            文件夹在该时间内没有新的变化才会发送信号，单位为毫秒
+
+        maxDelay: int
+            文件夹持续变化时 (比如复制大量歌曲) 发送信号的最大延迟，单位为毫秒
+
+        parent:
+            父级
+        """
+        super().__init__(parent=parent)
+        self.folderPaths = []
+        self.changedFolders = set()
+        self.scanner = FolderScanner(maxDepth, ignorePatterns)
+        self.watcher = QFileSystemWatcher(self)
+        self.debounceTimer = QTimer(self)
+        self.maxDelayTimer = QTimer(self)
+
+        self.debounceTimer.setSingleShot(True)
+        self.debounceTimer.setInterval(debounceInterval)
+        self.maxDelayTimer.setSingleShot(True)
+        self.maxDelayTimer.setInterval(maxDelay)
+
+        self.watcher.directoryChanged.connect(self.__onDirectoryChanged)
+        self.debounceTimer.timeout.connect(self.__emitChangedFolders)
+        self.maxDelayTimer.timeout.connect(self.__emitChangedFolders)
+        self.setFolderPaths(folderPaths)
+
+    def setFolderPaths(self, folderPaths: list):
+        """ 设置需要监视的歌曲文件夹，之前的变化会被丢弃 """
+        self.folderPaths = folderPaths or []
+        self.changedFolders.clear()
+        self.debounceTimer.stop()
+        self.maxDelayTimer.stop()
+
+        if self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+
+        # 遍历子文件夹比较耗时，推迟到事件循环中进行
+        QTimer.singleShot(0, lambda: self.__watchFolders(self.folderPaths))
+
+    def addChangedFolders(self, folderPaths: list):
+        """ 添加发生变化的文件夹，比如之前没有处理的变化 """
+        self.changedFolders.update(folderPaths)
+        self.__startTimers()
+
+    def __watchFolders(self, folderPaths: list):
+        """ 监视文件夹和它们的子文件夹中还未被监视的文件夹，已经被监视的子文件夹不会再被遍历 """
+        watched = {os.path.normcase(i) for i in self.watcher.directories()}
+        folders = []
+        for folder in folderPaths:
+            for path in self.scanner.iterFolders(folder, watched):
+                if os.path.normcase(path) not in watched:
+                    watched.add(os.path.normcase(path))
+                    folders.append(path)
+
+        if folders:
+            self.watcher.addPaths(folders)
+
+    def __onDirectoryChanged(self, folder: str):
+        """ 文件夹变化槽函数 """
+        self.changedFolders.add(folder)
+        self.__startTimers()
+
+    def __startTimers(self):
+        """ 重新开始防抖计时，第一次变化时开始最大延迟计时 """
+        self.debounceTimer.start()
+        if not self.maxDelayTimer.isActive():
+            self.maxDelayTimer.start()
+
+    def __emitChangedFolders(self):
+        """ 发送发生变化的文件夹 """
+        self.debounceTimer.stop()
+        self.maxDelayTimer.stop()
+
+        if not self.changedFolders:
+            return
+
+        folders = list(self.changedFolders)
+        self.changedFolders.clear()
+
+        # 监视新建的子文件夹，被删除后重新创建的歌曲文件夹也需要重新添加
+        watched = {os.path.normcase(i) for i in self.watcher.directories()}
+        self.__watchFolders(folders + [
+            i for i in self.folderPaths if os.path.normcase(i) not in watched])
+        self.foldersChanged.emit(folders)
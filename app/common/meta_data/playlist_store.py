@@ -0,0 +1,249 @@
+# coding:utf-8
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .song_info import SongInfo, encodeSongInfo
+
+
+class PlaylistStore:
+    """ 自定义播放列表库，播放列表文件只保存歌曲路径，使用时才从歌曲库中解析歌曲信息
+
+    播放列表的格式为 `{"playlistName", "modifiedTime", "songPaths"}`，
+    不在歌曲库中的歌曲 (比如歌曲文件夹被移除了) 的信息会额外保存在文件的 `songInfos` 中
+    """
+
+    folder = Path("cache/Playlists")
+    version = 2
+
+    def __init__(self, folder=None):
+        """
+        Parameters
+        ----------
+        folder: str or Path
+            播放列表文件夹，为 `None` 时使用默认文件夹
+        """
+        self.folder = Path(folder) if folder else self.folder
+        self.library = {}    # type:Dict[str, SongInfo]
+        self.fallbacks = {}  # type:Dict[str, SongInfo]
+
+    def setLibrary(self, songInfo_list: Iterable[dict]):
+        """ 设置歌曲库中的歌曲信息，播放列表中的歌曲路径优先从歌曲库中解析，
+        被移出歌曲库的歌曲信息会被记录下来，保存播放列表时写入文件
+        """
+        library = {i["songPath"]: i for i in songInfo_list}
+        removedPaths = set()
+        for songPath, songInfo in self.library.items():
+            if songPath not in library:
+                self.fallbacks[songPath] = songInfo
+                removedPaths.add(songPath)
+
+        self.library = library
+
+        # 播放列表文件中只保存了这些歌曲的路径，需要补上歌曲信息，否则重启之后就找不到了
+        if removedPaths:
+            self.__saveFallbacks(removedPaths)
+
+    def updateSongInfos(self, songInfo_list: Iterable[dict]) -> set:
+        """ 使用修改后的歌曲信息更新索引
+
+        Parameters
+        ----------
+        songInfo_list: Iterable[dict]
+            修改后的歌曲信息列表
+
+        Returns
+        -------
+        songPaths: set
+            不在歌曲库中的歌曲路径，包含这些歌曲的播放列表需要重新保存
+        """
+        songPaths = set()
+        for songInfo in songInfo_list:
+            songPath = songInfo["songPath"]
+            if songPath in self.library:
+                self.library[songPath] = songInfo
+            elif songPath in self.fallbacks:
+                self.fallbacks[songPath] = songInfo
+                songPaths.add(songPath)
+
+        return songPaths
+
+    def register(self, songInfo_list: Iterable[dict]) -> List[str]:
+        """ 获取歌曲路径列表，不在歌曲库中的歌曲信息会被记录下来，保存播放列表时写入文件 """
+        songPaths = []
+        for songInfo in songInfo_list:
+            songPath = songInfo["songPath"]
+            if songPath not in self.library:
+                self.fallbacks[songPath] = songInfo
+
+            songPaths.append(songPath)
+
+        return songPaths
+
+    def getSongPaths(self, playlist: dict) -> List[str]:
+        """ 获取播放列表的歌曲路径，已经解析过的播放列表以其中的歌曲信息为准 """
+        if "songInfo_list" in playlist:
+            return self.register(playlist["songInfo_list"])
+
+        return playlist.get("songPaths", []).copy()
+
+    def getSongInfo(self, songPath: str) -> SongInfo:
+        """ 获取歌曲信息，找不到时返回 `None` """
+        songInfo = self.library.get(songPath)
+        return songInfo if songInfo is not None else self.fallbacks.get(songPath)
+
+    def getSongInfos(self, playlist: dict) -> list:
+        """ 解析播放列表中的歌曲信息，找不到的歌曲会被跳过 """
+        songInfo_list = []
+        for songPath in playlist.get("songPaths", []):
+            songInfo = self.getSongInfo(songPath)
+            if songInfo is not None:
+                songInfo_list.append(songInfo)
+
+        return songInfo_list
+
+    def getFirstSongInfo(self, playlist: dict) -> SongInfo:
+        """ 获取播放列表中第一首能找到的歌曲，用于显示播放列表封面 """
+        for songPath in playlist.get("songPaths", []):
+            songInfo = self.getSongInfo(songPath)
+            if songInfo is not None:
+                return songInfo
+
+        return None
+
+    def resolve(self, playlist: dict) -> dict:
+        """ 返回包含歌曲信息列表 `songInfo_list` 的播放列表，用于打开播放列表 """
+        return {**playlist, "songInfo_list": self.getSongInfos(playlist)}
+
+    def getPlaylistPath(self, playlistName: str) -> Path:
+        """ 获取播放列表文件的路径 """
+        return self.folder / (playlistName + ".json")
+
+    def readPlaylists(self) -> Dict[str, dict]:
+        """ 读取所有播放列表，旧版本的播放列表会被转换为新的格式 """
+        self.folder.mkdir(exist_ok=True, parents=True)
+
+        playlists = {}
+        for file in self.folder.glob("*.json"):
+            playlist = self.__read(file)
+            if playlist is not None:
+                playlists[playlist["playlistName"]] = playlist
+
+        return playlists
+
+    def save(self, playlist: dict):
+        """ 保存播放列表
+
+        Parameters
+        ----------
+        playlist: dict
+            播放列表，格式为 `{"playlistName", "modifiedTime", "songPaths"}`
+        """
+        songPaths = playlist["songPaths"]
+        songInfos = {
+            i: self.fallbacks[i] for i in songPaths
+            if i not in self.library and i in self.fallbacks
+        }
+        data = {
+            "version": self.version,
+            "playlistName": playlist["playlistName"],
+            "modifiedTime": playlist.get("modifiedTime", ""),
+            "songPaths": songPaths,
+            "songInfos": songInfos,
+        }
+
+        self.folder.mkdir(exist_ok=True, parents=True)
+        self.__write(self.getPlaylistPath(playlist["playlistName"]), data)
+
+    def rename(self, oldName: str, playlist: dict):
+        """ 保存重命名后的播放列表并移除旧的播放列表文件 """
+        self.save(playlist)
+        oldPath = self.getPlaylistPath(oldName)
+        if oldName != playlist["playlistName"] and oldPath.exists():
+            oldPath.unlink()
+
+    def deleteSongs(self, songPaths: Iterable[str]):
+        """ 从播放列表文件中删除歌曲，用于播放列表界面还没有创建的时候 """
+        songPaths = set(songPaths)
+        for playlist in self.readPlaylists().values():
+            paths = [i for i in playlist["songPaths"] if i not in songPaths]
+            if len(paths) != len(playlist["songPaths"]):
+                playlist["songPaths"] = paths
+                self.save(playlist)
+
+    def saveSongInfos(self, songPaths: set):
+        """ 重新保存包含这些不在歌曲库中的歌曲的播放列表文件，用于播放列表界面还没有创建的时候 """
+        if not songPaths:
+            return
+
+        for playlist in self.readPlaylists().values():
+            if not songPaths.isdisjoint(playlist["songPaths"]):
+                self.save(playlist)
+
+    def __saveFallbacks(self, songPaths: set):
+        """ 将歌曲信息写入引用了这些歌曲的播放列表文件 """
+        if not self.folder.exists():
+            return
+
+        for file in self.folder.glob("*.json"):
+            try:
+                with open(file, encoding="utf-8") as f:
+                    data = json.load(f)  # type:dict
+            except (OSError, ValueError):
+                continue
+
+            if data.get("version", 1) < self.version:
+                continue
+
+            songInfos = data.setdefault("songInfos", {})
+            paths = songPaths.intersection(data.get("songPaths", [])) - songInfos.keys()
+            if not paths:
+                continue
+
+            songInfos.update({i: self.fallbacks[i] for i in paths})
+            self.__write(file, data)
+
+    @staticmethod
+    def __write(path: Path, data: dict):
+        """ 先写入临时文件再重命名，避免写入中断导致播放列表损坏 """
+        tempPath = path.with_name(f".{path.stem}.{os.getpid()}.tmp")
+        with open(tempPath, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=encodeSongInfo)
+
+        os.replace(tempPath, path)
+
+    def __read(self, file: Path) -> dict:
+        """ 读取一个播放列表文件，读取失败时返回 `None` """
+        try:
+            with open(file, encoding="utf-8") as f:
+                data = json.load(f)  # type:dict
+        except (OSError, ValueError) as e:
+            print(e)
+            return None
+
+        # 旧版本的播放列表直接保存了歌曲信息
+        isLegacy = data.get("version", 1) < self.version
+        if isLegacy:
+            songPaths = self.register(
+                SongInfo.fromDict(i) for i in data.get("songInfo_list", []) if i.get("songPath"))
+        else:
+            songPaths = data.get("songPaths", [])
+            for songPath, songInfo in data.get("songInfos", {}).items():
+                self.fallbacks.setdefault(songPath, SongInfo.fromDict(songInfo))
+
+        # 其他界面都以文件名作为播放列表的名字
+        playlist = {
+            "playlistName": file.stem,
+            "modifiedTime": data.get("modifiedTime", ""),
+            "songPaths": songPaths,
+        }
+
+        # 只需要转换一次，之后都以新的格式读取
+        if isLegacy:
+            self.save(playlist)
+
+        return playlist
+
+
+playlistStore = PlaylistStore()
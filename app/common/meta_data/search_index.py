@@ -0,0 +1,441 @@
+# coding:utf-8
+import re
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set, Union
+
+import pinyin
+
+from .song_info import internString
+
+
+# 中日韩文字没有空格分词，按照单字和相邻两字建立索引
+CJK = "\u2e80-\u9fff\uac00-\ud7af\uf900-\ufaff"
+WORD_PATTERN = re.compile(r"[^\W_]+")
+PART_PATTERN = re.compile(f"[{CJK}]+|[^{CJK}]+")
+CJK_PATTERN = re.compile(f"[{CJK}]")
+
+
+def normalize(text) -> str:
+    """ 将文本转换为小写并合并连续的空白字符 """
+    return " ".join(str(text or "").lower().split())
+
+
+@lru_cache(maxsize=None)
+def getInitial(char: str) -> str:
+    """ 获取一个汉字的拼音首字母 """
+    return pinyin.get_initial(char).lower()
+
+
+def getInitials(text: str) -> str:
+    """ 获取中文的拼音首字母，比如 `周杰伦` 的首字母为 `zjl` """
+    return "".join(map(getInitial, text))
+
+
+@lru_cache(maxsize=65536)
+def tokenize(text: str) -> FrozenSet[str]:
+    """ 对归一化之后的文本进行分词，歌手、专辑和流派重复度很高，所以缓存了分词结果
+
+    英文和数字按照单词分词，中日韩文字产生单字、相邻两字和拼音首字母三种词
+    """
+    tokens = set()
+    for word in WORD_PATTERN.findall(text):
+        for part in PART_PATTERN.findall(word):
+            if not CJK_PATTERN.match(part):
+                tokens.add(part)
+                continue
+
+            tokens.update(part)
+            tokens.update(part[i:i+2] for i in range(len(part)-1))
+            tokens.add(getInitials(part))
+
+    return frozenset(tokens)
+
+
+def parseQuery(text: str) -> List[tuple]:
+    """ 对归一化之后的搜索词进行分词
+
+    Returns
+    -------
+    terms: List[tuple]
+        `(词, 是否前缀匹配)` 列表，英文单词和拼音首字母使用前缀匹配，中日韩文字使用相邻两字精确匹配
+    """
+    terms = []
+    for word in WORD_PATTERN.findall(text):
+        for part in PART_PATTERN.findall(word):
+            if not CJK_PATTERN.match(part):
+                terms.append((part, True))
+            elif len(part) == 1:
+                terms.append((part, False))
+            else:
+                terms.extend((part[i:i+2], False) for i in range(len(part)-1))
+
+    return terms
+
+
+class SearchIndex:
+    """ 内存中的倒排索引，支持单词前缀、中文和拼音首字母搜索
+
+    每个词对应一个文档编号集合，词表有序，前缀匹配时使用二分查找得到所有以搜索词开头的词。
+    每个字段的完整文本也会加上字段标记作为一个词，用来直接查找字段和搜索词相同或者以搜索词开头的文档。
+
+    条目发生变化时只记录下它的键，下一次搜索时才会建立索引。为大量条目建立索引比较慢，
+    可以在其他线程中使用 `snapshot()` 返回的条目建立新的索引，建好之后再调用 `load()` 替换掉当前的索引
+    """
+
+    # 字段的匹配程度：和搜索词相同、以搜索词开头、包含搜索词，乘以字段权重之后就是相关度
+    exactScore = 4
+    prefixScore = 3
+    containScore = 2
+
+    EXACT, PREFIX, CONTAIN = range(3)
+
+    def __init__(self, fields: Dict[str, float], key: Union[str, Callable]):
+        """
+        Parameters
+        ----------
+        fields: Dict[str, float]
+            需要索引的字段和权重
+
+        key: str or callable
+            条目的键，可以是字段名或者以条目为参数的函数
+        """
+        self.fields = list(fields)
+        self.getKey = key if callable(key) else lambda item: item[key]
+
+        # 字段标记是控制字符，不会和单词冲突
+        self.__tags = [chr(i + 1) for i in range(len(self.fields))]
+
+        # 按照相关度从高到低排列的 `(匹配程度, 字段下标)`
+        scores = [self.exactScore, self.prefixScore, self.containScore]
+        tiers = [(scores[m] * w, -i, m) for i, w in enumerate(fields.values()) for m in range(3)]
+        self.__tiers = [(m, -i) for _, i, m in sorted(tiers, reverse=True)]
+
+        self.__items = {}       # type:Dict[object, object]
+        self.__dirtyKeys = set()
+        self.__recentKeys = set()  # 调用 `snapshot()` 之后发生变化的条目的键
+        self.__ids = {}         # type:Dict[object, int]
+        self.__docs = {}        # type:Dict[int, tuple]
+        self.__postings = {}    # type:Dict[str, Set[int]]
+        self.__vocabulary = []  # type:List[str]
+        self.__ranks = {}       # type:Dict[int, int]
+        self.__nextId = 0
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __contains__(self, key):
+        return key in self.__items
+
+    def clear(self):
+        """ 清空索引 """
+        self.__items.clear()
+        self.__dirtyKeys.clear()
+        self.__recentKeys.clear()
+        self.__ids.clear()
+        self.__docs.clear()
+        self.__postings.clear()
+        self.__vocabulary.clear()
+        self.__ranks.clear()
+        self.__nextId = 0
+
+    def setItems(self, items: Iterable):
+        """ 设置所有条目，只有新增、删除和替换了的条目会重新建立索引
+
+        Parameters
+        ----------
+        items: Iterable
+            所有条目，字段被原地修改的条目需要调用 `updateItems()`
+        """
+        oldItems = self.__items
+        self.__items = {self.getKey(i): i for i in items}
+
+        keys = [k for k in oldItems if k not in self.__items]
+        keys.extend(k for k, i in self.__items.items() if oldItems.get(k) is not i)
+        self.__dirtyKeys.update(keys)
+        self.__recentKeys.update(keys)
+
+    def updateItems(self, items: Iterable):
+        """ 添加条目或者更新已有的条目
+
+        Parameters
+        ----------
+        items: Iterable
+            新增或者修改后的条目
+        """
+        for item in items:
+            key = self.getKey(item)
+            self.__items[key] = item
+            self.__dirtyKeys.add(key)
+            self.__recentKeys.add(key)
+
+    def removeItems(self, keys: Iterable):
+        """ 移除条目
+
+        Parameters
+        ----------
+        keys: Iterable
+            需要移除的条目的键
+        """
+        for key in keys:
+            if self.__items.pop(key, None) is not None:
+                self.__dirtyKeys.add(key)
+                self.__recentKeys.add(key)
+
+    def dirtyNum(self) -> int:
+        """ 还没有建立索引的条目数 """
+        return len(self.__dirtyKeys)
+
+    def snapshot(self) -> list:
+        """ 获取所有条目，用于在其他线程中建立新的索引，之后发生变化的条目会在 `load()` 时重新建立索引 """
+        self.__recentKeys.clear()
+        return list(self.__items.values())
+
+    def build(self, interruptCallback=None) -> bool:
+        """ 为发生变化的条目建立索引，可以在其他线程中调用，但是不能同时修改这个索引
+
+        Parameters
+        ----------
+        interruptCallback: callable
+            返回是否需要中断的回调函数，中断后没有建立索引的条目会在下一次搜索时建立
+
+        Returns
+        -------
+        isFinished: bool
+            是否为所有条目建立了索引
+        """
+        self.__sync(interruptCallback)
+        return not self.__dirtyKeys
+
+    def load(self, index: "SearchIndex"):
+        """ 使用在其他线程中建立好的索引替换当前的索引
+
+        Parameters
+        ----------
+        index: SearchIndex
+            使用 `snapshot()` 返回的条目建立的索引，字段和键需要和当前的索引相同
+        """
+        items = self.__items
+        recentKeys = self.__recentKeys
+
+        self.__items = index.__items
+        self.__dirtyKeys = index.__dirtyKeys
+        self.__recentKeys = set()
+        self.__ids = index.__ids
+        self.__docs = index.__docs
+        self.__postings = index.__postings
+        self.__vocabulary = index.__vocabulary
+        self.__ranks = index.__ranks
+        self.__nextId = index.__nextId
+
+        # 建立索引期间发生变化的条目需要重新建立索引
+        self.setItems(items.values())
+        self.__dirtyKeys.update(recentKeys)
+
+    def search(self, keyWord: str, limit: int = None) -> list:
+        """ 搜索条目
+
+        Parameters
+        ----------
+        keyWord: str
+            搜索词，多个单词之间是与的关系
+
+        limit: int
+            最多返回的条目数，为 `None` 时返回所有匹配的条目
+
+        Returns
+        -------
+        items: list
+            按照相关度从高到低排序的条目，相关度相同时按照条目的顺序排列
+        """
+        query = normalize(keyWord)
+        if not query or limit == 0:
+            return []
+
+        self.__sync()
+
+        # 按照相关度从高到低依次取出文档，取够了就不再计算相关度更低的文档
+        docs = self.__docs
+        docIds = []
+        seen = set()
+        candidates = None
+        for match, field in self.__tiers:
+            if match == self.EXACT:
+                matched = self.__postings.get(self.__tags[field] + query, ())
+            elif match == self.PREFIX:
+                matched = self.__lookup(self.__tags[field] + query, True)
+            else:
+                if candidates is None:
+                    candidates = self.__getCandidates(query)
+
+                matched = self.__getContainedDocs(field, query, candidates)
+
+            self.__collect(docIds, seen, matched, limit)
+            if limit is not None and len(docIds) >= limit:
+                break
+        else:
+            # 只匹配了分散在各个字段中的单词或者拼音首字母的文档排在最后
+            if candidates is None:
+                candidates = self.__getCandidates(query)
+
+            self.__collect(docIds, seen, candidates, limit)
+
+        return [docs[i][0] for i in docIds]
+
+    def __collect(self, docIds: list, seen: set, matched, limit: int):
+        """ 将同一相关度的文档按照条目的顺序添加到结果中 """
+        matched = [i for i in matched if i not in seen]
+        if limit is None:
+            matched.sort(key=self.__ranks.__getitem__)
+        else:
+            matched = nsmallest(limit - len(docIds), matched, key=self.__ranks.__getitem__)
+
+        docIds.extend(matched)
+        seen.update(matched)
+
+    def __getCandidates(self, query: str) -> Set[int]:
+        """ 获取包含搜索词中所有单词的文档编号集合 """
+        terms = parseQuery(query)
+
+        # 只有标点符号的搜索词无法分词，直接检查每个字段
+        if not terms:
+            return set().union(*(self.__getContainedDocs(i, query) for i in range(len(self.fields))))
+
+        postings = [self.__lookup(*term) for term in terms]
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def __getContainedDocs(self, field: int, query: str, candidates: Set[int] = None):
+        """ 获取字段包含搜索词的文档编号
+
+        Parameters
+        ----------
+        field: int
+            字段下标
+
+        query: str
+            归一化之后的搜索词
+
+        candidates: Set[int]
+            候选文档编号集合，为 `None` 时检查所有文档
+        """
+        # 歌手、专辑和流派的不同文本远少于文档数，检查字段文本比逐个检查候选文档快
+        tag = self.__tags[field]
+        vocabulary = self.__vocabulary
+        start = bisect_left(vocabulary, tag)
+        end = bisect_left(vocabulary, chr(ord(tag) + 1), start)
+
+        if candidates is None or end - start < len(candidates):
+            texts = [i for i in vocabulary[start:end] if query in i]
+            docIds = set().union(*(self.__postings[i] for i in texts))
+            return docIds if candidates is None else docIds & candidates
+
+        docs = self.__docs
+        return [i for i in candidates if query in docs[i][1][field]]
+
+    def __lookup(self, term: str, isPrefix: bool) -> Set[int]:
+        """ 获取包含这个词或者包含以这个词开头的词的文档编号集合 """
+        if not isPrefix:
+            return self.__postings.get(term, set())
+
+        vocabulary = self.__vocabulary
+        start = bisect_left(vocabulary, term)
+        end = bisect_left(vocabulary, term[:-1] + chr(ord(term[-1]) + 1), start)
+        if end - start == 1:
+            return self.__postings[vocabulary[start]]
+
+        return set().union(*(self.__postings[i] for i in vocabulary[start:end]))
+
+    def __sync(self, interruptCallback=None):
+        """ 为发生变化的条目建立索引 """
+        dirtyKeys = self.__dirtyKeys
+        if not dirtyKeys:
+            return
+
+        items = [(k, i) for k, i in self.__items.items() if k in dirtyKeys]
+
+        self.__removeDocs([self.__ids.pop(k) for k in dirtyKeys
+                           if k not in self.__items and k in self.__ids])
+        dirtyKeys.clear()
+
+        newTokens = []
+        for n, (key, item) in enumerate(items):
+            if interruptCallback and n % 256 == 0 and interruptCallback():
+                dirtyKeys.update(k for k, _ in items[n:])
+                break
+
+            texts = tuple(internString(normalize(item[i])) for i in self.fields)
+            docId = self.__ids.get(key)
+            if docId is not None:
+                if self.__docs[docId][1] == texts:
+                    self.__docs[docId] = (item, texts)
+                    continue
+
+                self.__removeDocs([docId])
+
+            docId = self.__nextId
+            self.__nextId += 1
+            self.__ids[key] = docId
+            self.__docs[docId] = (item, texts)
+
+            for token in self.__getTokens(texts):
+                posting = self.__postings.get(token)
+                if posting is None:
+                    posting = self.__postings[token] = set()
+                    newTokens.append(token)
+
+                posting.add(docId)
+
+        # 新词很多时批量合并，逐个插入有序的词表太慢了
+        if len(newTokens) > 32:
+            self.__vocabulary.extend(newTokens)
+            self.__vocabulary.sort()
+        else:
+            for token in newTokens:
+                insort(self.__vocabulary, token)
+
+        # 被修改的条目会重新分配文档编号，所以相关度相同的文档按照条目的顺序而不是文档编号排序
+        ids = self.__ids
+        self.__ranks = {ids[k]: i for i, k in enumerate(self.__items) if k in ids}
+
+    def __getTokens(self, texts: tuple) -> Set[str]:
+        """ 获取文档的所有词，包括带有字段标记的字段文本 """
+        tokens = set().union(*map(tokenize, texts))
+        tokens.update(tag + text for tag, text in zip(self.__tags, texts))
+        return tokens
+
+    def __removeDocs(self, docIds: list):
+        """ 从倒排表中移除文档，空的倒排表对应的词也会从词表中移除 """
+        removedTokens = []
+        for docId in docIds:
+            _, texts = self.__docs.pop(docId)
+            for token in self.__getTokens(texts):
+                posting = self.__postings[token]
+                posting.discard(docId)
+                if not posting:
+                    del self.__postings[token]
+                    removedTokens.append(token)
+
+        vocabulary = self.__vocabulary
+        if len(removedTokens) > 32:
+            vocabulary[:] = [i for i in vocabulary if i in self.__postings]
+        else:
+            for token in removedTokens:
+                i = bisect_left(vocabulary, token)
+                if i < len(vocabulary) and vocabulary[i] == token:
+                    del vocabulary[i]
+
+
+class LibrarySearchIndex:
+    """ 歌曲库的搜索索引，包括本地歌曲、专辑和自定义播放列表 """
+
+    def __init__(self):
+        self.songs = SearchIndex(
+            {"songName": 1, "singer": 0.8, "album": 0.6, "genre": 0.4}, "songPath")
+        self.albums = SearchIndex(
+            {"album": 1, "singer": 0.8, "genre": 0.4}, lambda i: (i["album"], i["singer"]))
+        self.playlists = SearchIndex({"playlistName": 1}, "playlistName")
+
+
+librarySearchIndex = LibrarySearchIndex()
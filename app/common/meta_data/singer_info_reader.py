@@ -1,49 +1,70 @@
 # coding:utf-8
-from copy import deepcopy
 from typing import List, Dict
 
+from common.startup_tracer import startupTracer
+
 
 class SingerInfoReader:
-    """ 获取歌手信息的类 """
+    """ 获取歌手信息的类，歌手信息直接引用专辑信息，不会复制 """
 
+    @startupTracer.traced()
     def __init__(self, albumInfo_list: list) -> None:
-        self.albumInfo_list = deepcopy(albumInfo_list)    # type:List[dict]
+        self.albumInfo_list = albumInfo_list    # type:List[dict]
         self.singerInfos = self.getSingerInfos(self.albumInfo_list)
 
     @staticmethod
     def getSingerInfos(albumInfo_list: list) -> Dict[str, dict]:
         """ 获取歌手信息 """
         singerInfos = {}
+        years = {}
 
-        year = '0'
         for albumInfo in albumInfo_list:
             singer = albumInfo['singer']
             genre = albumInfo['genre']
-            year_ = albumInfo.get('year', '0')
+            year = albumInfo.get('year') or '0'
 
             # 如果字典中没有该歌手的信息就插入一个
-            if singer not in singerInfos:
-                singerInfos[singer] = {
+            singerInfo = singerInfos.get(singer)
+            if singerInfo is None:
+                singerInfo = singerInfos[singer] = {
                     "singer": singer,
                     "genre": genre,
                     "albumInfo_list": [],
                 }
 
-            singerInfos[singer]["albumInfo_list"].append(albumInfo)
+            singerInfo["albumInfo_list"].append(albumInfo)
 
             # 使用最新的专辑流派作为歌手的流派
-            if year_ >= year:
-                singerInfos[singer]['genre'] = genre
-                year = year_
+            if year >= years.get(singer, '0'):
+                singerInfo['genre'] = genre
+                years[singer] = year
 
         # 排序专辑信息
         for singerInfo in singerInfos.values():
             singerInfo["albumInfo_list"].sort(
-                key=lambda i: i.get('year', '0'), reverse=True)
+                key=lambda i: i.get('year') or '0', reverse=True)
 
         return singerInfos
 
     def updateSingerInfos(self, albumInfo_list: list):
         """ 更新歌手信息 """
-        self.albumInfo_list = deepcopy(albumInfo_list)    # type:List[dict]
+        self.albumInfo_list = albumInfo_list    # type:List[dict]
         self.singerInfos = self.getSingerInfos(self.albumInfo_list)
+
+    def updateSingers(self, albumInfo_list: list, singers: set):
+        """ 只更新指定歌手的信息
+
+        Parameters
+        ----------
+        albumInfo_list: list
+            所有的专辑信息
+
+        singers: set
+            专辑信息发生变化的歌手
+        """
+        self.albumInfo_list = albumInfo_list
+        for singer in singers:
+            self.singerInfos.pop(singer, None)
+
+        albumInfos = [i for i in albumInfo_list if i["singer"] in singers]
+        self.singerInfos.update(self.getSingerInfos(albumInfos))
@@ -0,0 +1,223 @@
+# coding:utf-8
+import re
+import sys
+from collections.abc import Mapping, MutableMapping
+
+
+# 歌曲信息的键，也是歌曲表的列
+SONG_INFO_KEYS = (
+    "songPath",
+    "singer",
+    "songName",
+    "album",
+    "coverName",
+    "genre",
+    "year",
+    "disc",
+    "discTotal",
+    "tracknumber",
+    "trackTotal",
+    "duration",
+    "suffix",
+    "createTime",
+    "modifiedTime",
+)
+
+
+def parseNumber(value, default=0) -> int:
+    """ 将标签中的数字转换为整数，兼容 `2019-05-01` 和 `(3, 12)` 等格式 """
+    if isinstance(value, int):
+        return value
+
+    match = re.search(r'\d+', str(value or ''))
+    return int(match.group()) if match else default
+
+
+def parseDuration(value) -> int:
+    """ 将 `3:45` 格式的时长转换为秒数 """
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    seconds = 0
+    for i in str(value or '').split(':'):
+        seconds = seconds * 60 + parseNumber(i)
+
+    return seconds
+
+
+def internString(value) -> str:
+    """ 驻留重复度很高的字符串，相同的歌手、专辑和流派只保存一份 """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# 写入歌曲信息时使用的转换函数，没有列出的键直接保存原始值
+PARSERS = {
+    "singer": internString,
+    "album": internString,
+    "coverName": internString,
+    "genre": internString,
+    "suffix": internString,
+    "year": parseNumber,
+    "disc": lambda i: parseNumber(i, 1),
+    "discTotal": lambda i: parseNumber(i, 1),
+    "tracknumber": parseNumber,
+    "trackTotal": lambda i: parseNumber(i, 1),
+    "duration": parseDuration,
+}
+
+# 以字典方式读取歌曲信息时使用的转换函数，和之前的歌曲信息字典保持一致
+FORMATTERS = {
+    "year": lambda i: str(i) if i else '',
+    "disc": str,
+    "discTotal": str,
+    "tracknumber": str,
+    "trackTotal": str,
+    "duration": lambda i: f"{i//60}:{i%60:02}",
+}
+
+
+class SongInfo(MutableMapping):
+    """ 歌曲信息，每首歌曲只有一个实例，由歌曲库持有，其他地方只保存它的引用
+
+    歌曲信息使用 `__slots__` 保存，数字信息保存为整数，歌手、专辑和流派等字符串会被驻留。
+    为了兼容之前的歌曲信息字典，`songInfo["duration"]` 等字典方式的访问会返回字符串，
+    而 `songInfo.duration` 返回的是整数
+    """
+
+    __slots__ = SONG_INFO_KEYS + ("_extra",)
+
+    def __init__(self, songPath='', singer='', songName='', album='', coverName='', genre='',
+                 year=0, disc=1, discTotal=1, tracknumber=0, trackTotal=1, duration=0,
+                 suffix='', createTime='', modifiedTime=''):
+        self.songPath = songPath              # type:str
+        self.singer = internString(singer)
+        self.songName = songName              # type:str
+        self.album = internString(album)
+        self.coverName = internString(coverName)
+        self.genre = internString(genre)
+        self.year = parseNumber(year)
+        self.disc = parseNumber(disc, 1)
+        self.discTotal = parseNumber(discTotal, 1)
+        self.tracknumber = parseNumber(tracknumber)
+        self.trackTotal = parseNumber(trackTotal, 1)
+        self.duration = parseDuration(duration)
+        self.suffix = internString(suffix)
+        self.createTime = createTime          # type:str
+        self.modifiedTime = modifiedTime      # type:str
+        self._extra = None                    # 在线歌曲封面路径等额外的信息
+
+    @classmethod
+    def fromDict(cls, songInfo: Mapping):
+        """ 从歌曲信息字典或者数据库中的行创建歌曲信息
+
+        Parameters
+        ----------
+        songInfo: Mapping
+            歌曲信息字典，缺少的键使用默认值
+        """
+        if isinstance(songInfo, SongInfo):
+            return songInfo.copy()
+
+        keys = songInfo.keys()
+        info = cls(**{k: songInfo[k] for k in keys if k in FIELDS})
+        for k in keys:
+            if k not in FIELDS:
+                info[k] = songInfo[k]
+
+        return info
+
+    def toDict(self) -> dict:
+        """ 转换为之前的歌曲信息字典，用于保存到 json 文件中 """
+        return dict(self)
+
+    def copy(self):
+        """ 复制歌曲信息，歌曲信息中的值都是不可变对象，浅复制就足够了 """
+        info = SongInfo.__new__(SongInfo)
+        for k in SONG_INFO_KEYS:
+            setattr(info, k, getattr(self, k))
+
+        info._extra = self._extra.copy() if self._extra else None
+        return info
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __getitem__(self, key: str):
+        if key in FIELDS:
+            value = getattr(self, key)
+            formatter = FORMATTERS.get(key)
+            return formatter(value) if formatter else value
+
+        if self._extra and key in self._extra:
+            return self._extra[key]
+
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key in FIELDS:
+            parser = PARSERS.get(key)
+            setattr(self, key, parser(value) if parser else value)
+            return
+
+        if self._extra is None:
+            self._extra = {}
+
+        self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in FIELDS or not self._extra or key not in self._extra:
+            raise KeyError(key)
+
+        del self._extra[key]
+
+    def __contains__(self, key):
+        return key in FIELDS or bool(self._extra) and key in self._extra
+
+    def __iter__(self):
+        yield from SONG_INFO_KEYS
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        return len(SONG_INFO_KEYS) + len(self._extra or ())
+
+    def __eq__(self, other):
+        if isinstance(other, SongInfo):
+            return self.__values() == other.__values()
+
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return self.__values()
+
+    def __setstate__(self, state):
+        for k, v in zip(SONG_INFO_KEYS, state):
+            setattr(self, k, internString(v) if k in PARSERS else v)
+
+        self._extra = state[-1]
+
+    def __repr__(self):
+        return f"SongInfo({dict(self)!r})"
+
+    def __values(self) -> tuple:
+        """ 所有字段的值 """
+        return tuple(getattr(self, k) for k in SONG_INFO_KEYS) + (self._extra or None,)
+
+
+FIELDS = frozenset(SONG_INFO_KEYS)
+
+
+def encodeSongInfo(obj):
+    """ `json.dump()` 的 `default` 参数，将歌曲信息转换为字典 """
+    if isinstance(obj, SongInfo):
+        return obj.toDict()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -1,174 +1,421 @@
 # coding:utf-8
 import os
-import json
-from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Sized, Tuple
 
-from mutagen import File
-from mutagen.mp3 import MP3
-from mutagen.mp4 import MP4
-from mutagen.flac import FLAC
-from tinytag import TinyTag
-
-from common.os_utils import checkDirExists
 from common.os_utils import adjustName
+from common.startup_tracer import startupTracer
 from PyQt5.QtCore import QFileInfo, Qt, QObject
 
+from .album_cover_reader import AlbumCoverReader
+from .cover_store import coverStore
+from .thumbnail_cache import thumbnailCache
+from .library_change_detector import (LibraryChangeDetector, LibraryDiff,
+                                      getModifiedTime)
+from .library_database import LibraryDatabase
+from .song_info import SongInfo
+from .tag_reader import readTag
+
 
 class SongInfoReader(QObject):
     """ 创建一个获取和保存歌曲信息的类 """
 
-    cachePath = Path("cache/song_info/songInfo.json")
+    parallelThreshold = 64  # 新歌曲数量达到该值时才使用进程池读取
+    chunkSize = 32          # 每个进程池任务读取的歌曲数量
+
+    @startupTracer.traced()
+    def __init__(self, folderPaths: list, maxWorkers: int = None, progressCallback=None,
+                 maxDepth: int = None, ignorePatterns: list = None, isLoadSnapshot=False,
+                 interruptCallback=None):
+        """
+        Parameters
+        ----------
+        folderPaths: list
+            歌曲文件夹列表
+
+        maxWorkers: int
+            读取歌曲信息的最大进程数，为 `None` 时使用 CPU 核数
+
+        progressCallback: callable
+            扫描进度回调函数，接受已读取的歌曲数量和需要读取的歌曲总数
+
+        maxDepth: int
+            递归扫描歌曲文件夹的最大深度，为 `None` 时不限制深度
 
-    def __init__(self, folderPaths: list):
+        ignorePatterns: list
+            扫描时忽略的文件和文件夹的通配符
+
+        isLoadSnapshot: bool
+            是否只读取歌曲库中上一次保存的歌曲信息而不扫描歌曲文件夹，
+            之后需要使用 `syncSnapshot()` 同步歌曲文件夹的变化
+
+        interruptCallback: callable
+            返回是否需要中断读取的回调函数，中断后读取歌曲信息的方法只返回已经读取的部分
+        """
         super().__init__()
         self.folderPaths = folderPaths
         if not folderPaths:
             self.folderPaths = []
 
+        self.maxWorkers = maxWorkers
+        self.progressCallback = progressCallback
+        self.interruptCallback = interruptCallback
+        self.database = LibraryDatabase()
+        self.changeDetector = LibraryChangeDetector(
+            maxDepth=maxDepth, ignorePatterns=ignorePatterns)
+        self.__pendingDiff = LibraryDiff()
+
+        # 最近一次增量更新中被移除和新读取的歌曲信息
+        self.removedSongInfos = []
+        self.updatedSongInfos = []
+
         self.songInfo_list = []
-        self.getInfo(folderPaths)
+        if isLoadSnapshot:
+            self.loadSnapshot(folderPaths)
+        else:
+            self.getInfo(folderPaths)
 
-    @checkDirExists('cache/song_info')
     def scanTargetFolderSongInfo(self, folderPaths: list):
         """ 扫描指定文件夹的歌曲信息并更新歌曲信息 """
         self.folderPaths = folderPaths
-
-        with open(self.cachePath, "w", encoding="utf-8") as f:
-            json.dump([{}], f)
-
+        self.database.clear()
         self.songInfo_list = []
         self.getInfo(folderPaths)
 
-    def rescanSongInfo(self):
-        """ 重新扫描歌曲信息，检查是否有歌曲信息的更新 """
-        hasSongModified = False
+    def rescanSongInfo(self, isFullScan=False):
+        """ 重新扫描歌曲信息，检查是否有歌曲信息的更新
 
+        Parameters
+        ----------
+        isFullScan: bool
+            是否扫描所有文件夹，文件被原地修改时文件夹的修改时间不会变化，需要使用完整扫描
+        """
         # 如果歌曲信息被删除了，就重新扫描一遍
-        if not self.cachePath.exists():
+        if not self.database.exists():
+            self.removedSongInfos = self.songInfo_list
+            self.database = LibraryDatabase()
             self.scanTargetFolderSongInfo(self.folderPaths)
+            self.updatedSongInfos = self.songInfo_list
             return True
 
-        # 利用当前的歌曲信息进行更新
-        self.songInfo_list = self.__readSongInfoFromJson()
-        self.songPath_list = self.__getSongFilePaths()
-        oldSongs = {info.get("songPath") for info in self.songInfo_list}
-
-        # 处理旧的歌曲信息
-        for songInfo in self.songInfo_list.copy():
-            songPath = songInfo["songPath"]
-
-            if os.path.exists(songPath):
-                t1 = songInfo["modifiedTime"]
-                t2 = QFileInfo(songPath).lastModified().toString(Qt.ISODate)
-
-                # 歌曲发生修改则重新扫描该歌曲的信息
-                if t1 != t2:
-                    hasSongModified = True
-                    self.songInfo_list.remove(songInfo)
-                    self.songInfo_list.append(self.getOneSongInfo(songPath))
-            else:
-                self.songInfo_list.remove(songInfo)  # 歌曲不存在则移除歌曲信息
-                hasSongModified = True
-
-        # 添加新的歌曲信息
-        for songPath in set(self.songPath_list) - oldSongs:
-            hasSongModified = True
-            self.songInfo_list.append(self.getOneSongInfo(songPath))
-
-        # 保存歌曲信息
+        # 合并 hasSongModified() 检测到但是还未处理的变化
+        diff = self.__pendingDiff
+        diff.merge(self.changeDetector.scan(isFullScan))
+        self.__pendingDiff = LibraryDiff()
+        return self.__applyDiff(diff)
+
+    def updateFolders(self, folderPaths: list):
+        """ 只重新扫描发生变化的歌曲文件夹
+
+        Parameters
+        ----------
+        folderPaths: list
+            发生变化的文件夹列表
+
+        Returns
+        -------
+        isUpdated: bool
+            歌曲信息是否有更新，变化的歌曲信息保存在 `removedSongInfos` 和 `updatedSongInfos` 中
+        """
+        return self.__applyDiff(self.changeDetector.scanFolders(folderPaths))
+
+    def updateSongInfos(self, songInfo_list: list):
+        """ 使用修改后的歌曲信息替换歌曲信息列表中路径相同的歌曲信息，不会写入歌曲库
+
+        Parameters
+        ----------
+        songInfo_list: list
+            修改后的歌曲信息列表
+        """
+        songInfos = {i["songPath"]: i for i in songInfo_list}
+        for i, songInfo in enumerate(self.songInfo_list):
+            newSongInfo = songInfos.get(songInfo["songPath"])
+            if newSongInfo is not None:
+                self.songInfo_list[i] = newSongInfo
+
+    def applySongInfos(self, removedPaths: list, updatedSongInfos: list):
+        """ 应用在其他地方 (比如后台同步线程) 读取的歌曲信息变化，不会写入歌曲库
+
+        Parameters
+        ----------
+        removedPaths: list
+            被移除的歌曲路径列表
+
+        updatedSongInfos: list
+            新增或者修改后的歌曲信息列表，路径已经存在的歌曲信息会被替换
+
+        Returns
+        -------
+        isUpdated: bool
+            歌曲信息是否有更新，变化的歌曲信息保存在 `removedSongInfos` 和 `updatedSongInfos` 中
+        """
+        songPaths = set(removedPaths) | {i["songPath"] for i in updatedSongInfos}
+        self.__replaceSongInfos(songPaths, updatedSongInfos)
+        return bool(self.removedSongInfos or self.updatedSongInfos)
+
+    def __applyDiff(self, diff: LibraryDiff):
+        """ 将文件的变化应用到歌曲信息列表和歌曲库中 """
+        self.removedSongInfos = []
+        self.updatedSongInfos = []
+        if diff.isEmpty():
+            return False
+
+        # 读取新增或者修改的歌曲信息
+        self.__replaceSongInfos(
+            diff.removed | diff.modified, self.getSongInfos(diff.added | diff.modified))
+
+        # 只保存发生变化的歌曲信息
+        self.database.removeSongInfos(diff.removed)
+        self.database.upsertSongInfos(self.updatedSongInfos)
+        return True
+
+    def __replaceSongInfos(self, removedPaths: set, updatedSongInfos: list):
+        """ 移除指定路径的歌曲信息并插入新的歌曲信息，变化的歌曲信息保存在
+        `removedSongInfos` 和 `updatedSongInfos` 中 """
+        songInfos = {i["songPath"]: i for i in self.songInfo_list}
+        self.removedSongInfos = [
+            songInfos.pop(i) for i in removedPaths if i in songInfos]
+
+        self.updatedSongInfos = updatedSongInfos
+        for songInfo in updatedSongInfos:
+            songInfos[songInfo["songPath"]] = songInfo
+
+        self.songInfo_list = list(songInfos.values())
+        self.songPath_list = list(songInfos.keys())
         self.sortByCreateTime()
-        self.save()
-        return hasSongModified
 
-    @checkDirExists('cache/song_info')
+    def loadSnapshot(self, folderPaths: list):
+        """ 读取歌曲库中上一次保存的歌曲信息，不会扫描歌曲文件夹 """
+        self.folderPaths = folderPaths or []
+        self.changeDetector.folderPaths = self.folderPaths
+        self.__pendingDiff = LibraryDiff()
+        self.songInfo_list = self.database.getSongInfos()
+        self.songPath_list = [i["songPath"] for i in self.songInfo_list]
+
+    def syncSnapshot(self, batchSize=256) -> Iterator[Tuple[List[str], List[SongInfo]]]:
+        """ 扫描歌曲文件夹并和 `loadSnapshot()` 读取的歌曲信息对比，
+        分批读取新增和修改的歌曲信息并写入歌曲库，适合在后台线程中调用
+
+        Parameters
+        ----------
+        batchSize: int
+            每一批读取的歌曲数量
+
+        Yields
+        ------
+        removedPaths: List[str]
+            被移除的歌曲路径列表
+
+        updatedSongInfos: List[SongInfo]
+            这一批读取的新增或者修改后的歌曲信息列表
+        """
+        oldSongs = {i["songPath"]: i["modifiedTime"] for i in self.songInfo_list}
+
+        # 歌曲库为空时边扫描文件夹边读取标签，不需要等待扫描完成
+        if not oldSongs:
+            for songInfo_list in self.iterSongInfos(self.changeDetector.iterRebuild(), batchSize):
+                self.database.upsertSongInfos(songInfo_list)
+                yield [], songInfo_list
+
+            return
+
+        newSongs = set(self.changeDetector.rebuild())
+        removedSongs = oldSongs.keys() - newSongs
+        if removedSongs:
+            self.database.removeSongInfos(removedSongs)
+            yield list(removedSongs), []
+
+        # 程序关闭期间被修改的歌曲需要重新读取
+        changedSongs = {
+            i for i in newSongs if oldSongs.get(i) != self.changeDetector.getModifiedTime(i)}
+        for songInfo_list in self.iterSongInfos(changedSongs, batchSize):
+            self.database.upsertSongInfos(songInfo_list)
+            yield [], songInfo_list
+
     def getInfo(self, folderPaths: list):
         """ 从指定的目录读取符合匹配规则的歌曲的标签卡信息 """
         self.folderPaths = folderPaths
-        self.songPath_list = self.__getSongFilePaths()
+        self.changeDetector.folderPaths = folderPaths or []
+        self.__pendingDiff = LibraryDiff()
+
+        # 从歌曲库读取旧信息
+        oldInfo = self.database.getSongInfos()
+
+        # 歌曲库为空时边扫描文件夹边读取标签，不需要等待扫描完成
+        if not oldInfo:
+            self.songInfo_list = self.getSongInfos(
+                self.changeDetector.iterRebuild())
+            self.songPath_list = list(self.changeDetector.fileStats)
+            self.sortByCreateTime()
+            self.database.upsertSongInfos(self.songInfo_list)
+            return
 
-        # 从json文件读取旧信息
-        oldInfo = self.__readSongInfoFromJson()
+        self.songPath_list = list(self.changeDetector.rebuild())
         oldSongs = {info.get("songPath") for info in oldInfo}
         newSongs = set(self.songPath_list)
 
-        # 如果文件路径完全相等就直接获取以前的文件信息并返回
-        if newSongs == oldSongs:
-            self.songInfo_list = oldInfo.copy()
+        # 程序关闭期间被修改的歌曲需要重新读取
+        modifiedSongs = {
+            info["songPath"] for info in oldInfo if info["songPath"] in newSongs and
+            info["modifiedTime"] != self.changeDetector.getModifiedTime(info["songPath"])
+        }
+
+        # 如果文件路径完全相等且没有歌曲被修改就直接获取以前的文件信息并返回
+        if newSongs == oldSongs and not modifiedSongs:
+            self.songInfo_list = oldInfo
             return
 
-        # 根据文件路径并集获取部分文件信息字典
-        commonSongs = newSongs & oldSongs
-        if commonSongs:
-            self.songInfo_list = [
-                info for info in oldInfo if info["songPath"] in commonSongs]
+        # 根据文件路径交集获取部分文件信息字典
+        self.songInfo_list = [
+            info for info in oldInfo
+            if info["songPath"] in newSongs and info["songPath"] not in modifiedSongs
+        ]
 
-        # 如果有差集的存在就需要更新json文件
-        for songPath in newSongs - oldSongs:
-            self.songInfo_list.append(self.getOneSongInfo(songPath))
+        # 如果有差集的存在就需要更新歌曲库
+        newInfos = self.getSongInfos((newSongs - oldSongs) | modifiedSongs)
+        self.songInfo_list.extend(newInfos)
 
         # 排序歌曲
         self.sortByCreateTime()
 
-        # 更新json文件
-        self.save()
+        # 更新歌曲库
+        self.database.removeSongInfos(oldSongs - newSongs)
+        self.database.upsertSongInfos(newInfos)
 
     def getOneSongInfo(self, songPath: str):
         """ 获取一首歌的信息 """
-        tag = TinyTag.get(songPath)
-        fileInfo = QFileInfo(songPath)
-
-        # 标签信息
-        suffix = "." + fileInfo.suffix()
-        songName = tag.title if tag.title and tag.title.strip() else fileInfo.baseName()
-        singer = tag.artist if tag.artist and tag.artist.strip() else self.tr("Unknown artist")
-        album = tag.album if tag.album and tag.album.strip() else self.tr("Unknown album")
-        trackTotal = str(tag.track_total) if tag.track_total else '1'
-        genre = tag.genre if tag.genre else self.tr("Unknown genre")
-        duration = f"{int(tag.duration//60)}:{int(tag.duration%60):02}"
-        coverName = adjustName(singer + '_' + album)
-        disc = str(tag.disc) if tag.disc else "1"
-        discTotal = str(tag.disc_total) if tag.disc_total else "1"
-
-        # 曲目
-        tracknumber = str(tag.track) if tag.track else "0"
-        tracknumber = self.__adjustTrackNumber(tracknumber)
-
-        # 年份
-        if tag.year and tag.year[0] != "0":
-            year = tag.year[:4]
-        else:
-            audio = File(songPath, [MP3, FLAC, MP4])
-            keyMap = {
-                ".m4a": "©day",
-                ".mp4": "©day",
-                ".mp3": "TDRC",
-                ".flac": "year"
-            }
-            year = str(audio.get(keyMap[suffix], [''])[0])[:4]
-
-        # 获取时间戳
-        createTime = fileInfo.birthTime().toString(Qt.ISODate)
-        modifiedTime = fileInfo.lastModified().toString(Qt.ISODate)
-
-        # 创建歌曲信息字典
-        songInfo = {
-            "songPath": songPath,
-            "singer": singer,
-            "songName": songName,
-            "album": album,  # album为原专辑名
-            "coverName": coverName,  # 保存下来的封面名字
-            "genre": genre,
-            "year": year,
-            "disc": disc,
-            "discTotal": discTotal,
-            "tracknumber": tracknumber,
-            "trackTotal": trackTotal,
-            "duration": duration,
-            "suffix": suffix,
-            "createTime": createTime,
-            "modifiedTime": modifiedTime,
+        return readSongInfo(songPath, self.__getUnknownInfo())
+
+    def getSongInfos(self, songPaths: Iterable[str]) -> list:
+        """ 获取多首歌的信息，歌曲数量较多时使用进程池并行读取
+
+        Parameters
+        ----------
+        songPaths: Iterable[str]
+            歌曲路径，可以是边扫描边返回路径的生成器
+
+        Returns
+        -------
+        songInfo_list: list
+            歌曲信息列表，顺序和 `songPaths` 一致
+        """
+        songInfo_list = []
+        for songInfos in self.iterSongInfos(songPaths):
+            songInfo_list.extend(songInfos)
+
+        return songInfo_list
+
+    def iterSongInfos(self, songPaths: Iterable[str], batchSize: int = None) -> Iterator[list]:
+        """ 分批获取多首歌的信息，歌曲数量较多时使用进程池并行读取
+
+        Parameters
+        ----------
+        songPaths: Iterable[str]
+            歌曲路径，可以是边扫描边返回路径的生成器
+
+        batchSize: int
+            每一批返回的最少歌曲数量 (最后一批除外)，为 `None` 时读取完所有歌曲后一次性返回
+
+        Yields
+        ------
+        songInfo_list: list
+            一批歌曲信息，所有批次拼接起来的顺序和 `songPaths` 一致
+        """
+        total = len(songPaths) if isinstance(songPaths, Sized) else None
+        songPaths = iter(songPaths)
+        unknownInfo = self.__getUnknownInfo()
+        maxWorkers = self.maxWorkers or os.cpu_count() or 1
+        batchSize = batchSize or float("inf")
+
+        # 歌曲较少时创建进程池的开销比读取标签还大，直接串行读取
+        head = list(islice(songPaths, self.parallelThreshold))
+        if len(head) < self.parallelThreshold or maxWorkers <= 1:
+            n = 0
+            songInfo_list = []
+            for songPath in chain(head, songPaths):
+                if self.__isInterrupted():
+                    break
+
+                songInfo_list.append(readSongInfo(songPath, unknownInfo))
+                n += 1
+                self.__reportProgress(n, total or max(n, len(head)))
+                if len(songInfo_list) >= batchSize:
+                    yield songInfo_list
+                    songInfo_list = []
+
+            if songInfo_list:
+                yield songInfo_list
+
+            return
+
+        # 子进程不会导入旧版本的封面，需要先在主进程中导入
+        coverStore.migrate()
+
+        # 分块提交任务，减少进程间通信的次数，生成器中的路径会被边扫描边读取。
+        # 同时进行的任务数有上限，被中断或者生成器被关闭时只需等待正在读取的几个任务，
+        # 中断之后返回已经读取的部分
+        executor = ProcessPoolExecutor(maxWorkers)
+        futures = deque()
+        try:
+            maxPending = 2 * maxWorkers
+            n = 0
+            count = 0
+            songPaths = chain(head, songPaths)
+            songInfo_list = []
+            isExhausted = False
+            while True:
+                while not isExhausted and len(futures) < maxPending:
+                    chunk = list(islice(songPaths, self.chunkSize))
+                    if not chunk:
+                        isExhausted = True
+                        break
+
+                    count += len(chunk)
+                    futures.append(executor.submit(readSongInfos, chunk, unknownInfo))
+
+                if not futures or self.__isInterrupted():
+                    break
+
+                # 按照提交顺序合并结果
+                songInfos = futures.popleft().result()
+                n += len(songInfos)
+                songInfo_list.extend(songInfos)
+                self.__reportProgress(n, total or count)
+                if len(songInfo_list) >= batchSize:
+                    # 载入子进程保存的封面
+                    coverStore.reload()
+                    yield songInfo_list
+                    songInfo_list = []
+        finally:
+            # Python 3.8 的 `shutdown()` 没有 `cancel_futures` 参数，需要手动取消还没开始的任务
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown()
+
+        # 载入子进程保存的封面
+        coverStore.reload()
+        if songInfo_list:
+            yield songInfo_list
+
+    def __getUnknownInfo(self):
+        """ 获取标签缺失时使用的默认信息 """
+        return {
+            "singer": self.tr("Unknown artist"),
+            "album": self.tr("Unknown album"),
+            "genre": self.tr("Unknown genre"),
         }
-        return songInfo
+
+    def __isInterrupted(self) -> bool:
+        """ 是否需要中断读取 """
+        return bool(self.interruptCallback and self.interruptCallback())
+
+    def __reportProgress(self, current: int, total: int):
+        """ 报告扫描进度 """
+        if self.progressCallback:
+            self.progressCallback(current, total)
 
     def sortByCreateTime(self):
         """ 依据文件创建日期排序文件信息列表 """
@@ -183,70 +430,91 @@ class SongInfoReader(QObject):
         """ 以歌手名排序文件信息列表 """
         self.songInfo_list.sort(key=lambda songInfo: songInfo["singer"])
 
-    def __adjustTrackNumber(self, trackNum: str):
-        """ 调整曲目编号 """
-        if trackNum != "0":
-            trackNum = trackNum.lstrip("0")
-        # 处理a/b
-        trackNum = trackNum.split("/")[0]
-        # 处理An
-        if trackNum[0].upper() == "A":
-            trackNum = trackNum[1:]
-        return trackNum
-
-    def __readSongInfoFromJson(self) -> list:
-        """ 从 json 文件中读取歌曲信息 """
-        try:
-            with open(self.cachePath, "r", encoding="utf-8") as f:
-                songInfo_list = json.load(f)
-        except:
-            songInfo_list = [{}]
-        return songInfo_list
-
-    @checkDirExists('cache/song_info')
     def save(self):
         """ 保存歌曲信息 """
-        with open(self.cachePath, "w", encoding="utf-8") as f:
-            json.dump(self.songInfo_list, f)
-
-    def __getSongFilePaths(self):
-        """ 获取指定歌曲文件夹下的歌曲文件 """
-        songPaths = []
-        for folder in self.folderPaths:
-            for file in Path(folder).glob('*'):
-                if file.suffix.lower() in ('.mp3', '.flac', '.m4a', '.mp4'):
-                    songPaths.append(str(file).replace('\\', '/'))
-
-        return songPaths
+        self.database.setSongInfos(self.songInfo_list)
 
     def hasSongModified(self):
         """ 检测是否有歌曲被修改 """
         # 如果歌曲信息被删除了，就重新扫描一遍
-        if not self.cachePath.exists():
+        if not self.database.exists():
             return True
 
-        # 利用当前的歌曲信息进行更新
-        songInfo_list = self.__readSongInfoFromJson()
-        songPath_list = self.__getSongFilePaths()
-        oldSongs = {info.get("songPath") for info in songInfo_list}
-
-        # 处理旧的歌曲信息
-        for songInfo in songInfo_list:
-            songPath = songInfo["songPath"]
-
-            if os.path.exists(songPath):
-                t1 = songInfo["modifiedTime"]
-                t2 = QFileInfo(songPath).lastModified().toString(Qt.ISODate)
-                # 歌曲发生修改则重新扫描该歌曲的信息
-                if t1 != t2:
-                    return True
-            else:
-                return True
-
-        return bool(set(songPath_list)-oldSongs)
+        # 只扫描修改时间发生变化的文件夹，检测到的变化留给 rescanSongInfo() 处理
+        self.__pendingDiff.merge(self.changeDetector.scan())
+        return not self.__pendingDiff.isEmpty()
 
     @staticmethod
     def getModifiedTime(songPath: str):
         """ 获取歌曲修改时间 """
-        fileInfo = QFileInfo(songPath)
-        return fileInfo.lastModified().toString(Qt.ISODate)
+        return getModifiedTime(songPath)
+
+def readSongInfo(songPath: str, unknownInfo: dict) -> SongInfo:
+    """ 读取一首歌的信息，定义在模块级别以便在进程池中调用
+
+    Parameters
+    ----------
+    songPath: str
+        歌曲路径
+
+    unknownInfo: dict
+        标签缺失时使用的歌手、专辑和流派名
+
+    Returns
+    -------
+    songInfo: SongInfo
+        歌曲信息
+    """
+    tag = readTag(songPath)
+    fileInfo = QFileInfo(songPath)
+
+    # 标签信息
+    suffix = "." + fileInfo.suffix()
+    songName = tag.title if tag.title and tag.title.strip() else fileInfo.baseName()
+    singer = tag.artist if tag.artist and tag.artist.strip() else unknownInfo["singer"]
+    album = tag.album if tag.album and tag.album.strip() else unknownInfo["album"]
+    trackTotal = tag.trackTotal or 1
+    genre = tag.genre if tag.genre else unknownInfo["genre"]
+    duration = int(tag.duration)
+    coverName = adjustName(singer + '_' + album)
+    disc = tag.disc or 1
+    discTotal = tag.discTotal or 1
+    tracknumber = tag.track or 0
+    year = tag.year[:4] if tag.year and tag.year[0] != "0" else 0
+
+    # 顺便保存专辑封面，避免再次解析音频文件
+    AlbumCoverReader.saveAlbumCover(coverName, tag.picData)
+
+    # 获取时间戳
+    createTime = fileInfo.birthTime().toString(Qt.ISODate)
+    modifiedTime = getModifiedTime(songPath)
+
+    # 创建歌曲信息
+    songInfo = SongInfo(
+        songPath=songPath,
+        singer=singer,
+        songName=songName,
+        album=album,            # album为原专辑名
+        coverName=coverName,    # 保存下来的封面名字
+        genre=genre,
+        year=year,
+        disc=disc,
+        discTotal=discTotal,
+        tracknumber=tracknumber,
+        trackTotal=trackTotal,
+        duration=duration,
+        suffix=suffix,
+        createTime=createTime,
+        modifiedTime=modifiedTime,
+    )
+    return songInfo
+
+
+def readSongInfos(songPaths: list, unknownInfo: dict) -> list:
+    """ 读取多首歌的信息，作为进程池的一个任务 """
+    songInfo_list = [readSongInfo(songPath, unknownInfo) for songPath in songPaths]
+
+    # 进程退出前需要等待新封面的缩略图生成完成
+    thumbnailCache.waitForDone()
+    return songInfo_list
+
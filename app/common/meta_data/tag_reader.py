@@ -0,0 +1,197 @@
+# coding:utf-8
+from typing import Union
+from pathlib import Path
+
+from mutagen import File, FileType, MutagenError
+from mutagen.flac import FLAC
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4
+
+
+class AudioTag:
+    """ 音频标签信息，包括专辑封面 """
+
+    def __init__(self):
+        self.title = None       # type:str
+        self.artist = None      # type:str
+        self.album = None       # type:str
+        self.genre = None       # type:str
+        self.year = None        # type:str
+        self.track = None       # type:int
+        self.trackTotal = None  # type:int
+        self.disc = None        # type:int
+        self.discTotal = None   # type:int
+        self.duration = 0       # type:float
+        self.picData = None     # type:bytes
+
+
+class TagReaderBase:
+    """ 标签读取器基类 """
+
+    def __init__(self, audio: FileType):
+        """
+        Parameters
+        ----------
+        audio: FileType
+            mutagen 解析得到的音频文件
+        """
+        self.audio = audio
+
+    def read(self) -> AudioTag:
+        """ 读取标签信息和专辑封面 """
+        tag = AudioTag()
+        if self.audio.info:
+            tag.duration = self.audio.info.length or 0
+
+        if self.audio.tags is not None:
+            self._readTag(tag)
+
+        return tag
+
+    def _readTag(self, tag: AudioTag):
+        """ 从标签中读取信息
+
+        Parameters
+        ----------
+        tag: AudioTag
+            需要填充的标签信息
+        """
+        raise NotImplementedError("该方法必须被子类实现")
+
+
+class MP3TagReader(TagReaderBase):
+    """ MP3 标签读取器 """
+
+    def _readTag(self, tag: AudioTag):
+        tags = self.audio.tags
+        tag.title = self.__getText('TIT2')
+        tag.artist = self.__getText('TPE1')
+        tag.album = self.__getText('TALB')
+        tag.year = self.__getText('TDRC')
+        tag.track, tag.trackTotal = splitNumber(self.__getText('TRCK'))
+        tag.disc, tag.discTotal = splitNumber(self.__getText('TPOS'))
+
+        if 'TCON' in tags and tags['TCON'].genres:
+            tag.genre = tags['TCON'].genres[0]
+
+        for k in tags.keys():
+            if k.startswith("APIC"):
+                tag.picData = tags[k].data
+                break
+
+    def __getText(self, key: str):
+        """ 获取文本帧的第一个值 """
+        frame = self.audio.tags.get(key)
+        if not frame or not frame.text:
+            return None
+
+        return str(frame.text[0])
+
+
+class FLACTagReader(TagReaderBase):
+    """ FLAC 标签读取器 """
+
+    def _readTag(self, tag: AudioTag):
+        tag.title = self.__getValue('title')
+        tag.artist = self.__getValue('artist')
+        tag.album = self.__getValue('album')
+        tag.genre = self.__getValue('genre')
+        tag.year = self.__getValue('date') or self.__getValue('year')
+        tag.track, tag.trackTotal = splitNumber(self.__getValue('tracknumber'))
+        tag.disc, tag.discTotal = splitNumber(self.__getValue('discnumber'))
+        tag.trackTotal = tag.trackTotal or toInt(
+            self.__getValue('tracktotal') or self.__getValue('totaltracks'))
+        tag.discTotal = tag.discTotal or toInt(
+            self.__getValue('disctotal') or self.__getValue('totaldiscs'))
+
+        if self.audio.pictures:
+            tag.picData = self.audio.pictures[0].data
+
+    def __getValue(self, key: str):
+        """ 获取 Vorbis 注释的第一个值 """
+        values = self.audio.tags.get(key)
+        return values[0] if values else None
+
+
+class MP4TagReader(TagReaderBase):
+    """ MP4/M4A 标签读取器 """
+
+    def _readTag(self, tag: AudioTag):
+        tag.title = self.__getValue('©nam')
+        tag.artist = self.__getValue('©ART')
+        tag.album = self.__getValue('©alb')
+        tag.genre = self.__getValue('©gen')
+        tag.year = self.__getValue('©day')
+
+        trkn = self.__getValue('trkn')
+        if trkn:
+            tag.track, tag.trackTotal = trkn[0] or None, trkn[1] or None
+
+        disk = self.__getValue('disk')
+        if disk:
+            tag.disc, tag.discTotal = disk[0] or None, disk[1] or None
+
+        covr = self.__getValue('covr')
+        if covr:
+            tag.picData = bytes(covr)
+
+    def __getValue(self, key: str):
+        """ 获取标签的第一个值 """
+        values = self.audio.tags.get(key)
+        return values[0] if values else None
+
+
+def readTag(songPath: Union[str, Path]) -> AudioTag:
+    """ 只解析一次音频文件，读取所有需要的标签信息和专辑封面
+
+    Parameters
+    ----------
+    songPath: str or Path
+        音频文件路径
+
+    Returns
+    -------
+    tag: AudioTag
+        标签信息，文件无法解析时返回空的标签信息
+    """
+    try:
+        audio = File(songPath, options=[MP3, FLAC, MP4])
+    except MutagenError as e:
+        print(e)
+        return AudioTag()
+
+    readerMap = {
+        MP3: MP3TagReader,
+        FLAC: FLACTagReader,
+        MP4: MP4TagReader
+    }
+    if type(audio) not in readerMap:
+        return AudioTag()
+
+    return readerMap[type(audio)](audio).read()
+
+
+def splitNumber(text: str):
+    """ 将 `a/b` 格式的编号拆分为编号和总数
+
+    Parameters
+    ----------
+    text: str
+        编号字符串，比如 `3/12`、`03` 或者 `A3`
+
+    Returns
+    -------
+    num, total: int
+        编号和总数，不存在时为 `None`
+    """
+    if not text:
+        return None, None
+
+    num, _, total = str(text).partition('/')
+    return toInt(num), toInt(total)
+
+
+def toInt(text: str):
+    """ 提取字符串中的整数，不存在时返回 `None` """
+    digits = ''.join(c for c in str(text or '') if c.isdigit())
+    return int(digits) if digits else None
@@ -0,0 +1,158 @@
+# coding:utf-8
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from threading import Lock
+
+from PIL import Image
+
+from .cover_store import coverStore
+
+
+class ThumbnailCache:
+    """ 专辑封面的多尺寸缩略图缓存，缩略图在后台线程池中生成 """
+
+    sizes = (113, 200, 275, 450)   # 界面中使用的封面尺寸
+    folder = Path("cache/Album_Cover/thumbnails")
+
+    def __init__(self, folder=None, maxWorkers=2):
+        """
+        Parameters
+        ----------
+        folder: str or Path
+            缩略图文件夹，为 `None` 时使用默认文件夹
+
+        maxWorkers: int
+            生成缩略图的最大线程数
+        """
+        self.folder = Path(folder) if folder else self.folder
+        self.maxWorkers = maxWorkers
+        self.thumbnails = None  # type:set
+        self.futures = {}
+        self.executor = None
+        self.lock = Lock()
+
+    def getThumbnailPath(self, coverPath: str, size: int) -> str:
+        """ 获取最接近指定尺寸的缩略图路径，缩略图还未生成时返回原图路径并在后台生成缩略图
+
+        Parameters
+        ----------
+        coverPath: str
+            封面路径，只有封面库中的封面才有缩略图
+
+        size: int
+            封面在界面中显示的边长
+        """
+        if not self.isThumbnailable(coverPath):
+            return coverPath
+
+        if self.thumbnails is None:
+            self.__load()
+
+        path = self.__getPath(coverPath, self.getSuitableSize(size))
+        if path in self.thumbnails:
+            return path
+
+        self.generateAsync(coverPath)
+        return coverPath
+
+    def generateAsync(self, coverPath: str):
+        """ 在后台线程池中生成所有尺寸的缩略图 """
+        if not self.isThumbnailable(coverPath):
+            return
+
+        with self.lock:
+            if coverPath in self.futures:
+                return
+
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(self.maxWorkers)
+
+            future = self.executor.submit(self.generate, coverPath)
+            self.futures[coverPath] = future
+
+        future.add_done_callback(lambda f: self.__onGenerateFinished(coverPath))
+
+    def generate(self, coverPath: str):
+        """ 生成所有尺寸的缩略图，已经存在的缩略图不会重复生成 """
+        if self.thumbnails is None:
+            self.__load()
+
+        paths = {size: self.__getPath(coverPath, size) for size in self.sizes}
+        missingSizes = [i for i in self.sizes if not os.path.exists(paths[i])]
+        if missingSizes:
+            self.__resize(coverPath, missingSizes, paths)
+
+        self.thumbnails.update(paths.values())
+
+    def waitForDone(self):
+        """ 等待所有缩略图生成完成 """
+        with self.lock:
+            futures = list(self.futures.values())
+
+        wait(futures)
+
+    def getSuitableSize(self, size: int) -> int:
+        """ 获取最接近的缩略图尺寸，允许小幅度的放大 """
+        for s in self.sizes:
+            if s >= size * 0.9:
+                return s
+
+        return self.sizes[-1]
+
+    @staticmethod
+    def isThumbnailable(coverPath: str) -> bool:
+        """ 是否是封面库中的封面 """
+        return bool(coverPath) and Path(coverPath).parent.parent == coverStore.blobFolder
+
+    def __resize(self, coverPath: str, sizes: list, paths: dict):
+        """ 将封面缩小为指定的尺寸，较短的边等于缩略图尺寸 """
+        try:
+            image = Image.open(coverPath)
+
+            # 对于 JPEG 图片，直接以较低的分辨率解码
+            image.draft('RGB', (max(sizes), max(sizes)))
+            image = image.convert('RGB')
+        except Exception as e:
+            print(e)
+            return
+
+        for size in sorted(sizes, reverse=True):
+            w, h = image.size
+            scale = size / min(w, h)
+            if scale < 1:
+                image = image.resize(
+                    (max(1, round(w*scale)), max(1, round(h*scale))), Image.LANCZOS)
+
+            # 先写入临时文件再重命名，避免其他进程读到不完整的缩略图
+            path = Path(paths[size])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tempPath = path.with_name(f".{path.stem}.{os.getpid()}.tmp")
+            image.save(tempPath, "JPEG", quality=90)
+            os.replace(tempPath, path)
+
+    def __onGenerateFinished(self, coverPath: str):
+        """ 缩略图生成完成 """
+        with self.lock:
+            self.futures.pop(coverPath, None)
+
+    def __getPath(self, coverPath: str, size: int) -> str:
+        """ 获取缩略图路径，使用封面的内容哈希作为文件名 """
+        return str(self.folder / str(size) / (Path(coverPath).stem + ".jpg"))
+
+    def __load(self):
+        """ 只遍历一次缩略图文件夹，载入已经生成的缩略图 """
+        thumbnails = set()
+        for size in self.sizes:
+            folder = self.folder / str(size)
+            if not folder.exists():
+                continue
+
+            with os.scandir(folder) as entries:
+                thumbnails.update(
+                    str(folder/i.name) for i in entries if not i.name.startswith('.'))
+
+        self.thumbnails = thumbnails
+
+
+thumbnailCache = ThumbnailCache()
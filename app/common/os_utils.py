@@ -1,9 +1,6 @@
 # coding:utf-8
 import os
 import re
-from pathlib import Path
-
-from win32com.shell import shell, shellcon
 
 
 def checkDirExists(dirPath: str):
@@ -20,6 +17,8 @@ def checkDirExists(dirPath: str):
 
 def moveToTrash(path: str):
     """ 将文件移动到回收站 """
+    # 只有这个函数依赖 pywin32，在使用时再导入，其他工具函数在任何平台上都可以使用
+    from win32com.shell import shell, shellcon
     shell.SHFileOperation((0, shellcon.FO_DELETE, path, None, shellcon.FOF_SILENT |
                            shellcon.FOF_ALLOWUNDO | shellcon.FOF_NOCONFIRMATION, None, None))
 
@@ -60,12 +59,6 @@ def getCoverPath(name: str, coverType: str) -> str:
     if coverType not in cover_path_dict:
         raise ValueError(f"{coverType} 非法")
 
-    cover = cover_path_dict[coverType]
-    folder = Path(f"cache/Album_Cover/{name}")
-    files = list(folder.glob('*')) if folder.exists() else []
-
-    # 如果目录下有封面就用这个封面作为albumCard的背景
-    if files and files[0].suffix.lower() in (".png", ".jpg", ".jpeg", ".jiff", ".gif"):
-        cover = str(files[0])
-
-    return cover
+    # 从封面库的内存索引中查找封面，不需要遍历文件夹
+    from common.meta_data.cover_store import coverStore
+    return coverStore.getCoverPath(name) or cover_path_dict[coverType]
@@ -0,0 +1,229 @@
+# coding:utf-8
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+
+class StartupTracer:
+    """ 启动耗时追踪器，记录启动过程中各个阶段和小部件构造的耗时，保存为 Chrome trace 格式的 JSON 文件
+
+    默认不启用，使用命令行参数 `--trace-startup[=path]` 或者环境变量 `GROOVE_TRACE_STARTUP=path` 启用，
+    生成的文件可以在 `chrome://tracing` 或者 Perfetto 中打开
+    """
+
+    argName = "--trace-startup"
+    envName = "GROOVE_TRACE_STARTUP"
+    defaultPath = "startup_trace.json"
+    widgetThreshold = 1     # 只为构造耗时超过这个值 (毫秒) 的小部件生成事件
+    slowestWidgetNum = 20   # 报告中列出的最慢的小部件构造次数
+
+    def __init__(self):
+        self.isEnabled = False
+        self.path = None
+        self.events = []
+        self.widgetTimes = []   # 小部件构造的 `(耗时, 类名)` 列表
+        self.__t0 = time.perf_counter()
+        self.__pid = os.getpid()
+
+    def enable(self, path=None):
+        """ 启用追踪
+
+        Parameters
+        ----------
+        path: str or Path
+            追踪结果的保存路径，为 `None` 时使用默认路径
+        """
+        self.isEnabled = True
+        self.path = Path(path or self.defaultPath)
+        self.events.append({
+            "name": "thread_name", "ph": "M", "pid": self.__pid,
+            "tid": threading.get_ident(), "args": {"name": "main"}
+        })
+
+    def enableFromArgs(self, argv: list) -> bool:
+        """ 根据命令行参数和环境变量决定是否启用追踪，命令行参数优先
+
+        Parameters
+        ----------
+        argv: list
+            命令行参数列表
+
+        Returns
+        -------
+        isEnabled: bool
+            是否启用了追踪
+        """
+        path = os.environ.get(self.envName)
+        for arg in argv:
+            if arg == self.argName:
+                path = self.defaultPath
+            elif arg.startswith(self.argName + "="):
+                path = arg.split("=", 1)[1]
+
+        if path:
+            self.enable(path)
+
+        return self.isEnabled
+
+    def addEvent(self, name: str, start: float, end: float, category="phase"):
+        """ 添加一个持续事件，时间为 `time.perf_counter()` 的返回值 """
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self.__t0) * 1e6),
+            "dur": round((end - start) * 1e6),
+            "pid": self.__pid,
+            "tid": threading.get_ident(),
+        })
+
+    def mark(self, name: str):
+        """ 添加一个瞬时事件 """
+        if not self.isEnabled:
+            return
+
+        self.events.append({
+            "name": name,
+            "cat": "mark",
+            "ph": "i",
+            "s": "g",
+            "ts": round((time.perf_counter() - self.__t0) * 1e6),
+            "pid": self.__pid,
+            "tid": threading.get_ident(),
+        })
+
+    @contextmanager
+    def phase(self, name: str):
+        """ 记录 `with` 语句块的耗时 """
+        if not self.isEnabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addEvent(name, start, time.perf_counter())
+
+    def traced(self, name: str = None):
+        """ 记录函数耗时的装饰器，没有启用追踪时直接调用函数
+
+        Parameters
+        ----------
+        name: str
+            阶段名字，为 `None` 时使用函数的限定名
+        """
+        def decorator(func):
+            phaseName = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.isEnabled:
+                    return func(*args, **kwargs)
+
+                with self.phase(phaseName):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def traceWidgets(self, packages=("View", "components")):
+        """ 为已经导入的包中定义的小部件类的构造函数计时
+
+        Parameters
+        ----------
+        packages: tuple
+            需要计时的包名
+        """
+        if not self.isEnabled:
+            return
+
+        # 在这里导入，避免导入追踪器时就导入 Qt
+        from PyQt5.QtWidgets import QWidget
+
+        for moduleName, module in list(sys.modules.items()):
+            if moduleName.split(".")[0] not in packages:
+                continue
+
+            for obj in list(vars(module).values()):
+                isWidgetClass = isinstance(obj, type) and issubclass(obj, QWidget)
+                if isWidgetClass and obj.__module__ == moduleName and "__init__" in vars(obj):
+                    self.__traceInit(obj)
+
+    def __traceInit(self, cls):
+        """ 为小部件类的构造函数计时，子类调用父类构造函数的时间算在子类中 """
+        init = cls.__init__
+        if getattr(init, "isTraced", False):
+            return
+
+        tracer = self
+
+        @wraps(init)
+        def __init__(self, *args, **kwargs):
+            if not tracer.isEnabled or type(self) is not cls:
+                return init(self, *args, **kwargs)
+
+            start = time.perf_counter()
+            init(self, *args, **kwargs)
+            tracer.addWidgetTime(cls.__name__, start, time.perf_counter())
+
+        __init__.isTraced = True
+        cls.__init__ = __init__
+
+    def addWidgetTime(self, className: str, start: float, end: float):
+        """ 记录一次小部件构造 """
+        t = (end - start) * 1000
+        self.widgetTimes.append((t, className))
+        if t >= self.widgetThreshold:
+            self.addEvent(className, start, end, "widget")
+
+    def finish(self):
+        """ 启动完成，保存追踪结果并停止追踪 """
+        if not self.isEnabled:
+            return
+
+        self.mark("startup finished")
+        self.isEnabled = False
+        self.save(self.path)
+
+    def save(self, path):
+        """ 保存追踪结果
+
+        Parameters
+        ----------
+        path: str or Path
+            保存路径
+        """
+        totalTime = (time.perf_counter() - self.__t0) * 1000
+        phases = {}
+        for event in self.events:
+            if event.get("cat") == "phase":
+                phases[event["name"]] = phases.get(event["name"], 0) + event["dur"] / 1000
+
+        widgets = sorted(self.widgetTimes, reverse=True)[:self.slowestWidgetNum]
+        data = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "totalTime": round(totalTime, 3),
+                "phases": {k: round(v, 3) for k, v in phases.items()},
+                "widgetCount": len(self.widgetTimes),
+                "slowestWidgets": [
+                    {"name": name, "time": round(t, 3)} for t, name in widgets
+                ],
+            }
+        }
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+
+
+startupTracer = StartupTracer()
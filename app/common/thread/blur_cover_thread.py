@@ -1,21 +1,75 @@
 # coding:utf-8
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
 
 from PyQt5.QtCore import QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QColor
+from PyQt5.QtGui import QPixmap, QColor, QImage
 
-from common.image_process_utils import getBlurPixmap, DominantColor
+from common.image_process_utils import gaussianBlur, DominantColor
+from common.meta_data.thumbnail_cache import thumbnailCache
+
+
+class BlurCoverCache:
+    """ 磨砂封面缓存，使用封面的内容哈希和磨砂参数作为键 """
+
+    def __init__(self, capacity=32):
+        """
+        Parameters
+        ----------
+        capacity: int
+            最多缓存的磨砂封面个数，超出后移除最久没有使用的封面
+        """
+        self.capacity = capacity
+        self.results = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: tuple):
+        """ 获取磨砂结果 `(图像字节, 图像形状, 主色调)`，不存在时返回 `None` """
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.results.move_to_end(key)
+
+            return result
+
+    def put(self, key: tuple, result: tuple):
+        """ 保存磨砂结果 """
+        with self.lock:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.capacity:
+                self.results.popitem(last=False)
+
+    @staticmethod
+    def getKey(coverPath: str, blurRadius, brightFactor, maxSize: tuple) -> tuple:
+        """ 生成缓存的键，封面库中的封面文件名就是内容哈希，不需要再读取文件 """
+        if coverPath.startswith(':'):
+            coverHash = coverPath
+        elif thumbnailCache.isThumbnailable(coverPath):
+            coverHash = Path(coverPath).stem
+        else:
+            try:
+                coverHash = hashlib.sha1(Path(coverPath).read_bytes()).hexdigest()
+            except OSError:
+                coverHash = coverPath
+
+        return (coverHash, blurRadius, brightFactor, tuple(maxSize))
 
 
 class BlurCoverThread(QThread):
     """ 磨砂专辑封面线程 """
 
     blurFinished = pyqtSignal(QPixmap, QColor)
+    cache = BlurCoverCache()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.coverPath = ""
         self.blurPixmap = None
         self.blurRadius = 7
+        self.brightFactor = 0.85
         self.maxSize = (450, 450)
 
     def run(self):
@@ -23,9 +77,23 @@ class BlurCoverThread(QThread):
         if not self.coverPath:
             return
 
-        color = DominantColor.getDominantColor(self.coverPath)
-        self.blurPixmap = getBlurPixmap(
-            self.coverPath, self.blurRadius, 0.85, self.maxSize)
+        key = self.cache.getKey(
+            self.coverPath, self.blurRadius, self.brightFactor, self.maxSize)
+        result = self.cache.get(key)
+
+        if result is None:
+            # 使用和磨砂尺寸接近的缩略图，减少解码的开销
+            path = thumbnailCache.getThumbnailPath(
+                self.coverPath, max(self.maxSize))
+            color = DominantColor.getDominantColor(path)
+            image = gaussianBlur(
+                path, self.blurRadius, self.brightFactor, self.maxSize)
+            result = (image.tobytes(), image.shape, color)
+            self.cache.put(key, result)
+
+        data, (h, w, c), color = result
+        imageFormat = QImage.Format_RGB888 if c == 3 else QImage.Format_RGBA8888
+        self.blurPixmap = QPixmap.fromImage(QImage(data, w, h, w*c, imageFormat))
         self.blurFinished.emit(self.blurPixmap, QColor(*color))
 
     def setCover(self, coverPath: str, blurRadius=6, maxSize: tuple = (450, 450)):
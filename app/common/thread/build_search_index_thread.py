@@ -0,0 +1,30 @@
+# coding:utf-8
+from common.meta_data import LibrarySearchIndex, librarySearchIndex
+from PyQt5.QtCore import QThread
+
+
+class BuildSearchIndexThread(QThread):
+    """ 在后台为歌曲和专辑建立搜索索引的线程，建好之后需要在主线程中调用 `load()` 替换掉歌曲库的搜索索引 """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.songInfo_list = librarySearchIndex.songs.snapshot()
+        self.albumInfo_list = librarySearchIndex.albums.snapshot()
+        self.searchIndex = LibrarySearchIndex()
+        self.isBuilt = False
+
+    def run(self):
+        """ 建立搜索索引 """
+        searchIndex = self.searchIndex
+        searchIndex.songs.setItems(self.songInfo_list)
+        searchIndex.albums.setItems(self.albumInfo_list)
+        self.isBuilt = searchIndex.songs.build(self.isInterruptionRequested) and \
+            searchIndex.albums.build(self.isInterruptionRequested)
+
+    def load(self):
+        """ 使用建好的索引替换歌曲库的搜索索引，线程被中断时不会替换 """
+        if not self.isBuilt:
+            return
+
+        librarySearchIndex.songs.load(self.searchIndex.songs)
+        librarySearchIndex.albums.load(self.searchIndex.albums)
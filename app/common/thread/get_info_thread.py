@@ -7,14 +7,20 @@ class GetInfoThread(QThread):
     """ 获取指定文件夹中音频文件信息线程 """
 
     scanFinished = pyqtSignal(list, list, dict)
+    scanProgressChanged = pyqtSignal(int, int)   # 已读取的歌曲数量和需要读取的歌曲总数
 
-    def __init__(self, folderPaths: list, parent=None):
+    def __init__(self, folderPaths: list, maxDepth: int = None, ignorePatterns: list = None, parent=None):
         super().__init__(parent=parent)
         self.folderPaths = folderPaths
+        self.maxDepth = maxDepth
+        self.ignorePatterns = ignorePatterns
+        self.songInfoReader = None  # type:SongInfoReader
 
     def run(self):
         """ 获取信息 """
-        songInfoReader = SongInfoReader(self.folderPaths)
+        self.songInfoReader = songInfoReader = SongInfoReader(
+            self.folderPaths, progressCallback=self.scanProgressChanged.emit,
+            maxDepth=self.maxDepth, ignorePatterns=self.ignorePatterns)
         albumCoverReader = AlbumCoverReader(songInfoReader.songInfo_list)
         albumInfoReader = AlbumInfoReader(songInfoReader.songInfo_list)
         singerInfoReader = SingerInfoReader(albumInfoReader.albumInfo_list)
@@ -1,18 +1,31 @@
 # coding:utf-8
 import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Event, Lock
 
-from common.crawler import KuWoMusicCrawler, KuGouMusicCrawler, WanYiMusicCrawler
+from common.crawler import KuWoMusicCrawler, KuGouMusicCrawler, WanYiMusicCrawler, providerHealth
 from common.lyric_parser import parse_lyric
 from common.os_utils import adjustName
 from PyQt5.QtCore import QThread, pyqtSignal
 
 
 class GetLyricThread(QThread):
-    """ 获取歌词线程 """
+    """ 获取歌词线程
+
+    所有爬虫在线程池中同时搜索歌词，按照爬虫的优先级选取最先搜到的歌词，优先级由服务商的健康状况决定，
+    熔断中的服务商不会被使用。优先级低的爬虫先搜到歌词时，最多再等待 `hedgeDelay` 秒，
+    期间优先级更高的爬虫搜到歌词则使用它的结果
+    """
 
     crawlFinished = pyqtSignal(dict)
     cacheFolder = Path('cache/lyric')
+    maxWorkers = 8      # 线程池的最大线程数，要比爬虫多，这样切歌之后被放弃但还没返回的搜索不会占满线程池
+    hedgeDelay = 0.3    # 等待优先级更高的爬虫的时间，单位为秒
+    cancelCheckInterval = 0.1   # 检查是否取消搜索的时间间隔，单位为秒
 
     def __init__(self, parent=None):
         super().__init__(parent=parent)
@@ -23,37 +36,146 @@ class GetLyricThread(QThread):
             WanYiMusicCrawler(),
             KuGouMusicCrawler()
         ]
+        self.latencies = {}  # 最后一次搜索中每个爬虫的耗时，没有完成的爬虫耗时为 `None`
+        self.executor = None
+        self.executorLock = Lock()
 
     def run(self):
         """ 搜索歌词 """
+        self.crawlFinished.emit(self.getLyric(self.singer, self.songName))
+
+    def getLyric(self, singer: str, songName: str, cancelEvent: Event = None) -> dict:
+        """ 获取歌词，优先从本地缓存中读取，搜到的歌词会保存到本地缓存中，可以在其他线程中调用
+
+        Parameters
+        ----------
+        singer: str
+            歌手
+
+        songName: str
+            歌曲名
+
+        cancelEvent: Event
+            取消搜索的事件，被设置之后不再等待爬虫，直接返回空歌词且不写入缓存
+
+        Returns
+        -------
+        lyric: dict
+            解析后的歌词
+        """
         self.cacheFolder.mkdir(exist_ok=True, parents=True)
 
         # 在本地缓存中寻找文件
-        file = adjustName(f'{self.singer}_{self.songName}.json')
-        lyricPath = self.cacheFolder / file
+        lyricPath = self.getLyricPath(singer, songName)
         if lyricPath.exists():
             with open(lyricPath, 'r', encoding='utf-8') as f:
-                self.crawlFinished.emit(json.load(f))
-                return
+                return json.load(f)
 
         # 搜索歌词
-        notEmpty = False
-        keyWord = self.singer + ' ' + self.songName
-
-        for crawler in self.crawlers:
-            lyric = crawler.getLyric(keyWord)
-            notEmpty = bool(lyric)
-            if notEmpty:
-                break
-
+        lyric = self.__crawlLyric(singer + ' ' + songName, cancelEvent)
+        notEmpty = bool(lyric)
         lyric = parse_lyric(lyric)
 
-        # 保存歌词文件
+        # 保存歌词文件，预取歌词的线程可能同时在读写同一个文件，所以先写入临时文件再替换
         if notEmpty:
-            with open(lyricPath, 'w', encoding='utf-8') as f:
+            with NamedTemporaryFile('w', encoding='utf-8', dir=self.cacheFolder,
+                                    suffix='.tmp', delete=False) as f:
                 json.dump(lyric, f)
 
-        self.crawlFinished.emit(lyric)
+            os.replace(f.name, lyricPath)
+
+        return lyric
+
+    @classmethod
+    def getLyricPath(cls, singer: str, songName: str) -> Path:
+        """ 获取歌词缓存文件的路径 """
+        return cls.cacheFolder / adjustName(f'{singer}_{songName}.json')
+
+    @classmethod
+    def isLyricCached(cls, singer: str, songName: str) -> bool:
+        """ 本地缓存中是否已经有歌词 """
+        return cls.getLyricPath(singer, songName).exists()
+
+    def __crawlLyric(self, keyWord: str, cancelEvent: Event = None):
+        """ 在线程池中同时使用所有爬虫搜索歌词，返回按优先级选取的第一个有效歌词，都没搜到或者被取消时返回 `None` """
+        # 预取歌词时会在多个线程中同时调用，需要加锁防止创建多个线程池
+        with self.executorLock:
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(
+                    self.maxWorkers, thread_name_prefix="GetLyric")
+
+        crawlers = providerHealth.sortCrawlers(self.crawlers)
+        names = [crawler.provider for crawler in crawlers]
+        latencies = dict.fromkeys(names)
+        futures = [self.executor.submit(self.__getLyric, crawler, keyWord)
+                   for crawler in crawlers]
+
+        # 优先级低的爬虫先搜到歌词时设置截止时间，超时之后不再等待优先级更高的爬虫
+        lyric = None
+        deadline = None
+        pending = set(futures)
+        while pending:
+            # 可以取消时分段等待，以便及时响应取消事件
+            remaining = None if deadline is None else max(deadline-time.time(), 0)
+            timeout = remaining
+            if cancelEvent is not None:
+                timeout = self.cancelCheckInterval if remaining is None else min(
+                    remaining, self.cancelCheckInterval)
+
+            done, pending = wait(pending, timeout, FIRST_COMPLETED)
+            if cancelEvent is not None and cancelEvent.is_set():
+                lyric = None
+                break
+
+            for future in done:
+                latencies[names[futures.index(future)]] = future.result()[1]
+
+            lyric, isDecided = self.__pickLyric(futures)
+            if isDecided or (not done and timeout == remaining):
+                break
+
+            if lyric and deadline is None:
+                deadline = time.time() + self.hedgeDelay
+
+        # 没有完成的爬虫的结果会被丢弃
+        for future in futures:
+            future.cancel()
+
+        self.latencies = latencies
+        return lyric
+
+    @staticmethod
+    def __pickLyric(futures: list):
+        """ 按照优先级选取已经完成的爬虫搜到的第一个歌词
+
+        Returns
+        -------
+        lyric:
+            歌词，没有爬虫搜到歌词时为 `None`
+
+        isDecided: bool
+            比选中的爬虫优先级更高的爬虫是否都已经完成，此时选中的歌词不会再变化
+        """
+        isDecided = True
+        for future in futures:
+            if not future.done():
+                isDecided = False
+            elif future.result()[0]:
+                return future.result()[0], isDecided
+
+        return None, isDecided
+
+    @staticmethod
+    def __getLyric(crawler, keyWord: str):
+        """ 使用一个爬虫搜索歌词，返回歌词和耗时 """
+        t0 = time.time()
+        try:
+            lyric = providerHealth.call(crawler, crawler.getLyric, keyWord)
+        except Exception as e:
+            print(e)
+            lyric = None
+
+        return lyric, time.time() - t0
 
     def setSongInfo(self, songInfo: dict):
         """ 设置歌曲信息 """
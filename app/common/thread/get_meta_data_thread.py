@@ -1,6 +1,7 @@
 # coding:utf-8
 from pathlib import Path
 
+from common.meta_data.folder_scanner import FolderScanner
 from common.meta_data.writer import writeAlbumCover, writeSongInfo
 from common.crawler.qq_music_crawler import QQMusicCrawler
 from PyQt5.QtCore import pyqtSignal, QThread
@@ -12,10 +13,26 @@ class GetFolderMetaDataThread(QThread):
     crawlSignal = pyqtSignal(str)
     cacheFolder = Path('cache/crawl_album_covers')
 
-    def __init__(self, folderPaths: list, parent=None):
+    def __init__(self, folderPaths: list, maxDepth: int = None, ignorePatterns: list = None, parent=None):
+        """
+        Parameters
+        ----------
+        folderPaths: list
+            歌曲文件夹列表
+
+        maxDepth: int
+            递归扫描歌曲文件夹的最大深度，为 `None` 时不限制深度
+
+        ignorePatterns: list
+            扫描时忽略的文件和文件夹的通配符
+
+        parent:
+            父级
+        """
         super().__init__(parent=parent)
         self.__isStopped = False
         self.folderPaths = folderPaths
+        self.scanner = FolderScanner(maxDepth, ignorePatterns)
         self.crawler = QQMusicCrawler()
 
     def run(self):
@@ -56,12 +73,7 @@ class GetFolderMetaDataThread(QThread):
         self.__isStopped = True
 
     def __getAudioFiles(self):
-        """ 获取音频文件路径和不包含后缀名的文件名
-
-        Parameters
-        ----------
-        folderPaths: list
-            文件夹列表
+        """ 递归获取音频文件路径和不包含后缀名的文件名
 
         Returns
         -------
@@ -74,10 +86,9 @@ class GetFolderMetaDataThread(QThread):
         songPaths = []
         fileNames = []
         for folder in self.folderPaths:
-            for file in Path(folder).glob('*'):
-                if file.suffix.lower() in ('.mp3', '.flac', '.m4a', '.mp4'):
-                    songPaths.append(str(file).replace('\\', '/'))
-                    fileNames.append(file.stem)
+            for songPath, _ in self.scanner.iterSongFiles(folder):
+                songPaths.append(songPath)
+                fileNames.append(Path(songPath).stem)
 
         return songPaths, fileNames
 
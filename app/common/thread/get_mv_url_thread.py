@@ -1,6 +1,6 @@
 # coding:utf-8
 from fuzzywuzzy import fuzz
-from common.crawler import KuWoMusicCrawler, WanYiMusicCrawler, KuGouMusicCrawler
+from common.crawler import KuWoMusicCrawler, WanYiMusicCrawler, KuGouMusicCrawler, providerHealth
 from PyQt5.QtCore import pyqtSignal, QThread
 
 
@@ -21,8 +21,9 @@ class GetMvUrlThread(QThread):
 
     def run(self):
         url = ''
-        for crawler in self.crawlers:
-            mvInfo_list, _ = crawler.getMvInfoList(self.key_word, page_size=10)
+        for crawler in providerHealth.sortCrawlers(self.crawlers):
+            mvInfo_list, _ = providerHealth.call(
+                crawler, crawler.getMvInfoList, self.key_word, page_size=10)
             if not mvInfo_list:
                 continue
 
@@ -33,8 +34,8 @@ class GetMvUrlThread(QThread):
             if best_match < 90:
                 continue
 
-            url = crawler.getMvUrl(
-                mvInfo_list[matches.index(best_match)], self.video_quality)
+            url = providerHealth.call(
+                crawler, crawler.getMvUrl, mvInfo_list[matches.index(best_match)], self.video_quality)
             if url:
                 break
 
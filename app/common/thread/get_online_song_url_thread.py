@@ -1,5 +1,4 @@
 # coding:utf-8
-import requests
 import os
 
 from common.meta_data import AlbumCoverReader
@@ -1,5 +1,5 @@
 # coding:utf-8
-from common.crawler import KuWoMusicCrawler, WanYiMusicCrawler
+from common.crawler import KuWoMusicCrawler, WanYiMusicCrawler, providerHealth
 from PyQt5.QtCore import pyqtSignal, QThread
 
 
@@ -19,8 +19,10 @@ class GetSingerAvatarThread(QThread):
 
     def run(self):
         """ 获取头像 """
-        for crawler in self.crawlers:
-            save_path = crawler.getSingerAvatar(self.singer, self.saveDir)
+        save_path = ''
+        for crawler in providerHealth.sortCrawlers(self.crawlers):
+            save_path = providerHealth.call(
+                crawler, crawler.getSingerAvatar, self.singer, self.saveDir)
             if save_path:
                 break
 
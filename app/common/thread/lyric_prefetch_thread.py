@@ -0,0 +1,101 @@
+# coding:utf-8
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+from PyQt5.QtCore import QThread
+
+from .get_lyric_thread import GetLyricThread
+
+
+class LyricPrefetchThread(QThread):
+    """ 歌词预取线程，以低优先级在后台获取播放队列中接下来几首歌的歌词并保存到本地缓存，
+    切换到下一首歌时就能直接从本地缓存中读取歌词
+    """
+
+    def __init__(self, prefetchNum=3, maxConcurrency=1, parent=None):
+        """
+        Parameters
+        ----------
+        prefetchNum: int
+            预取接下来几首歌的歌词，为 0 时不预取
+
+        maxConcurrency: int
+            同时获取歌词的歌曲数
+
+        parent:
+            父级
+        """
+        super().__init__(parent=parent)
+        self.prefetchNum = prefetchNum
+        self.maxConcurrency = max(maxConcurrency, 1)
+        self.songInfo_list = []  # 等待预取歌词的歌曲
+        self.lock = Lock()
+        self.cancelEvent = Event()
+        self.executor = None
+
+        # 使用单独的线程池获取歌词，不会和正在播放的歌曲争抢线程
+        self.getLyricThread = GetLyricThread(self)
+        self.getLyricThread.maxWorkers *= self.maxConcurrency
+
+        self.finished.connect(self.__onFinished)
+
+    def prefetch(self, songInfo_list: list):
+        """ 预取歌词，会替换掉还没开始预取的歌曲
+
+        Parameters
+        ----------
+        songInfo_list: list
+            按播放顺序排列的歌曲信息列表，只会预取前 `prefetchNum` 首歌的歌词
+        """
+        songInfo_list = [
+            i for i in songInfo_list[:self.prefetchNum]
+            if not GetLyricThread.isLyricCached(i['singer'], i['songName'])
+        ]
+
+        with self.lock:
+            self.songInfo_list = songInfo_list
+
+        self.cancelEvent.clear()
+        if songInfo_list and not self.isRunning():
+            self.start(QThread.LowestPriority)
+
+    def stop(self):
+        """ 取消预取并等待线程退出，正在进行的搜索不会再等待爬虫返回 """
+        with self.lock:
+            self.songInfo_list = []
+
+        self.cancelEvent.set()
+        self.wait()
+
+    def run(self):
+        """ 预取歌词，直到没有等待预取的歌曲为止 """
+        while True:
+            with self.lock:
+                songInfo_list = self.songInfo_list[:self.maxConcurrency]
+                del self.songInfo_list[:self.maxConcurrency]
+
+            if not songInfo_list:
+                break
+
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(
+                    self.maxConcurrency, thread_name_prefix="LyricPrefetch")
+
+            list(self.executor.map(self.__prefetchOne, songInfo_list))
+
+    def __prefetchOne(self, songInfo: dict):
+        """ 预取一首歌的歌词 """
+        try:
+            self.getLyricThread.getLyric(
+                songInfo['singer'], songInfo['songName'], self.cancelEvent)
+        except Exception as e:
+            print(e)
+
+    def __onFinished(self):
+        """ 线程正要退出时有了新的歌曲，需要重新启动线程 """
+        with self.lock:
+            isPending = bool(self.songInfo_list)
+
+        if isPending:
+            self.wait()
+            self.start(QThread.LowestPriority)
@@ -0,0 +1,77 @@
+# coding:utf-8
+from common.crawler import KuWoMusicCrawler
+from PyQt5.QtCore import pyqtSignal, QThread
+
+
+class SearchOnlineSongThread(QThread):
+    """ 搜索在线音乐线程
+
+    每次搜索都有一个递增的请求编号，网络请求期间又有了新的搜索时，旧请求的结果会被丢弃，
+    期间的多次搜索只会处理最新的一次，所以只有最新的搜索结果会被发送出去
+    """
+
+    searchFinished = pyqtSignal(int, list, int)  # 请求编号、在线音乐列表和在线音乐总数
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.crawler = KuWoMusicCrawler()
+        self.requestId = 0
+        self.__request = None         # 最新的请求，格式为 `(请求编号, 关键词, 页码, 每页数量)`
+        self.__handledRequest = None  # 线程最后处理的请求
+        self.finished.connect(self.__onFinished)
+
+    def search(self, keyWord: str, pageNum=1, pageSize=20) -> int:
+        """ 搜索在线音乐
+
+        Parameters
+        ----------
+        keyWord: str
+            关键词
+
+        pageNum: int
+            页码
+
+        pageSize: int
+            每页的在线音乐数量
+
+        Returns
+        -------
+        requestId: int
+            请求编号
+        """
+        self.requestId += 1
+        self.__request = (self.requestId, keyWord, pageNum, pageSize)
+        if not self.isRunning():
+            self.start()
+
+        return self.requestId
+
+    def cancel(self):
+        """ 取消还没有完成的搜索，正在进行的网络请求无法中断，但是它的结果会被丢弃 """
+        self.requestId += 1
+        self.__request = None
+
+    def isStale(self, requestId: int) -> bool:
+        """ 请求是否已经被更新的请求取代 """
+        return requestId != self.requestId
+
+    def run(self):
+        """ 处理最新的请求，直到没有新的请求为止 """
+        request = self.__request
+        while request is not None and request is not self.__handledRequest:
+            requestId, keyWord, pageNum, pageSize = request
+            songInfo_list, total = self.crawler.getSongInfoList(
+                keyWord, pageNum, pageSize)
+            self.__handledRequest = request
+
+            if not self.isStale(requestId):
+                self.searchFinished.emit(requestId, songInfo_list, total)
+
+            request = self.__request
+
+    def __onFinished(self):
+        """ 线程正要退出时有了新的请求，需要重新启动线程 """
+        request = self.__request
+        if request is not None and request is not self.__handledRequest:
+            self.wait()
+            self.start()
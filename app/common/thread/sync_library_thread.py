@@ -0,0 +1,49 @@
+# coding:utf-8
+from common.meta_data import SongInfoReader
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class SyncLibraryThread(QThread):
+    """ 在后台扫描歌曲文件夹并同步歌曲库快照的线程 """
+
+    songInfosChanged = pyqtSignal(list, list)     # 被移除的歌曲路径和新读取的一批歌曲信息
+    syncProgressChanged = pyqtSignal(int, int)    # 已读取的歌曲数量和需要读取的歌曲总数
+
+    def __init__(self, folderPaths: list, maxDepth: int = None, ignorePatterns: list = None,
+                 batchSize=256, parent=None):
+        """
+        Parameters
+        ----------
+        folderPaths: list
+            歌曲文件夹列表
+
+        maxDepth: int
+            递归扫描歌曲文件夹的最大深度，为 `None` 时不限制深度
+
+        ignorePatterns: list
+            扫描时忽略的文件和文件夹的通配符
+
+        batchSize: int
+            每一批发送的歌曲信息数量
+
+        parent:
+            父级
+        """
+        super().__init__(parent=parent)
+        self.folderPaths = folderPaths
+        self.maxDepth = maxDepth
+        self.ignorePatterns = ignorePatterns
+        self.batchSize = batchSize
+        self.songInfoReader = None  # type:SongInfoReader
+
+    def run(self):
+        """ 对比歌曲文件夹和歌曲库快照，分批发送发生变化的歌曲信息 """
+        self.songInfoReader = SongInfoReader(
+            self.folderPaths, progressCallback=self.syncProgressChanged.emit,
+            interruptCallback=self.isInterruptionRequested, maxDepth=self.maxDepth, ignorePatterns=self.ignorePatterns, isLoadSnapshot=True)
+
+        for removedPaths, songInfo_list in self.songInfoReader.syncSnapshot(self.batchSize):
+            if self.isInterruptionRequested():
+                return
+
+            self.songInfosChanged.emit(removedPaths, songInfo_list)
@@ -1,5 +1,6 @@
 # coding:utf-8
 
+from common.meta_data.thumbnail_cache import thumbnailCache
 from PIL import Image
 from PIL.ImageFilter import GaussianBlur
 from PIL.ImageQt import ImageQt
@@ -37,7 +38,8 @@ class AlbumBlurBackground(QWidget):
             return
 
         if not imagePath.startswith(':'):
-            albumCover = Image.open(imagePath)
+            albumCover = Image.open(
+                thumbnailCache.getThumbnailPath(imagePath, max(imageSize)))
         else:
             albumCover=Image.fromqpixmap(QPixmap(imagePath))
 
@@ -1,5 +1,6 @@
 # coding:utf-8
 from common.auto_wrap import autoWrap
+from common.meta_data.thumbnail_cache import thumbnailCache
 from components.buttons.blur_button import BlurButton
 from components.widgets.check_box import CheckBox
 from components.widgets.label import ClickableLabel
@@ -74,7 +75,7 @@ class AlbumCard(PerspectiveWidget):
         self.albumNameLabel.setFixedWidth(210)
         self.playButton.move(35, 70)
         self.addToButton.move(105, 70)
-        self.albumPic.setPixmap(QPixmap(self.coverPath).scaled(
+        self.albumPic.setPixmap(QPixmap(thumbnailCache.getThumbnailPath(self.coverPath, 200)).scaled(
             200, 200, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
         # 给小部件添加特效
         self.checkBox.setGraphicsEffect(self.checkBoxOpacityEffect)
@@ -83,15 +84,15 @@ class AlbumCard(PerspectiveWidget):
         self.addToButton.hide()
         # 设置鼠标光标
         self.contentLabel.setCursor(Qt.PointingHandCursor)
-        # 设置部件位置
-        self.__initLayout()
-        # 分配ID和属性
+        # 分配ID和属性，调整标签尺寸时会应用样式，所以要在布局之前设置
         self.setObjectName("albumCard")
         self.albumNameLabel.setObjectName("albumNameLabel")
         self.contentLabel.setObjectName("contentLabel")
         self.setProperty("isChecked", "False")
         self.albumNameLabel.setProperty("isChecked", "False")
         self.contentLabel.setProperty("isChecked", "False")
+        # 设置部件位置
+        self.__initLayout()
         # 将信号连接到槽函数
         self.playButton.clicked.connect(
             lambda: self.playSignal.emit(self.songInfo_list))
@@ -189,7 +190,7 @@ class AlbumCard(PerspectiveWidget):
         if newAlbumInfo == self.albumInfo:
             return
         self.__getAlbumInfo(newAlbumInfo)
-        self.albumPic.setPixmap(QPixmap(self.coverPath).scaled(
+        self.albumPic.setPixmap(QPixmap(thumbnailCache.getThumbnailPath(self.coverPath, 200)).scaled(
             200, 200, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
         self.albumNameLabel.setText(self.albumName)
         self.contentLabel.setText(self.singerName)
@@ -215,7 +216,7 @@ class AlbumCard(PerspectiveWidget):
         """ 更新专辑封面 """
         self.coverPath = coverPath
         self.albumPic.setPixmap(
-            QPixmap(self.coverPath).scaled(
+            QPixmap(thumbnailCache.getThumbnailPath(self.coverPath, 200)).scaled(
                 200, 200, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
         self.playButton.setBlurPic(coverPath, 40)
         self.addToButton.setBlurPic(coverPath, 40)
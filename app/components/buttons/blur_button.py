@@ -1,4 +1,5 @@
 # coding:utf-8
+from common.meta_data.thumbnail_cache import thumbnailCache
 from .tooltip_button import TooltipButton
 from PIL import Image
 from PIL.ImageFilter import GaussianBlur
@@ -69,7 +70,7 @@ class BlurButton(TooltipButton):
     def __blur(self):
         """ 真正进行磨砂操作 """
         if not self.blurPicPath.startswith(':'):
-            img = Image.open(self.blurPicPath)
+            img = Image.open(thumbnailCache.getThumbnailPath(self.blurPicPath, 200))
         else:
             img = Image.fromqpixmap(QPixmap(self.blurPicPath))
 
@@ -2,7 +2,7 @@
 import os
 from copy import deepcopy
 
-from common.image_process_utils import getPicSuffix
+from common.meta_data.cover_store import coverStore
 from common.os_utils import adjustName
 from components.buttons.perspective_button import PerspectivePushButton
 from components.widgets.label import ErrorIcon
@@ -257,29 +257,16 @@ class AlbumInfoEditDialog(MaskDialogBase):
         """ 保存新专辑封面 """
         if not self.newAlbumCoverPath:
             return
+        if self.newAlbumCoverPath == os.path.abspath(self.coverPath):
+            return
+
         with open(self.newAlbumCoverPath, "rb") as f:
             picData = f.read()
 
-            # 更换文件夹下的封面图片
-            if self.newAlbumCoverPath == os.path.abspath(self.coverPath):
-                return
-
-            # 判断文件格式后修改后缀名
-            newSuffix = getPicSuffix(picData)
-
-            # 如果封面路径是默认专辑封面，就修改封面路径
-            if self.coverPath == ":/images/default_covers/album_200_200.png":
-                self.coverPath = "cache/Album_Cover/{0}/{0}{1}".format(
-                    self.albumInfo["coverName"], newSuffix)
-
-            with open(self.coverPath, "wb") as f:
-                f.write(picData)
-
-            oldName, oldSuffix = os.path.splitext(self.coverPath)
-            if newSuffix != oldSuffix:
-                os.rename(self.coverPath, oldName + newSuffix)
-                self.coverPath = oldName + newSuffix
-                self.albumInfo["coverPath"] = self.coverPath
+        # 封面可能被其他专辑共享，所以不能覆盖原来的封面，而是让封面名字指向新的封面
+        self.coverPath = coverStore.saveCover(
+            self.albumInfo["coverName"], picData)
+        self.albumInfo["coverPath"] = self.coverPath
 
     def __setWidgetEnable(self, isEnable: bool):
         """ 设置编辑框是否启用 """
@@ -1,7 +1,7 @@
 # coding:utf-8
-import json
 from pathlib import Path
 
+from common.meta_data.playlist_store import playlistStore
 from components.buttons.three_state_button import ThreeStateButton
 from components.dialog_box.mask_dialog_base import MaskDialogBase
 from components.widgets.label import ClickableLabel
@@ -96,15 +96,14 @@ class CreatePlaylistDialog(MaskDialogBase):
         if self.__isPlaylistExist(playlistName):
             return
 
-        # 创建播放列表
+        # 创建播放列表，播放列表只保存歌曲路径
         songInfo_list = self.songInfo_list if self.songInfo_list else []
         playlist = {
             "playlistName": playlistName,
-            "songInfo_list": songInfo_list,
+            "songPaths": playlistStore.register(songInfo_list),
             "modifiedTime": QDateTime.currentDateTime().toString(Qt.ISODate),
         }
-        with open(self.playlistFolder/(playlistName+'.json'), "w", encoding="utf-8") as f:
-            json.dump(playlist, f)
+        playlistStore.save(playlist)
 
         self.createPlaylistSig.emit(playlistName, playlist)
         self.close()
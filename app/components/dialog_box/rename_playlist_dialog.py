@@ -1,7 +1,7 @@
 # coding:utf-8
-import json
 from pathlib import Path
 
+from common.meta_data.playlist_store import playlistStore
 from components.buttons.three_state_button import ThreeStateButton
 from components.dialog_box.mask_dialog_base import MaskDialogBase
 from components.widgets.label import ClickableLabel
@@ -90,15 +90,10 @@ class RenamePlaylistDialog(MaskDialogBase):
         # 创建新播放列表并写入json文件
         newPlaylist = {
             "playlistName": playlistName,
-            "songInfo_list": self.oldPlaylist["songInfo_list"],
+            "songPaths": playlistStore.getSongPaths(self.oldPlaylist),
             "modifiedTime": QDateTime.currentDateTime().toString(Qt.ISODate),
         }
-
-        oldPath = self.playlistFolder / (self.oldPlaylistName + '.json')
-        with open(oldPath, "w", encoding="utf-8") as f:
-            json.dump(newPlaylist, f)
-
-        oldPath.rename(self.playlistFolder/(playlistName+'.json'))
+        playlistStore.rename(self.oldPlaylistName, newPlaylist)
 
         # 发送信号
         self.renamePlaylistSig.emit(self.oldPlaylist, newPlaylist)
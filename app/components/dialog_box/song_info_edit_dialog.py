@@ -22,7 +22,7 @@ from .mask_dialog_base import MaskDialogBase
 class SongInfoEditDialog(MaskDialogBase):
     """ 歌曲信息编辑对话框 """
 
-    saveInfoSig = pyqtSignal(dict, dict)
+    saveInfoSig = pyqtSignal(object, object)
 
     def __init__(self, songInfo: dict, parent):
         super().__init__(parent)
@@ -1,9 +1,9 @@
 # coding:utf-8
 import os
-from copy import deepcopy
 from enum import Enum
 from json import dump, load
 
+from common.meta_data import encodeSongInfo
 from common.os_utils import checkDirExists
 from PyQt5.QtCore import QUrl
 from PyQt5.QtMultimedia import QMediaContent, QMediaPlaylist
@@ -105,6 +105,40 @@ class MediaPlaylist(QMediaPlaylist):
             else:
                 super().previous()
 
+    def getUpcomingSongs(self, num: int) -> list:
+        """ 按照播放顺序获取接下来要播放的歌曲，不包括当前播放的歌曲
+
+        Parameters
+        ----------
+        num: int
+            最多获取的歌曲数
+
+        Returns
+        -------
+        songInfo_list: list
+            歌曲信息列表
+        """
+        count = len(self.playlist)
+        current = self.currentIndex()
+        if current < 0 or count <= 1:
+            return []
+
+        # 随机播放时 Qt 会预先确定接下来的随机位置，`next()` 也会使用相同的位置
+        mode = self.playbackMode()
+        if mode == QMediaPlaylist.Random:
+            indexes = [self.nextIndex(i) for i in range(1, num+1)]
+        elif mode == QMediaPlaylist.Loop:
+            indexes = [(current+i) % count for i in range(1, num+1)]
+        else:
+            indexes = range(current+1, min(current+num+1, count))
+
+        songInfo_list = []
+        for i in dict.fromkeys(indexes):
+            if 0 <= i < count and i != current:
+                songInfo_list.append(self.playlist[i])
+
+        return songInfo_list
+
     def getCurrentSong(self) -> dict:
         """ 获取当前播放的歌曲信息 """
         if self.currentIndex() >= 0:
@@ -155,7 +189,7 @@ class MediaPlaylist(QMediaPlaylist):
             "lastSongInfo": self.getCurrentSong(),
         }
         with open("cache/song_info/lastPlaylistInfo.json", "w", encoding="utf-8") as f:
-            dump(playlistInfo, f)
+            dump(playlistInfo, f, default=encodeSongInfo)
 
     @checkDirExists('cache/song_info')
     def __readLastPlaylist(self):
@@ -175,7 +209,7 @@ class MediaPlaylist(QMediaPlaylist):
             # 弹出已经不存在的歌曲
             if not os.path.exists(self.lastSongInfo.get("songPath", "")):
                 self.lastSongInfo = {}
-            for songInfo in deepcopy(self.playlist):
+            for songInfo in self.playlist.copy():
                 if not os.path.exists(songInfo.get("songPath", "")):
                     self.playlist.remove(songInfo)
 
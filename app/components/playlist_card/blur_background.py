@@ -1,4 +1,5 @@
 # coding:utf-8
+from common.meta_data.thumbnail_cache import thumbnailCache
 from PIL import Image
 from PIL.ImageFilter import GaussianBlur
 from PyQt5.QtCore import Qt
@@ -21,7 +22,7 @@ class BlurBackground(QWidget):
 
         # 读入专辑封面
         if not imagePath.startswith(':'):
-            cover = Image.open(imagePath)
+            cover = Image.open(thumbnailCache.getThumbnailPath(imagePath, 288))
         else:
             cover = Image.fromqpixmap(QPixmap(imagePath))
 
@@ -1,6 +1,8 @@
 # coding:utf-8
 from common.auto_wrap import autoWrap
 from common.image_process_utils import DominantColor
+from common.meta_data.playlist_store import playlistStore
+from common.meta_data.thumbnail_cache import thumbnailCache
 from common.os_utils import getCoverPath
 from components.buttons.blur_button import BlurButton
 from components.widgets.check_box import CheckBox
@@ -54,7 +56,7 @@ class PlaylistCard(PerspectiveWidget):
         )
         self.playlistNameLabel = QLabel(self.playlistName, self)
         self.playlistLenLabel = QLabel(
-            str(len(self.songInfo_list))+self.tr(" songs"), self)
+            str(len(self.songPaths))+self.tr(" songs"), self)
         # 创建复选框
         self.checkBox = CheckBox(self, forwardTargetWidget=self.playlistCover)
         # 创建动画和窗口特效
@@ -108,11 +110,17 @@ class PlaylistCard(PerspectiveWidget):
         self.playlistName = playlist.get(
             "playlistName", self.tr("Unknown playlist"))
 
-        self.songInfo_list = playlist.get("songInfo_list", [])  # type:list
-        songInfo = self.songInfo_list[0] if self.songInfo_list else {}
+        # 播放列表只保存了歌曲路径，只解析第一首歌来获取封面
+        self.songPaths = playlist.get("songPaths", [])  # type:list
+        songInfo = playlistStore.getFirstSongInfo(playlist) or {}
         name = songInfo.get('coverName', '未知歌手_未知专辑')
         self.playlistCoverPath = getCoverPath(name, 'playlist_small')
 
+    @property
+    def songInfo_list(self) -> list:
+        """ 播放列表中的歌曲信息，使用时才从歌曲库中解析 """
+        return playlistStore.getSongInfos(self.playlist)
+
     def __adjustLabel(self):
         """ 调整标签的文本长度和位置 """
         newText, isWordWrap = autoWrap(self.playlistName, 32)
@@ -161,7 +169,7 @@ class PlaylistCard(PerspectiveWidget):
         self.playlistCover.setPlaylistCover(self.playlistCoverPath)
         self.playlistNameLabel.setText(self.playlistName)
         self.playlistLenLabel.setText(
-            str(len(self.songInfo_list))+self.tr(" songs"))
+            str(len(self.songPaths))+self.tr(" songs"))
         self.playButton.setBlurPic(self.playlistCoverPath, 40)
         self.addToButton.setBlurPic(self.playlistCoverPath, 40)
         self.__adjustLabel()
@@ -260,18 +268,20 @@ class PlaylistCover(QWidget):
         # 封面磨砂
         self.playlistCoverPath = picPath
 
+        # 使用和显示尺寸接近的缩略图，减少解码和缩放的开销
+        thumbPath = thumbnailCache.getThumbnailPath(picPath, 288)
         if not picPath.startswith(':'):
-            img = Image.open(picPath)
+            img = Image.open(thumbPath)
         else:
             img = Image.fromqpixmap(QPixmap(picPath))
 
         img = img.resize((288, 288)).crop((0, 46, 288, 242))
         self.__blurPix = img.filter(GaussianBlur(40)).toqpixmap()
-        self.__playlistCoverPix = QPixmap(picPath).scaled(
+        self.__playlistCoverPix = QPixmap(thumbnailCache.getThumbnailPath(picPath, 135)).scaled(
             135, 135, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)  # type:QPixmap
 
         # 获取主色调
-        self.dominantRgb = DominantColor.getDominantColor(picPath)
+        self.dominantRgb = DominantColor.getDominantColor(thumbPath)
         self.update()
 
     def paintEvent(self, e):
@@ -1,3 +1,6 @@
 from .song_card_type import SongCardType
 from .basic_song_list_widget import BasicSongListWidget
-from .no_scroll_song_list_widget import NoScrollSongListWidget
\ No newline at end of file
+from .no_scroll_song_list_widget import NoScrollSongListWidget
+from .song_list_model import SongListModel
+from .song_card_delegate import SongCardDelegate
+from .basic_song_list_view import BasicSongListView
@@ -18,9 +18,9 @@ class BasicSongCard(QWidget):
     clicked = pyqtSignal(int)
     doubleClicked = pyqtSignal(int)
     playButtonClicked = pyqtSignal(int)
-    addSongToPlayingSig = pyqtSignal(dict)
+    addSongToPlayingSig = pyqtSignal(object)
     checkedStateChanged = pyqtSignal(int, bool)
-    addSongToNewCustomPlaylistSig = pyqtSignal(dict)
+    addSongToNewCustomPlaylistSig = pyqtSignal(object)
     addSongsToCustomPlaylistSig = pyqtSignal(str, list)
 
     def __init__(self, songInfo: dict, songCardType, parent=None):
@@ -0,0 +1,499 @@
+# coding:utf-8
+import os
+from bisect import bisect_right
+from typing import List
+
+from common.meta_data.library_database import LibraryDatabase
+from components.dialog_box.song_info_edit_dialog import SongInfoEditDialog
+from components.dialog_box.song_property_dialog import SongPropertyDialog
+from components.widgets.list_widget import ListView
+from PyQt5.QtCore import QMargins, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import QFrame
+
+from .song_card import SongCardFactory
+from .song_card_delegate import SongCardDelegate
+from .song_card_type import SongCardType
+from .song_list_model import SongListModel
+
+
+class BasicSongListView(ListView):
+    """ 基本歌曲列表视图
+
+    和 `BasicSongListWidget` 的接口相同，但是不会为每一首歌创建歌曲卡，
+    只有选中的行和鼠标所在的行会显示真正的歌曲卡，其他行由委托绘制
+    """
+
+    emptyChangedSig = pyqtSignal(bool)                   # 歌曲卡是否为空信号
+    removeSongSignal = pyqtSignal(str)                   # 刪除歌曲列表中的一首歌
+    songCardNumChanged = pyqtSignal(int)                 # 歌曲数量发生改变
+    isAllCheckedChanged = pyqtSignal(bool)               # 歌曲卡卡全部选中改变
+    addSongToPlayingSignal = pyqtSignal(object)          # 将一首歌添加到正在播放
+    checkedSongCardNumChanged = pyqtSignal(int)          # 选中的歌曲卡数量发生改变
+    editSongInfoSignal = pyqtSignal(object, object)      # 编辑歌曲卡完成信号
+    selectionModeStateChanged = pyqtSignal(bool)         # 进入/退出 选择模式
+    addSongsToNewCustomPlaylistSig = pyqtSignal(list)    # 将歌曲添加到新的自定义播放列表
+    addSongsToCustomPlaylistSig = pyqtSignal(str, list)  # 将歌曲添加到已存在的自定义播放列表
+
+    def __init__(self, songInfo_list: list, songCardType: SongCardType, parent=None,
+                 viewportMargins=QMargins(30, 0, 30, 0), paddingBottomHeight: int = 116):
+        """
+        Parameters
+        ----------
+        songInfo_list: list
+            歌曲信息列表
+
+        songCardType: SongCardType
+            歌曲卡类型
+
+        parent:
+            父级窗口
+
+        viewportMargins: QMargins
+            视口的外边距
+
+        paddingBottomHeight: int
+            列表视图底部留白，如果为 `0` 或者 `None` 则不添加留白
+        """
+        super().__init__(parent)
+        self.__songCardType = songCardType
+        self.paddingBottomHeight = paddingBottomHeight
+        self.songListModel = SongListModel(songInfo_list, self)
+        self.songCardDelegate = SongCardDelegate(songCardType, self)
+        self.currentIndex = 0
+        self.playingIndex = 0  # 正在播放的歌曲卡下标
+        self.playingSongInfo = self.songInfo_list[0] if songInfo_list else None
+        # 初始化标志位
+        self.isInSelectionMode = False
+        self.isAllSongCardsChecked = False
+        self.__isCurrentSelected = False
+        self.__isPlayingVisible = False
+        self.__isPlayingSongExist = True
+        # 选中的行和鼠标所在的行对应的歌曲卡
+        self.__currentSongCard = None
+        self.__hoverSongCard = None
+
+        self.setModel(self.songListModel)
+        self.setItemDelegate(self.songCardDelegate)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(self.NoSelection)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setMouseTracking(True)
+        # 交错颜色
+        self.setAlternatingRowColors(True)
+        # 设置边距
+        self.setViewportMargins(viewportMargins)
+        self.entered.connect(self.__onEntered)
+
+    @property
+    def songInfo_list(self) -> List[dict]:
+        return self.songListModel.songInfo_list
+
+    @property
+    def checkedSongInfo_list(self) -> List[dict]:
+        """ 按照行号排序的选中的歌曲信息列表 """
+        return [self.songInfo_list[i] for i in self.songListModel.checkedRows()]
+
+    @property
+    def songCardType(self) -> SongCardType:
+        return self.__songCardType
+
+    def songCardState(self, row: int):
+        """ 返回一行的状态 `(是否选中, 是否正在播放, 歌曲是否存在)` """
+        if self.isInSelectionMode:
+            isSelected = self.songListModel.isChecked(row)
+        else:
+            isSelected = self.__isCurrentSelected and row == self.currentIndex
+
+        isPlaying = self.__isPlayingVisible and row == self.playingIndex
+        return isSelected, isPlaying, not isPlaying or self.__isPlayingSongExist
+
+    def setCurrentIndex(self, index: int):
+        """ 设置当前下标 """
+        if not self.isInSelectionMode:
+            # 被点击的悬浮歌曲卡已经是选中状态了，直接作为当前歌曲卡
+            hoverCard = self.__hoverSongCard
+            if hoverCard and hoverCard.itemIndex == index:
+                self.__hoverSongCard = self.__currentSongCard
+                self.__currentSongCard = hoverCard
+
+            self.currentIndex = index
+            self.__isCurrentSelected = True
+            self.__updateSongCards()
+        else:
+            # 如果处于选中模式下点击了歌曲卡则取反选中的卡的选中状态
+            isChecked = not self.songListModel.isChecked(index)
+            self.onSongCardCheckedStateChanged(index, isChecked)
+
+    def currentRow(self) -> int:
+        """ 返回鼠标最后点击的行 """
+        return self.selectionModel().currentIndex().row()
+
+    def appendSongCards(self, songInfo_list: list):
+        """ 在列表尾部添加歌曲
+
+        Parameters
+        ----------
+        songInfo_list: list
+            歌曲信息字典列表
+        """
+        self.songListModel.appendSongInfos(songInfo_list)
+
+    def removeSongCard(self, index: int):
+        """ 删除一首歌曲 """
+        self.songListModel.removeSongInfo(index)
+
+        # 更新下标
+        if self.currentIndex == index:
+            self.__isCurrentSelected = False
+        if self.currentIndex >= index:
+            self.currentIndex = max(self.currentIndex - 1, 0)
+
+        if self.playingIndex == index:
+            self.__isPlayingVisible = False
+        if self.playingIndex >= index:
+            self.playingIndex = max(self.playingIndex - 1, 0)
+
+        # 发送信号
+        self.songCardNumChanged.emit(len(self.songInfo_list))
+        self.__updateSongCards()
+
+    def removeSongCards(self, songPaths: list):
+        """ 移除多首歌曲，连续的行一起移除，只发送一次歌曲数量改变信号 """
+        songPaths = set(songPaths)
+        rows = [i for i, songInfo in enumerate(self.songInfo_list)
+                if songInfo["songPath"] in songPaths]
+        if not rows:
+            return
+
+        self.songListModel.removeSongInfos(rows)
+
+        # 更新下标，下标减去在它之前 (包括它自己) 被移除的行数
+        rowSet = set(rows)
+        if self.currentIndex in rowSet:
+            self.__isCurrentSelected = False
+        self.currentIndex = max(self.currentIndex - bisect_right(rows, self.currentIndex), 0)
+
+        if self.playingIndex in rowSet:
+            self.__isPlayingVisible = False
+        self.playingIndex = max(self.playingIndex - bisect_right(rows, self.playingIndex), 0)
+
+        # 发送信号
+        self.songCardNumChanged.emit(len(self.songInfo_list))
+        self.__updateSongCards()
+
+    def setPlay(self, index: int):
+        """ 设置歌曲卡播放状态 """
+        if not self.songInfo_list:
+            return
+
+        self.currentIndex = index
+        self.playingIndex = index  # 更新正在播放的下标
+        self.__isCurrentSelected = index >= 0
+        self.__isPlayingVisible = index >= 0
+        if index >= 0:
+            self.playingSongInfo = self.songInfo_list[index]
+            self.__isPlayingSongExist = self.songCardType == SongCardType.ONLINE_SONG_CARD or \
+                os.path.exists(self.playingSongInfo["songPath"])
+
+        self.__updateSongCards()
+
+    def setPlayBySongInfo(self, songInfo: dict):
+        """ 设置歌曲卡播放状态，如果指定的歌曲不在当前歌曲列表中，将正在播放的歌曲卡取消播放状态 """
+        index = self.index(songInfo)
+        if index is not None:
+            self.setPlay(index)
+        else:
+            self.cancelPlayState()
+
+    def cancelPlayState(self):
+        """ 取消正在播放的歌曲卡的播放状态 """
+        if not self.songInfo_list or self.playingIndex is None:
+            return
+
+        self.currentIndex = 0
+        self.playingIndex = 0
+        self.playingSongInfo = None
+        self.__isPlayingVisible = False
+        self.__isCurrentSelected = False
+        self.__updateSongCards()
+
+    def showSongPropertyDialog(self, songInfo: dict = None):
+        """ 显示selected的歌曲卡的属性 """
+        songInfo = self.songInfo_list[self.currentRow()] if not songInfo else songInfo
+        w = SongPropertyDialog(songInfo, self.window())
+        w.exec_()
+
+    def showSongInfoEditDialog(self, songInfo: dict = None):
+        """ 显示编辑歌曲信息面板 """
+        songInfo = self.songInfo_list[self.currentRow()] if not songInfo else songInfo
+        w = SongInfoEditDialog(songInfo, self.window())
+        w.saveInfoSig.connect(self.__saveModifidiedSongInfo)
+        w.exec_()
+
+    def __saveModifidiedSongInfo(self, oldSongInfo, newSongInfo):
+        """ 保存被更改的歌曲信息 """
+        self.updateOneSongCard(newSongInfo)
+        self.editSongInfoSignal.emit(oldSongInfo, newSongInfo)
+
+    def updateOneSongCard(self, newSongInfo, isNeedWriteToFile=True):
+        """ 更新一个歌曲卡 """
+        for i, songInfo in enumerate(self.songInfo_list):
+            if songInfo["songPath"] == newSongInfo["songPath"]:
+                self.songListModel.setData(
+                    self.songListModel.index(i), newSongInfo, SongListModel.SongInfoRole)
+
+        self.__updateSongCards()
+
+        if isNeedWriteToFile:
+            # 只将修改的歌曲信息存入歌曲库
+            LibraryDatabase().updateSongInfos([newSongInfo])
+
+    def updateMultiSongCards(self, newSongInfo_list: list):
+        """ 更新多个歌曲卡 """
+        rows = {}
+        for i, songInfo in enumerate(self.songInfo_list):
+            rows.setdefault(songInfo["songPath"], []).append(i)
+
+        for newSongInfo in newSongInfo_list:
+            for i in rows.get(newSongInfo["songPath"], []):
+                self.songListModel.setData(
+                    self.songListModel.index(i), newSongInfo, SongListModel.SongInfoRole)
+
+        self.__updateSongCards()
+
+        # 将修改的歌曲信息存入歌曲库
+        LibraryDatabase().updateSongInfos(newSongInfo_list)
+
+    def onSongCardCheckedStateChanged(self, itemIndex: int, isChecked: bool):
+        """ 歌曲卡选中状态改变对应的槽函数 """
+        model = self.songListModel
+        if model.isChecked(itemIndex) != isChecked:
+            model.setData(model.index(itemIndex), isChecked, Qt.CheckStateRole)
+            self.checkedSongCardNumChanged.emit(model.checkedNum)
+
+        self.__onCheckedNumChanged(itemIndex)
+
+    def __onCheckedNumChanged(self, itemIndex=0):
+        """ 选中的歌曲数量改变后更新全选状态和选择模式 """
+        checkedNum = self.songListModel.checkedNum
+        isAllChecked = checkedNum == len(self.songInfo_list)
+        if isAllChecked != self.isAllSongCardsChecked:
+            self.isAllSongCardsChecked = isAllChecked
+            self.isAllCheckedChanged.emit(isAllChecked)
+
+        # 如果先前不处于选择模式那么这次发生选中状态改变就进入选择模式
+        if not self.isInSelectionMode and checkedNum:
+            self.currentIndex = itemIndex
+            self.__setSelectionModeOpen(True)
+        elif self.isInSelectionMode and not checkedNum:
+            self.__isCurrentSelected = False
+            self.__setSelectionModeOpen(False)
+        else:
+            self.__updateSongCards()
+
+    def __setSelectionModeOpen(self, isOpenSelectionMode: bool):
+        """ 进入/退出选择模式 """
+        self.isInSelectionMode = isOpenSelectionMode
+        self.__updateSongCards()
+        # 发送信号要求主窗口隐藏/显示播放栏
+        self.selectionModeStateChanged.emit(isOpenSelectionMode)
+
+    def setAllSongCardCheckedState(self, isAllChecked: bool):
+        """ 设置所有的歌曲卡checked状态 """
+        if self.isAllSongCardsChecked == isAllChecked:
+            return
+
+        self.isAllSongCardsChecked = isAllChecked
+        self.songListModel.setAllChecked(isAllChecked)
+        self.checkedSongCardNumChanged.emit(self.songListModel.checkedNum)
+        self.__onCheckedNumChanged()
+
+    def unCheckSongCards(self):
+        """ 取消所有已处于选中状态的歌曲卡的选中状态 """
+        if not self.songListModel.checkedNum:
+            return
+
+        self.songListModel.setAllChecked(False)
+        self.checkedSongCardNumChanged.emit(0)
+        self.__onCheckedNumChanged()
+
+    def updateAllSongCards(self, songInfo_list: list):
+        """ 更新所有歌曲卡
+
+        Parameters
+        ----------
+        songInfo_list: list
+            歌曲信息列表
+        """
+        oldSongNum = len(self.songInfo_list)
+        newSongNum = len(songInfo_list) if songInfo_list else 0
+
+        # 当两个列表是否为空的的布尔值不同时发送歌曲卡列表是否为空信号
+        if not (oldSongNum and newSongNum):
+            self.emptyChangedSig.emit(not newSongNum)
+
+        self.songListModel.setSongInfos(songInfo_list)
+
+        # 更新样式和当前下标
+        self.currentIndex = 0
+        self.playingIndex = 0
+        self.playingSongInfo = None
+        self.__isCurrentSelected = False
+        self.__isPlayingVisible = False
+        self.__updateSongCards()
+
+        # 发出歌曲卡数量改变信号
+        if oldSongNum != newSongNum:
+            self.songCardNumChanged.emit(newSongNum)
+
+    def clearSongCards(self):
+        """ 清空歌曲卡 """
+        self.songListModel.setSongInfos([])
+        self.currentIndex = 0
+        self.playingIndex = 0
+        self.__isCurrentSelected = False
+        self.__isPlayingVisible = False
+        self.__updateSongCards()
+
+    def sortSongInfo(self, key: str, isReverse=True):
+        """ 依据指定的键排序歌曲信息列表
+
+        Parameters
+        ----------
+        key: str
+            排序依据，有'createTime'、'songName'、'singer'和'tracknumber'四种
+
+        isReverse: bool
+            是否降序，只对前三种排序方式有效
+        """
+        if key != "tracknumber":
+            songInfo = sorted(self.songInfo_list,
+                              key=lambda songInfo: songInfo[key], reverse=isReverse)
+        else:
+            songInfo = sorted(self.songInfo_list, key=lambda songInfo: int(
+                songInfo["tracknumber"]))
+        return songInfo
+
+    def songCardNum(self) -> int:
+        """ 返回歌曲卡数量 """
+        return len(self.songInfo_list)
+
+    def index(self, songInfo: dict):
+        """ 获取歌曲信息的索引，如果歌曲信息不存在于列表中，则返回 None """
+        if songInfo in self.songInfo_list:
+            return self.songInfo_list.index(songInfo)
+        return None
+
+    def _connectSongCardSignalToSlot(self, songCard):
+        """ 将一个歌曲卡的信号连接到槽函数 """
+        # 必须被子类重写
+        raise NotImplementedError
+
+    def __onEntered(self, index: QModelIndex):
+        """ 鼠标进入一行时将悬浮歌曲卡移动到这一行 """
+        row = index.row()
+        currentCard = self.__currentSongCard
+        if currentCard and currentCard.itemIndex == row:
+            return
+
+        # 先隐藏再显示，歌曲卡才能收到鼠标进入事件
+        if self.__hoverSongCard:
+            self.__hoverSongCard.hide()
+
+        self.__hoverSongCard = self.__placeSongCard(self.__hoverSongCard, row)
+
+    def __updateSongCards(self):
+        """ 根据当前的状态更新选中的行和鼠标所在的行的歌曲卡 """
+        songNum = len(self.songInfo_list)
+        row = self.currentIndex
+        if self.isInSelectionMode or not self.__isCurrentSelected or not 0 <= row < songNum:
+            row = None
+
+        self.__currentSongCard = self.__placeSongCard(self.__currentSongCard, row)
+
+        hoverCard = self.__hoverSongCard
+        if hoverCard and hoverCard.itemIndex is not None:
+            hoverRow = hoverCard.itemIndex
+            if hoverRow >= songNum or hoverRow == row:
+                hoverRow = None
+            self.__placeSongCard(hoverCard, hoverRow)
+
+        self.viewport().update()
+
+    def __placeSongCard(self, songCard, row: int):
+        """ 将歌曲卡放到指定的行上，`row` 为 `None` 时隐藏歌曲卡 """
+        if row is None:
+            if songCard:
+                songCard.hide()
+                songCard.itemIndex = None
+            return songCard
+
+        if songCard is None:
+            songCard = SongCardFactory.create(
+                self.songCardType, self.songInfo_list[row], self.viewport())
+            songCard.hide()
+            self._connectSongCardSignalToSlot(songCard)
+
+        self.__syncSongCard(songCard, row)
+        self.executeDelayedItemsLayout()
+        songCard.setGeometry(self.visualRect(self.songListModel.index(row)))
+        songCard.show()
+        return songCard
+
+    def __syncSongCard(self, songCard, row: int):
+        """ 使歌曲卡的内容和状态与指定的行一致 """
+        isSelected, isPlaying, isSongExist = self.songCardState(row)
+        isChecked = self.songListModel.isChecked(row)
+        songCard.itemIndex = row
+        songCard.updateSongCard(self.songInfo_list[row])
+
+        state = (songCard.isSelected, songCard.isPlaying, songCard.isSongExist,
+                 songCard.isChecked, songCard.isInSelectionMode)
+        if state == (isSelected, isPlaying, isSongExist, isChecked, self.isInSelectionMode):
+            return
+
+        # 更新复选框时不能发出信号，否则会被当成用户点击了复选框
+        songCard.checkBox.blockSignals(True)
+        songCard.checkBox.setChecked(isChecked)
+        songCard.checkBox.blockSignals(False)
+        songCard.isChecked = isChecked
+
+        songCard.setPlay(isPlaying)
+        songCard.setSelected(isSelected)
+        songCard.isInSelectionMode = self.isInSelectionMode
+
+        # 选中的歌曲卡一直显示按钮，选择模式下只显示复选框
+        songCard.songNameCard.setWidgetHidden(not isSelected)
+        if self.isInSelectionMode:
+            songCard.checkBox.show()
+            songCard.buttonGroup.hide()
+
+        cursor = Qt.ArrowCursor if self.isInSelectionMode else Qt.PointingHandCursor
+        songCard.setClickableLabelCursor(cursor)
+
+    def __moveSongCards(self):
+        """ 将歌曲卡移动到对应的行上 """
+        for songCard in [self.__currentSongCard, self.__hoverSongCard]:
+            if songCard and songCard.itemIndex is not None:
+                songCard.setGeometry(
+                    self.visualRect(self.songListModel.index(songCard.itemIndex)))
+
+    def updateGeometries(self):
+        """ 更新滚动条范围和歌曲卡位置 """
+        super().updateGeometries()
+
+        # 还没有设置模型时不需要处理
+        if self.model() is None:
+            return
+
+        # 在底部留白，效果和添加一个空白的行相同
+        if self.paddingBottomHeight:
+            scrollBar = self.verticalScrollBar()
+            scrollBar.setMaximum(scrollBar.maximum() + self.paddingBottomHeight)
+
+        self.__moveSongCards()
+
+    def resizeEvent(self, e):
+        """ 改变宽度时需要重新排列各行 """
+        super().resizeEvent(e)
+        self.scheduleDelayedItemsLayout()
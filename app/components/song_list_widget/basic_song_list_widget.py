@@ -1,7 +1,7 @@
 # coding:utf-8
-from json import dump
 from typing import List
 
+from common.meta_data.library_database import LibraryDatabase
 from components.dialog_box.song_info_edit_dialog import SongInfoEditDialog
 from components.dialog_box.song_property_dialog import SongPropertyDialog
 from components.widgets.list_widget import ListWidget
@@ -19,9 +19,9 @@ class BasicSongListWidget(ListWidget):
     removeSongSignal = pyqtSignal(str)                   # 刪除歌曲列表中的一首歌
     songCardNumChanged = pyqtSignal(int)                 # 歌曲数量发生改变
     isAllCheckedChanged = pyqtSignal(bool)               # 歌曲卡卡全部选中改变
-    addSongToPlayingSignal = pyqtSignal(dict)            # 将一首歌添加到正在播放
+    addSongToPlayingSignal = pyqtSignal(object)          # 将一首歌添加到正在播放
     checkedSongCardNumChanged = pyqtSignal(int)          # 选中的歌曲卡数量发生改变
-    editSongInfoSignal = pyqtSignal(dict, dict)          # 编辑歌曲卡完成信号
+    editSongInfoSignal = pyqtSignal(object, object)      # 编辑歌曲卡完成信号
     selectionModeStateChanged = pyqtSignal(bool)         # 进入/退出 选择模式
     addSongsToNewCustomPlaylistSig = pyqtSignal(list)    # 将歌曲添加到新的自定义播放列表
     addSongsToCustomPlaylistSig = pyqtSignal(str, list)  # 将歌曲添加到已存在的自定义播放列表
@@ -213,18 +213,16 @@ class BasicSongListWidget(ListWidget):
                 self.songCard_list[i].updateSongCard(newSongInfo)
 
         if isNeedWriteToFile:
-            # 将修改的信息存入json文件
-            with open("cache/song_info/songInfo.json", "w", encoding="utf-8") as f:
-                dump(self.songInfo_list, f)
+            # 只将修改的歌曲信息存入歌曲库
+            LibraryDatabase().updateSongInfos([newSongInfo])
 
     def updateMultiSongCards(self, newSongInfo_list: list):
         """ 更新多个歌曲卡 """
         for newSongInfo in newSongInfo_list:
             self.updateOneSongCard(newSongInfo, False)
 
-        # 将修改的信息存入json文件
-        with open("cache/song_info/songInfo.json", "w", encoding="utf-8") as f:
-            dump(self.songInfo_list, f)
+        # 将修改的歌曲信息存入歌曲库
+        LibraryDatabase().updateSongInfos(newSongInfo_list)
 
     def resizeEvent(self, e):
         """ 更新item的尺寸 """
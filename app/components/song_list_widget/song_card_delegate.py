@@ -0,0 +1,197 @@
+# coding:utf-8
+from PyQt5.QtCore import QPoint, QRect, QSize, Qt
+from PyQt5.QtGui import (QColor, QFont, QFontMetrics, QPainter, QPixmap,
+                         QResizeEvent)
+from PyQt5.QtWidgets import (QApplication, QStyledItemDelegate,
+                             QStyleOptionViewItem)
+
+from .song_card import SongCardFactory
+from .song_card_type import SongCardType
+from .song_list_model import SongListModel
+
+
+class SongCardDelegate(QStyledItemDelegate):
+    """ 歌曲卡委托，按照歌曲卡的样子绘制没有创建歌曲卡的行
+
+    各列的位置和宽度来自一张隐藏的模板歌曲卡，所以和真正的歌曲卡保持一致。
+    委托绘制的行只有离开和选中两种外观，鼠标悬浮等交互状态由列表视图创建的歌曲卡负责
+    """
+
+    # 和歌曲列表样式表保持一致的颜色
+    rowColors = (QColor(242, 242, 242), QColor(255, 255, 255))
+    selectedColor = QColor(0, 153, 188)
+    textColors = {
+        "notSelected-notPlay": QColor(48, 48, 48),
+        "notSelected-play": QColor(0, 107, 131),
+        "selected": QColor(255, 255, 255),
+    }
+    checkBoxColors = {
+        "notSelected-notPlay": QColor(0, 0, 0),
+        "notSelected-play": QColor(0, 107, 131),
+        "selected": QColor(255, 255, 255),
+    }
+
+    # 模板歌曲卡的歌曲信息，足够长的文本使得标签的宽度等于列宽
+    templateSongInfo = {
+        "songPath": "",
+        "songName": "W" * 100,
+        "singer": "W" * 100,
+        "album": "W" * 100,
+        "year": "W" * 100,
+        "genre": "W" * 100,
+        "duration": "0:00",
+        "tracknumber": "10",
+    }
+
+    def __init__(self, songCardType: SongCardType, parent=None):
+        """
+        Parameters
+        ----------
+        songCardType: SongCardType
+            歌曲卡类型
+
+        parent:
+            父级，一般为列表视图
+        """
+        super().__init__(parent)
+        self.songCardType = songCardType
+        self.rowHeight = 60
+        self.labelFont = QFont()
+        self.labelFont.setFamilies(["Segoe UI", "Microsoft YaHei"])
+        self.labelFont.setPixelSize(15)
+        self.songNameFont = QFont(self.labelFont)
+        self.songNameFont.setPixelSize(16)
+        self.__pixmaps = {}
+        self.__layoutWidth = None
+        self.__templateCard = None
+        self.__columns = []        # 歌名卡之后的各列 `(键, 位置)`
+        self.__songNameRect = QRect()
+        self.__playingSongNameX = 0
+        self.__playingIconPos = QPoint()
+        self.__trackNumRects = None
+        self.__checkBoxRect = None
+
+    def sizeHint(self, option: QStyleOptionViewItem, index):
+        return QSize(option.rect.width(), self.rowHeight)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        view = option.widget
+        row = index.row()
+        rect = option.rect
+        songInfo = index.data(SongListModel.SongInfoRole)
+        isChecked = index.data(Qt.CheckStateRole) == Qt.Checked
+        isSelected, isPlaying, isSongExist = view.songCardState(row)
+        self.__updateLayout(rect.width())
+
+        painter.save()
+        painter.translate(rect.topLeft())
+        painter.setClipRect(0, 0, rect.width(), rect.height())
+
+        # 绘制背景
+        color = self.selectedColor if isSelected else self.rowColors[row % 2]
+        painter.fillRect(0, 0, rect.width(), rect.height(), color)
+
+        if isSelected:
+            state = "selected"
+        else:
+            state = "notSelected-play" if isPlaying else "notSelected-notPlay"
+
+        # 绘制复选框
+        if view.isInSelectionMode and self.__checkBoxRect is not None:
+            if isChecked:
+                painter.drawPixmap(
+                    self.__checkBoxRect, self.__getPixmap(":/images/song_tab_interface/CheckMark.png"))
+            else:
+                painter.setPen(self.checkBoxColors[state])
+                painter.drawRect(self.__checkBoxRect.adjusted(0, 0, -1, -1))
+
+        painter.setPen(self.textColors[state])
+
+        # 绘制曲目序号，和歌曲卡一样在显示复选框或者正在播放时隐藏
+        if self.__trackNumRects and not (view.isInSelectionMode or isPlaying):
+            trackNum = str(songInfo.get("tracknumber", "0"))
+            if trackNum != "0":
+                painter.setFont(self.labelFont)
+                trackNumRect = self.__trackNumRects[len(trackNum) >= 2]
+                painter.drawText(
+                    trackNumRect, Qt.AlignLeft | Qt.AlignVCenter, trackNum + ".")
+
+        # 绘制正在播放图标，歌曲不存在时绘制警告图标
+        songNameRect = QRect(self.__songNameRect)
+        if isPlaying:
+            if isSongExist:
+                color = "white" if isSelected else "green"
+                path = f":/images/song_tab_interface/Playing_{color}.png"
+            else:
+                color = "white" if isSelected else "red"
+                path = f":/images/song_tab_interface/Info_{color}.png"
+
+            painter.drawPixmap(self.__playingIconPos, self.__getPixmap(path))
+            songNameRect.setLeft(self.__playingSongNameX)
+
+        # 绘制歌名和其他标签
+        painter.setFont(self.songNameFont)
+        painter.drawText(songNameRect, Qt.AlignLeft | Qt.AlignVCenter,
+                         songInfo.get("songName", ""))
+
+        painter.setFont(self.labelFont)
+        for key, columnRect in self.__columns:
+            painter.drawText(columnRect, Qt.AlignLeft | Qt.AlignVCenter,
+                             str(songInfo.get(key, "")))
+
+        painter.restore()
+
+    def __updateLayout(self, width: int):
+        """ 使用模板歌曲卡计算各列的位置 """
+        if width == self.__layoutWidth:
+            return
+
+        self.__layoutWidth = width
+        card = self.__templateCard
+        if card is None:
+            card = SongCardFactory.create(self.songCardType, self.templateSongInfo)
+            self.__templateCard = card
+
+        # 模板歌曲卡不会显示出来，需要手动发送尺寸改变事件来排列标签
+        oldSize = card.size()
+        card.resize(width, self.rowHeight)
+        QApplication.sendEvent(card, QResizeEvent(card.size(), oldSize))
+
+        # 显示出来的标签的高度会被调整为文本的高度，模板歌曲卡的标签高度不能直接使用
+        labelHeight = QFontMetrics(self.labelFont).height()
+        songNameHeight = QFontMetrics(self.songNameFont).height()
+
+        # 歌名卡
+        songNameCard = card.songNameCard
+        songNameLabel = songNameCard.songNameLabel
+        self.__songNameRect = QRect(
+            songNameLabel.x(), songNameLabel.y(),
+            songNameCard.width() - songNameLabel.x(), songNameHeight)
+        self.__playingIconPos = songNameCard.playingLabel.pos()
+        self.__playingSongNameX = self.__playingIconPos.x() + 26
+
+        if songNameCard.checkBox.width() > 0:
+            self.__checkBoxRect = QRect(songNameCard.checkBox.pos(), QSize(25, 25))
+
+        if hasattr(songNameCard, "trackNumLabel"):
+            y = songNameCard.trackNumLabel.y()
+            self.__trackNumRects = (
+                QRect(28, y, 25, labelHeight), QRect(19, y, 25, labelHeight))
+
+        # 其他标签，标签中的文本很长，所以标签宽度就是列宽
+        self.__columns = []
+        for key in ["singer", "album", "year", "genre", "duration"]:
+            label = getattr(card, key + "Label", None)
+            if label is None or label not in card.label_list:
+                continue
+
+            right = width if key == "duration" else label.x() + label.width()
+            columnRect = QRect(label.x(), label.y(), right - label.x(), labelHeight)
+            self.__columns.append((key, columnRect))
+
+    def __getPixmap(self, path: str) -> QPixmap:
+        """ 获取缓存的图标 """
+        if path not in self.__pixmaps:
+            self.__pixmaps[path] = QPixmap(path)
+
+        return self.__pixmaps[path]
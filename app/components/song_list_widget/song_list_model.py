@@ -0,0 +1,139 @@
+# coding:utf-8
+from typing import List
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class SongListModel(QAbstractListModel):
+    """ 歌曲列表模型，每一行对应一首歌曲，还记录了每一行的选中状态 """
+
+    SongInfoRole = Qt.UserRole
+
+    def __init__(self, songInfo_list: list = None, parent=None):
+        """
+        Parameters
+        ----------
+        songInfo_list: list
+            歌曲信息列表，模型直接使用这个列表而不会复制它
+
+        parent:
+            父级
+        """
+        super().__init__(parent)
+        self.songInfo_list = songInfo_list if songInfo_list is not None else []  # type:List[dict]
+        self.checkStates = [False] * len(self.songInfo_list)
+        self.checkedNum = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.songInfo_list)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.songInfo_list):
+            return None
+
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self.songInfo_list[row].get("songName", "")
+        if role == self.SongInfoRole:
+            return self.songInfo_list[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.checkStates[row] else Qt.Unchecked
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        if not index.isValid():
+            return False
+
+        row = index.row()
+        if role == Qt.CheckStateRole:
+            isChecked = value in (True, Qt.Checked)
+            if self.checkStates[row] != isChecked:
+                self.checkStates[row] = isChecked
+                self.checkedNum += 1 if isChecked else -1
+                self.dataChanged.emit(index, index, [role])
+            return True
+
+        if role == self.SongInfoRole:
+            self.songInfo_list[row] = value
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, role])
+            return True
+
+        return False
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def setSongInfos(self, songInfo_list: list):
+        """ 替换歌曲信息列表，所有行的选中状态会被清空 """
+        self.beginResetModel()
+        self.songInfo_list = songInfo_list if songInfo_list is not None else []
+        self.checkStates = [False] * len(self.songInfo_list)
+        self.checkedNum = 0
+        self.endResetModel()
+
+    def appendSongInfos(self, songInfo_list: list):
+        """ 在尾部添加歌曲 """
+        if not songInfo_list:
+            return
+
+        n = len(self.songInfo_list)
+        self.beginInsertRows(QModelIndex(), n, n + len(songInfo_list) - 1)
+        self.songInfo_list.extend(songInfo_list)
+        self.checkStates.extend([False] * len(songInfo_list))
+        self.endInsertRows()
+
+    def removeSongInfo(self, row: int):
+        """ 移除一首歌曲 """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.songInfo_list.pop(row)
+        self.checkedNum -= self.checkStates.pop(row)
+        self.endRemoveRows()
+
+    def removeSongInfos(self, rows: List[int]):
+        """ 移除多首歌曲，连续的行只会移除一次
+
+        Parameters
+        ----------
+        rows: List[int]
+            升序排列且不重复的行号列表
+        """
+        end = len(rows)
+        while end > 0:
+            # 从后往前找出连续的行，这样前面的行号不会受到影响
+            start = end - 1
+            while start > 0 and rows[start - 1] == rows[start] - 1:
+                start -= 1
+
+            first, last = rows[start], rows[end - 1]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.songInfo_list[first:last + 1]
+            self.checkedNum -= sum(self.checkStates[first:last + 1])
+            del self.checkStates[first:last + 1]
+            self.endRemoveRows()
+            end = start
+
+    def setAllChecked(self, isChecked: bool):
+        """ 设置所有行的选中状态 """
+        if not self.songInfo_list:
+            return
+
+        self.checkStates = [isChecked] * len(self.songInfo_list)
+        self.checkedNum = len(self.songInfo_list) if isChecked else 0
+        self.dataChanged.emit(
+            self.index(0), self.index(len(self.songInfo_list) - 1), [Qt.CheckStateRole])
+
+    def isChecked(self, row: int) -> bool:
+        """ 某一行是否被选中 """
+        return self.checkStates[row]
+
+    def checkedRows(self) -> List[int]:
+        """ 按照行号排序的选中行列表 """
+        return [i for i, isChecked in enumerate(self.checkStates) if isChecked]
+
+    def songInfo(self, row: int) -> dict:
+        """ 获取某一行的歌曲信息 """
+        return self.songInfo_list[row]
@@ -5,14 +5,14 @@ from math import cos, pi
 
 from PyQt5.QtCore import QDateTime, Qt, QTimer, QPoint
 from PyQt5.QtGui import QWheelEvent, QCursor
-from PyQt5.QtWidgets import QApplication, QListWidget
+from PyQt5.QtWidgets import QApplication, QListView, QListWidget
 
 
-class ListWidget(QListWidget):
-    """ 一个可以平滑滚动的列表控件"""
+class SmoothScrollMixin:
+    """ 列表平滑滚动混入类，需要放在 Qt 列表类的前面 """
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    def _initSmoothScroll(self):
+        """ 初始化平滑滚动 """
         self.fps = 60
         self.duration = 400
         self.stepsTotal = 0
@@ -120,6 +120,22 @@ class ListWidget(QListWidget):
         return res
 
 
+class ListWidget(SmoothScrollMixin, QListWidget):
+    """ 一个可以平滑滚动的列表控件"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._initSmoothScroll()
+
+
+class ListView(SmoothScrollMixin, QListView):
+    """ 一个可以平滑滚动的列表视图 """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._initSmoothScroll()
+
+
 class SmoothMode(Enum):
     """ 滚动模式 """
     NO_SMOOTH = 0
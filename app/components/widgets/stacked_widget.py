@@ -1,5 +1,5 @@
 # coding:utf-8
-from typing import List
+from typing import Callable, Dict, List
 
 from PyQt5.QtCore import (QAbstractAnimation, QEasingCurve,
                           QParallelAnimationGroup, QPoint, QPropertyAnimation,
@@ -9,7 +9,64 @@ from PyQt5.QtCore import QPropertyAnimation
 from PyQt5.QtWidgets import QGraphicsOpacityEffect, QStackedWidget
 
 
-class OpacityAniStackedWidget(QStackedWidget):
+class LazyStackedWidget(QStackedWidget):
+    """ 可以延迟创建窗口的堆叠窗口类，先放入一个占位窗口，第一次切换到或者加载窗口时才调用工厂函数创建它 """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.__factories = {}  # type:Dict[QWidget, Callable[[], QWidget]]
+
+    def addLazyWidget(self, factory: Callable[[], QWidget], *args, **kwargs) -> int:
+        """ 添加延迟创建的窗口
+
+        Parameters
+        ----------
+        factory: Callable[[], QWidget]
+            创建窗口的工厂函数
+
+        *args, **kwargs:
+            传给 `addWidget()` 的其他参数
+
+        Returns
+        -------
+        index: int
+            窗口的下标
+        """
+        placeholder = QWidget(self)
+        self.__factories[placeholder] = factory
+        self.addWidget(placeholder, *args, **kwargs)
+        return self.indexOf(placeholder)
+
+    def loadWidget(self, index: int) -> QWidget:
+        """ 创建下标对应的窗口并替换掉占位窗口，返回创建好的窗口 """
+        placeholder = self.widget(index)
+        factory = self.__factories.get(placeholder)
+        if factory is None:
+            return placeholder
+
+        # 创建失败时保留工厂函数，下次加载时重新创建
+        widget = factory()
+        del self.__factories[placeholder]
+        isCurrent = self.currentIndex() == index
+        self.removeWidget(placeholder)
+        self.insertWidget(index, widget)
+        if isCurrent:
+            super().setCurrentIndex(index)
+
+        self._onWidgetLoaded(index, widget)
+        placeholder.deleteLater()
+        return widget
+
+    def isWidgetLoaded(self, index: int) -> bool:
+        """ 下标对应的窗口是否已经创建 """
+        return self.widget(index) not in self.__factories
+
+    def _onWidgetLoaded(self, index: int, widget: QWidget):
+        """ 延迟创建的窗口替换掉占位窗口之后调用，子类在这里把动画转移到新的窗口上 """
+        pass
+
+
+class OpacityAniStackedWidget(LazyStackedWidget):
     """ 带淡入淡出动画效果的堆叠窗口类 """
 
     def __init__(self, parent=None):
@@ -36,6 +93,8 @@ class OpacityAniStackedWidget(QStackedWidget):
         if index == index_:
             return
 
+        self.loadWidget(index)
+
         if index > index_:
             ani = self.__anis[index]
             ani.setStartValue(0)
@@ -57,8 +116,12 @@ class OpacityAniStackedWidget(QStackedWidget):
         """ 动画完成后切换当前窗口 """
         super().setCurrentIndex(self.__nextIndex)
 
+    def _onWidgetLoaded(self, index: int, widget: QWidget):
+        # 占位窗口的透明特效会被转移到新的窗口上
+        widget.setGraphicsEffect(self.__effects[index])
+
 
-class PopUpAniStackedWidget(QStackedWidget):
+class PopUpAniStackedWidget(LazyStackedWidget):
     """ 带弹出式切换窗口动画和淡入淡出动画的堆叠窗口类 """
 
     aniFinished = pyqtSignal()
@@ -131,6 +194,7 @@ class PopUpAniStackedWidget(QStackedWidget):
             return
         if self.__currentAniGroup and self.__currentAniGroup.state() == QAbstractAnimation.Running:
             return
+        self.loadWidget(index)
         # 记录需要切换到的窗口下标
         self.__nextIndex = index
         self.__previousIndex = self.currentIndex()
@@ -218,6 +282,16 @@ class PopUpAniStackedWidget(QStackedWidget):
         ani.setEndValue(endValue)
         ani.setDuration(duration)
 
+    def _onWidgetLoaded(self, index: int, widget: QWidget):
+        # 弹出动画的目标换成新的窗口
+        widgetAni_dict = self.__widgetAni_list[index]
+        aniGroup = widgetAni_dict['aniGroup']  # type:QParallelAnimationGroup
+        aniGroup.removeAnimation(widgetAni_dict['popUpAni'])
+        popUpAni = QPropertyAnimation(widget, b'pos')
+        aniGroup.addAnimation(popUpAni)
+        widgetAni_dict['widget'] = widget
+        widgetAni_dict['popUpAni'] = popUpAni
+
     def __aniFinishedSlot(self):
         """ 动画完成后切换窗口 """
         # 取消之前设置的透明度特效，防止与子部件的透明度特效起冲突
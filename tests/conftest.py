@@ -0,0 +1,6 @@
+# coding:utf-8
+import sys
+from pathlib import Path
+
+# 程序以 app 文件夹为根目录导入模块
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
@@ -0,0 +1,83 @@
+# coding:utf-8
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from common.meta_data.folder_scanner import FolderScanner
+
+
+class TestFolderScanner(TestCase):
+    """ 测试歌曲文件夹扫描器 """
+
+    def setUp(self):
+        self.tempDir = TemporaryDirectory()
+        self.root = Path(self.tempDir.name).as_posix()
+        for path in ["a.mp3", "b.FLAC", "cover.jpg", "A/c.m4a", "A/B/d.mp4",
+                     "A/B/C/e.mp3", ".hidden/f.mp3", "A/Scans/g.mp3"]:
+            self.touch(path)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def touch(self, path: str, data=b"0"):
+        """ 创建文件 """
+        path = Path(self.root, path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def scan(self, scanner: FolderScanner, forcedFolders=None) -> list:
+        """ 扫描并返回相对路径 """
+        files = scanner.iterSongFiles(self.root, forcedFolders)
+        return sorted(os.path.relpath(i, self.root).replace('\\', '/') for i, _ in files)
+
+    def test_recursive(self):
+        """ 测试递归扫描和后缀过滤 """
+        self.assertEqual(self.scan(FolderScanner()), [
+            ".hidden/f.mp3", "A/B/C/e.mp3", "A/B/d.mp4", "A/Scans/g.mp3",
+            "A/c.m4a", "a.mp3", "b.FLAC"])
+
+    def test_max_depth(self):
+        """ 测试最大递归深度 """
+        self.assertEqual(self.scan(FolderScanner(0)), ["a.mp3", "b.FLAC"])
+        self.assertEqual(self.scan(FolderScanner(1)), [
+            ".hidden/f.mp3", "A/c.m4a", "a.mp3", "b.FLAC"])
+        self.assertEqual(len(self.scan(FolderScanner(-1))), 7)
+
+    def test_ignore_patterns(self):
+        """ 测试忽略名字或者相对路径匹配的文件和文件夹 """
+        scanner = FolderScanner(ignorePatterns=[".*", "*/Scans", "b.*"])
+        self.assertEqual(self.scan(scanner), ["A/B/C/e.mp3", "A/B/d.mp4", "A/c.m4a", "a.mp3"])
+        self.assertTrue(scanner.isIgnored(self.root, self.root + "/A/Scans"))
+        self.assertFalse(scanner.isIgnored(self.root, self.root + "/Scans"))
+
+    def test_cache(self):
+        """ 测试修改时间没有变化的文件夹使用缓存 """
+        scanner = FolderScanner()
+        self.scan(scanner)
+
+        # 修改时间不变时看不到新文件，强制扫描时才能看到
+        folder = Path(self.root, "A/B")
+        stat = folder.stat()
+        self.touch("A/B/h.mp3")
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertNotIn("A/B/h.mp3", self.scan(scanner))
+        self.assertIn("A/B/h.mp3", self.scan(scanner, {folder.as_posix()}))
+
+        # 修改时间变化后重新扫描文件夹
+        self.touch("A/i.mp3")
+        os.utime(Path(self.root, "A"), ns=(0, stat.st_mtime_ns + 10**9))
+        self.assertIn("A/i.mp3", self.scan(scanner))
+        self.assertEqual(len(self.scan(scanner, True)), 9)
+
+    def test_iter_folders(self):
+        """ 测试遍历文件夹 """
+        scanner = FolderScanner(1, [".*"])
+        folders = {os.path.relpath(i, self.root).replace('\\', '/')
+                   for i in scanner.iterFolders(self.root)}
+        self.assertEqual(folders, {".", "A"})
+
+        pruned = {os.path.normcase(self.root + "/A/B")}
+        folders = {os.path.relpath(i, self.root).replace('\\', '/')
+                   for i in FolderScanner().iterFolders(self.root, pruned)}
+        self.assertEqual(folders, {".", ".hidden", "A", "A/Scans"})
@@ -0,0 +1,119 @@
+# coding:utf-8
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from common.meta_data.library_change_detector import (LibraryChangeDetector, LibraryDiff,
+                                                      getModifiedTime, toISOTime)
+
+
+class TestLibraryDiff(TestCase):
+    """ 测试歌曲文件变化的合并 """
+
+    def test_merge(self):
+        """ 测试合并之后发生的变化 """
+        diff = LibraryDiff(added={"a"}, removed={"b"}, modified={"c"})
+        diff.merge(LibraryDiff(added={"b", "d"}, removed={"a", "c"}, modified={"e"}))
+        self.assertEqual(diff.added, {"d"})
+        self.assertEqual(diff.removed, {"c"})
+        self.assertEqual(diff.modified, {"b", "e"})
+        self.assertFalse(diff.isEmpty())
+        self.assertTrue(LibraryDiff().isEmpty())
+
+    def test_merge_added_then_modified(self):
+        """ 测试新增之后又被修改的文件依然是新增的文件 """
+        diff = LibraryDiff(added={"a"})
+        diff.merge(LibraryDiff(modified={"a"}))
+        self.assertEqual(diff.added, {"a"})
+        self.assertEqual(diff.modified, set())
+
+
+class TestLibraryChangeDetector(TestCase):
+    """ 测试歌曲文件变化检测器 """
+
+    def setUp(self):
+        self.tempDir = TemporaryDirectory()
+        self.root = Path(self.tempDir.name).as_posix()
+        self.folders = [self.root + "/A", self.root + "/B"]
+        for path in ["A/a.mp3", "A/sub/b.mp3", "B/c.flac"]:
+            self.touch(path)
+
+        self.detector = LibraryChangeDetector(self.folders)
+        self.detector.rebuild()
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def touch(self, path: str, data=b"0"):
+        """ 创建或者修改文件，并推迟所在文件夹的修改时间 """
+        path = Path(self.root, path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.bump(path.parent)
+
+    def bump(self, folder: Path):
+        """ 推迟文件夹的修改时间，避免文件系统的时间精度不够导致检测不到变化 """
+        mtime = folder.stat().st_mtime_ns + 10**9
+        os.utime(folder, ns=(mtime, mtime))
+
+    def path(self, path: str) -> str:
+        return self.root + "/" + path
+
+    def test_rebuild(self):
+        """ 测试建立索引 """
+        self.assertEqual(set(self.detector.fileStats), {
+            self.path("A/a.mp3"), self.path("A/sub/b.mp3"), self.path("B/c.flac")})
+        self.assertTrue(self.detector.scan().isEmpty())
+
+        paths = list(LibraryChangeDetector(self.folders).iterRebuild())
+        self.assertEqual(sorted(paths), sorted(self.detector.fileStats))
+
+    def test_scan(self):
+        """ 测试检测新增、删除和修改的文件 """
+        self.touch("A/sub/new.mp3")
+        os.remove(self.path("B/c.flac"))
+        self.bump(Path(self.root, "B"))
+        self.touch("A/a.mp3", b"modified")
+
+        diff = self.detector.scan()
+        self.assertEqual(diff.added, {self.path("A/sub/new.mp3")})
+        self.assertEqual(diff.removed, {self.path("B/c.flac")})
+        self.assertEqual(diff.modified, {self.path("A/a.mp3")})
+        self.assertTrue(self.detector.scan().isEmpty())
+
+    def test_in_place_modification(self):
+        """ 测试文件夹修改时间没有变化时需要完整扫描才能检测到文件被修改 """
+        folder = Path(self.root, "B")
+        stat = folder.stat()
+        path = Path(self.path("B/c.flac"))
+        path.write_bytes(b"modified")
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertTrue(self.detector.scan().isEmpty())
+        self.assertEqual(self.detector.scan(True).modified, {self.path("B/c.flac")})
+
+    def test_scan_folders(self):
+        """ 测试只扫描指定的子文件夹 """
+        folder = Path(self.root, "A/sub")
+        stat = folder.stat()
+        Path(self.path("A/sub/new.mp3")).write_bytes(b"0")
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        diff = self.detector.scanFolders([self.root + "/B"])
+        self.assertTrue(diff.isEmpty())
+        diff = self.detector.scanFolders([folder.as_posix()])
+        self.assertEqual(diff.added, {self.path("A/sub/new.mp3")})
+
+    def test_modified_time(self):
+        """ 测试从索引中获取修改时间 """
+        path = self.path("A/a.mp3")
+        os.utime(path, (0, 1600000000))
+        self.detector.scan(True)
+        self.assertEqual(self.detector.getModifiedTime(path), toISOTime(1600000000 * 10**9))
+        self.assertEqual(self.detector.getModifiedTime(path), getModifiedTime(path))
+
+    def test_set_folder_paths(self):
+        """ 测试更换歌曲文件夹 """
+        self.detector.setFolderPaths(self.folders[1:])
+        self.assertEqual(set(self.detector.fileStats), {self.path("B/c.flac")})
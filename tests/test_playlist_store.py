@@ -0,0 +1,114 @@
+# coding:utf-8
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from common.meta_data.playlist_store import PlaylistStore
+from common.meta_data.song_info import SongInfo
+
+
+class TestPlaylistStore(TestCase):
+    """ 测试播放列表库 """
+
+    def setUp(self):
+        self.tempDir = TemporaryDirectory()
+        self.folder = Path(self.tempDir.name)
+        self.songInfo = SongInfo("D:/music/a.mp3", "Aiko", "恋をしたのは", "Album", duration=245)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def createPlaylist(self, store: PlaylistStore, songInfo_list: list):
+        """ 创建并保存播放列表 """
+        playlist = {
+            "playlistName": "test",
+            "modifiedTime": "",
+            "songPaths": store.register(songInfo_list),
+        }
+        store.save(playlist)
+        return playlist
+
+    def test_save_paths_only(self):
+        """ 测试歌曲库中的歌曲只保存路径 """
+        store = PlaylistStore(self.folder)
+        store.setLibrary([self.songInfo])
+        self.createPlaylist(store, [self.songInfo])
+
+        with open(self.folder / "test.json", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self.assertEqual(data["songPaths"], [self.songInfo.songPath])
+        self.assertEqual(data["songInfos"], {})
+
+    def test_external_song(self):
+        """ 测试不在歌曲库中的歌曲会保存歌曲信息 """
+        store = PlaylistStore(self.folder)
+        self.createPlaylist(store, [self.songInfo])
+
+        playlists = PlaylistStore(self.folder).readPlaylists()
+        store = PlaylistStore(self.folder)
+        playlist = store.readPlaylists()["test"]
+        self.assertIn("test", playlists)
+        self.assertEqual(store.getSongInfos(playlist), [self.songInfo])
+
+    def test_song_removed_from_library(self):
+        """ 测试移出歌曲库的歌曲信息不会丢失 """
+        store = PlaylistStore(self.folder)
+        store.setLibrary([self.songInfo])
+        playlist = self.createPlaylist(store, [self.songInfo])
+
+        # 不重新保存播放列表也能在重启之后找到歌曲信息
+        store.setLibrary([])
+        newStore = PlaylistStore(self.folder)
+        self.assertEqual(newStore.getSongInfos(newStore.readPlaylists()["test"]), [self.songInfo])
+
+        store.save(playlist)
+        newStore = PlaylistStore(self.folder)
+        self.assertEqual(newStore.getSongInfos(newStore.readPlaylists()["test"]), [self.songInfo])
+
+    def test_library_first(self):
+        """ 测试优先使用歌曲库中的歌曲信息 """
+        store = PlaylistStore(self.folder)
+        playlist = self.createPlaylist(store, [self.songInfo])
+
+        newSongInfo = self.songInfo.copy()
+        newSongInfo["songName"] = "New name"
+        store.setLibrary([newSongInfo])
+        self.assertEqual(store.getSongInfos(playlist)[0]["songName"], "New name")
+
+    def test_legacy_playlist(self):
+        """ 测试旧版本的播放列表会被转换为新格式 """
+        with open(self.folder / "test.json", "w", encoding="utf-8") as f:
+            json.dump({"playlistName": "test", "songInfo_list": [self.songInfo.toDict()]}, f)
+
+        store = PlaylistStore(self.folder)
+        playlist = store.readPlaylists()["test"]
+        self.assertEqual(playlist["songPaths"], [self.songInfo.songPath])
+
+        with open(self.folder / "test.json", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["version"], PlaylistStore.version)
+
+    def test_delete_songs(self):
+        """ 测试不创建播放列表界面也能从播放列表文件中删除歌曲 """
+        other = SongInfo("D:/music/b.mp3", "Aiko", "カブトムシ", "Album", duration=300)
+        store = PlaylistStore(self.folder)
+        store.setLibrary([self.songInfo, other])
+        self.createPlaylist(store, [self.songInfo, other])
+
+        store.deleteSongs([self.songInfo.songPath])
+        playlist = PlaylistStore(self.folder).readPlaylists()["test"]
+        self.assertEqual(playlist["songPaths"], [other.songPath])
+
+    def test_save_song_infos(self):
+        """ 测试不在歌曲库中的歌曲信息被修改之后重新保存播放列表文件 """
+        store = PlaylistStore(self.folder)
+        self.createPlaylist(store, [self.songInfo])
+
+        newSongInfo = self.songInfo.copy()
+        newSongInfo["songName"] = "New name"
+        store.saveSongInfos(store.updateSongInfos([newSongInfo]))
+
+        newStore = PlaylistStore(self.folder)
+        playlist = newStore.readPlaylists()["test"]
+        self.assertEqual(newStore.getSongInfos(playlist)[0]["songName"], "New name")
@@ -0,0 +1,167 @@
+# coding:utf-8
+from unittest import TestCase, mock
+
+from common.crawler.crawler_base import exceptionHandler
+from common.crawler.http_client import httpClient
+from common.crawler.provider_health import ProviderHealthTracker
+
+
+class FakeCrawler:
+    """ 只有服务商名字的爬虫 """
+
+    def __init__(self, provider: str):
+        self.provider = provider
+
+
+class TestProviderHealthTracker(TestCase):
+    """ 测试服务商健康状况追踪器 """
+
+    def setUp(self):
+        self.tracker = ProviderHealthTracker(
+            windowSize=10, failureThreshold=3, coolDown=30, maxCoolDown=100)
+
+        self.now = 1000
+        patcher = mock.patch("common.crawler.provider_health.time")
+        self.time = patcher.start()
+        self.time.time.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+
+    def fail(self, provider: str, times: int):
+        """ 记录连续发生的异常 """
+        for _ in range(times):
+            self.tracker.record(provider, 1, False, True)
+
+    def test_open_circuit(self):
+        """ 测试连续发生异常之后熔断 """
+        self.fail("kuwo", 2)
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+
+        # 没有查到结果不是异常，不会熔断
+        self.tracker.record("kuwo", 1, False, False)
+        self.fail("kuwo", 2)
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+
+        self.fail("kuwo", 1)
+        self.assertFalse(self.tracker.isAvailable("kuwo"))
+        self.assertTrue(self.tracker.isAvailable("kugou"))
+
+        self.now += 29
+        self.assertFalse(self.tracker.isAvailable("kuwo"))
+
+    def test_half_open_probe(self):
+        """ 测试熔断结束之后只放行一次试探性的查询 """
+        self.fail("kuwo", 3)
+        self.now += 30
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+        self.assertFalse(self.tracker.isAvailable("kuwo"))
+
+        # 放行之后一直没有记录到结果时，等待冷却时间之后再次放行
+        self.now += 30
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+        self.assertFalse(self.tracker.isAvailable("kuwo"))
+
+    def test_probe_success(self):
+        """ 测试试探成功之后恢复 """
+        self.fail("kuwo", 3)
+        self.now += 30
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+
+        self.tracker.record("kuwo", 1, True, False)
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+
+        # 冷却时间被重置
+        self.fail("kuwo", 3)
+        self.now += 30
+        self.assertTrue(self.tracker.isAvailable("kuwo"))
+
+    def test_probe_failure(self):
+        """ 测试试探失败之后再次熔断并加倍冷却时间，冷却时间不超过上限 """
+        self.fail("kuwo", 3)
+        self.now += 30
+        for coolDown in [60, 100, 100]:
+            self.assertTrue(self.tracker.isAvailable("kuwo"))
+            self.fail("kuwo", 1)
+
+            self.now += coolDown - 1
+            self.assertFalse(self.tracker.isAvailable("kuwo"))
+            self.now += 1
+
+    def test_success_rate(self):
+        """ 测试使用拉普拉斯平滑的成功率 """
+        self.assertEqual(self.tracker.successRate("kuwo"), 0.5)
+
+        self.tracker.record("kuwo", 1, True, False)
+        self.tracker.record("kuwo", 1, True, False)
+        self.tracker.record("kuwo", 1, False, False)
+        self.assertAlmostEqual(self.tracker.successRate("kuwo"), 3/5)
+
+        # 只保留最近几次查询的记录
+        for _ in range(10):
+            self.tracker.record("kuwo", 1, False, False)
+
+        self.assertAlmostEqual(self.tracker.successRate("kuwo"), 1/12)
+
+    def test_latency(self):
+        """ 测试耗时的百分位数 """
+        self.assertEqual(self.tracker.latency("kuwo"), 1)
+
+        for latency in [5, 1, 4, 2, 3]:
+            self.tracker.record("kuwo", latency, True, False)
+
+        self.assertEqual(self.tracker.latency("kuwo", 50), 2)
+        self.assertEqual(self.tracker.latency("kuwo", 95), 5)
+        self.assertEqual(self.tracker.latency("kuwo", 0), 1)
+
+    def test_sort_crawlers(self):
+        """ 测试按照期望耗时排序并去掉熔断中的爬虫 """
+        crawlers = [FakeCrawler(i) for i in ["kuwo", "wanyi", "kugou", "qq"]]
+        self.tracker.record("kuwo", 2, True, False)
+        self.tracker.record("wanyi", 1, False, False)
+        self.tracker.record("kugou", 1, True, False)
+        self.fail("qq", 3)
+
+        # 期望耗时：kuwo 为 2/(2/3)，wanyi 为 1/(1/3)，kugou 为 1/(2/3)
+        providers = [i.provider for i in self.tracker.sortCrawlers(crawlers)]
+        self.assertEqual(providers, ["kugou", "kuwo", "wanyi"])
+
+        # 期望耗时相同时保持原来的顺序
+        crawlers = [FakeCrawler(i) for i in ["a", "b", "c"]]
+        providers = [i.provider for i in self.tracker.sortCrawlers(crawlers)]
+        self.assertEqual(providers, ["a", "b", "c"])
+
+    def test_call(self):
+        """ 测试调用爬虫的方法时记录健康状况 """
+        crawler = FakeCrawler("kuwo")
+        requestCount = [0]
+
+        def search(isError=False, isEmpty=False):
+            requestCount[0] += 1
+            if isError:
+                raise ConnectionError("network is unreachable")
+
+            return ([], 0) if isEmpty else ([{"songName": "カブトムシ"}], 1)
+
+        with mock.patch.object(httpClient, "requestCount", side_effect=lambda: requestCount[0]):
+            self.tracker.call(crawler, search)
+            self.tracker.call(crawler, search, isEmpty=True)
+            with self.assertRaises(ConnectionError):
+                self.tracker.call(crawler, search, isError=True)
+
+            # 被异常处理装饰器吞掉的异常也会被记录
+            self.tracker.call(crawler, exceptionHandler([], 0)(search), isError=True)
+
+        self.assertAlmostEqual(self.tracker.successRate("kuwo"), 2/6)
+        report = self.tracker.getReport()
+        self.assertEqual(len(report), 1)
+        self.assertFalse(report[0]["isOpen"])
+
+        self.fail("kuwo", 1)
+        self.assertFalse(self.tracker.isAvailable("kuwo"))
+
+    def test_call_without_request(self):
+        """ 测试没有发送网络请求的调用不会被记录 """
+        crawler = FakeCrawler("kuwo")
+        self.assertEqual(self.tracker.call(crawler, lambda: ([], 0)), ([], 0))
+        self.assertEqual(self.tracker.successRate("kuwo"), 0.5)
+        self.assertEqual(self.tracker.getReport()[0]["p50"], 1)
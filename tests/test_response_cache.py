@@ -0,0 +1,184 @@
+# coding:utf-8
+import sqlite3
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from common.crawler.crawler_base import exceptionHandler
+from common.crawler.response_cache import ResponseCache
+
+
+class FakeCrawler:
+    """ 返回预设结果的爬虫 """
+
+    provider = "fake"
+
+    def __init__(self, cache: ResponseCache):
+        self.results = {}
+        self.callCount = 0
+        self.isBroken = False
+
+        @exceptionHandler([], 0)
+        @cache.cached(ttl=100, negativeTtl=10)
+        def search(crawler, key_word: str, page_num=1):
+            crawler.callCount += 1
+            if crawler.isBroken:
+                raise ConnectionError("network is unreachable")
+
+            return crawler.results.get(key_word, []), len(crawler.results.get(key_word, []))
+
+        self.search = search.__get__(self)
+
+
+class TestResponseCache(TestCase):
+    """ 测试爬虫查询结果缓存 """
+
+    def setUp(self):
+        self.tempDir = TemporaryDirectory()
+        self.dbPath = Path(self.tempDir.name) / "cache.db"
+        self.cache = ResponseCache(self.dbPath)
+        self.crawler = FakeCrawler(self.cache)
+        self.crawler.results["aiko"] = [{"songName": "カブトムシ"}]
+
+        self.now = 1000
+        patcher = mock.patch("common.crawler.response_cache.time")
+        self.time = patcher.start()
+        self.time.time.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_make_key(self):
+        """ 测试字符串参数去掉多余的空白并忽略大小写 """
+        key = ResponseCache.makeKey("fake", "search", ["  Aiko\t ", 1])
+        self.assertEqual(key, ResponseCache.makeKey("fake", "search", ["aiko", 1]))
+        self.assertNotEqual(key, ResponseCache.makeKey("fake", "search", ["aiko", 2]))
+        self.assertNotEqual(key, ResponseCache.makeKey("other", "search", ["aiko", 1]))
+
+    def test_hit(self):
+        """ 测试规范化之后相同的参数命中缓存 """
+        value = self.crawler.search("aiko")
+        self.assertEqual(self.crawler.search(" AIKO ", page_num=1), value)
+        self.assertEqual(self.crawler.callCount, 1)
+
+        # 默认参数也是键的一部分
+        self.crawler.search("aiko", 2)
+        self.assertEqual(self.crawler.callCount, 2)
+
+    def test_preserve_tuple(self):
+        """ 测试元组返回值从缓存中读出来依然是元组，包括从数据库中读取 """
+        value = self.crawler.search("aiko")
+        self.assertEqual(self.crawler.search("aiko"), value)
+        self.assertIsInstance(self.crawler.search("aiko"), tuple)
+
+        cache = ResponseCache(self.dbPath)
+        isHit, cachedValue = cache.get(ResponseCache.makeKey("fake", "search", ["aiko", 1]))
+        self.assertTrue(isHit)
+        self.assertEqual(cachedValue, value)
+        self.assertIsInstance(cachedValue, tuple)
+
+    def test_copy_value(self):
+        """ 测试修改返回值不会影响缓存 """
+        self.crawler.search("aiko")[0].clear()
+        self.assertEqual(self.crawler.search("aiko")[1], 1)
+        self.assertEqual(len(self.crawler.search("aiko")[0]), 1)
+
+    def test_expire(self):
+        """ 测试缓存过期之后重新查询 """
+        self.crawler.search("aiko")
+        self.now += 99
+        self.crawler.search("aiko")
+        self.assertEqual(self.crawler.callCount, 1)
+
+        self.now += 1
+        self.crawler.search("aiko")
+        self.assertEqual(self.crawler.callCount, 2)
+
+    def test_negative_ttl(self):
+        """ 测试没有查询到结果时使用更短的有效期 """
+        self.assertEqual(self.crawler.search("unknown"), ([], 0))
+        self.now += 9
+        self.crawler.search("unknown")
+        self.assertEqual(self.crawler.callCount, 1)
+
+        self.now += 1
+        self.crawler.search("unknown")
+        self.assertEqual(self.crawler.callCount, 2)
+
+    def test_zero_negative_ttl(self):
+        """ 测试没有查询结果的有效期为 0 时不缓存 """
+        cache = ResponseCache(self.dbPath)
+        calls = []
+
+        @cache.cached(ttl=100)
+        def getLyric(crawler, key_word: str):
+            calls.append(key_word)
+            return None
+
+        getLyric(self.crawler, "aiko")
+        getLyric(self.crawler, "aiko")
+        self.assertEqual(len(calls), 2)
+
+    def test_skip_failed_request(self):
+        """ 测试查询过程中发生异常时不缓存异常处理返回的默认值 """
+        self.crawler.isBroken = True
+        self.assertEqual(self.crawler.search("aiko"), ([], 0))
+
+        self.crawler.isBroken = False
+        self.assertEqual(self.crawler.search("aiko")[1], 1)
+        self.assertEqual(self.crawler.callCount, 2)
+
+    def test_skip_swallowed_error(self):
+        """ 测试被内层的异常处理装饰器吞掉的异常也会阻止缓存 """
+        cache = ResponseCache(self.dbPath)
+        calls = []
+
+        @exceptionHandler()
+        def request():
+            raise ConnectionError("network is unreachable")
+
+        @cache.cached(ttl=100, negativeTtl=100)
+        def getLyric(crawler, key_word: str):
+            calls.append(key_word)
+            return request()
+
+        getLyric(self.crawler, "aiko")
+        getLyric(self.crawler, "aiko")
+        self.assertEqual(len(calls), 2)
+
+    def test_evict(self):
+        """ 测试缓存超过上限时删除最早的缓存，直到不超过上限的 80% """
+        cache = ResponseCache(self.dbPath, maxSize=400)
+        keys = [f"key{i}" for i in range(10)]
+        for key in keys:
+            cache.set(key, "x" * 90, 100)
+            self.now += 1
+
+        with sqlite3.connect(self.dbPath) as conn:
+            size = conn.execute("SELECT TOTAL(size) FROM responses").fetchone()[0]
+
+        self.assertLessEqual(size, 320)
+        self.assertFalse(cache.get(keys[0])[0])
+        self.assertTrue(cache.get(keys[-1])[0])
+
+        # 过期的缓存优先被删除，删掉之后没有超过上限就不再删除其他缓存
+        cache.set("short", "x" * 90, 1)
+        self.now += 2
+        cache.set("new", "x" * 90, 100)
+        self.assertTrue(cache.get(keys[-2])[0])
+        self.assertTrue(cache.get("new")[0])
+
+    def test_disabled(self):
+        """ 测试禁用缓存之后每次都重新查询 """
+        self.cache.isEnabled = False
+        self.crawler.search("aiko")
+        self.crawler.search("aiko")
+        self.assertEqual(self.crawler.callCount, 2)
+
+    def test_clear(self):
+        """ 测试清空缓存 """
+        self.crawler.search("aiko")
+        self.cache.clear()
+        self.crawler.search("aiko")
+        self.assertEqual(self.crawler.callCount, 2)
@@ -0,0 +1,147 @@
+# coding:utf-8
+from unittest import TestCase
+
+from common.meta_data.search_index import SearchIndex, parseQuery, tokenize
+
+
+def song(songName, singer="", album="", genre="Pop"):
+    """ 创建测试用的歌曲信息 """
+    return {"songPath": songName + ".mp3", "songName": songName,
+            "singer": singer, "album": album, "genre": genre}
+
+
+class TestSearchIndex(TestCase):
+    """ 测试搜索索引 """
+
+    def setUp(self):
+        self.index = SearchIndex(
+            {"songName": 1, "singer": 0.8, "album": 0.6, "genre": 0.4}, "songPath")
+
+    def search(self, keyWord: str, limit: int = None):
+        """ 搜索并返回歌曲名 """
+        return [i["songName"] for i in self.index.search(keyWord, limit)]
+
+    def test_tokenize(self):
+        """ 测试分词 """
+        self.assertEqual(tokenize("see you again"), {"see", "you", "again"})
+        self.assertEqual(tokenize("晴天"), {"晴", "天", "晴天", "qt"})
+        self.assertEqual(parseQuery("周杰伦 love"),
+                         [("周杰", False), ("杰伦", False), ("love", True)])
+
+    def test_prefix(self):
+        """ 测试单词前缀匹配 """
+        self.index.setItems([song("See You Again"), song("Hello"), song("Someone Like You")])
+        self.assertEqual(self.search("agai"), ["See You Again"])
+        self.assertEqual(self.search("yo"), ["See You Again", "Someone Like You"])
+        self.assertEqual(self.search("SEE  you"), ["See You Again"])
+        self.assertEqual(self.search("xyz"), [])
+        self.assertEqual(self.search(""), [])
+
+    def test_cjk(self):
+        """ 测试中文单字和相邻两字匹配 """
+        self.index.setItems([song("晴天", "周杰伦"), song("天下", "张杰"), song("稻香", "周杰伦")])
+        self.assertEqual(self.search("晴天"), ["晴天"])
+        self.assertEqual(self.search("天"), ["天下", "晴天"])
+        self.assertEqual(self.search("杰伦"), ["晴天", "稻香"])
+        self.assertEqual(self.search("周伦"), [])
+
+    def test_pinyin_initials(self):
+        """ 测试拼音首字母匹配 """
+        self.index.setItems([song("晴天", "周杰伦"), song("稻香", "周杰伦"), song("天下", "张杰")])
+        self.assertEqual(self.search("zjl"), ["晴天", "稻香"])
+        self.assertEqual(self.search("dx"), ["稻香"])
+        self.assertEqual(self.search("zj"), ["晴天", "稻香", "天下"])
+
+    def test_field_weight(self):
+        """ 测试相关度高的字段排在前面 """
+        self.index.setItems([song("Hello", album="Love"), song("Love", singer="Adele")])
+        self.assertEqual(self.search("love"), ["Love", "Hello"])
+        self.assertEqual(self.search("adele"), ["Love"])
+        self.assertEqual(self.search("pop", 1), ["Hello"])
+
+    def test_tie_order(self):
+        """ 测试相关度相同的条目按照条目的顺序排列 """
+        songs = [song(f"Love {i}") for i in range(10)]
+        self.index.setItems(songs)
+        self.assertEqual(self.search("love"), [i["songName"] for i in songs])
+
+        # 少量条目发生变化时也按照条目的顺序建立索引
+        index = SearchIndex({"songName": 1}, "songPath")
+        index.setItems([song("Love Story"), song("Lovely")])
+        self.assertEqual([i["songName"] for i in index.search("love")], ["Love Story", "Lovely"])
+        self.assertEqual([i["songName"] for i in index.search("pop")], [])
+
+        self.index.setItems([song(i, genre="") for i in ["Pop Star", "Lollipop", "Popcorn", "K-Pop"]])
+        self.assertEqual(self.search("pop"), ["Pop Star", "Popcorn", "K-Pop"])
+
+    def test_update_and_remove(self):
+        """ 测试增量更新和移除条目 """
+        self.index.setItems([song("Hello"), song("Halo")])
+        self.assertEqual(self.search("h"), ["Hello", "Halo"])
+
+        self.index.updateItems([song("Hello", singer="Adele"), song("Hero")])
+        self.assertEqual(self.search("adele"), ["Hello"])
+        self.assertEqual(self.search("her"), ["Hero"])
+
+        self.index.removeItems(["Halo.mp3", "missing.mp3"])
+        self.assertEqual(self.search("halo"), [])
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn("Halo.mp3", self.index)
+
+        # 只有被替换的条目会重新建立索引
+        items = [song("Hello"), song("Hero"), song("Halo")]
+        self.index.setItems(items)
+        self.assertEqual(self.search("h"), ["Hello", "Hero", "Halo"])
+        self.index.setItems(items[1:])
+        self.assertEqual(self.search("h"), ["Hero", "Halo"])
+
+        self.index.clear()
+        self.assertEqual(self.search("h"), [])
+
+    def createIndex(self):
+        """ 创建字段和键相同的空索引 """
+        return SearchIndex(
+            {"songName": 1, "singer": 0.8, "album": 0.6, "genre": 0.4}, "songPath")
+
+    def test_load(self):
+        """ 测试使用快照建立的索引，建立期间发生变化的条目会重新建立索引 """
+        songs = [song("Hello", "Adele"), song("Someone Like You", "Adele"), song("晴天", "周杰伦")]
+        self.index.setItems(songs)
+
+        index = self.createIndex()
+        index.setItems(self.index.snapshot())
+        self.assertTrue(index.build())
+        self.assertEqual(index.dirtyNum(), 0)
+
+        # 建立索引期间修改、删除和添加条目
+        songs[0]["singer"] = "Lionel Richie"
+        self.index.updateItems([songs[0]])
+        self.index.removeItems([songs[2]["songPath"]])
+        self.index.updateItems([song("稻香", "周杰伦")])
+
+        self.index.load(index)
+        self.assertEqual(self.index.dirtyNum(), 3)
+        self.assertEqual(self.search("adele"), ["Someone Like You"])
+        self.assertEqual(self.search("lionel"), ["Hello"])
+        self.assertEqual(self.search("zjl"), ["稻香"])
+        self.assertEqual(len(self.index), 3)
+
+    def test_load_without_changes(self):
+        """ 测试建立索引期间没有变化时搜索不需要再建立索引 """
+        self.index.setItems([song("Hello"), song("Hello World"), song("See You Again")])
+        index = self.createIndex()
+        index.setItems(self.index.snapshot())
+        index.build()
+
+        self.index.load(index)
+        self.assertEqual(self.index.dirtyNum(), 0)
+        self.assertEqual(self.search("hello"), ["Hello", "Hello World"])
+
+    def test_interrupt_build(self):
+        """ 测试中断建立索引之后，剩下的条目在搜索时建立索引 """
+        self.index.setItems([song(f"Song {i}") for i in range(1000)])
+        calls = []
+        self.assertFalse(self.index.build(lambda: calls.append(1) or len(calls) > 1))
+        self.assertEqual(self.index.dirtyNum(), 1000 - 256)
+        self.assertEqual(len(self.search("song")), 1000)
+        self.assertEqual(self.search("song 999"), ["Song 999"])
@@ -0,0 +1,89 @@
+# coding:utf-8
+import copy
+import json
+import pickle
+from unittest import TestCase
+
+from common.meta_data.song_info import SongInfo, encodeSongInfo, parseDuration, parseNumber
+
+
+class TestSongInfo(TestCase):
+    """ 测试歌曲信息 """
+
+    def setUp(self):
+        self.songInfo = SongInfo(
+            "D:/music/a.mp3", "Aiko", "恋をしたのは", "Album", "Aiko_Album", "J-Pop",
+            "2019-05-01", "1", "2", "3", (3, 12), "4:05", ".mp3", "2021-01-01T00:00:00")
+
+    def test_parse(self):
+        """ 测试解析标签中的数字和时长 """
+        self.assertEqual(parseNumber("2019-05-01"), 2019)
+        self.assertEqual(parseNumber((3, 12)), 3)
+        self.assertEqual(parseNumber(None), 0)
+        self.assertEqual(parseNumber("", 1), 1)
+        self.assertEqual(parseDuration("4:05"), 245)
+        self.assertEqual(parseDuration("1:02:03"), 3723)
+        self.assertEqual(parseDuration(12.7), 12)
+
+    def test_attributes(self):
+        """ 测试属性访问返回整数，字典访问返回字符串 """
+        info = self.songInfo
+        self.assertEqual((info.year, info.tracknumber, info.trackTotal, info.duration),
+                         (2019, 3, 3, 245))
+        self.assertEqual((info["year"], info["tracknumber"], info["duration"]),
+                         ("2019", "3", "4:05"))
+        self.assertEqual(SongInfo()["year"], "")
+
+    def test_mapping(self):
+        """ 测试和歌曲信息字典兼容 """
+        info = self.songInfo
+        info["duration"] = "1:00"
+        info["coverPath"] = "cover.jpg"
+        self.assertEqual(info.duration, 60)
+        self.assertEqual(info["coverPath"], "cover.jpg")
+        self.assertIn("coverPath", info)
+        self.assertEqual(list(info)[-1], "coverPath")
+        self.assertEqual(len(info), len(dict(info)))
+        self.assertEqual(info.get("missing", 1), 1)
+
+        del info["coverPath"]
+        self.assertNotIn("coverPath", info)
+        with self.assertRaises(KeyError):
+            del info["songName"]
+
+        with self.assertRaises(KeyError):
+            info["missing"]
+
+    def test_interned_strings(self):
+        """ 测试歌手和专辑等字符串只保存一份 """
+        singer = "".join(["Ai", "ko"])
+        other = SongInfo(singer=singer, album="".join(["Al", "bum"]))
+        self.assertIs(other.singer, self.songInfo.singer)
+        self.assertIs(other.album, self.songInfo.album)
+
+    def test_copy(self):
+        """ 测试复制和比较 """
+        info = self.songInfo
+        info["coverPath"] = "cover.jpg"
+        for other in [info.copy(), copy.copy(info), copy.deepcopy(info),
+                      pickle.loads(pickle.dumps(info)), SongInfo.fromDict(info)]:
+            self.assertIsNot(other, info)
+            self.assertEqual(other, info)
+
+        other = info.copy()
+        other["coverPath"] = "other.jpg"
+        self.assertEqual(info["coverPath"], "cover.jpg")
+        self.assertNotEqual(other, info)
+        self.assertEqual(info, dict(info))
+
+    def test_dict_conversion(self):
+        """ 测试和歌曲信息字典互相转换 """
+        data = json.loads(json.dumps([self.songInfo], default=encodeSongInfo))[0]
+        self.assertEqual(data["duration"], "4:05")
+        self.assertEqual(SongInfo.fromDict(data), self.songInfo)
+
+        info = SongInfo.fromDict({"songPath": "a.mp3", "disc": "2/3"})
+        self.assertEqual((info.songPath, info.disc, info.discTotal), ("a.mp3", 2, 1))
+
+        with self.assertRaises(TypeError):
+            json.dumps(object(), default=encodeSongInfo)